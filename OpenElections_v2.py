@@ -1,11 +1,38 @@
 # PA Election Results  
 # Takes downloaded file and converts to csv file usable by OpenElections
+#
+#   python OpenElections_v2.py in_file out_file
+#   python OpenElections_v2.py --batch out_dir "downloads/*.csv" ...
 import sys
 import csv
 import re
 import os
+import glob
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+# the office and party translators are shared with the county parsers
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parsers'))
+from office_normalizer import normalize as normalize_office, party_code  # noqa: E402
+
+# offices included in OpenElections data, as normalize_office names them;
+# exact names only, so "Governor and Lieutenant Governor" and special
+# elections aren't kept as the regular office
+OFFICES_TO_KEEP = {'State House', 'President', 'U.S. House', 'U.S. Senate',
+                   'Attorney General', 'State Senate', 'Governor'}
+
+HEADER = ['county','office','district','party','candidate','votes']
+
+# compiled once rather than per row
+EXTRA_SPACES = re.compile('  *')
+NON_DIGITS = re.compile(r'\D')
+
 
 # fuctions
+# the same candidates appear once per county (and per year in a batch),
+# so each distinct name is only converted once
+@lru_cache(maxsize=None)
 def convert_to_full(name):
     """Takes candidate name in the form of last, first etc. and converts to first middle last suffix"""
 
@@ -37,8 +64,7 @@ def convert_to_full(name):
         last = last[:2] + last[2:].title()
 
     # get rid of extra internal spaces in rest of name
-    extra_spaces = re.compile('  *')
-    rest = re.sub('  *',' ',rest)
+    rest = EXTRA_SPACES.sub(' ',rest)
 
     # split rest at spaces
     rest = rest.split(' ')
@@ -81,160 +107,150 @@ def convert_to_full(name):
         rest = []
 
     full = " ".join([first, middle, last, suffix]).strip()
-    full = re.sub("  *"," ",full)
+    full = EXTRA_SPACES.sub(" ",full)
 
     return full
 
 
-def main(in_file, out_file, *args):
-
-    # declare dictionaries used for transforming data in offices and parties columns
-    offices_to_keep = {'Representative in the General Assembly':'State House',
-                       'President of the United States': 'President',
-                       'Representative in Congress': 'U.S. House',
-                       'United States Senator': 'U.S. Senate',
-                       'Attorney General': 'Attorney General',
-                       'Senator in the General Assembly': 'State Senate',
-                       'Governor':'Governor'}
-
-    parties = {'Democratic':'DEM',
-               'Republican':'REP',
-               'Independent':'IND',
-               'Democratic / Republican':'DEMREP',
-               'Constitution Party':'CNST',
-               'Constitution':'CNST',
-               'Green':'GRN',
-               'Libertarian':'LIB',
-               'usaminutemen':'OTH',
-               'No Affiliation':'IND',
-               'Kate McGraw Independent':'IND',
-               'Reform':'REF',
-               'Republican / Democratic':'DEMREP',
-               'COA':'OTH',
-               'POV':'OTH',
-               'CFM':'OTH',
-               'DBP':'OTH',
-               'D/G':'OTH',
-               'HFR':'OTH',
-               'GFL':'OTH',
-               'SOS':'OTH',
-               'Healthcare':'OTH',
-               'Randolph for Congress':'OTH',
-               '51st Independent Delegation':'OTH',
-               'Action and Accountability':'OTH',
-               'Socialist Workers':'OTH',
-               'Growth Management':'OTH',
-               'None':'IND',
-               'Vote for Cash':'OTH',
-               'Socialist Party USA':'OTH',
-               'New American Independent':'OTH',
-               'SWP':'OTH',
-               'Blasko for Representative':'OTH',
-               'No Party Affiliation':'IND',
-               'Independent Patriots':'OTH',
-               'Victory For Vybiral':'OTH',
-               'Towne For Congress':'OTH',
-               'Fagan For 145th':'OTH',
-               'Unaffiliated Independent':'IND',
-               'American Congress':'OTH',
-               'For the 89th':'OTH',
-               'Warren Bloom Party':'OTH',
-               'BEDNARSKI FOR CONGRESS':'OTH',
-               'YORK LIBERTARIAN PARTY':'LIB',
-               'Families 4 Brentley':'OTH',
-               'McAteer For House':'OTH',
-               'Vote For Ines':'OTH'}
-
-    # ---- Error Checking
-    # the __main__ statement will check whether user provided input and
-    # ouput file names
-    # currently there's no extra arguments so *args is just a place holder
+def free_name(out_file, taken=None):
+    """Returns out_file, or out_file with the lowest free _vN version number
+    if it already exists. Looks at the directory once instead of testing
+    each version with os.path.isfile; names in taken count as existing."""
 
-    
-    # check to see if the out_file already exists
-    # if so, change out_file to new name
     # set ext to csv if user didn't include an extension
+    fn, ext = os.path.splitext(out_file)
+    ext = ext[1:] or 'csv'
+
+    directory = os.path.dirname(fn) or '.'
     try:
-        fn, ext = out_file.split('.')
-    except ValueError:
-        fn = out_file
-        ext = 'csv'
+        existing = set(os.listdir(directory))
+    except FileNotFoundError:
+        existing = set()
+    if taken:
+        existing.update(os.path.basename(name) for name in taken)
 
-    version = 1
     test_name = fn + '.' + ext
-    while os.path.isfile(test_name):
+    version = 1
+    while os.path.basename(test_name) in existing:
         print("File {} already exists, adding/incrementing version number.".format(test_name))
         test_name = fn + '_v' + str(version) + '.' + ext
         version += 1
 
-    out_file = test_name
+    return test_name
+
+
+def convert(in_file, out_file):
+    """Streams in_file through the office, party and district translators
+    into out_file. Returns a Counter of the party labels that aren't in
+    the party table (written as UNK), or None if in_file doesn't exist."""
 
     # try to open input file, if it doesn't work, forget the rest
     try:
         orig = open(in_file, 'r')
     except FileNotFoundError:
         print("Input file {} not found.".format(in_file))
-        return
+        return None
+
+    unknown_parties = Counter()
 
     # since that worked, if you've reached this far, open the new output file
-    rev = open(out_file,'w',newline='')
-
-
-    # ---- Get ready to rumble
-    # set up the reader and writer and sent the header row to the output file
-    reader = csv.reader(orig)
-
-    writer = csv.writer(rev)
-    writer.writerow(['county','office','district','party','candidate','votes'])
-
-    # skip the header row in the input file
-    next(reader, None)
-
-    # ----- Main loop
-    for row in reader:
-        # skip rows for offices not included in OpenElections data
-        
-        if row[2] in offices_to_keep:
-            # get county name and convert to title case
-            county = row[1].title()
-
-            # get office and convert to standard labels
-            office = offices_to_keep[row[2]]
-            
-            # get district and extract numbers, discard the rest
-            old_district = row[3]
-            district = ""
-            for char in old_district:
-                if char.isdigit():
-                    district = district + char
-            
+    with orig, open(out_file, 'w', newline='') as rev:
+        # set up the reader and writer and sent the header row to the output file
+        reader = csv.reader(orig)
+        writer = csv.writer(rev)
+        writer.writerow(HEADER)
+
+        # skip the header row in the input file
+        next(reader, None)
+
+        # ----- Main loop
+        for row in reader:
+            # skip rows for offices not included in OpenElections data
+            office = normalize_office(row[2], strict=True).office
+            if office not in OFFICES_TO_KEEP:
+                continue
+
             # get party and convert to abbreviation
-            party = row[4]
-            
-            if party in parties:
-                party = parties[party]
-            else:
-                print("Unknown party: {}", party)
-                parties[party] = 'UNK'
-                party = parties[party]
-            
-            # get candidate name and process to full name (first middle last suffix)        
-            candidate = convert_to_full(row[5])
+            party = party_code(row[4])
+            if party is None:
+                unknown_parties[row[4]] += 1
+                party = 'UNK'
+
+            writer.writerow([
+                row[1].title(),                 # county in title case
+                office,
+                NON_DIGITS.sub('', row[3]),     # district numbers only
+                party,
+                convert_to_full(row[5]),        # first middle last suffix
+                row[6].replace(',', ''),
+            ])
+
+    return unknown_parties
+
+
+def report_unknown_parties(unknown_parties):
+    for party, count in sorted(unknown_parties.items()):
+        print("Unknown party: {} ({} rows)".format(party, count))
+
+
+def main(in_file, out_file, *args):
+
+    # ---- Error Checking
+    # the __main__ statement will check whether user provided input and
+    # ouput file names
+    # currently there's no extra arguments so *args is just a place holder
+
+    # check to see if the out_file already exists
+    # if so, change out_file to new name
+    out_file = free_name(out_file)
+
+    unknown_parties = convert(in_file, out_file)
+    if unknown_parties:
+        report_unknown_parties(unknown_parties)
+
+
+def batch(patterns, out_dir, workers=None):
+    """Converts every file matching patterns (file names or globs) into
+    out_dir, several at a time, each named after its input file. Unknown
+    parties are reported once for the whole batch. Returns the output
+    file names."""
+
+    in_files = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern))
+        if not matches:
+            print("Input file {} not found.".format(pattern))
+        in_files.extend(matches)
+
+    # pick every output name up front so two inputs can't claim the same one
+    os.makedirs(out_dir, exist_ok=True)
+    out_files = []
+    for in_file in in_files:
+        name = os.path.splitext(os.path.basename(in_file))[0] + '.csv'
+        out_files.append(free_name(os.path.join(out_dir, name), out_files))
+
+    unknown_parties = Counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for found in pool.map(convert, in_files, out_files):
+            if found:
+                unknown_parties.update(found)
 
-            votes = row[6].replace(',','')
-            
-            writer.writerow([county,office,district, party,candidate,votes])
+    report_unknown_parties(unknown_parties)
+    return out_files
 
-    orig.close()
-    rev.close()
 
 # Heres where you make the program able to run from the command line
 if __name__ == "__main__":
-    if len(sys.argv) < 3:
+    if len(sys.argv) >= 2 and sys.argv[1] == '--batch':
+        # batch mode: --batch OUT_DIR FILE_OR_GLOB ...
+        if len(sys.argv) < 4:
+            raise SyntaxError("Need an output directory and input files or globs")
+        batch(sys.argv[3:], sys.argv[2])
+    elif len(sys.argv) < 3:
         # first value is the python file, so need three values to have
         # enough arguments
         raise SyntaxError("Need input and output file names")
-    if len(sys.argv) != 3:
+    elif len(sys.argv) != 3:
         # if there are keyword arguments
         main(sys.argv[1], sys.argv[2], *sys.argv[3:])
     else:
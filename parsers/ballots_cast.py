@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Ballots-cast sanity check for a whole election's precinct files.
+
+In every precinct a contest can't get more votes than ``Ballots Cast x
+vote_for``. This validator loads every ``<election>__<county>__precinct.csv``
+into one frame and, with grouped sums rather than per-file loops, computes
+each (county, precinct, contest)'s ratio of counted votes to that cap:
+
+  - **overcount**: the ratio is above 1 -- votes were double-counted or a
+    column was misread (always worth a look). Only contests with a
+    ``vote_for`` can be overcounts.
+  - **no_vote_for**: a contest without a ``vote_for`` whose ratio is above
+    1 -- usually a multi-seat race (committee seats). Its seat count isn't
+    known, and a primary's Ballots Cast counts every party's voters, so
+    its precincts can't be compared with each other either; these are
+    advisory and never fail ``--strict``.
+  - **undercount**: the ratio is below ``UNDERCOUNT_SHARE`` of the same
+    contest's median ratio across the county's precincts, in a precinct
+    with at least ``MIN_BALLOTS`` ballots -- usually rows dropped by the
+    parser. Roll-off varies by contest, hence comparing with the contest
+    rather than with a fixed floor.
+
+The report lists overcounts, then undercounts, then ``no_vote_for`` rows,
+each ranked by how many votes it is off by::
+
+    county  precinct  office  district  party  kind  votes  ballots_cast  vote_for  ratio  expected_ratio  off_by
+
+Ballots Cast is read from the ``Ballots Cast`` office row, or a ``Ballots
+Cast`` candidate row with no office. Contests without a ``vote_for``
+column or value are measured as vote-for-1 (``vote_for`` is blank in the
+report). Over/under-vote rows, printed totals and write-in detail rows are not
+votes and are left out of the sums; files without a ``precinct`` column
+are skipped::
+
+    python parsers/ballots_cast.py 20251104__pa__general -d 2025/counties [--top 40] [--strict]
+
+``--strict`` exits non-zero on any overcount, so the check can gate
+publishing an election; undercounts are advisory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from reconcile import DETAIL_CANDIDATES, DETAIL_PREFIXES, TOTAL_CANDIDATES
+
+CONTEST = ("county", "precinct", "office", "district", "party")
+COLUMNS = (*CONTEST, "candidate", "vote_for", "votes")
+BALLOTS_CAST = "Ballots Cast"
+# Rows counting ballots or blank/over/under votes rather than votes for a choice.
+NOT_VOTES = r"(?i)^(?:(?:over|under)\s*votes?|blank.*|rejected write-ins?|registered voters)$"
+UNDERCOUNT_SHARE = 0.1
+# Report order: what fails --strict first, advisory rows last.
+KIND_ORDER = {"overcount": 0, "undercount": 1, "no_vote_for": 2}
+MIN_BALLOTS = 20
+
+
+def _votes(column: pd.Series) -> pd.Series:
+    return pd.to_numeric(column.str.replace(",", "", regex=False), errors="coerce")
+
+
+def load(paths: Iterable) -> pd.DataFrame:
+    """``COLUMNS`` of every precinct CSV in ``paths`` as one frame, with
+    ``votes``/``vote_for`` numeric. Files without a precinct column are
+    left out."""
+    wanted = set(COLUMNS)
+    frames = []
+    for path in paths:
+        frame = pd.read_csv(
+            path,
+            dtype=str,
+            keep_default_na=False,
+            encoding="utf-8-sig",
+            usecols=lambda column: column.strip() in wanted,
+        )
+        frame.columns = frame.columns.str.strip()
+        if "precinct" in frame.columns:
+            frames.append(frame.reindex(columns=list(COLUMNS)))
+    if not frames:
+        return pd.DataFrame(columns=list(COLUMNS))
+    frame = pd.concat(frames, ignore_index=True)
+    frame[list(COLUMNS)] = frame[list(COLUMNS)].fillna("")
+    for key in (*CONTEST, "candidate"):
+        frame[key] = frame[key].str.strip()
+    frame["votes"] = _votes(frame["votes"])
+    frame["vote_for"] = _votes(frame["vote_for"])
+    return frame
+
+
+def _empty() -> pd.DataFrame:
+    return pd.DataFrame(columns=[
+        *CONTEST, "kind", "votes", "ballots_cast", "vote_for", "ratio", "expected_ratio", "off_by",
+    ])
+
+
+def check(
+    frame: pd.DataFrame,
+    undercount_share: float = UNDERCOUNT_SHARE,
+    min_ballots: int = MIN_BALLOTS,
+) -> pd.DataFrame:
+    """Ranked over/undercount anomalies in ``frame`` (as ``load`` returns it)."""
+    office, candidate = frame["office"], frame["candidate"]
+    is_ballots = (office == BALLOTS_CAST) | ((office == "") & (candidate == BALLOTS_CAST))
+    ballots = frame[is_ballots].groupby(["county", "precinct"], sort=False)["votes"].max()
+
+    is_vote = (
+        (office != "")
+        & ~is_ballots
+        & ~office.str.match(NOT_VOTES)
+        & ~candidate.str.match(NOT_VOTES)
+        & ~candidate.isin([*TOTAL_CANDIDATES, *DETAIL_CANDIDATES])
+        & ~candidate.str.startswith(DETAIL_PREFIXES)
+    )
+    contests = frame[is_vote].groupby(list(CONTEST), sort=False).agg(
+        votes=("votes", "sum"), vote_for=("vote_for", "max")
+    )
+    if not len(contests) or not len(ballots):
+        return _empty()
+    contests = contests.join(ballots.rename("ballots_cast"), on=["county", "precinct"], how="inner")
+    contests = contests[contests["ballots_cast"] > 0]
+    known = contests["vote_for"].notna()
+    contests["vote_for"] = contests["vote_for"].clip(lower=1)
+
+    cap = contests["ballots_cast"] * contests["vote_for"].fillna(1)
+    contests["ratio"] = contests["votes"] / cap
+    by_contest = [contests.index.get_level_values(k) for k in ("county", "office", "district", "party")]
+    contests["expected_ratio"] = contests["ratio"].groupby(by_contest).transform("median")
+    expected = contests["expected_ratio"] * cap
+
+    above_cap = contests["ratio"] > 1
+    over = above_cap & known
+    no_vote_for = above_cap & ~known
+    under = (
+        (contests["ballots_cast"] >= min_ballots)
+        & (contests["ratio"] < contests["expected_ratio"] * undercount_share)
+    )
+    contests["kind"] = np.select(
+        [over, no_vote_for, under], ["overcount", "no_vote_for", "undercount"], default=""
+    )
+    contests["off_by"] = np.where(
+        above_cap, contests["votes"] - cap, expected - contests["votes"]
+    ).round().astype(np.int64)
+
+    report = contests[over | no_vote_for | under].reset_index()
+    report["rank"] = report["kind"].map(KIND_ORDER)
+    report = report.sort_values(
+        ["rank", "off_by", *CONTEST], ascending=[True, False, *[True] * len(CONTEST)]
+    )
+    return report[_empty().columns].reset_index(drop=True)
+
+
+def ballots_cast_sanity(path) -> list[dict]:
+    """Overcounted contests in one precinct CSV, as row dicts."""
+    report = check(load([path]))
+    return report[report["kind"] == "overcount"].to_dict("records")
+
+
+def check_election(election: str, directory, **options) -> pd.DataFrame:
+    """``check`` every precinct file of ``election`` in ``directory``."""
+    paths = sorted(Path(directory).glob(f"{election}__*__precinct.csv"))
+    return check(load(paths), **options)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("election", help="file prefix, e.g. 20251104__pa__general")
+    parser.add_argument("-d", "--directory", default=".", help="directory with the precinct CSVs")
+    parser.add_argument("--top", type=int, default=40, help="anomalies to print (default 40)")
+    parser.add_argument("--strict", action="store_true", help="exit 1 on any overcount")
+    args = parser.parse_args(argv)
+
+    report = check_election(args.election, args.directory)
+    kinds = report["kind"].value_counts()
+    print(
+        f"{args.election}: {kinds.get('overcount', 0)} overcounts, "
+        f"{kinds.get('undercount', 0)} undercounts in {report['county'].nunique()} counties"
+    )
+    if kinds.get("no_vote_for", 0):
+        print(f"{kinds['no_vote_for']} precinct contests without a vote_for are above one vote per ballot (multi-seat?)")
+    if len(report):
+        print(report.head(args.top).to_string(index=False), file=sys.stderr)
+    return 1 if args.strict and kinds.get("overcount", 0) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""One candidate-name registry for parsers and validators.
+
+Candidate names arrive in every shape: ``BIDEN, JOSEPH ROBINETTE JR``
+from the state's results API, ``Joseph R. Biden`` from a county PDF,
+``JOSEPH R BIDEN`` in an earlier CSV. ``normalize`` folds case,
+punctuation and ``LAST, FIRST`` order into one key, with any generational
+suffix moved to the end::
+
+    normalize("Biden, Joseph R. Jr.")      # 'JOSEPH R BIDEN JR'
+    normalize("WAYNE LANGERHOLC, JR")      # 'WAYNE LANGERHOLC JR'
+
+The suffix stays in the key, so a father and son of the same name are two
+candidates. A ``CandidateRegistry`` maps every alias's key to its
+candidate's id (the key of the canonical name) in a dict, so resolving a
+row is one hash lookup. Each alias is also registered without its suffix,
+for names that leave it off; that bare form resolves only while it is
+unambiguous (``JOHN SMITH`` finds John Smith Jr. until John Smith Sr. is
+registered too), and a name that carries a suffix must match it. Names no
+alias covers can fall back to a fuzzy match over a trigram index built as
+aliases are added: only aliases sharing trigrams with the name are scored
+(Dice coefficient), and the best one at or above ``min_score`` wins.
+Validators, whose job is to report misspelled names, should resolve with
+``fuzzy=False``::
+
+    registry = CandidateRegistry()
+    registry.add("JOSEPH R BIDEN", aliases=["BIDEN, JOSEPH ROBINETTE JR"], party="DEM")
+    registry.resolve("Biden, Joseph Robinette Jr.")   # 'JOSEPH R BIDEN'
+    registry.match("JOSEPH R BIDDEN")                 # 'JOSEPH R BIDEN' (fuzzy)
+    registry.resolve("Joseph Robinette Biden")       # 'JOSEPH R BIDEN' (suffix left off)
+    registry.canonical("JOSEPH R BIDDEN", fuzzy=False)  # 'JOSEPH R BIDDEN' (unknown: its own key)
+
+``pa_2020_primary()`` is the registry for the 2020 primary, built from
+``constants/pa_candidates_2020.py``.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Iterable, Optional
+
+SUFFIXES = frozenset({"JR", "SR", "II", "III", "IV"})
+MIN_SCORE = 0.8
+NGRAM = 3
+
+_PUNCTUATION = re.compile(r"[.\"'()]")
+_SPACES = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=None)
+def normalize(name: str) -> str:
+    """``name`` upper-cased, in first-last order, without punctuation,
+    single-spaced, with any generational suffix last."""
+    name = _PUNCTUATION.sub(" ", name.upper())
+    parts = [part.split() for part in name.split(",")]
+    suffixes = [word for part in parts for word in part if word in SUFFIXES]
+    parts = [words for words in ([w for w in part if w not in SUFFIXES] for part in parts) if words]
+    if len(parts) == 2:
+        last, first = parts
+        parts = [first, last]
+    return " ".join([word for part in parts for word in part] + list(dict.fromkeys(suffixes)))
+
+
+def strip_suffix(key: str) -> str:
+    """A normalized key without its generational suffix."""
+    return " ".join(word for word in key.split() if word not in SUFFIXES)
+
+
+def _ngrams(key: str) -> Counter:
+    padded = f" {key} "
+    return Counter(padded[i:i + NGRAM] for i in range(len(padded) - NGRAM + 1))
+
+
+class CandidateRegistry:
+    def __init__(self) -> None:
+        self._ids: dict[str, str] = {}  # alias key -> candidate id
+        # alias key without its suffix -> candidate id, None once two candidates share it
+        self._bare: dict[str, Optional[str]] = {}
+        self._parties: dict[str, str] = {}
+        self._ngrams: dict[str, Counter] = {}  # alias key -> its trigrams
+        self._postings: defaultdict[str, set] = defaultdict(set)  # trigram -> alias keys
+
+    def __len__(self) -> int:
+        return len(set(self._ids.values()))
+
+    def __contains__(self, name: str) -> bool:
+        return normalize(name) in self._ids
+
+    def add(self, canonical: str, aliases: Iterable[str] = (), party: Optional[str] = None) -> str:
+        """Register ``canonical`` and its ``aliases``; returns the candidate id.
+        An alias already registered for another candidate keeps its first id."""
+        candidate_id = normalize(canonical)
+        for name in (canonical, *aliases):
+            key = normalize(name)
+            bare = strip_suffix(key)
+            if self._bare.setdefault(bare, candidate_id) != candidate_id:
+                self._bare[bare] = None
+            if key in self._ids:
+                continue
+            self._ids[key] = candidate_id
+            grams = self._ngrams[key] = _ngrams(key)
+            for gram in grams:
+                self._postings[gram].add(key)
+        if party:
+            self._parties.setdefault(candidate_id, party)
+        return candidate_id
+
+    def _lookup(self, key: str) -> Optional[str]:
+        candidate_id = self._ids.get(key)
+        if candidate_id is None and key == strip_suffix(key):
+            candidate_id = self._bare.get(key)
+        return candidate_id
+
+    def resolve(self, name: str) -> Optional[str]:
+        """The id of the candidate ``name`` is an alias of, if any."""
+        return self._lookup(normalize(name))
+
+    def match(self, name: str, min_score: float = MIN_SCORE) -> Optional[str]:
+        """``resolve``, falling back to the closest alias by trigram Dice
+        score when that is at least ``min_score``."""
+        key = normalize(name)
+        candidate_id = self._lookup(key)
+        if candidate_id is not None or not key:
+            return candidate_id
+        grams = _ngrams(key)
+        shared: Counter = Counter()
+        for gram, count in grams.items():
+            for alias in self._postings.get(gram, ()):
+                shared[alias] += min(count, self._ngrams[alias][gram])
+        size = sum(grams.values())
+        best, best_score = None, min_score
+        for alias, common in shared.items():
+            score = 2 * common / (size + sum(self._ngrams[alias].values()))
+            if score >= best_score and (best is None or score > best_score or alias < best):
+                best, best_score = alias, score
+        return self._ids[best] if best is not None else None
+
+    def canonical(self, name: str, fuzzy: bool = True) -> str:
+        """A key for ``name`` that is the same for all of a candidate's
+        aliases: its id if registered, else the normalized name."""
+        candidate_id = self.match(name) if fuzzy else self.resolve(name)
+        return candidate_id if candidate_id is not None else normalize(name)
+
+    def party(self, name: str) -> Optional[str]:
+        candidate_id = self.resolve(name)
+        return self._parties.get(candidate_id) if candidate_id else None
+
+
+def pa_2020_primary() -> CandidateRegistry:
+    """Statewide 2020 primary candidates, plus the state's official names
+    for the candidates the parsed files spell differently."""
+    from constants.pa_candidates_2020 import OFFICIAL_PRIMARY_CANDIDATE_ALIASES, STATEWIDE_PRIMARY_CANDIDATES
+
+    registry = CandidateRegistry()
+    for name in sorted(STATEWIDE_PRIMARY_CANDIDATES):
+        registry.add(name)
+    for official, aliases in OFFICIAL_PRIMARY_CANDIDATE_ALIASES.items():
+        registry.add(aliases[0], aliases=[official, *aliases[1:]])
+    return registry
@@ -1,23 +1,14 @@
 import clarify
 import re
-import requests
-import zipfile
 import csv
 
-try:
-    from StringIO import StringIO
-except ImportError:
-    from io import StringIO, BytesIO
+from clarity_stream import ClarityDetail
 
 def statewide_results(url):
     j = clarify.Jurisdiction(url=url, level="state")
-    r = requests.get("http://results.enr.clarityelections.com/WV/74487/207685/reports/detailxml.zip", stream=True)
-    z = zipfile.ZipFile(BytesIO(r.content))
-    z.extractall()
-    p = clarify.Parser()
-    p.parse("detail.xml")
-    results = []
-    for result in p.results:
+    p = ClarityDetail("http://results.enr.clarityelections.com/WV/74487/207685/reports/detailxml.zip")
+    results = {}
+    for result in p.results():
         candidate = re.sub(r'^\(\d+\)\s*', '', result.choice.text)
         office, district = parse_office(result.contest.text)
         party = parse_party(result.contest.text)
@@ -38,16 +29,16 @@ def statewide_results(url):
             county = result.jurisdiction.name
         else:
             county = None
-        r = [x for x in results if x['county'] == county and x['office'] == office and x['district'] == district and x['party'] == party and x['candidate'] == candidate]
-        if r:
-             r[0][result.vote_type] = result.votes
+        key = (county, office, district, party, candidate)
+        if key in results:
+             results[key][result.vote_type] = result.votes
         else:
-            results.append({ 'county': county, 'office': office, 'district': district, 'party': party, 'candidate': candidate, result.vote_type: result.votes})
+            results[key] = { 'county': county, 'office': office, 'district': district, 'party': party, 'candidate': candidate, result.vote_type: result.votes}
 
     with open("20180508__wv__general.csv", "wt") as csvfile:
         w = csv.writer(csvfile)
         w.writerow(['county', 'office', 'district', 'party', 'candidate', 'votes'])
-        for row in results:
+        for row in results.values():
             total_votes = row['Election Day']# + row['Absentee by Mail'] + row['Advance in Person'] + row['Provisional']
             w.writerow([row['county'], row['office'], row['district'], row['party'], row['candidate'], total_votes])
 
@@ -57,22 +48,18 @@ def download_county_files(url, filename):
     subs = j.get_subjurisdictions()
     for sub in subs:
         try:
-            r = requests.get(sub.report_url('xml'), stream=True)
-            z = zipfile.ZipFile(BytesIO(r.content))
-            z.extractall()
-            precinct_results(sub.name.replace(' ','_').lower(),filename)
+            precinct_results(sub.name.replace(' ','_').lower(), filename, sub.report_url('xml'))
         except Exception:
             no_xml.append(sub.name)
 
     print(no_xml)
 
-def precinct_results(county_name, filename):
+def precinct_results(county_name, filename, source="detail.xml"):
     f = filename + '__' + county_name + '__precinct.csv'
-    p = clarify.Parser()
-    p.parse("detail.xml")
-    results = []
+    p = ClarityDetail(source)
+    results = {}
     vote_types = []
-    for result in [x for x in p.results if not 'Number of Precincts' in x.vote_type]:
+    for result in (x for x in p.results() if not 'Number of Precincts' in x.vote_type):
         vote_types.append(result.vote_type)
         if result.choice is None:
             continue
@@ -97,11 +84,11 @@ def precinct_results(county_name, filename):
             precinct = None
         if precinct == None:
             continue
-        r = [x for x in results if x['county'] == county and x['precinct'] == precinct and x['office'] == office and x['district'] == district and x['party'] == party and x['candidate'] == candidate]
-        if r:
-             r[0][result.vote_type] = result.votes
+        key = (county, precinct, office, district, party, candidate)
+        if key in results:
+             results[key][result.vote_type] = result.votes
         else:
-            results.append({ 'county': county, 'precinct': precinct, 'office': office, 'district': district, 'party': party, 'candidate': candidate, result.vote_type: result.votes})
+            results[key] = { 'county': county, 'precinct': precinct, 'office': office, 'district': district, 'party': party, 'candidate': candidate, result.vote_type: result.votes}
 
     vote_types = list(dict.fromkeys(vote_types))
     print(vote_types)
@@ -121,7 +108,7 @@ def precinct_results(county_name, filename):
         w = csv.writer(csvfile)
         headers = ['county', 'precinct', 'office', 'district', 'party', 'candidate', 'votes'] + [x.replace(' ','_').lower() for x in vote_types]
         w.writerow(headers)
-        for row in results:
+        for row in results.values():
             if 'Republican' in row['office']:
                 row['party'] = 'REP'
             elif 'Democrat' in row['office']:
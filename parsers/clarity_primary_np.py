@@ -9,24 +9,26 @@ office). Each choice (candidate) has a ``party`` attribute and one
 each ``VoteType`` has one ``Precinct`` element per precinct with a vote
 count.
 
-This script reads a ``detail.xml`` and emits one row per
+This script reads a ``detail.xml`` (or the zip itself) and emits one row per
 (county, precinct, office, district, party, candidate) with the total
 vote plus the per-method breakdown (election_day, mail, provisional).
 ``Registered Voters`` and ``Ballots Cast`` contests are emitted as
 metadata rows (candidate empty, party empty for Registered Voters).
 
 Usage:
-    uv run python parsers/clarity_primary_np.py <County> <detail.xml> <output.csv>
+    uv run python parsers/clarity_primary_np.py <County> <detail.xml|detailxml.zip> <output.csv>
 """
 
 from __future__ import annotations
 
-import csv
 import re
 import sys
 from pathlib import Path
+from typing import Iterable
 
-import clarify
+from clarity_stream import ClarityDetail
+from office_normalizer import office_aliases
+from row_table import RowTable, write_rows
 
 
 PARTY_PREFIX_RE = re.compile(
@@ -64,32 +66,10 @@ SPECIAL_ELECTION_PREFIX_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Statewide / federal / legislative offices, from the shared table in
+# ``constants/offices.csv``.
 STATEWIDE_OFFICES: dict[str, tuple[str, bool]] = {
-    "PRESIDENT OF THE UNITED STATES": ("President", False),
-    "UNITED STATES SENATOR": ("U.S. Senate", False),
-    "GOVERNOR": ("Governor", False),
-    "LIEUTENANT GOVERNOR": ("Lieutenant Governor", False),
-    "LT. GOVERNOR": ("Lieutenant Governor", False),
-    "LT GOVERNOR": ("Lieutenant Governor", False),
-    "ATTORNEY GENERAL": ("Attorney General", False),
-    "AUDITOR GENERAL": ("Auditor General", False),
-    "STATE TREASURER": ("State Treasurer", False),
-    "REPRESENTATIVE IN CONGRESS": ("U.S. House", True),
-    "REP. IN CONGRESS": ("U.S. House", True),
-    "REP IN CONGRESS": ("U.S. House", True),
-    "SENATOR IN THE GENERAL ASSEMBLY": ("State Senate", True),
-    "SENATOR IN GENERAL ASSEMBLY": ("State Senate", True),
-    "SEN. IN THE GEN. ASSEMBLY": ("State Senate", True),
-    "REPRESENTATIVE IN THE GENERAL ASSEMBLY": ("State House", True),
-    "REPRESENTATIVE IN GENERAL ASSEMBLY": ("State House", True),
-    "REP. IN GEN. ASSEMBLY": ("State House", True),
-    "REP IN GEN ASSEMBLY": ("State House", True),
-    "MEMBER OF DEMOCRATIC STATE COMMITTEE": ("Member of Democratic State Committee", False),
-    "MEMBER OF REPUBLICAN STATE COMMITTEE": ("Member of Republican State Committee", False),
-    "MEMBER OF THE DEMOCRATIC STATE COMMITTEE": ("Member of Democratic State Committee", False),
-    "MEMBER OF THE REPUBLICAN STATE COMMITTEE": ("Member of Republican State Committee", False),
-    "DEMOCRATIC STATE COMMITTEE": ("Member of Democratic State Committee", False),
-    "REPUBLICAN STATE COMMITTEE": ("Member of Republican State Committee", False),
+    **office_aliases(),
     # Allegheny uses bare "MEMBER OF STATE COMMITTEE" with party in the
     # contest prefix ("DEM Member of State Committee 37th District"). Resolve
     # to the party-specific name below.
@@ -236,26 +216,30 @@ VOTE_TYPE_MAP = {
 }
 
 
-def parse_detail_xml(county: str, xml_path: Path) -> list[dict]:
-    p = clarify.Parser()
-    p.parse(str(xml_path))
+def parse_detail_xml(county: str, xml_path: Path) -> RowTable:
+    """Rows for ``xml_path`` (a ``detail.xml`` or the ``detailxml.zip``),
+    read in one streaming pass."""
 
-    # Aggregation key: (precinct, office, district, party, candidate).
-    # Accumulate votes per vote-type into the breakdown columns.
-    rows: dict[tuple, dict] = {}
+    # Aggregation key: (precinct, office, district, party, candidate) -> row
+    # index. Accumulate votes per vote-type into the breakdown columns.
+    rows = RowTable(FIELDNAMES)
+    index: dict[tuple, int] = {}
     # Per-precinct registered voters (only one choice per precinct, party blank).
-    rv_rows: dict[tuple, dict] = {}
+    rv_rows = RowTable(FIELDNAMES)
+    rv_index: dict[tuple, int] = {}
 
-    def get_cell(key, vt_name):
-        row = rows[key]
-        col = VOTE_TYPE_MAP.get(vt_name)
-        if col is None:
-            return
-        if row[col] == "":
-            row[col] = 0
-        row[col] += 0  # placeholder; actual += done at call site
+    def row_for(table, keys, key, precinct, office, district, party, candidate):
+        i = keys.get(key)
+        if i is None:
+            i = keys[key] = table.append({
+                "county": county, "precinct": precinct, "office": office,
+                "district": district, "party": party, "candidate": candidate,
+                "votes": 0, "election_day": "", "absentee": "",
+                "provisional": "",
+            })
+        return i
 
-    for r in p.results:
+    for r in ClarityDetail(xml_path).results():
         contest_text = r.contest.text
         # "BALLOTS CAST - DEMOCRATIC" / "BALLOTS CAST - REPUBLICAN" ->
         # office "Ballots Cast", candidate empty, party from suffix.
@@ -268,22 +252,15 @@ def parse_detail_xml(county: str, xml_path: Path) -> list[dict]:
                 continue  # skip county-level aggregate
             precinct = r.jurisdiction.name
             key = (precinct, office, district, party, "")
-            row = rows.setdefault(key, {
-                "county": county, "precinct": precinct, "office": office,
-                "district": district, "party": party, "candidate": "",
-                "votes": 0, "election_day": "", "absentee": "",
-                "provisional": "",
-            })
+            i = row_for(rows, index, key, precinct, office, district, party, "")
             # Each Ballots Cast VoteType (Election Day, Absentee/Mail,
             # Provisional) accumulates into the matching breakdown column
             # and the total. regVotersCounty is all-zero; skip it explicitly.
             vt = r.vote_type
             col = VOTE_TYPE_MAP.get(vt)
             if col is not None:
-                if row[col] == "":
-                    row[col] = 0
-                row[col] += r.votes or 0
-            row["votes"] = (row["votes"] or 0) + (r.votes or 0)
+                rows.add_to(i, col, r.votes or 0)
+            rows.add_to(i, "votes", r.votes or 0)
             continue
         # Skip "REGISTERED VOTERS" pseudo-contests.
         if contest_text.upper().startswith("REGISTERED VOTERS"):
@@ -291,18 +268,13 @@ def parse_detail_xml(county: str, xml_path: Path) -> list[dict]:
                 continue
             precinct = r.jurisdiction.name
             key = (precinct, "Registered Voters", "", "", "")
-            rv = rv_rows.setdefault(key, {
-                "county": county, "precinct": precinct, "office": "Registered Voters",
-                "district": "", "party": "", "candidate": "",
-                "votes": 0, "election_day": "", "absentee": "",
-                "provisional": "",
-            })
+            i = row_for(rv_rows, rv_index, key, precinct, "Registered Voters", "", "", "")
             # Clarity's "REGISTERED VOTERS" contest uses the regVotersCounty
             # VoteType whose Precinct votes are 0; the real count lives on
             # the jurisdiction's total_voters attribute.
             tv = getattr(r.jurisdiction, "total_voters", None)
             if tv:
-                rv["votes"] = int(tv)
+                rv_rows.set(i, "votes", int(tv))
             continue
         office, district, party = _normalize_office(contest_text)
         if not office:
@@ -333,30 +305,20 @@ def parse_detail_xml(county: str, xml_path: Path) -> list[dict]:
         if vt == "regVotersCounty":
             continue
         key = (precinct, office, district, party, candidate)
-        row = rows.setdefault(key, {
-            "county": county, "precinct": precinct, "office": office,
-            "district": district, "party": party, "candidate": candidate,
-            "votes": 0, "election_day": "", "absentee": "",
-            "provisional": "",
-        })
+        i = row_for(rows, index, key, precinct, office, district, party, candidate)
         col = VOTE_TYPE_MAP.get(vt)
         if col is None:
             continue
-        if row[col] == "":
-            row[col] = 0
-        row[col] += r.votes or 0
-        row["votes"] += r.votes or 0
+        rows.add_to(i, col, r.votes or 0)
+        rows.add_to(i, "votes", r.votes or 0)
 
-    out = list(rv_rows.values()) + list(rows.values())
-    return out
+    rv_rows.extend(rows)
+    return rv_rows
 
 
-def write_csv(rows: list[dict], out_path: Path) -> None:
+def write_csv(rows: Iterable[dict], out_path: Path) -> None:
     with out_path.open("w", newline="") as fh:
-        w = csv.DictWriter(fh, fieldnames=FIELDNAMES)
-        w.writeheader()
-        for r in rows:
-            w.writerow({k: r.get(k, "") for k in FIELDNAMES})
+        write_rows(fh, rows, FIELDNAMES, extrasaction="ignore")
 
 
 def main(argv: list[str]) -> None:
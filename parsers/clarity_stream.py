@@ -0,0 +1,191 @@
+"""Stream Clarity Elections ``detail.xml`` results without building the tree.
+
+Clarity publishes results as ``detailxml.zip`` holding one ``detail.xml``:
+turnout per precinct under ``VoterTurnout``, then one ``Contest`` per race
+with ``Choice`` / ``VoteType`` / ``Precinct`` vote counts. The parsers used
+to download the whole zip into memory, extract it and let ``clarify``
+build the full document tree before walking ``results`` (once per kind of
+output). For a large county that's hundreds of MB for a file that can be
+read front to back.
+
+``ClarityDetail`` reads it front to back instead: the archive is spooled
+to a temporary file (a zip's directory is at its end, so it has to be
+seekable), the member is decompressed as it's read, and
+``xml.etree.ElementTree.iterparse`` yields each result as its element is
+parsed, dropping every finished contest::
+
+    with ClarityDetail(url_or_path) as detail:
+        for result in detail.results():
+            ...
+        detail.result_jurisdictions     # turnout, once results() has run
+
+Results carry the attributes ``clarify`` results do (``contest.text``,
+``contest.is_question``, ``choice.text``, ``choice.party``,
+``jurisdiction.name``, ``jurisdiction.total_voters``, ``vote_type``,
+``votes``) and come in the same order: per contest, the no-choice vote
+types (over/under votes), then each choice's vote types; each vote type
+first as a county-wide result (``jurisdiction`` None), then per precinct
+(or per county in a state-level file). ``source`` can be a URL, a zip, a
+bare ``detail.xml`` or an open binary file.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import zipfile
+from collections import namedtuple
+from typing import Iterator, Optional
+from xml.etree import ElementTree
+
+XML_FILENAME = "detail.xml"
+DOWNLOAD_CHUNK = 1 << 20  # bytes
+TIMEOUT = 120
+
+Contest = namedtuple("Contest", "key text vote_for is_question")
+Choice = namedtuple("Choice", "key text party total_votes")
+Jurisdiction = namedtuple("Jurisdiction", "name total_voters ballots_cast level")
+Result = namedtuple("Result", "contest vote_type jurisdiction votes choice")
+
+# Turnout elements, by their parent's tag, and the level they describe.
+_TURNOUT_LEVELS = {"Precincts": "precinct", "Counties": "county"}
+_SUBJURISDICTIONS = ("Precinct", "County")
+
+
+def _int(value: Optional[str]) -> Optional[int]:
+    return int(value) if value not in (None, "") else None
+
+
+def _spool(url: str, fh) -> None:
+    import requests
+
+    with requests.get(url, stream=True, timeout=TIMEOUT) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(DOWNLOAD_CHUNK):
+            fh.write(chunk)
+    fh.seek(0)
+
+
+class ClarityDetail:
+    """One pass over a Clarity ``detail.xml`` (see the module docstring)."""
+
+    def __init__(self, source, member: str = XML_FILENAME) -> None:
+        self.source = source
+        self.member = member
+        self.region: Optional[str] = None
+        self.election_name: Optional[str] = None
+        self.election_date: Optional[str] = None
+        self.timestamp: Optional[str] = None
+        self.jurisdictions: dict[str, Jurisdiction] = {}
+        self._closing: list = []
+
+    # -- opening --------------------------------------------------------
+
+    def open(self):
+        """The ``detail.xml`` as a binary file object, read as it's consumed."""
+        source = self.source
+        if hasattr(source, "read"):
+            return source
+        if isinstance(source, str) and source.startswith(("http://", "https://")):
+            spool = tempfile.TemporaryFile()
+            self._closing.append(spool)
+            _spool(source, spool)
+            source = spool
+        elif not zipfile.is_zipfile(source):
+            fh = open(source, "rb")
+            self._closing.append(fh)
+            return fh
+        archive = zipfile.ZipFile(source)
+        self._closing.append(archive)
+        fh = archive.open(self.member)
+        self._closing.append(fh)
+        return fh
+
+    def close(self) -> None:
+        while self._closing:
+            self._closing.pop().close()
+
+    def __enter__(self) -> "ClarityDetail":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -- reading --------------------------------------------------------
+
+    @property
+    def result_jurisdictions(self) -> list[Jurisdiction]:
+        """Precincts (or counties) listed under the turnout section."""
+        return [j for j in self.jurisdictions.values() if j.level is not None]
+
+    def _jurisdiction(self, name: str) -> Jurisdiction:
+        jurisdiction = self.jurisdictions.get(name)
+        if jurisdiction is None:
+            jurisdiction = self.jurisdictions[name] = Jurisdiction(name, None, None, None)
+        return jurisdiction
+
+    def results(self) -> Iterator[Result]:
+        """Every result in document order; fills in the header attributes
+        and ``jurisdictions`` as they're reached."""
+        fh = self.open()
+        try:
+            yield from self._results(fh)
+        finally:
+            if fh is not self.source:
+                self.close()
+
+    def _results(self, fh) -> Iterator[Result]:
+        events = ElementTree.iterparse(fh, events=("start", "end"))
+        _, root = next(events)
+        path = [root.tag]
+        contest = choice = vote_type = None
+        for event, elem in events:
+            tag = elem.tag
+            if event == "start":
+                path.append(tag)
+                if tag == "Contest":
+                    a = elem.attrib
+                    contest = Contest(
+                        a.get("key"), a.get("text"), _int(a.get("voteFor")),
+                        a.get("isQuestion", "").lower() == "true",
+                    )
+                elif tag == "Choice" and contest is not None:
+                    a = elem.attrib
+                    choice = Choice(a.get("key"), a.get("text"), a.get("party"), _int(a.get("totalVotes")))
+                elif tag == "VoteType" and contest is not None:
+                    vote_type = elem.get("name")
+                    yield Result(contest, vote_type, None, _int(elem.get("votes")), choice)
+                continue
+
+            path.pop()
+            if not path:
+                break
+            parent = path[-1]
+            if tag in _SUBJURISDICTIONS and parent == "VoteType":
+                yield Result(
+                    contest, vote_type, self._jurisdiction(elem.get("name")),
+                    _int(elem.get("votes")), choice,
+                )
+            elif tag in _SUBJURISDICTIONS and parent in _TURNOUT_LEVELS:
+                name = elem.get("name")
+                self.jurisdictions[name] = Jurisdiction(
+                    name, _int(elem.get("totalVoters")), _int(elem.get("ballotsCast")),
+                    _TURNOUT_LEVELS[parent],
+                )
+            elif tag == "VoteType":
+                elem.clear()
+            elif tag == "Choice":
+                choice = None
+            elif tag == "Contest":
+                contest = None
+            elif tag == "Region":
+                self.region = elem.text
+            elif tag == "ElectionName":
+                self.election_name = elem.text
+            elif tag == "ElectionDate":
+                self.election_date = elem.text
+            elif tag == "Timestamp":
+                self.timestamp = elem.text
+            if len(path) == 1:
+                # A finished top-level section: drop it from the tree.
+                root.clear()
+
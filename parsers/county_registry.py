@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""In-process registry of county parser configs for the shared engines.
+
+Every config-driven county script in ``parsers/`` exposes a module-level
+``CONFIG`` (or, like Franklin's 2024 primary, a ``build_config()`` factory)
+built from one of the shared engines' config dataclasses:
+
+  - ``ElectionwareConfig``      -> ``electionware_precinct_np``
+  - ``PrimaryConfig``           -> ``electionware_primary_np``
+  - ``SovcGeoConfig``           -> ``sovc_geo_np``
+  - ``PrimarySovcConfig``       -> ``sovc_geo_primary_np``
+  - ``SovcCrosstabConfig``      -> ``sovc_crosstab_pp``
+  - ``ElectionwareRegexConfig`` -> ``electionware_regex_np``
+
+``discover()`` imports each of those county modules once and indexes its
+config by ``(county, election)``, where ``election`` is the
+``<type>_<year>`` token from the script name (``general_2025``,
+``primary_2026``). Electionware counties with a 2025-general config but no
+dedicated primary script are also registered for ``primary_2024`` /
+``primary_2026`` via the generic ``pa_electionware_primary_<year>`` adapters,
+exactly as those scripts would build them on the command line.
+
+A county module may also define ``post_process(rows)``, the fix-ups its
+script applies between parsing and writing (districts the PDF leaves out);
+the registry runs it after the engine, so a registry run writes the same
+CSV as the script.
+
+``parse(county, election, pdf)`` then runs the right engine in the current
+interpreter and returns its rows, so a long-lived worker (see the ``batch``
+command below) pays the natural-pdf/pdfplumber/pandas import cost once
+instead of once per county subprocess.
+
+Usage:
+    python parsers/county_registry.py list [--family FAMILY] [--election ELECTION]
+    python parsers/county_registry.py parse <County> <election> <input.pdf> <output.csv>
+    python parsers/county_registry.py batch <jobs.csv>
+
+where ``jobs.csv`` has a ``county,election,pdf,output`` header and one row
+per county to parse.
+"""
+
+from __future__ import annotations
+
+import csv
+import importlib
+import re
+import sys
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Optional
+
+PARSERS_DIR = Path(__file__).resolve().parent
+
+# pa_<county>_<type>_<year>_<suffix>.py, e.g.
+# pa_huntingdon_general_2025_results_parser.py. Multi-county scripts
+# (pa_bradford_columbia_primary_2026_county_parser.py) keep the joined name.
+MODULE_NAME_RE = re.compile(
+    r"^pa_(?P<county>[a-z_]+?)_(?P<type>general|primary)_(?P<year>\d{4})_(?P<suffix>\w+)$"
+)
+
+# Cheap source-level pre-filter so standalone scripts (scrapers, one-off
+# pdftotext parsers) are never imported just to find out they have no config.
+_CONFIG_SOURCE_RE = re.compile(r"^(?:CONFIG\s*[:=]|def build_config\()", re.MULTILINE)
+
+# Elections for which the generic Electionware primary adapters can derive a
+# config from a county's 2025-general ``CONFIG``.
+ADAPTER_ELECTIONS = {
+    "primary_2024": "pa_electionware_primary_2024",
+    "primary_2026": "pa_electionware_primary_2026",
+}
+
+
+# ---------------------------------------------------------------------------
+# Engine adapters. Each engine's parse/write entry point has its own return
+# shape and signature; these normalize them to ``parse(pdf, config) -> rows``
+# and ``write(rows, out_path, config)``. Engine modules are imported lazily so
+# listing the registry never pays for an engine that isn't used.
+# ---------------------------------------------------------------------------
+
+
+def _parse_electionware_np(pdf_path, config):
+    from electionware_precinct_np import parse_pdf
+
+    rows, _precinct_count = parse_pdf(Path(pdf_path), config)
+    return rows
+
+
+def _write_electionware_np(rows, out_path, config):
+    from electionware_precinct_np import write_csv
+
+    write_csv(rows, Path(out_path))
+
+
+def _parse_electionware_primary(pdf_path, config):
+    from electionware_primary_np import parse_primary_pdf
+
+    rows, _precinct_count = parse_primary_pdf(Path(pdf_path), config)
+    return rows
+
+
+def _write_electionware_primary(rows, out_path, config):
+    from electionware_primary_np import write_primary_csv
+
+    write_primary_csv(rows, Path(out_path))
+
+
+def _parse_sovc_geo(pdf_path, config):
+    from sovc_geo_np import parse_sovc_geo_results
+
+    results, _printed_totals = parse_sovc_geo_results(str(pdf_path), config)
+    return results
+
+
+def _write_sovc_geo(rows, out_path, config):
+    from sovc_geo_np import write_csv
+
+    write_csv(rows, str(out_path))
+
+
+def _parse_sovc_geo_primary(pdf_path, config):
+    from sovc_geo_primary_np import parse_primary_sovc_pdf
+
+    return parse_primary_sovc_pdf(Path(pdf_path), config)
+
+
+def _write_sovc_geo_primary(rows, out_path, config):
+    from sovc_geo_primary_np import write_csv
+
+    write_csv(rows, Path(out_path))
+
+
+def _parse_sovc_crosstab(pdf_path, config):
+    from sovc_crosstab_pp import parse_sovc_crosstab_results
+
+    return parse_sovc_crosstab_results(str(pdf_path), config)
+
+
+def _write_sovc_crosstab(rows, out_path, config):
+    from sovc_crosstab_pp import write_csv
+
+    write_csv(rows, str(out_path), config)
+
+
+def _parse_electionware_regex(pdf_path, config):
+    from electionware_regex_np import parse_electionware_regex_results
+
+    return parse_electionware_regex_results(str(pdf_path), config)
+
+
+def _write_electionware_regex(rows, out_path, config):
+    from electionware_regex_np import write_csv
+
+    write_csv(rows, str(out_path))
+
+
+@dataclass(frozen=True)
+class Engine:
+    family: str
+    module: str
+    parse: Callable  # (pdf_path, config) -> list[dict]
+    write: Callable  # (rows, out_path, config) -> None
+
+
+# Keyed by config class name rather than class object so the registry can
+# be imported (and ``list`` run) without importing every engine up front.
+# ``PrimaryConfig`` subclasses ``ElectionwareConfig``; the exact class name
+# is looked up first, so it never falls through to the general engine.
+ENGINES: dict[str, Engine] = {
+    "ElectionwareConfig": Engine(
+        "electionware_np", "electionware_precinct_np",
+        _parse_electionware_np, _write_electionware_np,
+    ),
+    "PrimaryConfig": Engine(
+        "electionware_primary", "electionware_primary_np",
+        _parse_electionware_primary, _write_electionware_primary,
+    ),
+    "SovcGeoConfig": Engine(
+        "sovc_geo", "sovc_geo_np", _parse_sovc_geo, _write_sovc_geo,
+    ),
+    "PrimarySovcConfig": Engine(
+        "sovc_geo_primary", "sovc_geo_primary_np",
+        _parse_sovc_geo_primary, _write_sovc_geo_primary,
+    ),
+    "SovcCrosstabConfig": Engine(
+        "sovc_crosstab", "sovc_crosstab_pp",
+        _parse_sovc_crosstab, _write_sovc_crosstab,
+    ),
+    "ElectionwareRegexConfig": Engine(
+        "electionware_regex", "electionware_regex_np",
+        _parse_electionware_regex, _write_electionware_regex,
+    ),
+}
+
+
+def engine_for(config) -> Engine:
+    """Return the engine that parses ``config``'s class (or nearest base)."""
+    for cls in type(config).__mro__:
+        engine = ENGINES.get(cls.__name__)
+        if engine is not None:
+            return engine
+    raise TypeError(f"No engine registered for config type {type(config).__name__}")
+
+
+# ---------------------------------------------------------------------------
+# Discovery.
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class CountyEntry:
+    county: str  # lower-case key, e.g. "huntingdon"
+    election: str  # "<type>_<year>", e.g. "general_2025"
+    module: str  # module the config was loaded from
+    config: object
+    engine: Engine
+    post_process: Optional[Callable] = None  # (rows) -> None, in place
+
+    @property
+    def family(self) -> str:
+        return self.engine.family
+
+
+def _ensure_on_path() -> None:
+    # County scripts import their engine as a top-level module
+    # (``from electionware_precinct_np import ...``), so parsers/ must be
+    # importable no matter where the caller was started from.
+    if str(PARSERS_DIR) not in sys.path:
+        sys.path.insert(0, str(PARSERS_DIR))
+
+
+def _load_module_config(module_name: str):
+    """``(config, post_process)`` for a county module."""
+    mod = importlib.import_module(module_name)
+    config = getattr(mod, "CONFIG", None)
+    if config is None and callable(getattr(mod, "build_config", None)):
+        config = mod.build_config()
+    return config, getattr(mod, "post_process", None)
+
+
+@lru_cache(maxsize=None)
+def discover() -> dict[tuple[str, str], CountyEntry]:
+    """Import every config-driven county module once and index it by
+    ``(county, election)``. Cached for the life of the process."""
+    _ensure_on_path()
+    entries: dict[tuple[str, str], CountyEntry] = {}
+
+    for path in sorted(PARSERS_DIR.glob("pa_*.py")):
+        m = MODULE_NAME_RE.match(path.stem)
+        if not m:
+            continue
+        if not _CONFIG_SOURCE_RE.search(path.read_text(encoding="utf-8")):
+            continue
+        config, post_process = _load_module_config(path.stem)
+        if config is None:
+            continue
+        try:
+            engine = engine_for(config)
+        except TypeError:
+            continue
+        key = (m.group("county"), f"{m.group('type')}_{m.group('year')}")
+        # Two scripts for the same county/election (e.g. a county-level and
+        # a precinct-level parser): prefer the ``_results_parser`` one.
+        if key in entries and not path.stem.endswith("_results_parser"):
+            continue
+        entries[key] = CountyEntry(key[0], key[1], path.stem, config, engine, post_process)
+
+    for election, adapter_name in ADAPTER_ELECTIONS.items():
+        adapter = None
+        for (county, source_election), entry in list(entries.items()):
+            if source_election != "general_2025" or entry.family != "electionware_np":
+                continue
+            if (county, election) in entries:
+                continue
+            if adapter is None:
+                adapter = importlib.import_module(adapter_name)
+            config = adapter.load_config(county)
+            entries[(county, election)] = CountyEntry(
+                county, election, adapter_name, config, engine_for(config)
+            )
+
+    return entries
+
+
+def get(county: str, election: str) -> CountyEntry:
+    key = (county.lower(), election.lower())
+    entries = discover()
+    if key not in entries:
+        available = sorted(e for c, e in entries if c == key[0])
+        hint = f" (available for {county}: {', '.join(available)})" if available else ""
+        raise KeyError(f"No registered config for {county!r} / {election!r}{hint}")
+    return entries[key]
+
+
+def parse(county: str, election: str, pdf_path) -> list[dict]:
+    """Parse ``pdf_path`` with the registered config for ``county`` and
+    ``election`` in the current process; returns the engine's rows, after
+    the county's ``post_process`` if it has one."""
+    entry = get(county, election)
+    rows = entry.engine.parse(pdf_path, entry.config)
+    if entry.post_process is not None:
+        entry.post_process(rows)
+    return rows
+
+
+def write(county: str, election: str, rows: list[dict], out_path) -> None:
+    """Write ``rows`` with the CSV schema of ``county``/``election``'s engine."""
+    entry = get(county, election)
+    entry.engine.write(rows, out_path, entry.config)
+
+
+# ---------------------------------------------------------------------------
+# CLI.
+# ---------------------------------------------------------------------------
+
+
+def _run_job(county: str, election: str, pdf_path: str, out_path: str) -> int:
+    if not Path(pdf_path).exists():
+        print(f"Missing PDF: {pdf_path}", file=sys.stderr)
+        return 1
+    start = time.perf_counter()
+    rows = parse(county, election, pdf_path)
+    write(county, election, rows, out_path)
+    elapsed = time.perf_counter() - start
+    print(f"{county} {election}: wrote {len(rows)} rows to {out_path} in {elapsed:.1f}s")
+    return 0
+
+
+def _cmd_list(argv: list[str]) -> int:
+    family: Optional[str] = None
+    election: Optional[str] = None
+    if "--family" in argv:
+        family = argv[argv.index("--family") + 1]
+    if "--election" in argv:
+        election = argv[argv.index("--election") + 1]
+    for (county, elec), entry in sorted(discover().items()):
+        if family and entry.family != family:
+            continue
+        if election and elec != election:
+            continue
+        print(f"{county:20} {elec:14} {entry.family:22} {entry.module}")
+    return 0
+
+
+def _cmd_batch(jobs_path: str) -> int:
+    with open(jobs_path, newline="") as fh:
+        jobs = list(csv.DictReader(fh))
+    failures = 0
+    for job in jobs:
+        try:
+            rc = _run_job(job["county"], job["election"], job["pdf"], job["output"])
+        except Exception as exc:  # keep the worker alive for the other counties
+            print(f"{job['county']} {job['election']}: FAILED: {exc}", file=sys.stderr)
+            rc = 1
+        failures += rc
+    print(f"{len(jobs) - failures}/{len(jobs)} jobs succeeded")
+    return 1 if failures else 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    argv = list(argv) if argv is not None else sys.argv[1:]
+    usage = (
+        "Usage: county_registry.py list [--family FAMILY] [--election ELECTION]\n"
+        "       county_registry.py parse <County> <election> <input.pdf> <output.csv>\n"
+        "       county_registry.py batch <jobs.csv>"
+    )
+    if not argv:
+        print(usage, file=sys.stderr)
+        return 1
+    command, rest = argv[0], argv[1:]
+    if command == "list":
+        return _cmd_list(rest)
+    if command == "parse" and len(rest) == 4:
+        return _run_job(*rest)
+    if command == "batch" and len(rest) == 1:
+        return _cmd_batch(rest[0])
+    print(usage, file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
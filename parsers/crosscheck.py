@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Check an election's precinct files against its county-level results.
+
+For every county with both a ``<election>__<county>__precinct.csv`` and
+county-level results (its own ``<election>__<county>__county.csv``, or the
+rows for that county in a statewide ``<election>__county.csv``), the
+precinct rows are summed per (county, office, district, party, candidate)
+and compared with the county figures. All files are read into one frame
+(only the key and vote columns) and checked with a single grouped sum and
+merge, so a whole election takes a few seconds::
+
+    python parsers/crosscheck.py 20260519__pa__primary -d 2026/counties
+    python parsers/crosscheck.py 20201103__pa__general -d 2020/counties \\
+        --county-file 2020/20201103__pa__general__county.csv [--strict]
+
+Keys are compared case- and whitespace-insensitively, with party names and
+common abbreviations folded together (``Democratic``/``Dem``/``DEM``) and
+leading zeros dropped from numeric districts; periods and commas in
+candidate names are ignored. The result has one row per
+mismatching (contest, candidate, field); a side with no row for that
+candidate shows NaN::
+
+    county  office  district  party  candidate  field  precincts  county_total
+
+Counties present on only one side, and contests the county results don't
+list, are not compared.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+KEYS = ("county", "office", "district", "party", "candidate")
+FIELDS = ("votes",)
+PARTY_ALIASES = {
+    "DEMOCRATIC": "DEM",
+    "REPUBLICAN": "REP",
+    "LIBERTARIAN": "LIB",
+    "LBT": "LIB",
+    "GREEN": "GRN",
+    "GRE": "GRN",
+    "INDEPENDENT": "IND",
+}
+
+
+def election_files(election: str, directory) -> tuple[list[Path], list[Path]]:
+    """The ``(precinct, county)`` CSVs for ``election`` in ``directory``."""
+    directory = Path(directory)
+    return (
+        sorted(directory.glob(f"{election}__*__precinct.csv")),
+        sorted(directory.glob(f"{election}__*__county.csv")),
+    )
+
+
+def _normalize(frame: pd.DataFrame) -> pd.DataFrame:
+    for key in KEYS:
+        frame[key] = frame[key].str.strip().str.replace(r"\s+", " ", regex=True).str.upper()
+    frame["candidate"] = frame["candidate"].str.replace(r"[.,]", "", regex=True)
+    frame["party"] = frame["party"].replace(PARTY_ALIASES)
+    frame["district"] = frame["district"].str.replace(r"^0+(?=\d)", "", regex=True)
+    return frame
+
+
+def load(paths: Iterable, fields: Sequence[str] = FIELDS) -> pd.DataFrame:
+    """Key and ``fields`` columns of every CSV in ``paths`` as one frame with
+    normalized keys; a field a file lacks is NaN, as is an unparseable value."""
+    wanted = {*KEYS, *fields}
+    frames = []
+    for path in paths:
+        frame = pd.read_csv(
+            path,
+            dtype=str,
+            keep_default_na=False,
+            encoding="utf-8-sig",
+            usecols=lambda column: column.strip() in wanted,
+        )
+        frame.columns = frame.columns.str.strip()
+        frames.append(frame.reindex(columns=[*KEYS, *fields]))
+    if not frames:
+        return pd.DataFrame(columns=[*KEYS, *fields])
+    frame = pd.concat(frames, ignore_index=True)
+    frame[list(KEYS)] = frame[list(KEYS)].fillna("")
+    for field in fields:
+        frame[field] = pd.to_numeric(
+            frame[field].str.replace(",", "", regex=False), errors="coerce"
+        )
+    return _normalize(frame)
+
+
+def crosscheck(
+    precincts: pd.DataFrame,
+    counties: pd.DataFrame,
+    fields: Sequence[str] = FIELDS,
+) -> pd.DataFrame:
+    """Mismatches between summed ``precincts`` rows and ``counties`` rows
+    (both as ``load`` returns them), one row per (key, field). A field is
+    only compared where the county side has a value for it."""
+    keys = list(KEYS)
+    shared = np.intersect1d(precincts["county"].unique(), counties["county"].unique())
+    counties = counties[counties["county"].isin(shared)]
+    # Contests the county results don't carry (committee seats, turnout
+    # rows in some years) can't be checked.
+    contests = list(KEYS[:-1])
+    listed = pd.MultiIndex.from_frame(counties[contests]).unique()
+    precincts = precincts[pd.MultiIndex.from_frame(precincts[contests]).isin(listed)]
+
+    summed = precincts.groupby(keys, sort=False)[list(fields)].sum(min_count=1)
+    printed = counties.groupby(keys, sort=False)[list(fields)].sum(min_count=1)
+    joined = summed.join(printed, how="outer", lsuffix="_precincts", rsuffix="_county")
+    p = joined[[f"{f}_precincts" for f in fields]].to_numpy(dtype=float)
+    c = joined[[f"{f}_county" for f in fields]].to_numpy(dtype=float)
+    in_precincts = joined.index.isin(summed.index)[:, None]
+    in_county = joined.index.isin(printed.index)[:, None]
+    # A candidate only one side lists is reported unless it got no votes there.
+    only_precincts = in_precincts & ~in_county & ~np.isnan(p) & (p != 0)
+    only_county = in_county & ~in_precincts & ~np.isnan(c) & (c != 0)
+    differ = ~np.isnan(c) & (np.nan_to_num(p) != c) & in_precincts & in_county
+    rows, cols = np.nonzero(only_precincts | only_county | differ)
+
+    out = joined.index[rows].to_frame(index=False)
+    out["field"] = np.asarray(fields, dtype=object)[cols]
+    out["precincts"] = p[rows, cols]
+    out["county_total"] = c[rows, cols]
+    return out.sort_values(keys, kind="stable", ignore_index=True)
+
+
+def check_election(
+    election: str,
+    directory,
+    county_file=None,
+    fields: Sequence[str] = FIELDS,
+) -> pd.DataFrame:
+    """``crosscheck`` every precinct file of ``election`` in ``directory``
+    against the per-county county files there, or ``county_file``."""
+    precinct_paths, county_paths = election_files(election, directory)
+    if county_file is not None:
+        county_paths = [Path(county_file)]
+    return crosscheck(load(precinct_paths, fields), load(county_paths, fields), fields)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("election", help="file prefix, e.g. 20260519__pa__primary")
+    parser.add_argument("-d", "--directory", default=".", help="directory with the county CSVs")
+    parser.add_argument("--county-file", help="statewide county-level CSV to compare against")
+    parser.add_argument("--fields", default=",".join(FIELDS), help="comma-separated vote columns")
+    parser.add_argument("--strict", action="store_true", help="exit 1 on any mismatch")
+    args = parser.parse_args(argv)
+
+    fields = [f.strip() for f in args.fields.split(",") if f.strip()]
+    mismatches = check_election(args.election, args.directory, args.county_file, fields)
+    counties = mismatches["county"].nunique()
+    print(f"{args.election}: {len(mismatches)} mismatches in {counties} counties")
+    if len(mismatches):
+        print(mismatches.to_string(index=False, max_rows=60), file=sys.stderr)
+    return 1 if args.strict and len(mismatches) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
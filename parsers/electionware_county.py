@@ -6,7 +6,6 @@ Parse county-level election results summary PDF and produce CSV output.
 import csv
 import re
 import sys
-import pdfplumber
 
 
 def parse_election_results(pdf_path, output_csv):
@@ -16,6 +15,8 @@ def parse_election_results(pdf_path, output_csv):
     results = []
     county = None
     
+    import pdfplumber
+
     with pdfplumber.open(pdf_path) as pdf:
         # Track current office and district
         current_office = None
@@ -152,7 +152,6 @@ class ElectionwarePDFPageParser:
 def pdf_to_csv(pdf, csv_writer, pdf_page_parser_clazz):
     csv_writer.writeheader()
     for page in pdf:
-        print(f'processing page {page.get_page_number()}')
         pdf_page_parser = pdf_page_parser_clazz(page)
         for row in pdf_page_parser:
             csv_writer.writerow(row)
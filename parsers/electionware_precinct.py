@@ -6,7 +6,6 @@ Parse Elk County election results PDF and produce CSV output.
 import csv
 import re
 import sys
-import pdfplumber
 
 
 def parse_election_results(pdf_path, output_csv):
@@ -17,6 +16,8 @@ def parse_election_results(pdf_path, output_csv):
     county = None
     precinct = None
     
+    import pdfplumber
+
     with pdfplumber.open(pdf_path) as pdf:
         # Track current office and district
         current_office = None
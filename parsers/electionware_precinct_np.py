@@ -11,19 +11,23 @@ Undervotes.
 
 Currently used by the Huntingdon, Cameron, and Snyder parsers.
 See ``NATURAL_PDF_EVALUATION.md`` for the evaluation that led to this
-module and which pieces of natural-pdf are used.
+module and which pieces of natural-pdf are used, and ``engine_bench.py``
+for timing it against a synthetic report rendered from a precinct CSV.
 """
 
 from __future__ import annotations
 
-import csv
 import re
 import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Iterable, Optional
 
-import natural_pdf as npdf
+import instrumentation
+import parse_manifest
+from row_table import RowTable, write_rows
+from text_backends import DEFAULT_BACKEND, document_page_texts, open_page_texts
 
 
 # ---------------------------------------------------------------------------
@@ -77,6 +81,14 @@ SMALL_WORDS = {"of", "the", "and", "for", "in", "to", "a", "at", "on"}
 SMALL_WORDS_NARROW = {"of", "the", "and", "for", "in", "to", "a"}
 ROMAN_RE = re.compile(r"^[IVX]+$")
 
+# Magisterial District Judge. Accepts both "MAGISTERIAL DISTRICT JUDGE
+# DISTRICT 20-3-01" (Huntingdon) and "Magisterial District Judge 58-3-2"
+# (Mifflin) — the "DISTRICT" keyword is optional and matching is
+# case-insensitive.
+MAGISTERIAL_RE = re.compile(
+    r"Magisterial District Judge(?:\s+District)?\s+(.+)$", re.IGNORECASE
+)
+
 
 # ---------------------------------------------------------------------------
 # String helpers.
@@ -192,9 +204,10 @@ def identity(s: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=None)
 def make_retention_re(style: str) -> re.Pattern[str]:
     """
-    Build the retention regex for a county.
+    Build the retention regex for a county (cached per style).
 
     Styles:
       "retention"       - "SUPREME COURT RETENTION - CHRISTINE DONOHUE"
@@ -278,6 +291,12 @@ class ElectionwareConfig:
         Callable[..., Iterable[tuple[str, str]]]
     ] = None
 
+    # Library that produces each page's text for the default block extractor:
+    # "natural_pdf", "pdfplumber", "pypdfium2" or "pdftotext" (see
+    # text_backends.py). Switch only after `text_backends.py <pdf>` reports
+    # the county's PDF as equivalent.
+    text_backend: str = DEFAULT_BACKEND
+
     # Fallback used when no other rule matches an office header.
     fallback_title_case: Callable[[str], str] = title_case
 
@@ -286,16 +305,107 @@ class ElectionwareConfig:
     # whose precinct PDFs omit party codes entirely.
     party_optional: bool = False
 
+    # Compiled office-normalization tables and per-header memo, built on the
+    # first ``normalize_office`` call (see ``_office_table``). Not a knob.
+    _office_table: Optional["_OfficeTable"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
 
 # ---------------------------------------------------------------------------
 # Office normalization.
 # ---------------------------------------------------------------------------
 
 
+class _OfficeTable:
+    """Everything ``normalize_office`` needs from a config, compiled once.
+
+    ``local_index`` maps each ``local_offices`` key to ``(position, norm)``;
+    ``match_word_prefix``/``match_word_suffix`` probe it at every word
+    boundary of a header instead of scanning the whole list with
+    ``startswith``/``endswith``, keeping the list-order precedence. ``memos`` caches finished
+    results per raw header (office headers repeat in every precinct); the
+    primary engine keeps its own namespace there.
+    """
+
+    def __init__(self, config: ElectionwareConfig):
+        self.retention_re = make_retention_re(config.retention_style)
+        self.local_index = build_word_index(config.local_offices)
+        self.memos: dict[str, dict[str, tuple[str, str]]] = {}
+
+    def memo(self, namespace: str) -> dict[str, tuple[str, str]]:
+        return self.memos.setdefault(namespace, {})
+
+
+def _office_table(config: ElectionwareConfig) -> _OfficeTable:
+    # Built lazily and kept on the config. Configs are treated as immutable
+    # once parsing starts; edit office tables before the first parse.
+    table = config._office_table
+    if table is None:
+        table = config._office_table = _OfficeTable(config)
+    return table
+
+
+def build_word_index(pairs: Iterable[tuple[str, object]]) -> dict[str, tuple[int, object]]:
+    """Index ``(key, value)`` pairs as ``key -> (position, value)``; the
+    first occurrence of a duplicated key wins, as it would in a list scan."""
+    index: dict[str, tuple[int, object]] = {}
+    for pos, (key, value) in enumerate(pairs):
+        index.setdefault(key, (pos, value))
+    return index
+
+
+def match_word_prefix(
+    text: str, index: dict[str, tuple[int, object]]
+) -> Optional[tuple[int, object]]:
+    """Return ``(prefix_len, value)`` for the earliest-listed key where
+    ``text == key`` or ``text.startswith(key + " ")``, else None."""
+    best = index.get(text)
+    best_len = len(text)
+    pos = text.find(" ")
+    while pos != -1:
+        hit = index.get(text[:pos])
+        if hit is not None and (best is None or hit[0] < best[0]):
+            best, best_len = hit, pos
+        pos = text.find(" ", pos + 1)
+    return None if best is None else (best_len, best[1])
+
+
+def match_word_suffix(
+    text: str, index: dict[str, tuple[int, object]]
+) -> Optional[tuple[int, object]]:
+    """Return ``(suffix_start, value)`` for the earliest-listed key where
+    ``text == key`` or ``text.endswith(" " + key)``, else None."""
+    best = index.get(text)
+    best_start = 0
+    pos = text.find(" ")
+    while pos != -1:
+        hit = index.get(text[pos + 1:])
+        if hit is not None and (best is None or hit[0] < best[0]):
+            best, best_start = hit, pos + 1
+        pos = text.find(" ", pos + 1)
+    return None if best is None else (best_start, best[1])
+
+
 def normalize_office(raw: str, config: ElectionwareConfig) -> tuple[str, str]:
-    """Return (office, district) for a raw office header line."""
-    line = raw.strip()
+    """Return (office, district) for a raw office header line.
 
+    Memoized per config: each distinct header is normalized once per run.
+    """
+    line = raw.strip()
+    table = _office_table(config)
+    memo = table.memo("general")
+    result = memo.get(line)
+    if result is None:
+        with instrumentation.phase("office_normalization"):
+            result = memo[line] = _normalize_office_line(line, config, table)
+        instrumentation.count("office_memo_misses")
+    return result
+
+
+def _normalize_office_line(
+    line: str, config: ElectionwareConfig, table: _OfficeTable
+) -> tuple[str, str]:
     if line in config.exact_offices:
         return config.exact_offices[line]
 
@@ -306,7 +416,7 @@ def normalize_office(raw: str, config: ElectionwareConfig) -> tuple[str, str]:
             return result
 
     # Retention.
-    m = make_retention_re(config.retention_style).match(line)
+    m = table.retention_re.match(line)
     if m:
         court = m.group(1).capitalize()
         tail = m.group(2).strip()
@@ -324,16 +434,8 @@ def normalize_office(raw: str, config: ElectionwareConfig) -> tuple[str, str]:
     ):
         return ("Judge of the Court of Common Pleas", "")
 
-    # Magisterial District Judge. Accepts both "MAGISTERIAL DISTRICT JUDGE
-    # DISTRICT 20-3-01" (Huntingdon) and "Magisterial District Judge 58-3-2"
-    # (Mifflin) — the "DISTRICT" keyword is optional and matching is
-    # case-insensitive.
     if config.include_magisterial:
-        m = re.match(
-            r"Magisterial District Judge(?:\s+District)?\s+(.+)$",
-            line,
-            re.IGNORECASE,
-        )
+        m = MAGISTERIAL_RE.match(line)
         if m:
             return ("Magisterial District Judge", m.group(1).strip())
 
@@ -345,36 +447,35 @@ def normalize_office(raw: str, config: ElectionwareConfig) -> tuple[str, str]:
 
     # Local offices.
     if config.local_office_orientation == "prefix":
-        for prefix, norm in config.local_offices:
-            if line == prefix:
-                return (norm, "")
-            if line.startswith(prefix + " "):
-                remainder = line[len(prefix):].strip().split()
-                years: Optional[str] = None
-                if remainder:
-                    # Leading term token (Potter: "COUNCILMAN 4yr ABBOTT TWP").
-                    tm = config.term_token_re.match(remainder[0])
-                    if tm:
-                        years = tm.group(1)
-                        remainder = remainder[1:]
-                    else:
-                        # Trailing term token (Tioga: "SUPERVISOR Bloss
-                        # Township 6yr"). Only checked if leading didn't
-                        # match so counties that support either style work.
-                        tm_trail = config.term_token_re.match(remainder[-1])
-                        if tm_trail:
-                            years = tm_trail.group(1)
-                            remainder = remainder[:-1]
-                if years is not None and not config.drop_term_token:
-                    office = f"{norm} ({years} Year)"
+        hit = match_word_prefix(line, table.local_index)
+        if hit is not None:
+            prefix_len, norm = hit
+            remainder = line[prefix_len:].strip().split()
+            years: Optional[str] = None
+            if remainder:
+                # Leading term token (Potter: "COUNCILMAN 4yr ABBOTT TWP").
+                tm = config.term_token_re.match(remainder[0])
+                if tm:
+                    years = tm.group(1)
+                    remainder = remainder[1:]
                 else:
-                    office = norm
-                district = (
-                    config.municipality_normalizer(" ".join(remainder))
-                    if remainder
-                    else ""
-                )
-                return (office, district)
+                    # Trailing term token (Tioga: "SUPERVISOR Bloss
+                    # Township 6yr"). Only checked if leading didn't
+                    # match so counties that support either style work.
+                    tm_trail = config.term_token_re.match(remainder[-1])
+                    if tm_trail:
+                        years = tm_trail.group(1)
+                        remainder = remainder[:-1]
+            if years is not None and not config.drop_term_token:
+                office = f"{norm} ({years} Year)"
+            else:
+                office = norm
+            district = (
+                config.municipality_normalizer(" ".join(remainder))
+                if remainder
+                else ""
+            )
+            return (office, district)
     elif config.local_office_orientation == "suffix":
         # Optionally strip a trailing term token ("4YR", "2yr", etc.).
         work = line
@@ -385,14 +486,10 @@ def normalize_office(raw: str, config: ElectionwareConfig) -> tuple[str, str]:
             if tm:
                 trailing_years = tm.group(1)
                 work = " ".join(tokens[:-1])
-        for suffix, norm in config.local_offices:
-            prefix_text: Optional[str] = None
-            if work == suffix:
-                prefix_text = ""
-            elif work.endswith(" " + suffix):
-                prefix_text = work[: -len(suffix)].strip()
-            if prefix_text is None:
-                continue
+        hit = match_word_suffix(work, table.local_index)
+        if hit is not None:
+            suffix_start, norm = hit
+            prefix_text = work[:suffix_start].strip()
             if trailing_years is not None and not config.drop_term_token:
                 office = f"{norm} ({trailing_years} Year)"
             else:
@@ -415,59 +512,102 @@ def normalize_office(raw: str, config: ElectionwareConfig) -> tuple[str, str]:
 # ---------------------------------------------------------------------------
 
 
+STATISTICS_MARKERS = ("Statistics", "STATISTICS")
+
+
+def _is_statistics_marker(line: str) -> bool:
+    # Accept both "Statistics" (title case; most counties) and "STATISTICS"
+    # (Juniata), even when column-header text runs into the same visual row
+    # (Mifflin: "Statistics TOTAL ElectionMail VotesProvisional").
+    return any(word in STATISTICS_MARKERS for word in line.split())
+
+
+def _precinct_name_above(
+    lines: list[str], config: ElectionwareConfig
+) -> Optional[str]:
+    """Return the nearest line above a Statistics marker that isn't page
+    furniture (another marker, a ``skip_prefixes`` line, the county header)."""
+    for line in reversed(lines):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith(STATISTICS_MARKERS):
+            continue
+        if line.startswith(config.skip_prefixes):
+            continue
+        if line.endswith(config.county_header_suffix):
+            continue
+        return line
+    return None
+
+
+def segment_precinct_pages(
+    pages: Iterable[str], config: ElectionwareConfig
+) -> Iterable[tuple[str, str]]:
+    """Yield (precinct_name, text) tuples from page texts, in one pass.
+
+    A precinct block starts on the page carrying its "Statistics" marker and
+    runs through the page before the next marker's page; the precinct name
+    is the nearest real line above the marker. Pages before the first marker
+    are ignored. When two markers share a page, every block but the last one
+    started there is empty. Independent of natural-pdf so it can be tested
+    against plain text pages (see tests/test_electionware_rows.py).
+    """
+    name: Optional[str] = None
+    chunks: list[str] = []
+    for page_number, text in enumerate(pages, start=1):
+        lines = text.split("\n")
+        names: list[str] = []
+        for i, line in enumerate(lines):
+            if not _is_statistics_marker(line):
+                continue
+            above = _precinct_name_above(lines[:i], config)
+            if above is None:
+                raise RuntimeError(
+                    f"Could not find precinct name above Statistics on page {page_number}"
+                )
+            names.append(above)
+        if not names:
+            if name is not None:
+                chunks.append(text)
+            continue
+        if name is not None:
+            yield name, "\n".join(chunks)
+        for earlier in names[:-1]:
+            yield earlier, ""
+        name, chunks = names[-1], [text]
+    if name is None:
+        raise RuntimeError("No 'Statistics' markers found; wrong PDF format?")
+    yield name, "\n".join(chunks)
+
+
 def extract_precinct_blocks(
     pdf, config: ElectionwareConfig
 ) -> Iterable[tuple[str, str]]:
-    """Yield (precinct_name, text) tuples, one per precinct."""
-    # Accept both "Statistics" (title case; most counties) and "STATISTICS"
-    # (Juniata). natural-pdf's :contains is case-sensitive, so we query twice
-    # and merge.
-    stat_hits = [
-        el
-        for el in pdf.find_all('text:contains("Statistics")')
-        if el.text.strip() == "Statistics"
-    ] + [
-        el
-        for el in pdf.find_all('text:contains("STATISTICS")')
-        if el.text.strip() == "STATISTICS"
-    ]
-    if not stat_hits:
-        raise RuntimeError("No 'Statistics' markers found; wrong PDF format?")
-    # Re-sort by (page number, top) since we merged two result lists.
-    stat_hits.sort(key=lambda el: (el.page.number, el.top))
-
-    start_pages = [el.page.number for el in stat_hits]
-    precinct_names: list[str] = []
-    for el in stat_hits:
-        above_region = el.page.region(top=0, bottom=el.top)
-        above_text = (above_region.extract_text() or "").strip().split("\n")
-        name: Optional[str] = None
-        for line in reversed(above_text):
-            line = line.strip()
-            if not line:
-                continue
-            # Skip the "Statistics" marker even when column-header text
-            # runs into the same visual row (Mifflin: "Statistics TOTAL
-            # ElectionMail VotesProvisional").
-            if line.startswith("Statistics") or line.startswith("STATISTICS"):
-                continue
-            if line.startswith(config.skip_prefixes):
-                continue
-            if line.endswith(config.county_header_suffix):
-                continue
-            name = line
-            break
-        if name is None:
-            raise RuntimeError(
-                f"Could not find precinct name above Statistics on page {el.page.number}"
-            )
-        precinct_names.append(name)
+    """Yield (precinct_name, text) tuples, one per precinct, from an open
+    natural-pdf document. Each page's text is extracted exactly once."""
+    return segment_precinct_pages(document_page_texts(pdf), config)
+
+
+def precinct_blocks(pdf_path: Path, config: ElectionwareConfig) -> Iterable[tuple[str, str]]:
+    """Yield (precinct_name, text) tuples for ``pdf_path``, reading page text
+    with ``config.text_backend`` unless the config brings its own
+    natural-pdf based ``precinct_block_extractor``."""
+    if config.precinct_block_extractor is None:
+        return segment_precinct_pages(open_page_texts(pdf_path, config.text_backend), config)
+    if config.text_backend != DEFAULT_BACKEND:
+        raise ValueError(
+            f"{config.county}: precinct_block_extractor needs the natural_pdf "
+            f"text backend, not {config.text_backend!r}"
+        )
+    # Imported here, not at module level: natural-pdf pulls in pdfplumber,
+    # pandas, scikit-image etc. (~0.5s), which usage errors and callers that
+    # only need the config/normalization helpers shouldn't pay for.
+    import natural_pdf as npdf
 
-    total_pages = len(pdf.pages)
-    for i, (start, name) in enumerate(zip(start_pages, precinct_names)):
-        end = (start_pages[i + 1] - 1) if i + 1 < len(start_pages) else total_pages
-        chunks = [pdf.pages[p - 1].extract_text() or "" for p in range(start, end + 1)]
-        yield name, "\n".join(chunks)
+    with instrumentation.phase("pdf_open"):
+        pdf = npdf.PDF(str(pdf_path))
+    return config.precinct_block_extractor(pdf, config)
 
 
 # ---------------------------------------------------------------------------
@@ -475,56 +615,203 @@ def extract_precinct_blocks(
 # ---------------------------------------------------------------------------
 
 
-def parse_votes(tokens: list[str]) -> tuple[int, int, int, int]:
-    return tuple(int(t.replace(",", "")) for t in tokens)  # type: ignore[return-value]
+# Aggregate rows Electionware may print more than once per contest when a
+# long write-in list spans pages (see ``SplitAggregateRows``).
+SPLIT_AGGREGATE_CANDIDATES = frozenset({"Write-ins", "Overvotes", "Undervotes"})
 
+_DIGIT_RE = re.compile(r"\d")
 
-def parse_precinct_rows(
-    precinct: str, text: str, config: ElectionwareConfig
-) -> list[dict]:
-    rows: list[dict] = []
-    current_office: Optional[str] = None
-    current_district: str = ""
-    current_vote_for: int = 1
+# Vote-tail row heads that name an aggregate rather than a candidate.
+_AGGREGATE_HEAD_KINDS = {
+    "Write-In Totals": "write_in_totals",
+    "Not Assigned": "not_assigned",
+    "Overvotes": "overvotes",
+    "Undervotes": "undervotes",
+}
+
+_STAT_PREFIXES = ("Registered Voters - Total", "Ballots Cast - Total", "Ballots Cast - Blank")
+
+
+@dataclass
+class LineToken:
+    """One classified line of a precinct block.
+
+    ``kind`` is one of:
+
+    - ``skipped``: starts with a ``skip_prefixes`` entry (``vote_for`` is set
+      when it sits where an office header would)
+    - ``statistics``: the "Statistics"/"STATISTICS" marker
+    - ``header``: office header; ``vote_for`` is the N of the "Vote For N"
+      line that follows it
+    - ``registered`` / ``ballots_cast`` / ``ballots_blank``: statistics rows;
+      ``vals`` is empty when the numbers didn't parse
+    - ``yes_no``: retention/question answer; ``head`` is "Yes" or "No"
+    - ``party_candidate``: ``party`` is the upper-cased code, ``head`` the
+      name after it
+    - ``write_in_totals`` / ``write_in`` / ``not_assigned`` / ``overvotes`` /
+      ``undervotes``: aggregate and individual write-in rows
+    - ``candidate``: any other vote-tail row; ``head`` is the raw label
+    """
+
+    kind: str
+    text: str
+    vote_for: Optional[int] = None
+    head: str = ""
+    party: str = ""
+    vals: tuple[int, ...] = ()
 
-    lines = [ln.strip() for ln in text.split("\n")]
-    if config.line_preprocessor is not None:
-        lines = [config.line_preprocessor(ln) for ln in lines]
 
-    # Merge wrapped Write-In continuation lines: a line with no digits
-    # following a "Write-In:" line is treated as a continuation.
-    merged: list[str] = []
-    for ln in lines:
+def parse_votes(tokens: list[str]) -> tuple[int, int, int, int]:
+    return tuple([int(t.replace(",", "")) for t in tokens])  # type: ignore[return-value]
+
+
+def _merged_lines(text: str, config: ElectionwareConfig) -> Iterable[str]:
+    """Yield the non-empty lines of ``text``, stripped and preprocessed, with
+    wrapped Write-In continuation lines folded in: a line with no digits
+    following a "Write-In:" line is treated as a continuation."""
+    preprocess = config.line_preprocessor
+    current: Optional[str] = None
+    for ln in text.split("\n"):
+        ln = ln.strip()
+        if preprocess is not None:
+            ln = preprocess(ln)
         if (
-            merged
-            and merged[-1].startswith("Write-In:")
+            current
             and ln
-            and not re.search(r"\d", ln)
+            and current.startswith("Write-In:")
+            and not _DIGIT_RE.search(ln)
         ):
-            merged[-1] = merged[-1] + " " + ln
-        else:
-            merged.append(ln)
-    lines = merged
-
-    # Office headers = lines whose next non-empty line starts with "Vote For".
-    # Also capture the N (seats) from the "Vote For N" line so rows under
-    # the office can carry a vote_for column.
-    office_header_idx: dict[int, int] = {}
-    for i, ln in enumerate(lines):
-        if not ln:
+            current = current + " " + ln
             continue
-        for j in range(i + 1, len(lines)):
-            nxt = lines[j]
-            if not nxt:
-                continue
-            vf = VOTE_FOR_RE.match(nxt)
-            if vf:
-                office_header_idx[i] = int(vf.group(1))
-            break
+        if current:
+            yield current
+        current = ln
+    if current:
+        yield current
+
+
+def _classify_line(
+    line: str,
+    vote_for: Optional[int],
+    config: ElectionwareConfig,
+    vote_tail_re: re.Pattern[str],
+) -> Optional[LineToken]:
+    if line.startswith(config.skip_prefixes):
+        return LineToken("skipped", line, vote_for)
+    if line.startswith(("Statistics", "STATISTICS")):
+        return LineToken("statistics", line)
+    if vote_for is not None:
+        return LineToken("header", line, vote_for)
+
+    # Statistics rows.
+    if line.startswith(_STAT_PREFIXES):
+        if line.startswith("Registered Voters - Total"):
+            m = SINGLE_TAIL_RE.match(line)
+            vals = (int(m.group(2).replace(",", "")),) if m else ()
+            return LineToken("registered", line, vals=vals)
+        kind = "ballots_cast" if line.startswith("Ballots Cast - Total") else "ballots_blank"
+        m = vote_tail_re.match(line)
+        vals = parse_votes(m.groups()[1:]) if m else ()
+        return LineToken(kind, line, vals=vals)
+
+    m = vote_tail_re.match(line)
+    if m is None:
+        return None
+    head = m.group(1).strip()
+    vals = parse_votes(m.groups()[1:])
+
+    if head.upper() in ("YES", "NO"):
+        return LineToken("yes_no", line, head=head.upper().capitalize(), vals=vals)
+    pm = PARTY_RE.match(head)
+    if pm:
+        return LineToken(
+            "party_candidate", line, head=pm.group(2).strip(),
+            party=pm.group(1).upper(), vals=vals,
+        )
+    kind = _AGGREGATE_HEAD_KINDS.get(head)
+    if kind is None:
+        kind = "write_in" if head.startswith("Write-In:") else "candidate"
+    return LineToken(kind, line, head=head, vals=vals)
+
+
+def tokenize_precinct_lines(
+    text: str,
+    config: ElectionwareConfig,
+    vote_tail_re: re.Pattern[str] = VOTE_TAIL_RE,
+) -> Iterable[LineToken]:
+    """Classify each line of a precinct block once, in a single pass.
+
+    Office headers are the lines whose next non-empty line starts with
+    "Vote For"; the tokenizer holds back one line so that look-ahead costs a
+    single ``VOTE_FOR_RE`` match per line. Lines that are neither statistics
+    nor a vote-tail row (column headers, wrapped names) produce no token.
+    Shared by ``parse_precinct_rows`` and the primary engine's
+    ``parse_primary_precinct_rows``.
+    """
+    pending: Optional[str] = None
+    for line in _merged_lines(text, config):
+        if pending is not None:
+            vf = VOTE_FOR_RE.match(line) if line[0] in "Vv" else None
+            token = _classify_line(
+                pending, int(vf.group(1)) if vf else None, config, vote_tail_re
+            )
+            if token is not None:
+                yield token
+        pending = line
+    if pending is not None:
+        token = _classify_line(pending, None, config, vote_tail_re)
+        if token is not None:
+            yield token
+
+
+class SplitAggregateRows:
+    """Row sink that merges split aggregate subtotals as rows arrive.
+
+    Some reports print a "Write-In Totals"/"Overvotes"/"Undervotes"
+    subtotal partway through a long write-in candidate list that spans
+    multiple pages (each page repeats the office header), followed by more
+    write-in names or real candidate rows, then a second partial aggregate
+    for the same contest. Both partials are real and must be summed for the
+    true total rather than left as separate (and duplicate-looking) rows.
+    Merges into the *first* occurrence within a contiguous run of rows
+    sharing the same office, so a same-named office appearing again later
+    (after other offices) is never merged.
+    """
+
+    def __init__(self, fields: Iterable[str]) -> None:
+        self.rows = RowTable(fields)
+        self._office_key: Optional[tuple] = None
+        self._agg_index: dict[tuple, int] = {}
+
+    def append(self, row: dict) -> None:
+        office_key = (row["office"], row["district"])
+        if office_key != self._office_key:
+            self._office_key = office_key
+            self._agg_index = {}
+        if row["candidate"] in SPLIT_AGGREGATE_CANDIDATES:
+            key = (office_key, row["party"], row["candidate"])
+            idx = self._agg_index.get(key)
+            if idx is not None:
+                for fld in ("votes", "election_day", "mail", "provisional"):
+                    if fld in self.rows.fields:
+                        prev = self.rows.get(idx, fld)
+                        self.rows.set(idx, fld, str(int(prev or 0) + int(row.get(fld) or 0)))
+                return
+            self._agg_index[key] = len(self.rows)
+        self.rows.append(row)
+
+
+def parse_precinct_rows(
+    precinct: str, text: str, config: ElectionwareConfig
+) -> RowTable:
+    out = SplitAggregateRows(FIELDNAMES)
+    current_office: Optional[str] = None
+    current_district: str = ""
+    current_vote_for: int = 1
 
     def add(office, district, party, candidate, vals, vote_for=None):
         total, ed, mail, prov = vals
-        rows.append(
+        out.append(
             {
                 "county": config.county,
                 "precinct": precinct,
@@ -540,26 +827,20 @@ def parse_precinct_rows(
             }
         )
 
-    for idx, line in enumerate(lines):
-        if not line:
-            continue
-        if line.startswith(config.skip_prefixes):
-            continue
-        if line.startswith("Statistics") or line.startswith("STATISTICS"):
+    for tok in tokenize_precinct_lines(text, config):
+        kind = tok.kind
+        if kind in ("skipped", "statistics"):
             continue
 
-        if idx in office_header_idx:
-            office, district = normalize_office(line, config)
-            current_office = office
-            current_district = district
-            current_vote_for = office_header_idx[idx]
+        if kind == "header":
+            current_office, current_district = normalize_office(tok.text, config)
+            current_vote_for = tok.vote_for
             continue
 
         # Statistics rows — no vote_for (not a contest).
-        if line.startswith("Registered Voters - Total"):
-            m = SINGLE_TAIL_RE.match(line)
-            if m:
-                rows.append(
+        if kind == "registered":
+            if tok.vals:
+                out.append(
                     {
                         "county": config.county,
                         "precinct": precinct,
@@ -567,7 +848,7 @@ def parse_precinct_rows(
                         "district": "",
                         "party": "",
                         "candidate": "",
-                        "votes": int(m.group(2).replace(",", "")),
+                        "votes": tok.vals[0],
                         "election_day": "",
                         "mail": "",
                         "provisional": "",
@@ -575,92 +856,35 @@ def parse_precinct_rows(
                     }
                 )
             continue
-        if line.startswith("Ballots Cast - Total"):
-            m = VOTE_TAIL_RE.match(line)
-            if m:
-                vals = parse_votes([m.group(i) for i in (2, 3, 4, 5)])
-                add("Ballots Cast", "", "", "", vals)
+        if kind == "ballots_cast":
+            if tok.vals:
+                add("Ballots Cast", "", "", "", tok.vals)
             continue
-        if line.startswith("Ballots Cast - Blank"):
-            m = VOTE_TAIL_RE.match(line)
-            if m:
-                vals = parse_votes([m.group(i) for i in (2, 3, 4, 5)])
-                add("Ballots Cast Blank", "", "", "", vals)
+        if kind == "ballots_blank":
+            if tok.vals:
+                add("Ballots Cast Blank", "", "", "", tok.vals)
             continue
 
-        vote_m = VOTE_TAIL_RE.match(line)
-        if vote_m is None:
-            continue
-
-        head = vote_m.group(1).strip()
-        vals = parse_votes([vote_m.group(i) for i in (2, 3, 4, 5)])
-
         if current_office is None:
             continue
 
-        if head.upper() in ("YES", "NO"):
-            add(current_office, current_district, "", head.upper().capitalize(), vals, current_vote_for)
-            continue
-
-        pm = PARTY_RE.match(head)
-        if pm:
-            add(current_office, current_district, pm.group(1).upper(), pm.group(2).strip(), vals, current_vote_for)
-            continue
-
-        if head == "Write-In Totals":
-            add(current_office, current_district, "", "Write-ins", vals, current_vote_for)
-            continue
-        if head.startswith("Write-In:"):
-            continue
-        if head == "Not Assigned":
-            continue
-        if head == "Overvotes":
-            add(current_office, current_district, "", "Overvotes", vals, current_vote_for)
-            continue
-        if head == "Undervotes":
-            add(current_office, current_district, "", "Undervotes", vals, current_vote_for)
-            continue
-
-        # Party-optional counties (Centre): rows without a party prefix are
-        # real candidates. Anything that isn't a known aggregate row falls
-        # through to here and is emitted with an empty party.
-        if config.party_optional:
-            add(current_office, current_district, "", head, vals, current_vote_for)
-            continue
-
-    return _merge_split_aggregates(rows)
-
-
-def _merge_split_aggregates(rows: list[dict]) -> list[dict]:
-    """Some reports print a "Write-In Totals"/"Overvotes"/"Undervotes"
-    subtotal partway through a long write-in candidate list that spans
-    multiple pages (each page repeats the office header), followed by more
-    write-in names or real candidate rows, then a second partial aggregate
-    for the same contest. Both partials are real and must be summed for the
-    true total rather than left as separate (and duplicate-looking) rows.
-    Merges into the *first* occurrence within a contiguous run of rows
-    sharing the same office, so a same-named office appearing again later
-    (after other offices) is never merged."""
-    aggregate_candidates = {"Write-ins", "Overvotes", "Undervotes"}
-    merged: list[dict] = []
-    agg_index: dict[tuple, int] = {}
-    current_office_key: Optional[tuple] = None
-    for row in rows:
-        office_key = (row["office"], row["district"])
-        if office_key != current_office_key:
-            current_office_key = office_key
-            agg_index = {}
-        key = (row["office"], row["district"], row["party"], row["candidate"])
-        if row["candidate"] in aggregate_candidates and key in agg_index:
-            idx = agg_index[key]
-            prev = merged[idx]
-            for field in ("votes", "election_day", "mail", "provisional"):
-                prev[field] = str(int(prev.get(field) or 0) + int(row.get(field) or 0))
-        else:
-            merged.append(row)
-            if row["candidate"] in aggregate_candidates:
-                agg_index[key] = len(merged) - 1
-    return merged
+        if kind == "yes_no":
+            add(current_office, current_district, "", tok.head, tok.vals, current_vote_for)
+        elif kind == "party_candidate":
+            add(current_office, current_district, tok.party, tok.head, tok.vals, current_vote_for)
+        elif kind == "write_in_totals":
+            add(current_office, current_district, "", "Write-ins", tok.vals, current_vote_for)
+        elif kind == "overvotes":
+            add(current_office, current_district, "", "Overvotes", tok.vals, current_vote_for)
+        elif kind == "undervotes":
+            add(current_office, current_district, "", "Undervotes", tok.vals, current_vote_for)
+        elif kind == "candidate" and config.party_optional:
+            # Party-optional counties (Centre): rows without a party prefix
+            # are real candidates. Anything that isn't a known aggregate row
+            # falls through to here and is emitted with an empty party.
+            add(current_office, current_district, "", tok.head, tok.vals, current_vote_for)
+
+    return out.rows
 
 
 # ---------------------------------------------------------------------------
@@ -685,37 +909,49 @@ FIELDNAMES = [
 VOTE_FOR_RE = re.compile(r"^Vote For\s+(\d+)", re.IGNORECASE)
 
 
-def parse_pdf(pdf_path: Path, config: ElectionwareConfig) -> tuple[list[dict], int]:
-    pdf = npdf.PDF(str(pdf_path))
-    rows: list[dict] = []
+def parse_pdf(pdf_path: Path, config: ElectionwareConfig) -> tuple[RowTable, int]:
+    rows = RowTable(FIELDNAMES)
     precinct_count = 0
-    extractor = config.precinct_block_extractor or extract_precinct_blocks
-    for precinct_name, text in extractor(pdf, config):
+    for precinct_name, text in precinct_blocks(pdf_path, config):
         precinct_count += 1
         pretty = re.sub(r"\s{2,}", " ", config.prettify_precinct(precinct_name)).strip()
-        rows.extend(parse_precinct_rows(pretty, text, config))
+        with instrumentation.unit("precinct", pretty) as unit, instrumentation.phase("line_classification"):
+            block_rows = parse_precinct_rows(pretty, text, config)
+            unit.rows = len(block_rows)
+        rows.extend(block_rows)
+    instrumentation.count("rows", len(rows))
     return rows, precinct_count
 
 
-def write_csv(rows: list[dict], out_path: Path) -> None:
+def write_csv(rows: Iterable[dict], out_path: Path) -> None:
     with out_path.open("w", newline="") as fh:
-        writer = csv.DictWriter(fh, fieldnames=FIELDNAMES)
-        writer.writeheader()
-        writer.writerows(rows)
+        write_rows(fh, rows, FIELDNAMES)
 
 
 def run_cli(config: ElectionwareConfig, argv: Optional[list[str]] = None) -> None:
-    """Standard two-argument CLI for county parsers."""
-    argv = list(argv) if argv is not None else sys.argv
+    """Standard two-argument CLI for county parsers. ``--profile[=trace.json]``
+    reports where the run's time went (see ``instrumentation``);
+    ``--if-changed`` skips the run when neither the PDF, the county script
+    nor the engine changed since the output was written (see
+    ``parse_manifest``)."""
+    argv, profile = instrumentation.split_profile_arg(list(argv) if argv is not None else sys.argv)
+    argv, if_changed = parse_manifest.split_if_changed_arg(argv)
     if len(argv) != 3:
         script = Path(argv[0]).name if argv else "parser"
-        sys.exit(f"Usage: {script} <input.pdf> <output.csv>")
+        sys.exit(f"Usage: {script} <input.pdf> <output.csv> [--profile[=trace.json]] [--if-changed]")
     pdf_path = Path(argv[1])
     out_path = Path(argv[2])
     if not pdf_path.exists():
         sys.exit(f"Missing PDF: {pdf_path}")
-    rows, precinct_count = parse_pdf(pdf_path, config)
-    write_csv(rows, out_path)
+    if if_changed and parse_manifest.up_to_date(out_path, pdf_path):
+        print(f"{out_path} is up to date")
+        return
+    with instrumentation.session(profile, label=str(pdf_path)), \
+            parse_manifest.recording(out_path, pdf_path) as run:
+        rows, precinct_count = parse_pdf(pdf_path, config)
+        with instrumentation.phase("csv_write"):
+            write_csv(rows, out_path)
+        run.rows = len(rows)
     print(
         f"Wrote {len(rows)} rows across {precinct_count} precincts to {out_path}"
     )
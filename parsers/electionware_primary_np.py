@@ -19,29 +19,45 @@ Usage from a county script::
     CONFIG = PrimaryConfig(county="Juniata", ...)
     if __name__ == "__main__":
         run_cli(CONFIG)
+
+A county that publishes its primary in parts (a combined Democratic /
+Republican report read as two page ranges, or a report split across
+volumes) is parsed in one run into one CSV::
+
+    python pa_x_primary_2026_results_parser.py dem_rep.pdf:1-180 dem_rep.pdf:181- out.csv
+
+Each input is a pass (``PdfPass``: a PDF and an optional ``FIRST-LAST``
+page range). The passes share one ``text_backends.PageTextCache``, so each
+PDF is opened once and each page's text extracted once however many
+passes read it; their rows are written in pass order.
 """
 
 from __future__ import annotations
 
-import csv
 import re
 import sys
 from pathlib import Path
-from typing import Optional
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence
 
+import instrumentation
+import parse_manifest
+from row_table import RowTable, write_rows
+from text_backends import DEFAULT_BACKEND, PageTextCache
 from electionware_precinct_np import (
     PARTY_CODES,
-    PARTY_RE,
-    SINGLE_TAIL_RE,
-    VOTE_FOR_RE,
     VOTE_TAIL_RE,
     ElectionwareConfig,
-    _merge_split_aggregates,
-    extract_precinct_blocks,
+    SplitAggregateRows,
+    _office_table,
+    build_word_index,
+    match_word_prefix,
     normalize_office,
-    parse_votes,
+    precinct_blocks,
+    segment_precinct_pages,
+    tokenize_precinct_lines,
 )
-import natural_pdf as npdf
+from office_normalizer import office_aliases
 
 
 # 2024 primary file convention (matches the existing Adams/Chester 2024
@@ -93,42 +109,23 @@ DISTRICT_ORDINAL_RE = re.compile(
     r"\b(\d+)(?:ST|ND|RD|TH)\s+DISTRICT\b", re.IGNORECASE
 )
 
-# Standard 2024 PA primary statewide / federal / legislative office names
-# (the raw all-caps text after the party code is stripped). Values are
-# (normalized_office, extract_district?) — when extract_district is True,
-# a trailing ordinal district is pulled out of the header into ``district``.
+# Shared aliases these primary reports never use as an office header:
+# electors are only on general-election ballots, and "STATE REPRESENTATIVE"
+# is a county summary spelling. Left out so the engine keeps the office
+# set it had before the table was shared.
+NON_PRIMARY_ALIASES = frozenset({"PRESIDENTIAL ELECTORS", "STATE REPRESENTATIVE"})
+
+# Standard PA primary statewide / federal / legislative office names (the
+# raw all-caps text after the party code is stripped), from the shared table
+# in ``constants/offices.csv``. Values are (normalized_office,
+# extract_district?) — when extract_district is True, a trailing ordinal
+# district is pulled out of the header into ``district``.
 STATEWIDE_OFFICES: dict[str, tuple[str, bool]] = {
-    "PRESIDENT OF THE UNITED STATES": ("President", False),
-    "UNITED STATES SENATOR": ("U.S. Senate", False),
-    "GOVERNOR": ("Governor", False),
-    "LIEUTENANT GOVERNOR": ("Lieutenant Governor", False),
-    "LT. GOVERNOR": ("Lieutenant Governor", False),
-    "LT GOVERNOR": ("Lieutenant Governor", False),
-    "ATTORNEY GENERAL": ("Attorney General", False),
-    "AUDITOR GENERAL": ("Auditor General", False),
-    "STATE TREASURER": ("State Treasurer", False),
-    "REPRESENTATIVE IN CONGRESS": ("U.S. House", True),
-    "REP. IN CONGRESS": ("U.S. House", True),
-    "REP IN CONGRESS": ("U.S. House", True),
-    "SENATOR IN THE GENERAL ASSEMBLY": ("State Senate", True),
-    "SENATOR IN GENERAL ASSEMBLY": ("State Senate", True),
-    "SEN. IN THE GEN. ASSEMBLY": ("State Senate", True),
-    "SEN IN THE GENERAL ASSEMBLY": ("State Senate", True),
-    "REPRESENTATIVE IN THE GENERAL ASSEMBLY": ("State House", True),
-    "REPRESENTATIVE IN GENERAL ASSEMBLY": ("State House", True),
-    "REP. IN GEN. ASSEMBLY": ("State House", True),
-    "REP IN GEN ASSEMBLY": ("State House", True),
-    "REP. IN THE GENERAL ASSEMBLY": ("State House", True),
-    "REP IN GEN. ASSEMBLY": ("State House", True),
-    "MEMBER OF DEMOCRATIC STATE COMMITTEE": ("Member of Democratic State Committee", False),
-    "MEMBER OF REPUBLICAN STATE COMMITTEE": ("Member of Republican State Committee", False),
-    "MEMBER OF THE DEMOCRATIC STATE COMMITTEE": ("Member of Democratic State Committee", False),
-    "MEMBER OF THE REPUBLICAN STATE COMMITTEE": ("Member of Republican State Committee", False),
-    "DEMOCRATIC STATE COMMITTEE": ("Member of Democratic State Committee", False),
-    "REPUBLICAN STATE COMMITTEE": ("Member of Republican State Committee", False),
+    **{alias: hit for alias, hit in office_aliases().items() if alias not in NON_PRIMARY_ALIASES},
     # Bare "STATE COMMITTEE" (Snyder) — resolved via current_party below.
     "STATE COMMITTEE": ("__STATE_COMMITTEE__", False),
 }
+_STATEWIDE_INDEX = build_word_index(STATEWIDE_OFFICES.items())
 
 
 def _split_primary_header(line: str) -> tuple[str, str]:
@@ -147,8 +144,8 @@ def _split_primary_header(line: str) -> tuple[str, str]:
 
 def parse_primary_precinct_rows(
     precinct: str, text: str, config: ElectionwareConfig
-) -> list[dict]:
-    rows: list[dict] = []
+) -> RowTable:
+    out = SplitAggregateRows(PRIMARY_FIELDNAMES)
     current_office: Optional[str] = None
     current_district: str = ""
     current_party: str = ""
@@ -165,37 +162,6 @@ def parse_primary_precinct_rows(
     vre = getattr(config, "vote_tail_re", None) or VOTE_TAIL_RE
     breakdown = getattr(config, "vote_breakdown", True)
 
-    lines = [ln.strip() for ln in text.split("\n")]
-    if config.line_preprocessor is not None:
-        lines = [config.line_preprocessor(ln) for ln in lines]
-
-    # Merge wrapped Write-In continuation lines.
-    merged: list[str] = []
-    for ln in lines:
-        if (
-            merged
-            and merged[-1].startswith("Write-In:")
-            and ln
-            and not re.search(r"\d", ln)
-        ):
-            merged[-1] = merged[-1] + " " + ln
-        else:
-            merged.append(ln)
-    lines = merged
-
-    office_header_idx: dict[int, int] = {}
-    for i, ln in enumerate(lines):
-        if not ln:
-            continue
-        for j in range(i + 1, len(lines)):
-            nxt = lines[j]
-            if not nxt:
-                continue
-            vf = VOTE_FOR_RE.match(nxt)
-            if vf:
-                office_header_idx[i] = int(vf.group(1))
-            break
-
     def add(office, district, party, candidate, vals, vote_for=None):
         # vals is a tuple of ints; length depends on the vote-tail regex.
         # 4 -> (total, ed, mail, prov); 1 -> (total,). Pad missing breakdown
@@ -204,7 +170,7 @@ def parse_primary_precinct_rows(
         ed = vals[1] if len(vals) > 1 and breakdown else ""
         mail = vals[2] if len(vals) > 2 and breakdown else ""
         prov = vals[3] if len(vals) > 3 and breakdown else ""
-        rows.append(
+        out.append(
             {
                 "county": config.county,
                 "precinct": precinct,
@@ -219,14 +185,13 @@ def parse_primary_precinct_rows(
             }
         )
 
-    for idx, line in enumerate(lines):
-        if not line:
-            continue
-        if line.startswith(config.skip_prefixes):
+    for tok in tokenize_precinct_lines(text, config, vre):
+        kind = tok.kind
+        if kind == "skipped":
             # A skipped office header (e.g. per-precinct committee race)
             # must clear the current-office context so subsequent candidate
             # rows aren't attributed to the previous contest.
-            if idx in office_header_idx:
+            if tok.vote_for is not None:
                 current_office = None
                 current_district = ""
             continue
@@ -234,13 +199,13 @@ def parse_primary_precinct_rows(
         # a multi-page precinct block (Mercer). Skip lines that match the
         # precinct name so they aren't misread as candidate rows under the
         # previous page's last office.
-        if precinct and line == precinct:
+        if precinct and tok.text == precinct:
             continue
-        if line.startswith("Statistics") or line.startswith("STATISTICS"):
+        if kind == "statistics":
             continue
 
-        if idx in office_header_idx:
-            party, rest = _split_primary_header(line)
+        if kind == "header":
+            party, rest = _split_primary_header(tok.text)
             # Section-based party tracking (Snyder 2026 primary): some
             # reports prefix only the first office in a party section
             # ("DEM GOVERNOR") and leave subsequent offices un-prefixed
@@ -256,13 +221,12 @@ def parse_primary_precinct_rows(
                           else "Member of Democratic State Committee")
             current_office = office
             current_district = district
-            current_vote_for = office_header_idx[idx]
+            current_vote_for = tok.vote_for
             continue
 
-        if line.startswith("Registered Voters - Total"):
-            m = SINGLE_TAIL_RE.match(line)
-            if m and not emitted_registered_voters:
-                rows.append(
+        if kind == "registered":
+            if tok.vals and not emitted_registered_voters:
+                out.append(
                     {
                         "county": config.county,
                         "precinct": precinct,
@@ -270,7 +234,7 @@ def parse_primary_precinct_rows(
                         "district": "",
                         "party": "",
                         "candidate": "",
-                        "votes": int(m.group(2).replace(",", "")),
+                        "votes": tok.vals[0],
                         "election_day": "",
                         "provisional": "",
                         "absentee": "",
@@ -278,86 +242,52 @@ def parse_primary_precinct_rows(
                 )
                 emitted_registered_voters = True
             continue
-        if line.startswith("Ballots Cast - Total"):
-            m = vre.match(line)
-            if m:
-                vals = parse_votes(list(m.groups()[1:]))
-                add("Ballots Cast", "", "", "", vals)
-            continue
-        if line.startswith("Ballots Cast - Blank"):
-            m = vre.match(line)
-            if m:
-                vals = parse_votes(list(m.groups()[1:]))
-                add("Ballots Cast Blank", "", "", "", vals)
+        if kind == "ballots_cast":
+            if tok.vals:
+                add("Ballots Cast", "", "", "", tok.vals)
             continue
-
-        vote_m = vre.match(line)
-        if vote_m is None:
+        if kind == "ballots_blank":
+            if tok.vals:
+                add("Ballots Cast Blank", "", "", "", tok.vals)
             continue
 
-        head = vote_m.group(1).strip()
-        vals = parse_votes(list(vote_m.groups()[1:]))
-
-        if current_office is None:
+        if current_office is None or kind == "write_in":
             continue
 
-        if head.upper() in ("YES", "NO"):
+        if kind == "party_candidate":
             add(
                 current_office,
                 current_district,
-                current_party,
-                head.upper().capitalize(),
-                vals,
+                tok.party,
+                _finalize_candidate(tok.head),
+                tok.vals,
                 current_vote_for,
             )
-            continue
-
-        pm = PARTY_RE.match(head)
-        if pm:
+        elif kind == "candidate":
+            # No per-row party prefix: inherit the office-header party
+            # (primary). For party-optional counties (no header party
+            # either), emit empty.
             add(
                 current_office,
                 current_district,
-                pm.group(1).upper(),
-                _finalize_candidate(pm.group(2).strip()),
-                vals,
+                current_party,
+                _finalize_candidate(tok.head),
+                tok.vals,
                 current_vote_for,
             )
-            continue
-
-        if head == "Write-In Totals":
+        else:
+            # Yes/No and the aggregate rows keep their label and inherit
+            # the header party.
             add(
                 current_office,
                 current_district,
                 current_party,
-                "Write-In Totals",
-                vals,
+                tok.head,
+                tok.vals,
                 current_vote_for,
             )
-            continue
-        if head.startswith("Write-In:"):
-            continue
-        if head == "Not Assigned":
-            add(current_office, current_district, current_party, "Not Assigned", vals, current_vote_for)
-            continue
-        if head == "Overvotes":
-            add(current_office, current_district, current_party, "Overvotes", vals, current_vote_for)
-            continue
-        if head == "Undervotes":
-            add(current_office, current_district, current_party, "Undervotes", vals, current_vote_for)
-            continue
-
-        # No per-row party prefix: inherit the office-header party (primary).
-        # For party-optional counties (no header party either), emit empty.
-        add(
-            current_office,
-            current_district,
-            current_party,
-            _finalize_candidate(head),
-            vals,
-            current_vote_for,
-        )
 
-    return _merge_split_aggregates(rows)
+    return out.rows
 
 
 def _normalize_primary_office(rest: str, config: ElectionwareConfig) -> tuple[str, str]:
@@ -367,7 +297,18 @@ def _normalize_primary_office(rest: str, config: ElectionwareConfig) -> tuple[st
     where applicable), then falls through to the general engine's
     ``normalize_office`` so per-county ``exact_offices`` / ``local_offices``
     still handle local contests (township supervisor, school director, etc.).
+    Memoized per config alongside the general engine's office memo.
     """
+    memo = _office_table(config).memo("primary")
+    result = memo.get(rest)
+    if result is None:
+        with instrumentation.phase("office_normalization"):
+            result = memo[rest] = _normalize_primary_office_uncached(rest, config)
+        instrumentation.count("office_memo_misses")
+    return result
+
+
+def _normalize_primary_office_uncached(rest: str, config: ElectionwareConfig) -> tuple[str, str]:
     upper = rest.upper()
     dm = DISTRICT_ORDINAL_RE.search(upper)
     district = str(int(dm.group(1))) if dm else ""
@@ -377,54 +318,154 @@ def _normalize_primary_office(rest: str, config: ElectionwareConfig) -> tuple[st
         return (norm, district if extract else "")
     # Some reports omit "DISTRICT" and use just "5TH" — try matching the
     # base office name against the prefix of the header.
-    for key, (norm, extract) in STATEWIDE_OFFICES.items():
-        if office_key == key or office_key.startswith(key + " "):
-            return (norm, district if extract else "")
+    hit = match_word_prefix(office_key, _STATEWIDE_INDEX)
+    if hit is not None:
+        norm, extract = hit[1]
+        return (norm, district if extract else "")
     return normalize_office(rest, config)
 
 
-def parse_primary_pdf(
-    pdf_path: Path, config: ElectionwareConfig
-) -> tuple[list[dict], int]:
-    pdf = npdf.PDF(str(pdf_path))
-    rows: list[dict] = []
+def _parse_blocks(
+    blocks: Iterable[tuple[str, str]], config: ElectionwareConfig, rows: RowTable
+) -> int:
+    """Append the rows of each (precinct_name, text) block to ``rows``;
+    returns the number of blocks."""
     precinct_count = 0
-    extractor = config.precinct_block_extractor or extract_precinct_blocks
-    for precinct_name, text in extractor(pdf, config):
+    for precinct_name, text in blocks:
         precinct_count += 1
         pretty = re.sub(r"\s{2,}", " ", config.prettify_precinct(precinct_name)).strip()
-        rows.extend(parse_primary_precinct_rows(pretty, text, config))
+        with instrumentation.unit("precinct", pretty) as unit, instrumentation.phase("line_classification"):
+            block_rows = parse_primary_precinct_rows(pretty, text, config)
+            unit.rows = len(block_rows)
+        rows.extend(block_rows)
+    return precinct_count
+
+
+def parse_primary_pdf(
+    pdf_path: Path, config: ElectionwareConfig
+) -> tuple[RowTable, int]:
+    rows = RowTable(PRIMARY_FIELDNAMES)
+    precinct_count = _parse_blocks(precinct_blocks(pdf_path, config), config, rows)
+    instrumentation.count("rows", len(rows))
     return rows, precinct_count
 
 
-def write_primary_csv(rows: list[dict], out_path: Path) -> None:
+_PASS_RE = re.compile(r"^(?P<path>.+?):(?P<first>\d+)(?:-(?P<last>\d*))?$")
+
+
+@dataclass(frozen=True)
+class PdfPass:
+    """One input of a run: a PDF and the pages to read from it (1-based,
+    inclusive; ``last`` None for the end of the document)."""
+
+    path: Path
+    first: int = 1
+    last: Optional[int] = None
+
+    @classmethod
+    def parse(cls, arg: str) -> "PdfPass":
+        """``report.pdf``, ``report.pdf:5`` (page 5 only), ``report.pdf:5-40``
+        or ``report.pdf:5-`` (page 5 to the end). An existing file whose
+        name happens to end in ``:N`` is taken as a whole document."""
+        m = _PASS_RE.match(arg)
+        if m is None or Path(arg).exists():
+            return cls(Path(arg))
+        first = int(m.group("first"))
+        if m.group("last") is None:
+            last: Optional[int] = first
+        else:
+            last = int(m.group("last")) if m.group("last") else None
+        if first < 1 or (last is not None and last < first):
+            raise ValueError(f"Bad page range in {arg!r}")
+        return cls(Path(m.group("path")), first, last)
+
+    @property
+    def whole(self) -> bool:
+        return self.first == 1 and self.last is None
+
+    def __str__(self) -> str:
+        if self.whole:
+            return str(self.path)
+        return f"{self.path}:{self.first}-{'' if self.last is None else self.last}"
+
+
+def pass_blocks(
+    source: PdfPass, config: ElectionwareConfig, cache: PageTextCache
+) -> Iterable[tuple[str, str]]:
+    """``precinct_blocks`` for one pass, reading through ``cache``."""
+    if config.precinct_block_extractor is None:
+        return segment_precinct_pages(cache.pages(source.path, source.first, source.last), config)
+    if config.text_backend != DEFAULT_BACKEND:
+        raise ValueError(
+            f"{config.county}: precinct_block_extractor needs the natural_pdf "
+            f"text backend, not {config.text_backend!r}"
+        )
+    if not source.whole:
+        raise ValueError(
+            f"{config.county}: page ranges ({source}) need the standard block "
+            "extractor; the config's precinct_block_extractor reads whole documents"
+        )
+    return config.precinct_block_extractor(cache.document(source.path), config)
+
+
+def parse_primary_passes(
+    sources: Sequence[PdfPass], config: ElectionwareConfig
+) -> tuple[RowTable, int]:
+    """Rows of every pass, in order, as one table, with each PDF opened and
+    each page's text extracted once across all passes."""
+    cache = PageTextCache(config.text_backend)
+    rows = RowTable(PRIMARY_FIELDNAMES)
+    precinct_count = 0
+    for source in sources:
+        precinct_count += _parse_blocks(pass_blocks(source, config, cache), config, rows)
+    instrumentation.count("rows", len(rows))
+    return rows, precinct_count
+
+
+def write_primary_csv(rows: Iterable[dict], out_path: Path) -> None:
     with out_path.open("w", newline="") as fh:
-        writer = csv.DictWriter(fh, fieldnames=PRIMARY_FIELDNAMES)
-        writer.writeheader()
-        for r in rows:
-            writer.writerow({k: r.get(k, "") for k in PRIMARY_FIELDNAMES})
+        write_rows(fh, rows, PRIMARY_FIELDNAMES, extrasaction="ignore")
 
 
 def run_cli(config: ElectionwareConfig, argv: Optional[list[str]] = None) -> None:
-    argv = list(argv) if argv is not None else sys.argv
-    if len(argv) != 3:
+    """``<input.pdf>[:PAGES] ... <output.csv>``: one or more passes (see
+    ``PdfPass``) merged into one CSV."""
+    argv, profile = instrumentation.split_profile_arg(list(argv) if argv is not None else sys.argv)
+    argv, if_changed = parse_manifest.split_if_changed_arg(argv)
+    if len(argv) < 3:
         script = Path(argv[0]).name if argv else "parser"
-        sys.exit(f"Usage: {script} <input.pdf> <output.csv>")
-    pdf_path = Path(argv[1])
-    out_path = Path(argv[2])
-    if not pdf_path.exists():
-        sys.exit(f"Missing PDF: {pdf_path}")
-    rows, precinct_count = parse_primary_pdf(pdf_path, config)
-    write_primary_csv(rows, out_path)
+        sys.exit(
+            f"Usage: {script} <input.pdf>[:FIRST-LAST] [<input.pdf>[:FIRST-LAST] ...] <output.csv> "
+            "[--profile[=trace.json]] [--if-changed]"
+        )
+    try:
+        sources = [PdfPass.parse(arg) for arg in argv[1:-1]]
+    except ValueError as exc:
+        sys.exit(str(exc))
+    out_path = Path(argv[-1])
+    for source in sources:
+        if not source.path.exists():
+            sys.exit(f"Missing PDF: {source.path}")
+    pdf_paths = list(dict.fromkeys(source.path for source in sources))
+    # A plain one-PDF run records no options, as before multi-pass runs.
+    options = {} if len(sources) == 1 and sources[0].whole else {"passes": [str(s) for s in sources]}
+    if if_changed and parse_manifest.up_to_date(out_path, pdf_paths, options):
+        print(f"{out_path} is up to date")
+        return
+    with instrumentation.session(profile, label=", ".join(str(s) for s in sources)), \
+            parse_manifest.recording(out_path, pdf_paths, options) as run:
+        rows, precinct_count = parse_primary_passes(sources, config)
+        with instrumentation.phase("csv_write"):
+            write_primary_csv(rows, out_path)
+        run.rows = len(rows)
     print(
         f"Wrote {len(rows)} rows across {precinct_count} precincts to {out_path}"
     )
 
 
 # Re-export commonly used symbols so county scripts only need this one import.
-from dataclasses import dataclass
-
 __all__ = [
+    "PdfPass",
     "PrimaryConfig",
     "STATEWIDE_OFFICES",
     "run_cli",
@@ -27,11 +27,18 @@ repo to golden-test against:
 
 from __future__ import annotations
 
-import csv
 import re
 from dataclasses import dataclass
 from typing import Callable, Optional
 
+import instrumentation
+import parse_manifest
+from row_table import RowTable, write_rows
+from text_backends import DEFAULT_BACKEND, open_page_texts
+
+FIELDNAMES = ['county', 'precinct', 'office', 'district', 'party',
+              'candidate', 'vote_for', 'votes', 'election_day', 'mail', 'provisional']
+
 
 @dataclass(frozen=True)
 class ElectionwareRegexConfig:
@@ -47,6 +54,7 @@ class ElectionwareRegexConfig:
     dedup_write_in_totals: bool = False
     yesno_uppercase_candidate: bool = False
     yesno_pattern: str = r'(Yes|No)'  # Lackawanna matches YES/Yes/NO/No case variants
+    text_backend: str = DEFAULT_BACKEND  # page-text library; see text_backends.py
 
 
 def _build_regexes(config: ElectionwareRegexConfig):
@@ -91,14 +99,17 @@ def process_pages(pages, config: ElectionwareRegexConfig):
     fixtures without a real PDF (see tests/test_electionware_regex.py)."""
     candidate_re, yesno_re, write_in_totals_re, stats_line_re, vote_for_re = _build_regexes(config)
 
-    results = []
+    results = RowTable(FIELDNAMES)
     current_precinct = None
     current_office = None
     current_vote_for = '1'
     seen_stats = set()
     seen_write_in = set()
 
-    for lines in pages:
+    page_units = instrumentation.each_unit(
+        "page", pages, rows=lambda: len(results), phase="line_classification"
+    )
+    for lines in page_units:
         page_precinct = extract_precinct_from_page(lines, config)
         if page_precinct and page_precinct != current_precinct:
             current_precinct = page_precinct
@@ -208,15 +219,13 @@ def process_pages(pages, config: ElectionwareRegexConfig):
 
 
 def parse_electionware_regex_results(pdf_path, config: ElectionwareRegexConfig):
-    from natural_pdf import PDF
-
-    pdf = PDF(pdf_path)
-    total_pages = len(pdf.pages)
+    page_texts = open_page_texts(pdf_path, config.text_backend)
+    total_pages = len(page_texts)
     print(f"Total pages: {total_pages}")
 
     pages = []
-    for page_idx, page in enumerate(pdf.pages):
-        pages.append(page.extract_text().split('\n'))
+    for page_idx, text in enumerate(page_texts):
+        pages.append(text.split('\n'))
         if (page_idx + 1) % 200 == 0:
             print(f"  Processed {page_idx + 1} of {total_pages} pages...")
 
@@ -224,13 +233,8 @@ def parse_electionware_regex_results(pdf_path, config: ElectionwareRegexConfig):
 
 
 def write_csv(results, output_path):
-    fieldnames = ['county', 'precinct', 'office', 'district', 'party',
-                  'candidate', 'vote_for', 'votes', 'election_day', 'mail', 'provisional']
-
     with open(output_path, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(results)
+        write_rows(f, results, FIELDNAMES)
 
     print(f"Wrote {len(results)} results to {output_path}")
 
@@ -239,9 +243,10 @@ def run_cli(config: ElectionwareRegexConfig, argv=None):
     import sys
     from pathlib import Path
 
-    argv = argv if argv is not None else sys.argv[1:]
+    argv, profile = instrumentation.split_profile_arg(argv if argv is not None else sys.argv[1:])
+    argv, if_changed = parse_manifest.split_if_changed_arg(argv)
     if len(argv) != 2:
-        print(f"Usage: uv run python {sys.argv[0]} <input_pdf> <output_csv>")
+        print(f"Usage: uv run python {sys.argv[0]} <input_pdf> <output_csv> [--profile[=trace.json]] [--if-changed]")
         sys.exit(1)
 
     pdf_path, output_path = argv
@@ -250,6 +255,15 @@ def run_cli(config: ElectionwareRegexConfig, argv=None):
         print(f"Error: PDF file not found: {pdf_path}", file=sys.stderr)
         sys.exit(1)
 
+    if if_changed and parse_manifest.up_to_date(output_path, pdf_path):
+        print(f"{output_path} is up to date")
+        return
+
     print(f"Parsing {pdf_path}...")
-    results = parse_electionware_regex_results(pdf_path, config)
-    write_csv(results, output_path)
+    with instrumentation.session(profile, label=pdf_path), \
+            parse_manifest.recording(output_path, pdf_path) as run:
+        results = parse_electionware_regex_results(pdf_path, config)
+        instrumentation.count("rows", len(results))
+        run.rows = len(results)
+        with instrumentation.phase("csv_write"):
+            write_csv(results, output_path)
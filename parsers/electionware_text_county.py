@@ -6,57 +6,92 @@ Parse election results PDF (county summary) by extracting text with pdftotext an
 import csv
 import re
 import sys
-import subprocess
-import tempfile
-import os
+
+from line_classifier import LineClassifier, Rule
+from pdftotext_stream import LookaheadLines, pdftotext_lines
+
+MONTHS = r'(?:January|February|March|April|May|June|July|August|September|October|November|December)'
+
+# Line kinds, matched on the stripped line (``upper=True``: case-insensitively).
+LINES = LineClassifier([
+    # An office header that ends a STATISTICS block after a blank line.
+    Rule("office_after_blank", upper=True, prefixes=(
+        "JUDGE", "ATTORNEY", "DISTRICT ATTORNEY", "SHERIFF", "COUNTY", "SUPREME",
+        "SUPERIOR", "COMMONWEALTH",
+    )),
+    # An office header that ends a STATISTICS block.
+    Rule("office_start", upper=True, prefixes=(
+        "JUDGE", "ATTORNEY", "DISTRICT ATTORNEY", "SHERIFF", "AUDITOR", "STATE", "SENATOR",
+        "REP", "MAYOR", "COUNCIL", "SCHOOL", "SCH", "CONTROLLER", "TAX", "INSPECTOR",
+        "MAGISTERIAL", "MEMBER OF", "SUPERVISOR", "CONSTABLE", "COUNTY", "SUPREME",
+        "SUPERIOR", "COMMONWEALTH",
+    ), contains=(" SCH DIR ",), suffixes=(" RETENTION",)),
+    # Anything the office-header chain below could match; lines outside it
+    # (candidate rows, mostly) skip the chain. Add new office keywords here too.
+    Rule("office", upper=True, prefixes=(
+        "JUSTICE OF", "JUDGE", "ATTORNEY GENERAL", "AUDITOR", "STATE", "UNITED STATES SENATOR",
+        "COUNTY", "CLERK OF COURTS", "DISTRICT", "SHERIFF", "JURY COMMISSIONER",
+        "REPRESENTATIVE", "SENATOR", "PRESIDENTIAL ELECTORS", "SUPREME", "SUPERIOR",
+        "COMMONWEALTH", "COURT OF", "RET", "COMMON PLEAS", "REFERENDUM QUESTION",
+        "JUDICIAL RETENTION QUESTION", "BRADFORD CITY STUDY COMMISSION", "CHARTER AMENDMENT",
+        "PROTHONOTARY", "RECORDER OF DEEDS", "MAGISTERIAL", "SCHOOL", "SCH DIR",
+        "MEMBER OF COUNCIL", "COUNCIL", "COMMISSIONER -", "TOWNSHIP COMMISSIONER",
+        "DECREASE IN NUMBER OF MEMBERS OF", "WILLIAMS TOWNSHIP EARNED INCOME TAX REFERENDUM",
+        "CITY MAYOR", "MAYOR", "TAX COLLECTOR", "CONTROLLER", "CITY CONTROLLER",
+        "INSPECTOR OF ELECTION", "CONSTABLE", "SUPERVISOR",
+    ), contains=(
+        "REGISTER AND RECORDER", "REGISTER & RECORDER", "REGISTER OF WILLS",
+        "SCHOOL BOARD DIRECTOR", " SCH DIR ", " JUDGE OF ELECTIONS", " INSPECTOR OF ELECTIONS",
+        " SCHOOL DIRECTOR ", "AREA SCHOOL DIRECTOR", "CODE AMENDMENT", " MAYOR ", "BOROUGH",
+        " COUNCIL ", "COUNCIL PERSON", " AUDITOR", " TAX COLLECTOR", " CONSTABLE", " SUPERVISOR",
+    ), suffixes=(" RETENTION", " QUESTION")),
+    # Column labels and page headers inside a contest.
+    Rule("header", prefixes=(
+        "Vote For", "STATISTICS", "Election", "TOTAL", "Mail", "Provisional", "Day",
+        "Precinct Summary", "Total Votes", "Contest Totals", "Voter Turnout",
+        "Election Day Precincts",
+    ), patterns=(
+        # "November 4, 2025 Northumberland County"
+        rf'^{MONTHS}\s+\d+,\s+\d{{4}}',
+        # "NOVEMBER 4, 2025 CENTRE COUNTY" appearing mid-text
+        rf'{MONTHS}\s+\d+,\s+\d{{4}}\s+.*COUNTY',
+    )),
+    Rule("header", upper=True, prefixes=("VOTE FOR", "TOTAL VOTES", "CONTEST TOTALS", "PRECINCTS")),
+    # A date anywhere in the line, any case: a page header, never a candidate.
+    Rule("dated", patterns=(rf'(?i:{MONTHS}\s+\d+,?\s+\d{{4}})',)),
+])
+
+PERCENT = re.compile(r'^\d+(?:\.\d+)?%$')
+PARTY_ROW = re.compile(r'^([A-Z]{1,4}(?:/[A-Z]{1,4})*)\s+(.+?)\s+(\d+(?:,\d+)?)\s+(?:\d+(?:\.\d+)?%)?\s*(\d+(?:,\d+)?)\s+(\d+(?:,\d+)?)\s+(\d+(?:,\d+)?)$', re.IGNORECASE)
+NO_PARTY_ROW = re.compile(r'^(.+?)\s+(\d+(?:,\d+)?)\s+(?:\d+(?:\.\d+)?%)?\s+(\d+(?:,\d+)?)\s+(\d+(?:,\d+)?)\s+(\d+)$')
 
 
 def parse_election_results(pdf_path, output_csv, county_name=None):
-    """Parse the election results PDF by extracting text with pdftotext and writing to CSV.
+    """Parse the election results PDF by streaming pdftotext's output and writing to CSV.
     
     Args:
         pdf_path: Path to the PDF file
         output_csv: Path to the output CSV file
         county_name: Optional county name (titlecase). If provided, skips auto-detection.
     """
-    
-    # Create a temporary file for the extracted text
-    with tempfile.NamedTemporaryFile(mode='w+', suffix='.txt', delete=False) as temp_file:
-        temp_text_path = temp_file.name
-    
-    try:
-        # Extract text from PDF using pdftotext with -layout option
-        subprocess.run(['pdftotext', '-layout', pdf_path, temp_text_path], 
-                      check=True, capture_output=True, text=True)
-        
-        # Parse the extracted text
-        _parse_text_file(temp_text_path, output_csv, county_name)
-    
-    finally:
-        # Clean up temporary file
-        if os.path.exists(temp_text_path):
-            os.remove(temp_text_path)
+    _parse_lines(pdftotext_lines(pdf_path), output_csv, county_name)
 
 
 def _parse_text_file(text_path, output_csv, county_name=None):
-    
-    results = []
-    county = county_name  # Use provided county or extract from PDF header
-    current_office = None
-    current_district = None
-    office_count = {}  # Track occurrences of each office name for deduplication
-    
+    """Parse text previously saved with ``pdftotext -layout``."""
     with open(text_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    # Preprocess: join lines that were wrapped in the middle of words or numbers
-    # Only join short trailing fragments that appear to be part of the previous line
-    processed_lines = []
+        _parse_lines(f, output_csv, county_name)
+
+
+def _join_wrapped_lines(source):
+    """Yield lines with wrapped word/number fragments joined back on."""
+    lines = LookaheadLines(source)
     i = 0
-    while i < len(lines):
+    while lines.has(i):
+        lines.release(i)
         line = lines[i].rstrip()
         # Check if next line is a small continuation (wrapped word like "CENTRE\nCOUNTY" or number fragment like "7,84\n8")
-        while (i + 1 < len(lines) and 
+        while (lines.has(i + 1) and 
                lines[i + 1].strip() and
                not lines[i + 1][0].isspace() and
                len(lines[i + 1].rstrip()) < 20 and  # Small line, likely wrapped
@@ -67,23 +102,36 @@ def _parse_text_file(text_path, output_csv, county_name=None):
             i += 1
         # Also check for continuation lines that start with whitespace and contain only numbers/commas
         # These are wrapped vote numbers like " 1,319        4"
-        while (i + 1 < len(lines) and 
+        while (lines.has(i + 1) and 
                lines[i + 1].strip() and
                lines[i + 1][0].isspace() and
                re.match(r'^[\d\s,]+$', lines[i + 1].strip())):  # Only digits, commas, and spaces
             # Join with a space separator to maintain column alignment
             line = line + ' ' + lines[i + 1].strip()
             i += 1
-        processed_lines.append(line)
+        yield line
         i += 1
+
+
+def _parse_lines(source, output_csv, county_name=None):
+    
+    results = []
+    county = county_name  # Use provided county or extract from PDF header
+    current_office = None
+    current_district = None
+    office_count = {}  # Track occurrences of each office name for deduplication
     
-    lines = processed_lines
+    # Preprocess: join lines that were wrapped in the middle of words or numbers
+    # Only join short trailing fragments that appear to be part of the previous line
+    lines = LookaheadLines(_join_wrapped_lines(source))
     
     i = 0
-    while i < len(lines):
+    while lines.has(i):
+        lines.release(i - 1)  # only ever backs up one line
         line = lines[i].rstrip()
         stripped = line.strip()
         stripped_upper = stripped.upper()  # For case-insensitive comparisons
+        kinds = LINES.classify(stripped)
         
         # Extract county from header (appears after date or standalone)
         if county is None:
@@ -106,14 +154,14 @@ def _parse_text_file(text_path, output_csv, county_name=None):
                 # Could be a county name, check if it's followed by date context
                 potential_county = stripped
                 # Look ahead to see if next line has election year
-                if i + 1 < len(lines) and ('202' in lines[i + 1] or '2025' in lines[i + 1] or 'ELECTION' in lines[i + 1].upper()):
+                if lines.has(i + 1) and ('202' in lines[i + 1] or '2025' in lines[i + 1] or 'ELECTION' in lines[i + 1].upper()):
                     county = potential_county.title()
         
         # Parse STATISTICS section (county-level only) - case insensitive
         # "Statistics" may appear on the same line as other text
         if "STATISTICS" in stripped_upper or stripped_upper == "STATISTICS":
             i += 1
-            while i < len(lines):
+            while lines.has(i):
                 line = lines[i].rstrip()
                 stripped = line.strip()
                 
@@ -121,49 +169,16 @@ def _parse_text_file(text_path, output_csv, county_name=None):
                 if not stripped:
                     # Check if next non-empty line is an office
                     j = i + 1
-                    while j < len(lines) and not lines[j].strip():
+                    while lines.has(j) and not lines[j].strip():
                         j += 1
-                    if j < len(lines):
-                        next_line = lines[j].strip().upper()
-                        if (next_line.startswith("JUDGE") or 
-                            next_line.startswith("ATTORNEY") or
-                            next_line.startswith("DISTRICT ATTORNEY") or
-                            next_line.startswith("SHERIFF") or
-                            next_line.startswith("COUNTY") or
-                            next_line.startswith("SUPREME") or
-                            next_line.startswith("SUPERIOR") or
-                            next_line.startswith("COMMONWEALTH")):
-                            break
+                    if lines.has(j) and LINES.matches("office_after_blank", lines[j].strip()):
+                        break
                     i += 1
                     continue
                 
                 # Stop on office headers
                 stripped_upper = stripped.upper()
-                if (stripped_upper.startswith("JUDGE") or 
-                    stripped_upper.startswith("ATTORNEY") or
-                    stripped_upper.startswith("DISTRICT ATTORNEY") or
-                    stripped_upper.startswith("SHERIFF") or
-                    stripped_upper.startswith("AUDITOR") or
-                    stripped_upper.startswith("STATE") or
-                    stripped_upper.startswith("SENATOR") or
-                    stripped_upper.startswith("REP") or
-                    stripped_upper.startswith("MAYOR") or
-                    stripped_upper.startswith("COUNCIL") or
-                    stripped_upper.startswith("SCHOOL") or
-                    stripped_upper.startswith("SCH") or
-                    " SCH DIR " in stripped_upper or
-                    stripped_upper.startswith("CONTROLLER") or
-                    stripped_upper.startswith("TAX") or
-                    stripped_upper.startswith("INSPECTOR") or
-                    stripped_upper.startswith("MAGISTERIAL") or
-                    stripped_upper.startswith("MEMBER OF") or
-                    stripped_upper.startswith("SUPERVISOR") or
-                    stripped_upper.startswith("CONSTABLE") or
-                    stripped_upper.startswith("COUNTY") or
-                    stripped_upper.startswith("SUPREME") or
-                    stripped_upper.startswith("SUPERIOR") or
-                    stripped_upper.startswith("COMMONWEALTH") or
-                    stripped_upper.endswith(" RETENTION")):
+                if LINES.matches("office_start", stripped):
                     i -= 1  # Back up to process the office
                     break
                 
@@ -201,7 +216,9 @@ def _parse_text_file(text_path, output_csv, county_name=None):
             continue
         
         # Parse office headers (case-insensitive comparison)
-        if stripped_upper.startswith("JUSTICE OF SUPREME COURT "):
+        if "office" not in kinds:
+            pass
+        elif stripped_upper.startswith("JUSTICE OF SUPREME COURT "):
             judge_name = stripped[len("JUSTICE OF SUPREME COURT "):].strip()
             current_office = f"Supreme Court of Pennsylvania Retention Election - {judge_name.title()}" if judge_name else "Supreme Court of Pennsylvania Retention Election"
             current_district = ""
@@ -769,26 +786,7 @@ def _parse_text_file(text_path, output_csv, county_name=None):
         # Parse candidate lines
         if current_office and stripped:
             # Skip header lines and office lines
-            if (stripped.startswith("Vote For") or
-                stripped.startswith("STATISTICS") or
-                stripped.startswith("Election") or
-                stripped.startswith("TOTAL") or
-                stripped.startswith("Mail") or
-                stripped.startswith("Provisional") or
-                stripped.startswith("Day") or
-                stripped.startswith("Precinct Summary") or
-                stripped.startswith("Total Votes") or
-                stripped.startswith("Contest Totals") or
-                stripped.startswith("Voter Turnout") or
-                stripped.startswith("Election Day Precincts") or
-                stripped_upper.startswith("VOTE FOR") or
-                stripped_upper.startswith("TOTAL VOTES") or
-                stripped_upper.startswith("CONTEST TOTALS") or
-                stripped_upper.startswith("PRECINCTS") or
-                # Skip date patterns like "November 4, 2025 Northumberland County"
-                re.match(r'^(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d+,\s+\d{4}', stripped) or
-                # Skip "NOVEMBER 4, 2025 CENTRE COUNTY" patterns appearing mid-text
-                re.search(r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d+,\s+\d{4}\s+.*COUNTY', stripped)):
+            if "header" in kinds:
                 i += 1
                 continue
             
@@ -799,7 +797,7 @@ def _parse_text_file(text_path, output_csv, county_name=None):
             # Check for Yes/No votes (retention elections)
             if stripped_upper.startswith("YES") or stripped_upper.startswith("NO"):
                 # Remove percentages from parts before extracting votes
-                parts = [p for p in stripped.split() if not re.match(r'^\d+(?:\.\d+)?%$', p)]
+                parts = [p for p in stripped.split() if not PERCENT.match(p)]
                 if len(parts) >= 5:
                     candidate = parts[0]  # "YES" or "NO"
                     votes = [p.replace(',', '') for p in parts[-4:]]
@@ -809,7 +807,7 @@ def _parse_text_file(text_path, output_csv, county_name=None):
             # Check for Write-In Totals (skip the nested Write-In: Scattered details)
             elif stripped_upper.startswith("WRITE-IN TOTALS"):
                 # Remove percentages from parts before extracting votes
-                parts = [p for p in stripped.split() if not re.match(r'^\d+(?:\.\d+)?%$', p)]
+                parts = [p for p in stripped.split() if not PERCENT.match(p)]
                 if len(parts) >= 5:
                     votes = [p.replace(',', '') for p in parts[-4:]]
                     results.append([county, current_office, current_district,
@@ -823,7 +821,7 @@ def _parse_text_file(text_path, output_csv, county_name=None):
             # Check for Over Votes / Under Votes
             elif stripped_upper.startswith("OVER VOTES"):
                 # Remove percentages from parts before extracting votes
-                parts = [p for p in stripped.split() if not re.match(r'^\d+(?:\.\d+)?%$', p)]
+                parts = [p for p in stripped.split() if not PERCENT.match(p)]
                 if len(parts) >= 4:
                     votes = [p.replace(',', '') for p in parts[-4:]]
                     if len(votes) == 4:
@@ -832,7 +830,7 @@ def _parse_text_file(text_path, output_csv, county_name=None):
             
             elif stripped_upper.startswith("UNDER VOTES"):
                 # Remove percentages from parts before extracting votes
-                parts = [p for p in stripped.split() if not re.match(r'^\d+(?:\.\d+)?%$', p)]
+                parts = [p for p in stripped.split() if not PERCENT.match(p)]
                 if len(parts) >= 4:
                     votes = [p.replace(',', '') for p in parts[-4:]]
                     if len(votes) == 4:
@@ -846,7 +844,7 @@ def _parse_text_file(text_path, output_csv, county_name=None):
             # Check for party-candidate lines
             else:
                 # Skip lines that look like date headers appearing mid-file
-                if re.search(r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d+,?\s+\d{4}', stripped, re.IGNORECASE):
+                if "dated" in kinds:
                     i += 1
                     continue
                 
@@ -865,7 +863,7 @@ def _parse_text_file(text_path, output_csv, county_name=None):
                 }
 
                 # Match any 1-4 letter party code followed by a space, then candidate name
-                party_match = re.match(r'^([A-Z]{1,4}(?:/[A-Z]{1,4})*)\s+(.+?)\s+(\d+(?:,\d+)?)\s+(?:\d+(?:\.\d+)?%)?\s*(\d+(?:,\d+)?)\s+(\d+(?:,\d+)?)\s+(\d+(?:,\d+)?)$', stripped, re.IGNORECASE)
+                party_match = PARTY_ROW.match(stripped)
                 
                 if party_match:
                     party_raw = party_match.group(1).upper()
@@ -887,7 +885,7 @@ def _parse_text_file(text_path, output_csv, county_name=None):
                 else:
                     # Try pattern without party, may include percentage
                     # "No 12,184 59.37% 10,944 1,235 5" -> candidate="No", total=12184, election_day=10944, mail=1235, provisional=5
-                    no_party_match = re.match(r'^(.+?)\s+(\d+(?:,\d+)?)\s+(?:\d+(?:\.\d+)?%)?\s+(\d+(?:,\d+)?)\s+(\d+(?:,\d+)?)\s+(\d+)$', stripped)
+                    no_party_match = NO_PARTY_ROW.match(stripped)
                     if no_party_match:
                         candidate = no_party_match.group(1).strip()
                         total = no_party_match.group(2).replace(',', '')
@@ -6,33 +6,61 @@ Parse election results PDF by extracting text with pdftotext and producing CSV o
 import csv
 import re
 import sys
-import subprocess
-import tempfile
-import os
+
+from line_classifier import LineClassifier, Rule
+from pdftotext_stream import LookaheadLines, pdftotext_lines
+
+# Line kinds, matched on the stripped line.
+LINES = LineClassifier([
+    # A line that starts a precinct's results: the line before it names the precinct.
+    Rule("precinct_follower", prefixes=(
+        "STATISTICS", "Registered Voters", "JUDGE", "ATTORNEY", "AUDITOR", "STATE", "SENATOR",
+        "REP", "MAYOR", "COUNCIL", "SCHOOL", "CONTROLLER", "TAX", "INSPECTOR", "MAGISTERIAL",
+        "JUDICIAL", "MEMBER OF", "SUPERVISOR", "CONSTABLE",
+    )),
+    # Short lines that are vote rows or column labels, never precinct names.
+    Rule("not_precinct", prefixes=(
+        "Vote For", "Election", "TOTAL", "Mail", "Provisional", "Votes", "Yes", "No",
+        "Write-In", "Not Assigned", "Registered Voters", "Ballots Cast", "Voter Turnout",
+    )),
+    Rule("has_votes", patterns=(r'\d{1,3},?\s+\d{1,3}',)),
+    # An office header that ends a STATISTICS block.
+    Rule("office_start", prefixes=(
+        "JUDGE", "ATTORNEY", "AUDITOR", "STATE", "SENATOR", "REP", "MAYOR", "COUNCIL", "SCHOOL",
+        "CONTROLLER", "TAX", "INSPECTOR", "MAGISTERIAL", "MEMBER OF", "SUPERVISOR", "CONSTABLE",
+    )),
+    # Anything the office-header chain below could match; lines outside it
+    # (candidate rows, mostly) skip the chain. Add new office keywords here too.
+    Rule("office", prefixes=(
+        "SUPREME", "SUPERIOR", "COMMONWEALTH", "JUDGE", "ATTORNEY GENERAL", "AUDITOR",
+        "STATE TREASURER", "REPRESENTATIVE", "SENATOR", "MAGISTERIAL", "SCHOOL",
+        "MEMBER OF COUNCIL", "MAYOR", "TAX COLLECTOR", "CONTROLLER", "INSPECTOR OF ELECTIONS",
+        "JUDICIAL RETENTION", "SUPERVISOR", "CONSTABLE", "COMMISSIONER", "CHARTER AMENDMENT",
+        "REFERENDUM QUESTION", "RETAIN",
+    ), contains=(
+        " SCH DIR ", " COUNCIL ", "COUNCIL PERSON", "CITY MAYOR", " AUDITOR", " TAX COLLECTOR",
+        " CONSTABLE", " SUPERVISOR", " COMMISSIONER ",
+    ), suffixes=(" RETENTION", " QUESTION")),
+    # Column labels inside a contest.
+    Rule("header", prefixes=("Vote For", "STATISTICS", "Election", "TOTAL", "Mail", "Provisional", "Day")),
+])
+
+PARTY_ROW = re.compile(r'^([A-Z]{2,4}(?:/[A-Z]{2,4})?)\s+(.+?)\s+(\d+(?:,\d+)?)\s+(?:\d+(?:\.\d+)?%)?\s*(\d+(?:,\d+)?)\s+(\d+(?:,\d+)?)\s+(\d+(?:,\d+)?)$')
+NO_PARTY_ROW = re.compile(r'^(.+?)\s+(\d+(?:,\d+)?)\s+(?:\d+(?:\.\d+)?%)?\s+(\d+(?:,\d+)?)\s+(\d+(?:,\d+)?)\s+(\d+)$')
 
 
 def parse_election_results(pdf_path, output_csv):
-    """Parse the election results PDF by extracting text with pdftotext and writing to CSV."""
-    
-    # Create a temporary file for the extracted text
-    with tempfile.NamedTemporaryFile(mode='w+', suffix='.txt', delete=False) as temp_file:
-        temp_text_path = temp_file.name
-    
-    try:
-        # Extract text from PDF using pdftotext with -layout option
-        subprocess.run(['pdftotext', '-layout', pdf_path, temp_text_path], 
-                      check=True, capture_output=True, text=True)
-        
-        # Parse the extracted text
-        _parse_text_file(temp_text_path, output_csv)
-    
-    finally:
-        # Clean up temporary file
-        if os.path.exists(temp_text_path):
-            os.remove(temp_text_path)
+    """Parse the election results PDF by streaming pdftotext's output and writing to CSV."""
+    _parse_lines(pdftotext_lines(pdf_path), output_csv)
 
 
 def _parse_text_file(text_path, output_csv):
+    """Parse text previously saved with ``pdftotext -layout``."""
+    with open(text_path, 'r', encoding='utf-8') as f:
+        _parse_lines(f, output_csv)
+
+
+def _parse_lines(source, output_csv):
     
     results = []
     county = None
@@ -40,13 +68,14 @@ def _parse_text_file(text_path, output_csv):
     current_office = None
     current_district = None
     
-    with open(text_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+    lines = LookaheadLines(source)
     
     i = 0
-    while i < len(lines):
+    while lines.has(i):
+        lines.release(i - 1)  # only ever backs up one line
         line = lines[i].rstrip()
         stripped = line.strip()
+        kinds = LINES.classify(stripped)
         
         # Extract county from header (appears after date)
         if county is None:
@@ -56,55 +85,22 @@ def _parse_text_file(text_path, output_csv):
         
         # Extract precinct name (appears on its own line, before STATISTICS or JUDGE/SCHOOL/etc.)
         # Precinct names are short lines (usually < 60 chars) that precede either STATISTICS or office names
-        if stripped and len(stripped) < 60 and not re.search(r'\d{1,3},?\s+\d{1,3}', line):
+        if stripped and len(stripped) < 60 and "has_votes" not in kinds:
             # Check if this might be a precinct name by looking at next meaningful line
             j = i + 1
-            while j < len(lines) and not lines[j].strip():
+            while lines.has(j) and not lines[j].strip():
                 j += 1  # Skip empty lines
             
-            if j < len(lines):
-                next_line = lines[j].strip()
-                # Precinct if followed by office or STATISTICS
-                if (next_line.startswith("STATISTICS") or
-                    next_line.startswith("Registered Voters") or
-                    next_line.startswith("JUDGE") or
-                    next_line.startswith("ATTORNEY") or
-                    next_line.startswith("AUDITOR") or
-                    next_line.startswith("STATE") or
-                    next_line.startswith("SENATOR") or
-                    next_line.startswith("REP") or
-                    next_line.startswith("MAYOR") or
-                    next_line.startswith("COUNCIL") or
-                    next_line.startswith("SCHOOL") or
-                    next_line.startswith("CONTROLLER") or
-                    next_line.startswith("TAX") or
-                    next_line.startswith("INSPECTOR") or
-                    next_line.startswith("MAGISTERIAL") or
-                    next_line.startswith("JUDGE OF") or
-                    next_line.startswith("JUDICIAL") or
-                    next_line.startswith("MEMBER OF") or
-                    next_line.startswith("SUPERVISOR") or
-                    next_line.startswith("CONSTABLE")):
-                    # Make sure this doesn't look like vote numbers or column headers
-                    if (not stripped.startswith("Vote For") and
-                        not stripped.startswith("Election") and
-                        not stripped.startswith("TOTAL") and
-                        not stripped.startswith("Mail") and
-                        not stripped.startswith("Provisional") and
-                        not stripped.startswith("Votes") and
-                        not stripped.startswith("Yes") and
-                        not stripped.startswith("No") and
-                        not stripped.startswith("Write-In") and
-                        not stripped.startswith("Not Assigned") and
-                        not stripped.startswith("Registered Voters") and
-                        not stripped.startswith("Ballots Cast") and
-                        not stripped.startswith("Voter Turnout")):
-                        precinct = stripped
+            # Precinct if followed by office or STATISTICS
+            if lines.has(j) and LINES.matches("precinct_follower", lines[j].strip()):
+                # Make sure this doesn't look like vote numbers or column headers
+                if "not_precinct" not in kinds:
+                    precinct = stripped
         
         # Parse STATISTICS section
         if stripped == "STATISTICS":
             i += 1
-            while i < len(lines):
+            while lines.has(i):
                 line = lines[i].rstrip()
                 stripped = line.strip()
                 
@@ -112,22 +108,7 @@ def _parse_text_file(text_path, output_csv):
                     break
                 
                 # Stop on office headers
-                if (stripped.startswith("JUDGE") or 
-                    stripped.startswith("ATTORNEY") or
-                    stripped.startswith("AUDITOR") or
-                    stripped.startswith("STATE") or
-                    stripped.startswith("SENATOR") or
-                    stripped.startswith("REP") or
-                    stripped.startswith("MAYOR") or
-                    stripped.startswith("COUNCIL") or
-                    stripped.startswith("SCHOOL") or
-                    stripped.startswith("CONTROLLER") or
-                    stripped.startswith("TAX") or
-                    stripped.startswith("INSPECTOR") or
-                    stripped.startswith("MAGISTERIAL") or
-                    stripped.startswith("MEMBER OF") or
-                    stripped.startswith("SUPERVISOR") or
-                    stripped.startswith("CONSTABLE")):
+                if LINES.matches("office_start", stripped):
                     i -= 1  # Back up to process the office
                     break
                 
@@ -161,7 +142,9 @@ def _parse_text_file(text_path, output_csv):
         
         # Parse office headers
         # Retention election formats (must come before other JUDGE handlers)
-        if stripped.endswith(" RETENTION"):
+        if "office" not in kinds:
+            pass
+        elif stripped.endswith(" RETENTION"):
             # Handle "[JUDGE NAME] Retention" format
             judge_name = stripped.replace(" Retention", "").replace(" retention", "").strip()
             current_office = f"Judicial Retention Election - {judge_name}"
@@ -310,13 +293,7 @@ def _parse_text_file(text_path, output_csv):
         # Parse candidate lines
         if current_office and stripped:
             # Skip header lines and office lines
-            if (stripped.startswith("Vote For") or
-                stripped.startswith("STATISTICS") or
-                stripped.startswith("Election") or
-                stripped.startswith("TOTAL") or
-                stripped.startswith("Mail") or
-                stripped.startswith("Provisional") or
-                stripped.startswith("Day")):
+            if "header" in kinds:
                 i += 1
                 continue
             
@@ -379,7 +356,7 @@ def _parse_text_file(text_path, output_csv):
                                 'LIN', 'PIA', 'PIU'}
                 
                 # Pattern: "PARTY CANDIDATE_NAME VOTES ELECTION_DAY MAIL PROVISIONAL"
-                party_match = re.match(r'^([A-Z]{2,4}(?:/[A-Z]{2,4})?)\s+(.+?)\s+(\d+(?:,\d+)?)\s+(?:\d+(?:\.\d+)?%)?\s*(\d+(?:,\d+)?)\s+(\d+(?:,\d+)?)\s+(\d+(?:,\d+)?)$', stripped)
+                party_match = PARTY_ROW.match(stripped)
                 
                 if party_match and party_match.group(1) in known_parties:
                     party = party_match.group(1)
@@ -393,7 +370,7 @@ def _parse_text_file(text_path, output_csv):
                                   party, candidate, total, election_day, mail, provisional])
                 else:
                     # Try pattern without party, may include percentage
-                    no_party_match = re.match(r'^(.+?)\s+(\d+(?:,\d+)?)\s+(?:\d+(?:\.\d+)?%)?\s+(\d+(?:,\d+)?)\s+(\d+(?:,\d+)?)\s+(\d+)$', stripped)
+                    no_party_match = NO_PARTY_ROW.match(stripped)
                     if no_party_match:
                         candidate = no_party_match.group(1).strip()
                         total = no_party_match.group(2).replace(',', '')
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Benchmark the shared parsing engines on synthetic PDFs.
+
+For each layout in ``synthetic_pdf.LAYOUTS`` this renders a PDF from a
+precinct CSV, parses it with the matching engine in a fresh interpreter
+(so peak RSS and import costs belong to that engine alone), and reports
+pages/sec, rows/sec and peak RSS together with a round-trip check of the
+parsed rows against the rows that were drawn:
+
+  - ``electionware``  -> ``electionware_precinct_np.parse_pdf``
+  - ``sovc_geo``      -> ``sovc_geo_np.parse_sovc_geo_results``
+  - ``sovc_crosstab`` -> ``sovc_crosstab_pp.parse_sovc_crosstab_results``
+
+Save a run with ``--json`` and pass it back as ``--baseline`` after an
+engine change to see the speedup per layout. ``--backend NAME`` reads page
+text with that ``text_backends`` backend in the layouts whose engine has a
+``text_backend`` knob. Exits non-zero if any layout fails its round trip.
+
+Usage:
+    python parsers/engine_bench.py [--csv PATH] [--copies N] [--layout NAME ...]
+                                   [--backend NAME] [--keep DIR] [--json OUT]
+                                   [--baseline PREV.json]
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+PARSERS_DIR = Path(__file__).resolve().parent
+
+DEFAULT_CSV = PARSERS_DIR.parent / "2025" / "counties" / "20251104__pa__general__adams__precinct.csv"
+
+
+def _parse(layout: str, pdf_path: Path, config) -> list[dict]:
+    if layout == "electionware":
+        from electionware_precinct_np import parse_pdf
+
+        rows, _precinct_count = parse_pdf(pdf_path, config)
+        return rows
+    if layout == "sovc_geo":
+        from sovc_geo_np import parse_sovc_geo_results
+
+        rows, _printed_totals = parse_sovc_geo_results(str(pdf_path), config)
+        return rows
+    if layout == "sovc_crosstab":
+        from sovc_crosstab_pp import parse_sovc_crosstab_results
+
+        return parse_sovc_crosstab_results(str(pdf_path), config)
+    raise KeyError(layout)
+
+
+def _peak_rss_mb() -> float:
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_layout(layout: str, csv_path: Path, copies: int, pdf_dir: Path, backend: Optional[str] = None) -> dict:
+    """Render, parse and check one layout in this process."""
+    from synthetic_pdf import compare_rows, render
+
+    synthetic = render(layout, csv_path, copies)
+    pdf_path = pdf_dir / f"{layout}.pdf"
+    pdf_path.write_bytes(synthetic.pdf_bytes)
+    config = synthetic.config
+    if backend and hasattr(config, "text_backend"):
+        config = dataclasses.replace(config, text_backend=backend)
+
+    start = time.perf_counter()
+    # The engines print progress lines; keep them out of the report.
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = _parse(layout, pdf_path, config)
+    seconds = time.perf_counter() - start
+
+    problems = compare_rows(synthetic.expected, rows)
+    return {
+        "layout": layout,
+        "backend": getattr(config, "text_backend", None),
+        "pages": synthetic.page_count,
+        "rows": len(rows),
+        "expected_rows": len(synthetic.expected),
+        "seconds": round(seconds, 3),
+        "pages_per_sec": round(synthetic.page_count / seconds, 2),
+        "rows_per_sec": round(len(rows) / seconds, 1),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "mismatches": len(problems),
+        "sample_mismatches": problems[:5],
+    }
+
+
+def _run_in_child(layout: str, csv_path: Path, copies: int, pdf_dir: Path, backend: Optional[str]) -> dict:
+    # The child runs in parsers/, so paths relative to the caller's
+    # directory are resolved first.
+    proc = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), "--child", layout,
+         "--csv", str(csv_path.resolve()), "--copies", str(copies), "--keep", str(pdf_dir.resolve())]
+        + (["--backend", backend] if backend else []),
+        cwd=PARSERS_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "no output"
+        raise RuntimeError(f"{layout} benchmark failed: {tail}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _pop_option(argv: list[str], name: str, default=None, multiple: bool = False):
+    values = []
+    while name in argv:
+        idx = argv.index(name)
+        values.append(argv[idx + 1])
+        del argv[idx:idx + 2]
+    if multiple:
+        return values
+    return values[-1] if values else default
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    from synthetic_pdf import LAYOUTS
+    from text_backends import BACKENDS
+
+    argv = list(argv) if argv is not None else sys.argv[1:]
+    child = _pop_option(argv, "--child")
+    csv_path = Path(_pop_option(argv, "--csv", DEFAULT_CSV))
+    copies = int(_pop_option(argv, "--copies", 1))
+    keep = _pop_option(argv, "--keep")
+    json_out = _pop_option(argv, "--json")
+    baseline_path = _pop_option(argv, "--baseline")
+    backend = _pop_option(argv, "--backend")
+    layouts = _pop_option(argv, "--layout", multiple=True) or list(LAYOUTS)
+    unknown = [name for name in layouts if name not in LAYOUTS]
+    if argv or unknown or (backend and backend not in BACKENDS):
+        print(__doc__.split("Usage:")[1].rstrip(), file=sys.stderr)
+        return 1
+
+    if child:
+        print(json.dumps(run_layout(child, csv_path, copies, Path(keep), backend)))
+        return 0
+
+    baseline = {}
+    if baseline_path:
+        baseline = {r["layout"]: r for r in json.loads(Path(baseline_path).read_text())}
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_dir = Path(keep) if keep else Path(tmp)
+        pdf_dir.mkdir(parents=True, exist_ok=True)
+        print(f"{csv_path.name}, copies={copies}" + (f", backend={backend}" if backend else ""))
+        for layout in layouts:
+            result = _run_in_child(layout, csv_path, copies, pdf_dir, backend)
+            results.append(result)
+            status = "ok" if result["mismatches"] == 0 else f"{result['mismatches']} MISMATCHES"
+            line = (
+                f"{layout:14} {result['pages']:5d} pages {result['rows']:7d} rows "
+                f"{result['seconds']:8.2f} s {result['pages_per_sec']:7.2f} pages/s "
+                f"{result['rows_per_sec']:9.1f} rows/s {result['peak_rss_mb']:7.1f} MB  {status}"
+            )
+            prev = baseline.get(layout)
+            if prev:
+                line += f"  ({prev['seconds'] / result['seconds']:.2f}x vs baseline)"
+            print(line)
+            for problem in result["sample_mismatches"]:
+                print(f"    {problem}", file=sys.stderr)
+
+    if json_out:
+        Path(json_out).write_text(json.dumps(results, indent=2) + "\n")
+    return 1 if any(r["mismatches"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Post-process county-level summary CSVs: keep only standard statewide/
-legislative offices and normalize office-name variants (e.g. "Member Of The
-Democratic State Committee" -> "Member of Democratic State Committee").
+legislative offices and normalize office-name variants with
+``office_normalizer`` (e.g. "Member Of The Democratic State Committee" ->
+"Member of Democratic State Committee", filling in a district the office
+name carries).
 Also collapses internal whitespace in office names (Cumberland spreads
 "MEMBER OF THE ... STATE COMMITTEE" across columns) and normalizes
 "Write- In Totals" -> "Write-In Totals".
@@ -17,26 +19,15 @@ import re
 import sys
 from pathlib import Path
 
-OFFICE_NORMALIZE = {
-    "Governor": "Governor",
-    "Lieutenant Governor": "Lieutenant Governor",
-    "Attorney General": "Attorney General",
-    "Auditor General": "Auditor General",
-    "State Treasurer": "State Treasurer",
-    "U.S. House": "U.S. House",
-    "State Senate": "State Senate",
-    "State House": "State House",
-    "State Representative": "State House",
-    "U.S. Senate": "U.S. Senate",
-    "President": "President",
-    "Member of Democratic State Committee": "Member of Democratic State Committee",
-    "Member of Republican State Committee": "Member of Republican State Committee",
-    "Member Of The Democratic State Committee": "Member of Democratic State Committee",
-    "Member Of The Republican State Committee": "Member of Republican State Committee",
-    "Member Of The Democratic State Comm": "Member of Democratic State Committee",
-    "Member Of The Republican State Comm": "Member of Republican State Committee",
-    "Member of the Democratic State Committee": "Member of Democratic State Committee",
-    "Member of the Republican State Committee": "Member of Republican State Committee",
+from office_normalizer import normalize
+
+# Offices kept, as office_normalizer names them.
+OFFICES_TO_KEEP = {
+    "Governor", "Lieutenant Governor", "Attorney General", "Auditor General",
+    "State Treasurer", "U.S. House", "State Senate", "State House",
+    "U.S. Senate", "President",
+    "Member of Democratic State Committee",
+    "Member of Republican State Committee",
 }
 
 FIELDNAMES = [
@@ -72,11 +63,10 @@ def main(argv: list[str]) -> None:
         rows = list(reader)
     out_rows = []
     for r in rows:
-        # Collapse internal whitespace so "Member  Of The ... State Committee"
-        # matches the normalize map.
-        office_raw = re.sub(r"\s+", " ", r["office"]).strip()
-        office = OFFICE_NORMALIZE.get(office_raw)
-        if office is None:
+        # normalize() collapses internal whitespace, so "Member  Of The ...
+        # State Committee" still matches.
+        office, district, _ = normalize(r["office"], strict=True)
+        if office not in OFFICES_TO_KEEP:
             dropped += 1
             continue
         cand = r["candidate"].strip()
@@ -87,6 +77,7 @@ def main(argv: list[str]) -> None:
             dropped += 1
             continue
         r["office"] = office
+        r["district"] = r.get("district") or district
         # Normalize "Write- In Totals" -> "Write-In Totals"
         if cand.lower().replace(" ", "") == "write-intotals":
             r["candidate"] = "Write-In Totals"
@@ -2,7 +2,9 @@
 """Post-process a county-level 2026 primary CSV: fill in the ``party``
 column for statewide-office + U.S. House rows whose party is blank, using
 a candidate->party map derived from the other already-parsed 2026
-primary precinct CSVs.
+primary precinct CSVs. Candidates are matched on their normalized name
+(``candidate_registry.normalize``), so ``Stacy Garrity`` here finds
+``STACY GARRITY`` or ``Garrity, Stacy`` elsewhere.
 
 State Senate and State House rows are left blank (the source PDF for some
 counties omits party prefixes on legislative contest headers, and the
@@ -20,6 +22,8 @@ import sys
 from collections import defaultdict, Counter
 from pathlib import Path
 
+from candidate_registry import normalize
+
 STATEWIDE_OFFICES = {
     "Governor", "Lieutenant Governor", "Attorney General",
     "Auditor General", "State Treasurer", "U.S. Senate", "U.S. House",
@@ -44,7 +48,7 @@ def build_map(precinct_dir: Path, skip_county: str) -> dict[str, str]:
                 c = row["candidate"]
                 if not p or not c or c in SKIP_CANDS:
                     continue
-                cand_party[c][p] += 1
+                cand_party[normalize(c)][p] += 1
     return {c: cnt.most_common(1)[0][0] for c, cnt in cand_party.items() if cnt}
 
 
@@ -64,8 +68,8 @@ def main(argv: list[str]) -> None:
         for row in r:
             if row["office"] in STATEWIDE_OFFICES and not row["party"]:
                 c = row["candidate"]
-                if c not in SKIP_CANDS and c in mapping:
-                    row["party"] = mapping[c]
+                if c not in SKIP_CANDS and normalize(c) in mapping:
+                    row["party"] = mapping[normalize(c)]
                     filled += 1
             rows.append(row)
     with src.open("w", newline="") as fh:
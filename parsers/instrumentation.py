@@ -0,0 +1,266 @@
+"""Opt-in timers and counters for the shared parsing engines.
+
+Every shared engine's ``run_cli`` accepts ``--profile`` (print a report to
+stderr when the run finishes) or ``--profile=trace.json`` (also write the
+raw numbers as a JSON trace). While a profile is active the engines record:
+
+  - wall time per phase: ``pdf_open``, ``page_load``, ``text_extraction``,
+    ``table_extraction``, ``page_render``, ``line_classification``,
+    ``office_normalization``, ``llm_request``, ``csv_write``. Phases can
+    nest (office normalization happens inside line classification), so
+    shares don't add up to 100%.
+  - per-unit durations and row counts, where a unit is a ``page`` or, for
+    the Electionware engines whose rows come out per precinct block, a
+    ``precinct``; the report lists the slowest of each.
+  - plain counters (pages, lines, memo hits, ...).
+
+With no profile active every hook is a no-op costing one global lookup,
+so engines call them unconditionally.
+
+Usage inside an engine::
+
+    import instrumentation
+
+    with instrumentation.phase("pdf_open"):
+        pdf = PDF(path)
+    for index in range(len(pdf.pages)):
+        with instrumentation.unit("page", index + 1) as unit:
+            page = instrumentation.load_page(pdf.pages, index)
+            with instrumentation.phase("text_extraction"):
+                text = page.extract_text()
+            unit.rows = ...
+
+and in ``run_cli``::
+
+    argv, profile = instrumentation.split_profile_arg(argv)
+    ...
+    with instrumentation.session(profile, label=str(pdf_path)):
+        ...
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+SLOWEST = 10
+
+T = TypeVar("T")
+
+_active: Optional["Profile"] = None
+
+
+class _Phase:
+    __slots__ = ("profile", "name", "start")
+
+    def __init__(self, profile: "Profile", name: str) -> None:
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self) -> "_Phase":
+        self.profile.open_phases.add(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.profile.open_phases.discard(self.name)
+        self.profile.add_phase(self.name, time.perf_counter() - self.start)
+
+
+class _Unit:
+    __slots__ = ("profile", "kind", "label", "rows", "start")
+
+    def __init__(self, profile: Optional["Profile"], kind: str, label: object) -> None:
+        self.profile = profile
+        self.kind = kind
+        self.label = label
+        self.rows = 0
+
+    def __enter__(self) -> "_Unit":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self.profile is not None:
+            self.profile.add_unit(self.kind, self.label, time.perf_counter() - self.start, self.rows)
+
+
+_NULL_PHASE = nullcontext()
+
+
+class Profile:
+    """Accumulated timings for one run."""
+
+    def __init__(self, label: str = "") -> None:
+        self.label = label
+        self.total_seconds = 0.0
+        self.phases: dict[str, list] = {}  # name -> [calls, seconds]
+        self.counters: dict[str, int] = {}
+        # kind -> label -> [seconds, rows]; the same unit may be entered more
+        # than once (extraction, then parsing) and accumulates.
+        self.units: dict[str, dict[str, list]] = {}
+        # A phase re-entered while already open (the primary office
+        # normalizer falling through to the general one) is timed once.
+        self.open_phases: set[str] = set()
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        entry = self.phases.get(name)
+        if entry is None:
+            self.phases[name] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+    def add_unit(self, kind: str, label: object, seconds: float, rows: int) -> None:
+        entry = self.units.setdefault(kind, {}).setdefault(str(label), [0.0, 0])
+        entry[0] += seconds
+        entry[1] += rows
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def slowest(self, kind: str, n: int = SLOWEST) -> list[tuple[str, float, int]]:
+        entries = self.units.get(kind, {})
+        ranked = sorted(entries.items(), key=lambda item: item[1][0], reverse=True)
+        return [(label, seconds, rows) for label, (seconds, rows) in ranked[:n]]
+
+    def to_json(self) -> dict:
+        return {
+            "label": self.label,
+            "total_seconds": round(self.total_seconds, 6),
+            "phases": {
+                name: {"calls": calls, "seconds": round(seconds, 6)}
+                for name, (calls, seconds) in self.phases.items()
+            },
+            "counters": dict(self.counters),
+            "units": {
+                kind: [
+                    {"label": label, "seconds": round(seconds, 6), "rows": rows}
+                    for label, (seconds, rows) in entries.items()
+                ]
+                for kind, entries in self.units.items()
+            },
+        }
+
+    def report(self) -> str:
+        total = self.total_seconds or 1e-9
+        lines = [f"profile: {self.label}  total {self.total_seconds:.2f} s"]
+        lines.append(f"  {'phase':24} {'calls':>7} {'seconds':>9} {'share':>7}")
+        for name, (calls, seconds) in sorted(self.phases.items(), key=lambda item: -item[1][1]):
+            lines.append(f"  {name:24} {calls:7d} {seconds:9.3f} {100 * seconds / total:6.1f}%")
+        if self.counters:
+            lines.append("  counters: " + ", ".join(f"{k}={v}" for k, v in sorted(self.counters.items())))
+        for kind in sorted(self.units):
+            entries = self.units[kind]
+            lines.append(f"  slowest {kind}s (of {len(entries)}):")
+            for label, seconds, rows in self.slowest(kind):
+                lines.append(f"    {label:30} {seconds:8.3f} s {rows:6d} rows")
+        return "\n".join(lines)
+
+
+def active() -> Optional[Profile]:
+    return _active
+
+
+def phase(name: str):
+    """Context manager timing one pass through phase ``name``."""
+    if _active is None or name in _active.open_phases:
+        return _NULL_PHASE
+    return _Phase(_active, name)
+
+
+def unit(kind: str, label: object) -> _Unit:
+    """Context manager timing one page/precinct; set ``.rows`` inside it."""
+    return _Unit(_active, kind, label)
+
+
+def each_unit(
+    kind: str,
+    items: Iterable[T],
+    rows: Optional[Callable[[], int]] = None,
+    label: Optional[Callable[[T], object]] = None,
+    phase: Optional[str] = None,
+) -> Iterator[T]:
+    """Yield ``items``, timing each pass of the caller's loop body as one
+    unit and, if given, as one call of ``phase``. Units are labelled
+    ``label(item)``, or by 1-based position. ``rows`` returns a running row
+    count; the unit's rows are its growth across the pass. Lets a loop with
+    ``continue`` statements be profiled without restructuring it::
+
+        for lines in instrumentation.each_unit("page", pages, rows=lambda: len(results)):
+            ...
+    """
+    profile = _active
+    if profile is None:
+        yield from items
+        return
+    for number, item in enumerate(items, 1):
+        before = rows() if rows else 0
+        started = time.perf_counter()
+        try:
+            yield item
+        finally:
+            seconds = time.perf_counter() - started
+            profile.add_unit(
+                kind, label(item) if label else number, seconds, rows() - before if rows else 0
+            )
+            if phase:
+                profile.add_phase(phase, seconds)
+
+
+def load_page(pages, index: int):
+    """``pages[index]``, timed as ``page_load``. natural-pdf parses a page's
+    objects when the page is first fetched, not in ``extract_text``, so
+    iterating ``pdf.pages`` directly would leave most of the cost untimed."""
+    with phase("page_load"):
+        return pages[index]
+
+
+def count(name: str, n: int = 1) -> None:
+    if _active is not None:
+        _active.count(name, n)
+
+
+def split_profile_arg(argv: list[str]) -> tuple[list[str], Optional[str]]:
+    """Strip ``--profile`` / ``--profile=PATH`` from ``argv``.
+
+    Returns ``(argv, setting)`` where ``setting`` is None (profiling off),
+    ``""`` (report only) or the JSON trace path.
+    """
+    setting: Optional[str] = None
+    rest = []
+    for arg in argv:
+        if arg == "--profile":
+            setting = ""
+        elif arg.startswith("--profile="):
+            setting = arg.split("=", 1)[1]
+        else:
+            rest.append(arg)
+    return rest, setting
+
+
+@contextmanager
+def session(setting: Optional[str], label: str = "") -> Iterator[Optional[Profile]]:
+    """Activate a profile for the duration of the block when ``setting`` is
+    not None; on exit print the report to stderr and, if ``setting`` is a
+    path, write the JSON trace there."""
+    global _active
+    if setting is None:
+        yield None
+        return
+    profile = Profile(label)
+    previous, _active = _active, profile
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.total_seconds = time.perf_counter() - start
+        _active = previous
+        print(profile.report(), file=sys.stderr)
+        if setting:
+            Path(setting).write_text(json.dumps(profile.to_json(), indent=2) + "\n")
+            print(f"profile trace written to {setting}", file=sys.stderr)
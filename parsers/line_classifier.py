@@ -0,0 +1,102 @@
+"""Table-driven line classification for the line-by-line text engines.
+
+An engine declares what its line kinds look like as a table of ``Rule``s
+(keyword prefixes, substrings, suffixes, regexes) instead of chains of
+``stripped.startswith(...)``; ``LineClassifier`` compiles every kind's
+rules into one alternation per case mode and classifies each distinct line
+once. Results are cached by text, so a line already classified while
+looking ahead is free when the parse loop reaches it, and the page
+headers, column labels and boilerplate that repeat on every page cost a
+dict lookup.
+
+    CLASSIFIER = LineClassifier([
+        Rule("office", prefixes=("JUDGE", "SHERIFF"), suffixes=(" RETENTION",), upper=True),
+        Rule("header", prefixes=("Vote For", "TOTAL")),
+    ])
+    if "office" in CLASSIFIER.classify(stripped): ...
+    if CLASSIFIER.matches("header", stripped): ...
+
+Adding a keyword is a table edit in the engine.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import FrozenSet, Iterable
+
+# Distinct lines in one report run to the low tens of thousands; past this
+# the cache is dropped and refilled rather than grown without bound.
+CACHE_LIMIT = 200_000
+
+
+@dataclass(frozen=True)
+class Rule:
+    """One way a line can be of ``kind``.
+
+    ``prefixes``/``contains``/``suffixes`` are literal strings;
+    ``patterns`` are regexes searched anywhere in the line (anchor them
+    with ``^`` to match at the start, and scope flags inline, e.g.
+    ``(?i:...)``). With ``upper`` set the line is upper-cased first, so
+    write the literals in capitals.
+    """
+
+    kind: str
+    prefixes: tuple[str, ...] = ()
+    contains: tuple[str, ...] = ()
+    suffixes: tuple[str, ...] = ()
+    patterns: tuple[str, ...] = ()
+    upper: bool = False
+
+
+def _alternation(rules: list[Rule]) -> str:
+    parts = []
+    prefixes = [p for r in rules for p in r.prefixes]
+    contains = [c for r in rules for c in r.contains]
+    suffixes = [s for r in rules for s in r.suffixes]
+    if prefixes:
+        parts.append("^(?:" + "|".join(map(re.escape, prefixes)) + ")")
+    if contains:
+        parts.append("(?:" + "|".join(map(re.escape, contains)) + ")")
+    if suffixes:
+        parts.append("(?:" + "|".join(map(re.escape, suffixes)) + r")\Z")
+    parts.extend(f"(?:{p})" for p in (p for r in rules for p in r.patterns))
+    return "|".join(parts)
+
+
+class LineClassifier:
+    """Classify stripped lines into the kinds declared by a rule table."""
+
+    def __init__(self, rules: Iterable[Rule]) -> None:
+        grouped: dict[tuple[str, bool], list[Rule]] = {}
+        for rule in rules:
+            grouped.setdefault((rule.kind, rule.upper), []).append(rule)
+        # kind -> (regex on the line, regex on the upper-cased line)
+        self._matchers: dict[str, list] = {}
+        for (kind, upper), kind_rules in grouped.items():
+            pattern = _alternation(kind_rules)
+            if pattern:
+                self._matchers.setdefault(kind, [None, None])[upper] = re.compile(pattern)
+        self.kinds = frozenset(self._matchers)
+        self._cache: dict[str, FrozenSet[str]] = {}
+
+    def classify(self, line: str) -> FrozenSet[str]:
+        """Every kind ``line`` belongs to (pass it already stripped)."""
+        kinds = self._cache.get(line)
+        if kinds is None:
+            upper = line.upper()
+            kinds = frozenset(
+                kind
+                for kind, (plain, upper_re) in self._matchers.items()
+                if (plain is not None and plain.search(line))
+                or (upper_re is not None and upper_re.search(upper))
+            )
+            if len(self._cache) >= CACHE_LIMIT:
+                self._cache.clear()
+            self._cache[line] = kinds
+        return kinds
+
+    def matches(self, kind: str, line: str) -> bool:
+        if kind not in self.kinds:
+            raise KeyError(f"No rules for line kind {kind!r}")
+        return kind in self.classify(line)
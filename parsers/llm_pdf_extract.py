@@ -26,15 +26,22 @@ import re
 import sys
 import tempfile
 
+import instrumentation
+import parse_manifest
+
 
 def extract_pdf_text(pdf_path):
     """Extract all text from PDF pages (mode="text")."""
     import pdfplumber
 
     pages_text = []
-    with pdfplumber.open(pdf_path) as pdf:
+    with instrumentation.phase("pdf_open"):
+        pdf = pdfplumber.open(pdf_path)
+    with pdf:
+        instrumentation.count("pages", len(pdf.pages))
         for page_num, page in enumerate(pdf.pages, 1):
-            text = page.extract_text()
+            with instrumentation.unit("page", page_num), instrumentation.phase("text_extraction"):
+                text = page.extract_text()
             if text:
                 pages_text.append({'page_num': page_num, 'text': text})
     return pages_text
@@ -45,12 +52,16 @@ def render_pdf_pages(pdf_path):
     import pdfplumber
 
     pages = []
-    with pdfplumber.open(pdf_path) as pdf:
+    with instrumentation.phase("pdf_open"):
+        pdf = pdfplumber.open(pdf_path)
+    with pdf:
+        instrumentation.count("pages", len(pdf.pages))
         for page_num, page in enumerate(pdf.pages, 1):
-            image = page.to_image(resolution=200)
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp:
-                image.save(tmp.name, format="PNG")
-                pages.append({"page_num": page_num, "image_path": tmp.name})
+            with instrumentation.unit("page", page_num), instrumentation.phase("page_render"):
+                image = page.to_image(resolution=200)
+                with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp:
+                    image.save(tmp.name, format="PNG")
+                    pages.append({"page_num": page_num, "image_path": tmp.name})
     return pages
 
 
@@ -246,8 +257,11 @@ def _call_anthropic_direct(prompt, model_name, image_path=None):
     return response.content[0].text
 
 
-def extract_with_llm(pages, county_name, mode, level, model_name="claude-haiku-4.5"):
-    """Run extraction over ``pages`` (from extract_pdf_text or render_pdf_pages)."""
+def extract_with_llm(pages, county_name, mode, level, model_name="claude-haiku-4.5", failed_pages=None):
+    """Run extraction over ``pages`` (from extract_pdf_text or render_pdf_pages).
+
+    A page whose request or response fails is reported and skipped; its
+    number is appended to ``failed_pages`` if a list is given."""
     import llm
 
     config = _config_for(mode, level)
@@ -264,24 +278,28 @@ def extract_with_llm(pages, county_name, mode, level, model_name="claude-haiku-4
         # calling the Anthropic API directly with the raw model id.
         use_direct = True
 
-    for page_data in pages:
+    page_units = instrumentation.each_unit(
+        "page", pages, rows=lambda: len(all_results), label=lambda page_data: page_data["page_num"]
+    )
+    for page_data in page_units:
         page_num = page_data["page_num"]
         print(f"Processing page {page_num}...")
         prompt = config["build_prompt"](page_data, county_name)
 
         try:
-            if use_direct:
-                response_text = _call_anthropic_direct(
-                    prompt,
-                    model_name,
-                    image_path=page_data["image_path"] if mode == "image" else None,
-                )
-            else:
-                kwargs = {"schema": schema}
-                if mode == "image":
-                    kwargs["attachments"] = [llm.Attachment(path=page_data["image_path"], type="image/png")]
-                response = model.prompt(prompt, **kwargs)
-                response_text = response.text()
+            with instrumentation.phase("llm_request"):
+                if use_direct:
+                    response_text = _call_anthropic_direct(
+                        prompt,
+                        model_name,
+                        image_path=page_data["image_path"] if mode == "image" else None,
+                    )
+                else:
+                    kwargs = {"schema": schema}
+                    if mode == "image":
+                        kwargs["attachments"] = [llm.Attachment(path=page_data["image_path"], type="image/png")]
+                    response = model.prompt(prompt, **kwargs)
+                    response_text = response.text()
 
             try:
                 response_json = json.loads(response_text)
@@ -297,9 +315,12 @@ def extract_with_llm(pages, county_name, mode, level, model_name="claude-haiku-4
         except json.JSONDecodeError as e:
             print(f"  Warning: Could not parse JSON response for page {page_num}: {e}")
             print(f"  Response: {response_text[:200]}...")
+            if failed_pages is not None:
+                failed_pages.append(page_num)
         except Exception as e:
             print(f"  Error processing page {page_num}: {e}")
-            continue
+            if failed_pages is not None:
+                failed_pages.append(page_num)
 
     return all_results
 
@@ -318,15 +339,19 @@ def run_cli(mode, level, argv=None, default_output_suffix="2025_general.csv"):
 
     ``mode``: "text" or "image". ``level``: "county" or "precinct".
     """
-    argv = argv if argv is not None else sys.argv[1:]
+    argv, profile = instrumentation.split_profile_arg(argv if argv is not None else sys.argv[1:])
+    argv, if_changed = parse_manifest.split_if_changed_arg(argv)
     prog = sys.argv[0]
 
     if len(argv) < 1:
-        print(f"Usage: python {prog} <pdf_path> [output_csv] [--county COUNTY_NAME] [--test-page PAGE_NUM]")
+        print(f"Usage: python {prog} <pdf_path> [output_csv] [--county COUNTY_NAME] [--test-page PAGE_NUM]"
+              " [--profile[=trace.json]] [--if-changed]")
         print("\nRequires llm library configured with API keys.")
         print("--county: Specify county name (auto-detected from filename if not provided)")
         print("--test-page: Test extraction on a specific page number.")
         print("--model: Claude model id to use (default: claude-haiku-4.5).")
+        print("--profile: Report time per phase and slowest pages (=PATH also writes a JSON trace).")
+        print("--if-changed: Skip the run if the PDF, script and model are unchanged since the output was written.")
         sys.exit(1)
 
     pdf_path = argv[0]
@@ -365,41 +390,58 @@ def run_cli(mode, level, argv=None, default_output_suffix="2025_general.csv"):
         if model_idx + 1 < len(argv):
             model_name = argv[model_idx + 1]
 
-    if mode == "text":
-        print(f"Extracting text from {pdf_path}...")
-        pages = extract_pdf_text(pdf_path)
-        print(f"Found {len(pages)} pages with text")
-    else:
-        print(f"Rendering page images from {pdf_path}...")
-        pages = render_pdf_pages(pdf_path)
-        print(f"Rendered {len(pages)} pages")
+    options = {"mode": mode, "level": level, "county": county_name, "model": model_name}
+    if if_changed and not test_page and parse_manifest.up_to_date(output_path, pdf_path, options):
+        print(f"{output_path} is up to date")
+        return
 
-    try:
-        if test_page:
-            if test_page < 1 or test_page > len(pages):
-                print(f"Error: Page {test_page} not found (available pages: 1-{len(pages)})")
-                sys.exit(1)
+    with instrumentation.session(profile, label=pdf_path):
+        if mode == "text":
+            print(f"Extracting text from {pdf_path}...")
+            pages = extract_pdf_text(pdf_path)
+            print(f"Found {len(pages)} pages with text")
+        else:
+            print(f"Rendering page images from {pdf_path}...")
+            pages = render_pdf_pages(pdf_path)
+            print(f"Rendered {len(pages)} pages")
 
-            page_data = [pages[test_page - 1]]
-            print(f"\n=== TESTING PAGE {test_page} ===")
-            if mode == "text":
-                print(f"Page text preview:\n{page_data[0]['text'][:500]}...\n")
-            results = extract_with_llm(page_data, county_name, mode, level, model_name=model_name)
-            print(f"\nExtracted {len(results)} results from page {test_page}:")
-            for result in results:
-                if level == "precinct":
-                    print(f"  {result.get('precinct',''):20} | {result.get('office',''):30} | "
-                          f"{result.get('candidate',''):25} | {result.get('party',''):3} | {result.get('votes','')}")
-                else:
-                    print(f"  {result.get('office',''):30} | {result.get('candidate',''):25} | "
-                          f"{result.get('party',''):3} | {result.get('votes','')}")
-            return
-
-        print(f"\nExtracting election results...")
-        results = extract_with_llm(pages, county_name, mode, level, model_name=model_name)
-        print(f"\nTotal candidate results: {len(results)}")
-        write_csv(results, output_path, mode, level)
-        print("Done!")
-    finally:
-        if mode == "image":
-            cleanup_images(pages)
+        try:
+            if test_page:
+                if test_page < 1 or test_page > len(pages):
+                    print(f"Error: Page {test_page} not found (available pages: 1-{len(pages)})")
+                    sys.exit(1)
+
+                page_data = [pages[test_page - 1]]
+                print(f"\n=== TESTING PAGE {test_page} ===")
+                if mode == "text":
+                    print(f"Page text preview:\n{page_data[0]['text'][:500]}...\n")
+                results = extract_with_llm(page_data, county_name, mode, level, model_name=model_name)
+                print(f"\nExtracted {len(results)} results from page {test_page}:")
+                for result in results:
+                    if level == "precinct":
+                        print(f"  {result.get('precinct',''):20} | {result.get('office',''):30} | "
+                              f"{result.get('candidate',''):25} | {result.get('party',''):3} | {result.get('votes','')}")
+                    else:
+                        print(f"  {result.get('office',''):30} | {result.get('candidate',''):25} | "
+                              f"{result.get('party',''):3} | {result.get('votes','')}")
+                return
+
+            print(f"\nExtracting election results...")
+            failed_pages = []
+            with parse_manifest.recording(output_path, pdf_path, options) as run:
+                results = extract_with_llm(
+                    pages, county_name, mode, level, model_name=model_name, failed_pages=failed_pages
+                )
+                print(f"\nTotal candidate results: {len(results)}")
+                with instrumentation.phase("csv_write"):
+                    write_csv(results, output_path, mode, level)
+                run.rows = len(results)
+                run.complete = not failed_pages
+            if failed_pages:
+                pages_text = ", ".join(str(page_num) for page_num in failed_pages)
+                print(f"Incomplete: page(s) {pages_text} failed; --if-changed will re-parse", file=sys.stderr)
+            else:
+                print("Done!")
+        finally:
+            if mode == "image":
+                cleanup_images(pages)
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""Turn the 2024 primary notebooks into modules and re-run them in bulk.
+
+``parsers/2024-primary_parsers/*.ipynb`` hold one county each: a cell of
+imports, a cell of helper functions, a cell naming the source PDF
+(``file = '.../Adams PA Primary 2024.pdf'``) and ``county_name``, then
+cells of pandas clean-up ending in ``df.to_csv(...)``. ``extract`` writes
+that code out as a module next to the notebook with a standard entry
+point::
+
+    COUNTY = 'Adams'
+    SOURCE_FILE = 'Adams PA Primary 2024.pdf'
+    OUTPUT_FILE = '20240423__pa__primary__adams__precinct.csv'
+
+    def parse(source):        # path of the source PDF
+        ...                   # the notebook's cells
+        return df             # the output rows, as the notebook wrote them
+
+Import and function cells become module level; every other cell becomes
+the body of ``parse``, with the source-file assignment taking ``source``,
+the final ``to_csv`` turned into the return, and cells that only display
+a value (``df.dtypes``) or assign something nothing reads (a directory
+listing) left out. Comments are kept, and regex strings with invalid
+escapes (``'(\\d+)'``) are made raw so the modules compile cleanly::
+
+    python parsers/notebook_modules.py extract
+    python parsers/notebook_modules.py run --sources ../openelections-sources-pa/2024 [--jobs 4]
+
+``run`` re-generates every county's CSV in a process pool (into ``--out``,
+a temporary directory by default) and diffs each against the checked-in
+``2024/counties`` file: identical, or the number of rows only in one of
+them. It exits non-zero if any county differs or fails.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import importlib.util
+import io
+import json
+import sys
+import tempfile
+import time
+import tokenize
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+PARSERS_DIR = Path(__file__).resolve().parent
+REPO_DIR = PARSERS_DIR.parent
+NOTEBOOK_DIR = PARSERS_DIR / "2024-primary_parsers"
+EXPECTED_DIR = REPO_DIR / "2024" / "counties"
+OUTPUT_TEMPLATE = "20240423__pa__primary__{}__precinct.csv"
+
+MODULE_LEVEL = (ast.Import, ast.ImportFrom, ast.FunctionDef, ast.ClassDef)
+# Calls that only show something in the notebook.
+DISPLAY_CALLS = {"head", "tail", "info", "describe", "print", "display"}
+SOURCE_SUFFIXES = (".pdf", ".xlsx", ".xls", ".csv", ".txt")
+
+
+def _cells(notebook: Path) -> list[str]:
+    cells = json.loads(notebook.read_text())["cells"]
+    return ["".join(cell["source"]) for cell in cells if cell["cell_type"] == "code"]
+
+
+def _call_name(node: ast.AST) -> Optional[str]:
+    if isinstance(node, ast.Call):
+        func = node.func
+        return func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+    return None
+
+
+def _source_assignment(node: ast.stmt) -> Optional[tuple[str, str]]:
+    """``(name, path)`` if ``node`` is ``name = '<source file path>'``."""
+    if (
+        isinstance(node, ast.Assign)
+        and len(node.targets) == 1
+        and isinstance(node.targets[0], ast.Name)
+        and isinstance(node.value, ast.Constant)
+        and isinstance(node.value.value, str)
+        and node.value.value.lower().endswith(SOURCE_SUFFIXES)
+    ):
+        return node.targets[0].id, node.value.value
+    return None
+
+
+def _loaded_names(trees: list[ast.Module]) -> set[str]:
+    return {
+        node.id
+        for tree in trees
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load)
+    }
+
+
+def _is_unused_assignment(node: ast.stmt, loaded: set[str]) -> bool:
+    return (
+        isinstance(node, ast.Assign)
+        and all(isinstance(t, ast.Name) for t in node.targets)
+        and not any(t.id in loaded for t in node.targets)
+    )
+
+
+def _is_display(node: ast.stmt) -> bool:
+    if not isinstance(node, ast.Expr):
+        return False
+    return not isinstance(node.value, ast.Call) or _call_name(node.value) in DISPLAY_CALLS
+
+
+def _raw_strings(source: str) -> str:
+    """``source`` with string literals that have invalid escapes (``'(\\d+)'``)
+    made raw, where that leaves their value unchanged."""
+    lines = source.splitlines(keepends=True)
+    tokens = tokenize.generate_tokens(io.StringIO(source).readline)
+    for token in reversed(list(tokens)):
+        text = token.string
+        if token.type != tokenize.STRING or text[0] not in "'\"" or token.start[0] != token.end[0]:
+            continue
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", SyntaxWarning)
+            try:
+                ast.literal_eval(text)
+                continue
+            except SyntaxError:
+                pass
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", SyntaxWarning)
+            if ast.literal_eval("r" + text) != ast.literal_eval(text):
+                continue
+        row, col = token.start[0] - 1, token.start[1]
+        lines[row] = lines[row][:col] + "r" + lines[row][col:]
+    return "".join(lines)
+
+
+def extract(notebook: Path) -> str:
+    """The module source for ``notebook`` (see the module docstring)."""
+    cells = _cells(notebook)
+    with warnings.catch_warnings():
+        # A few of the notebooks' regexes are non-raw strings (see _raw_strings).
+        warnings.simplefilter("ignore", SyntaxWarning)
+        trees = [ast.parse(cell) for cell in cells]
+    loaded = _loaded_names(trees)
+    header: list[str] = []
+    body: list[str] = []
+    source_file = county = result = None
+
+    for cell, tree in zip(cells, trees):
+        if body == [] and all(isinstance(node, MODULE_LEVEL) for node in tree.body):
+            header.append(cell.strip("\n"))
+            continue
+        lines = cell.splitlines()
+        replaced: dict[int, Optional[str]] = {}  # first line -> replacement (None: drop)
+        spans: dict[int, int] = {}
+        for node in tree.body:
+            replacement = ...
+            assignment = _source_assignment(node)
+            if assignment is not None:
+                name, path = assignment
+                source_file = Path(path).name
+                replacement = f"{name} = source"
+            elif isinstance(node, ast.Expr) and _call_name(node.value) == "to_csv":
+                receiver = node.value.func.value
+                result = ast.unparse(receiver)
+                replacement = None
+            elif _is_display(node) or _is_unused_assignment(node, loaded):
+                replacement = None
+            if (
+                isinstance(node, ast.Assign)
+                and getattr(node.targets[0], "id", None) == "county_name"
+                and isinstance(node.value, ast.Constant)
+            ):
+                county = node.value.value
+            if replacement is not ...:
+                replaced[node.lineno - 1] = replacement
+                spans[node.lineno - 1] = node.end_lineno
+        kept, i = [], 0
+        while i < len(lines):
+            if i in replaced:
+                if replaced[i] is not None:
+                    kept.append(replaced[i])
+                i = spans[i]
+                continue
+            kept.append(lines[i])
+            i += 1
+        if any(line.strip() for line in kept):
+            body.append("\n".join(kept).strip("\n"))
+
+    if source_file is None or county is None or result is None:
+        raise ValueError(f"{notebook.name}: no source file, county_name or to_csv cell found")
+    parse_body = "\n\n".join(body)
+    parse_body = "\n".join(("    " + line) if line.strip() else "" for line in parse_body.splitlines())
+    docstring = (
+        f'"""{county} County 2024 primary precinct results.\n\n'
+        f"Generated from ``{notebook.name}``\n"
+        f'by ``parsers/notebook_modules.py extract``; edit the notebook, not this file.\n"""\n'
+    )
+    module = docstring + "\n" + "\n\n\n".join([
+        "\n\n".join(header[:1]) + "\n\n"
+        f"COUNTY = {county!r}\n"
+        f"SOURCE_FILE = {source_file!r}\n"
+        f"OUTPUT_FILE = {OUTPUT_TEMPLATE.format(county.lower())!r}",
+        *header[1:],
+        f"def parse(source):\n{parse_body}\n\n    return {result}",
+    ]) + "\n"
+    return _raw_strings(module)
+
+
+def notebooks(directory=NOTEBOOK_DIR) -> list[Path]:
+    return sorted(Path(directory).glob("*.ipynb"))
+
+
+def write_module(notebook: Path) -> Path:
+    path = notebook.with_suffix(".py")
+    path.write_text(extract(notebook))
+    return path
+
+
+def load_module(path: Path):
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_module(module_path: Path, sources: Path, out_dir: Path) -> tuple[str, str, float]:
+    """Run one generated module; ``(OUTPUT_FILE, status, seconds)``."""
+    start = time.perf_counter()
+    module = load_module(module_path)
+    source = sources / module.SOURCE_FILE
+    if not source.exists():
+        return module.OUTPUT_FILE, f"missing source {source}", 0.0
+    module.parse(str(source)).to_csv(out_dir / module.OUTPUT_FILE, index=False)
+    return module.OUTPUT_FILE, "ok", time.perf_counter() - start
+
+
+def diff_csv(new: Path, expected: Path) -> str:
+    """``identical``, or how many rows are only in one of the files."""
+    if not expected.exists():
+        return "no checked-in file"
+    if new.read_bytes() == expected.read_bytes():
+        return "identical"
+    import pandas as pd
+
+    left = pd.read_csv(new, dtype=str, keep_default_na=False)
+    right = pd.read_csv(expected, dtype=str, keep_default_na=False)
+    if list(left.columns) != list(right.columns):
+        return f"columns differ: {list(left.columns)} vs {list(right.columns)}"
+    merged = left.merge(right, how="outer", indicator=True)
+    counts = merged["_merge"].value_counts()
+    return (
+        f"{counts.get('left_only', 0)} rows only in the new file, "
+        f"{counts.get('right_only', 0)} only in the checked-in one"
+    )
+
+
+def run(sources, out_dir, jobs: int = 4, expected_dir=EXPECTED_DIR, notebook_dir=NOTEBOOK_DIR) -> int:
+    """Re-generate every county's CSV and diff it; the number of counties
+    that failed or differ."""
+    sources, out_dir, expected_dir = Path(sources), Path(out_dir), Path(expected_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    modules = [notebook.with_suffix(".py") for notebook in notebooks(notebook_dir)]
+    failed = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = [pool.submit(run_module, path, sources, out_dir) for path in modules]
+        for path, future in zip(modules, futures):
+            try:
+                output, status, seconds = future.result()
+            except Exception as e:  # one county's failure shouldn't stop the batch
+                print(f"{path.name}: failed: {e!r}")
+                failed += 1
+                continue
+            if status == "ok":
+                status = diff_csv(out_dir / output, expected_dir / output)
+            print(f"{output}: {status} ({seconds:.1f}s)")
+            failed += status != "identical"
+    print(f"{len(modules)} counties in {time.perf_counter() - start:.1f}s, {failed} differ or failed")
+    return failed
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("extract", help="write a module next to every notebook")
+    run_parser = commands.add_parser("run", help="re-generate and diff every county's CSV")
+    run_parser.add_argument("--sources", required=True, help="directory with the source PDFs")
+    run_parser.add_argument("--out", help="directory for the new CSVs (default: a temporary one)")
+    run_parser.add_argument("--jobs", type=int, default=4, help="worker processes (default 4)")
+    args = parser.parse_args(argv)
+
+    if args.command == "extract":
+        for notebook in notebooks():
+            print(write_module(notebook).relative_to(REPO_DIR))
+        return 0
+    if args.out:
+        return 1 if run(args.sources, args.out, args.jobs) else 0
+    with tempfile.TemporaryDirectory() as out_dir:
+        return 1 if run(args.sources, out_dir, args.jobs) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
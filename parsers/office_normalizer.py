@@ -0,0 +1,153 @@
+"""One table of office and party names for every engine and post-processor.
+
+Office headers arrive as ``DEM REPRESENTATIVE IN CONGRESS 13th DISTRICT``
+(Clarity, Electionware primaries), ``Representative in Congress`` (the
+state's results file), ``Member Of The Democratic State Comm`` (summary
+CSVs) or ``Representative in the General Assembly (District 196)`` (York).
+The aliases live in ``constants/offices.csv`` (``alias,office,district``,
+where ``district`` says whether the office takes one) and the party labels
+in ``constants/parties.csv`` (``alias,party``); both are read once.
+
+``normalize`` splits a raw header into ``(office, district, party)``::
+
+    normalize("DEM REPRESENTATIVE IN CONGRESS 13th DISTRICT")
+    # Office(office='U.S. House', district='13', party='DEM')
+    normalize("Member Of The Democratic State Comm")
+    # Office(office='Member of Democratic State Committee', district='', party='')
+    normalize("Judge of the Superior Court")
+    # Office(office=None, district='', party='')   -- not a shared office
+
+The district is read from an ``Nth DISTRICT`` (or truncated ``DISTRI``) or
+``(District N)`` phrase and kept only for offices that take one; the party
+from a leading or trailing party label. Headers the table doesn't know get
+``office`` None, so each caller keeps its own fallback (drop the row,
+title-case it). ``normalize(raw, strict=True)`` skips the prefix match, for
+callers that filter on the office (``Governor and Lieutenant Governor`` or
+``Attorney General Special`` are other contests, not ``Governor`` or
+``Attorney General``). Results are memoized per raw string, and
+``normalize_column`` maps a whole column with one lookup per distinct
+value.
+"""
+
+from __future__ import annotations
+
+import csv
+import re
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+CONSTANTS_DIR = Path(__file__).resolve().parent / "constants"
+OFFICES_FILE = CONSTANTS_DIR / "offices.csv"
+PARTIES_FILE = CONSTANTS_DIR / "parties.csv"
+
+Office = namedtuple("Office", "office district party")
+
+DISTRICT_ORDINAL_RE = re.compile(
+    r"\b(\d+)(?:ST|ND|RD|TH)\s+(?:LEGISLATIVE\s+|SENATORIAL\s+|CONGRESSIONAL\s+)?"
+    r"DIST(?:RICT|RIC|RI|R)?\b",
+    re.IGNORECASE,
+)
+DISTRICT_PARENS_RE = re.compile(r"\(\s*DISTRICT\s+(\d+)\s*\)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def office_aliases() -> dict[str, tuple[str, bool]]:
+    """``ALIAS -> (office, takes_district)``, in file order. Shared: copy
+    before adding engine-specific entries."""
+    with OFFICES_FILE.open(newline="") as fh:
+        return {row["alias"]: (row["office"], row["district"] == "yes") for row in csv.DictReader(fh)}
+
+
+@lru_cache(maxsize=None)
+def _parties() -> dict[str, str]:
+    with PARTIES_FILE.open(newline="") as fh:
+        return {row["alias"].upper(): row["party"] for row in csv.DictReader(fh)}
+
+
+@lru_cache(maxsize=None)
+def _offices() -> dict[str, tuple[str, bool]]:
+    # Aliases, plus every canonical name as itself (exact matches only).
+    offices = {office.upper(): (office, district) for office, district in office_aliases().values()}
+    offices.update(office_aliases())
+    return offices
+
+
+@lru_cache(maxsize=None)
+def _alias_positions() -> dict[str, int]:
+    return {alias: pos for pos, alias in enumerate(office_aliases())}
+
+
+def _prefix_lookup(key: str) -> Optional[tuple[str, bool]]:
+    """The office of the earliest-listed alias ``key`` starts with (as a
+    whole word)."""
+    positions = _alias_positions()
+    best = None  # (position, alias)
+    pos = key.find(" ")
+    while pos != -1:
+        position = positions.get(key[:pos])
+        if position is not None and (best is None or position < best[0]):
+            best = (position, key[:pos])
+        pos = key.find(" ", pos + 1)
+    return None if best is None else office_aliases()[best[1]]
+
+
+@lru_cache(maxsize=None)
+def party_code(raw: str) -> Optional[str]:
+    """The party abbreviation for a party label (``Democratic``, ``DEM``,
+    ``No Affiliation``), or None if it isn't in the table."""
+    return _parties().get(" ".join(raw.split()).upper())
+
+
+def _party_splits(text: str):
+    """``(rest, party)`` for each way ``text`` carries a party label: a
+    leading word, a trailing word or a trailing ``-DEM``."""
+    parties = _parties()
+    first, _, rest = text.partition(" ")
+    if rest and first in parties:
+        yield rest, parties[first]
+    for separator in (" ", "-"):
+        head, _, last = text.rpartition(separator)
+        if head and last in parties:
+            yield head.strip(" -"), parties[last]
+
+
+@lru_cache(maxsize=None)
+def normalize(raw: str, strict: bool = False) -> Office:
+    """``(office, district, party)`` for a raw office header (see the
+    module docstring). With ``strict`` only exact names match, never an
+    alias the header merely starts with."""
+    text = " ".join(raw.split()).upper()
+    district = ""
+    m = DISTRICT_ORDINAL_RE.search(text) or DISTRICT_PARENS_RE.search(text)
+    if m:
+        district = str(int(m.group(1)))
+        text = " ".join((text[:m.start()] + " " + text[m.end():]).split()).strip(" -,")
+
+    # Exact names (with or without a party label) before prefixes, so
+    # "REP IN CONGRESS" isn't read as a Republican "IN CONGRESS" and
+    # "GOVERNOR DEMOCRATIC" isn't read as a longer governor's title.
+    splits = [(text, ""), *_party_splits(text)]
+    lookups = (_offices().get,) if strict else (_offices().get, _prefix_lookup)
+    for lookup in lookups:
+        for key, party in splits:
+            hit = lookup(key)
+            if hit is not None:
+                office, takes_district = hit
+                return Office(office, district if takes_district else "", party)
+    return Office(None, district, splits[1][1] if len(splits) > 1 else "")
+
+
+def normalize_column(values):
+    """``normalize`` over a column (a pandas Series or any sequence of
+    strings): a DataFrame with ``office``, ``district`` and ``party``
+    columns on the same index, normalizing each distinct value once."""
+    import pandas as pd
+
+    series = values if isinstance(values, pd.Series) else pd.Series(list(values), dtype=object)
+    codes, uniques = pd.factorize(series.fillna("").astype(str))
+    table = pd.DataFrame([normalize(value) for value in uniques], columns=list(Office._fields))
+    frame = table.take(codes) if len(table) else pd.DataFrame(columns=list(Office._fields))
+    frame.index = series.index
+    return frame
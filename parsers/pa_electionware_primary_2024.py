@@ -10,7 +10,7 @@ The party-on-office-header parsing is handled by the shared
 ``electionware_primary_np`` engine.
 
 Usage:
-    python parsers/pa_electionware_primary_2024.py <County> <input.pdf> <output.csv>
+    python parsers/pa_electionware_primary_2024.py <County> <input.pdf>[:FIRST-LAST] [...] <output.csv>
 
 where <County> matches the name suffix of an existing
 ``parsers/pa_<county_lower>_general_2025_results_parser.py`` module
@@ -113,6 +113,7 @@ def load_config(county: str) -> PrimaryConfig:
         fallback_title_case=base.fallback_title_case,
         party_optional=base.party_optional,
         drop_term_token=base.drop_term_token,
+        text_backend=base.text_backend,
     )
 
 
@@ -120,18 +121,23 @@ if __name__ == "__main__":
     argv = sys.argv
     use_standard_extractor = False
     filtered = [argv[0]]
+    passthrough = []  # --profile[=trace.json] and --if-changed go to run_cli as-is
     for a in argv[1:]:
         if a == "--standard-extractor":
             use_standard_extractor = True
+        elif a.startswith("--profile") or a == "--if-changed":
+            passthrough.append(a)
         else:
             filtered.append(a)
-    if len(filtered) != 4:
+    if len(filtered) < 4:
         script = Path(argv[0]).name if argv else "parser"
-        sys.exit(f"Usage: {script} [--standard-extractor] <County> <input.pdf> <output.csv>")
+        sys.exit(
+            f"Usage: {script} [--standard-extractor] [--profile[=trace.json]] [--if-changed] "
+            "<County> <input.pdf>[:FIRST-LAST] [<input.pdf>[:FIRST-LAST] ...] <output.csv>"
+        )
     county = filtered[1]
-    pdf_path = filtered[2]
-    out_path = filtered[3]
     config = load_config(county)
     if use_standard_extractor:
         config.precinct_block_extractor = None
-    run_cli(config, argv=[filtered[0], pdf_path, out_path])
\ No newline at end of file
+    # Every input PDF (or page range) is parsed in one run into one CSV.
+    run_cli(config, argv=[filtered[0], *filtered[2:]] + passthrough)
\ No newline at end of file
@@ -85,6 +85,7 @@ def build_config() -> PrimaryConfig:
         fallback_title_case=base.fallback_title_case,
         party_optional=base.party_optional,
         drop_term_token=base.drop_term_token,
+        text_backend=base.text_backend,
         vote_tail_re=TWO_COL_VOTE_RE,
         vote_breakdown=False,
     )
@@ -93,4 +94,4 @@ def build_config() -> PrimaryConfig:
 if __name__ == "__main__":
     import sys
     config = build_config()
-    run_cli(config, argv=[sys.argv[0], sys.argv[1], sys.argv[2]])
\ No newline at end of file
+    run_cli(config, argv=sys.argv[:3] + [a for a in sys.argv[3:] if a.startswith("--profile")])
\ No newline at end of file
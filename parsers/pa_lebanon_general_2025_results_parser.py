@@ -47,9 +47,7 @@ Lebanon-specific quirks:
 """
 
 import re
-from typing import Iterable, Optional
-
-import natural_pdf as npdf
+from typing import TYPE_CHECKING, Iterable, Optional
 
 from electionware_precinct_np import (
     ElectionwareConfig,
@@ -57,6 +55,9 @@ from electionware_precinct_np import (
     title_case,
 )
 
+if TYPE_CHECKING:
+    import natural_pdf
+
 
 SKIP_PREFIXES = (
     "Summary Results Report Official Reports",
@@ -81,7 +82,7 @@ COUNTY_HEADER = "November 4, 2025 Lebanon County"
 
 
 def lebanon_extract_precinct_blocks(
-    pdf: "npdf.PDF", config: ElectionwareConfig
+    pdf: "natural_pdf.PDF", config: ElectionwareConfig
 ) -> Iterable[tuple[str, str]]:
     """Yield (precinct_name, full_text) for each Lebanon precinct.
 
@@ -70,6 +70,12 @@ CONFIG = PrimaryConfig(
 )
 
 
+def post_process(rows) -> None:
+    """Fill in the districts the PDF leaves out. ``county_registry`` runs
+    this too, so registry and script output match."""
+    rows.fill("district", "office", DISTRICT_FIXES)
+
+
 if __name__ == "__main__":
     argv = sys.argv
     if len(argv) != 3:
@@ -79,9 +85,7 @@ if __name__ == "__main__":
     if not pdf_path.exists():
         sys.exit(f"Missing PDF: {pdf_path}")
     rows, precinct_count = parse_primary_pdf(pdf_path, CONFIG)
-    for r in rows:
-        if not r["district"] and r["office"] in DISTRICT_FIXES:
-            r["district"] = DISTRICT_FIXES[r["office"]]
+    post_process(rows)
     write_primary_csv(rows, out_path)
     print(
         f"Wrote {len(rows)} rows across {precinct_count} precincts to {out_path}"
@@ -1,9 +1,51 @@
-from collections import namedtuple
+import argparse
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from pdfreader import PageDoesNotExist, SimplePDFViewer
 
 
 CandidateData = namedtuple('CandidateData', 'office district party candidate')
 
+# pages each worker renders per task when pages are rendered in parallel
+PAGES_PER_TASK = 8
+
+
+def jobs_from_argv(argv):
+    """The ``--jobs N`` switch every legacy parser script accepts (default 1),
+    read from the script's arguments in its ``__main__`` block."""
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument('--jobs', type=int, default=1)
+    args, _ = parser.parse_known_args(argv)
+    return max(1, args.jobs)
+
+
+def render_page_strings(filename, first_page, last_page):
+    """The strings of pages ``first_page`` .. ``last_page`` (1-based), in order;
+    stops early at the end of the document."""
+    with open(filename, 'rb') as f:
+        pdf_viewer = SimplePDFViewer(f)
+        pages = []
+        for page_number in range(first_page, last_page + 1):
+            try:
+                pdf_viewer.navigate(page_number)
+            except PageDoesNotExist:
+                break
+            pdf_viewer.render()
+            pages.append(pdf_viewer.canvas.strings)
+        return pages
+
+
+class PDFPage:
+    def __init__(self, page_number, strings):
+        self._page_number = page_number
+        self._strings = strings
+
+    def get_page_number(self):
+        return self._page_number
+
+    def get_strings(self):
+        return self._strings
+
 
 class PDFStringIterator:
     def __init__(self, strings):
@@ -29,17 +71,29 @@ class PDFStringIterator:
 
 
 class PDFPageIterator:
-    def __init__(self, filename):
+    """Walks a PDF's pages in order; each step returns the iterator itself as
+    the current page. With ``jobs`` > 1 the pages of a PDF file are
+    rendered ahead in a process pool and handed out in the same order, so
+    page parsers are unchanged; the file is then only opened by the workers.
+    ``get_page`` reads any one page directly."""
+
+    def __init__(self, filename, jobs=1):
+        self._filename = filename
+        self._jobs = max(1, jobs)
         self._pdf_viewer = None
         self._page_number = 0
         self._rendered = False
-        if filename:
+        self._strings = None
+        self._rendered_pages = None
+        if filename and self._jobs == 1:
             self._pdf_viewer = SimplePDFViewer(open(filename, 'rb'))
 
     def __iter__(self):
         return self
 
     def __next__(self):
+        if self._filename and self._jobs > 1:
+            return self._next_rendered_page()
         try:
             self._go_to_next_pdf_page()
             return self
@@ -50,17 +104,60 @@ class PDFPageIterator:
         return self._page_number
 
     def get_strings(self):
+        if self._strings is not None:
+            return self._strings
         if not self._rendered:
             self._pdf_viewer.render()
             self._rendered = True
         return self._pdf_viewer.canvas.strings
 
+    def get_page(self, page_number):
+        """Page ``page_number`` (1-based), independent of the iteration."""
+        pages = render_page_strings(self._filename, page_number, page_number)
+        if not pages:
+            raise PageDoesNotExist(page_number)
+        return PDFPage(page_number, pages[0])
+
     def _go_to_next_pdf_page(self):
         if self._page_number != 0:
             self._pdf_viewer.next()
         self._page_number += 1
         self._rendered = False
 
+    def _next_rendered_page(self):
+        if self._rendered_pages is None:
+            self._rendered_pages = self._render_pages()
+        self._strings = next(self._rendered_pages)
+        self._page_number += 1
+        return self
+
+    def _render_pages(self):
+        # At most ``2 * jobs`` tasks are in flight; a task that comes back
+        # short has reached the end of the document.
+        with ProcessPoolExecutor(max_workers=self._jobs) as pool:
+            pending = deque()
+            next_page = 1
+
+            def submit_next():
+                nonlocal next_page
+                last_page = next_page + PAGES_PER_TASK - 1
+                pending.append(pool.submit(render_page_strings, self._filename, next_page, last_page))
+                next_page = last_page + 1
+
+            for _ in range(2 * self._jobs):
+                submit_next()
+            try:
+                while pending:
+                    pages = pending.popleft().result()
+                    if len(pages) < PAGES_PER_TASK:
+                        yield from pages
+                        return
+                    submit_next()
+                    yield from pages
+            finally:
+                for future in pending:
+                    future.cancel()
+
 
 class TableHeader:
     _congressional_keywords = None
@@ -284,7 +381,6 @@ def pdf_to_csv(pdf, csv_writer, pdf_page_parser_clazz):
     previous_table_header = None
     previous_party = ''
     for page in pdf:
-        print(f'processing page {page.get_page_number()}')
         pdf_page_parser = pdf_page_parser_clazz(page, previous_table_header, previous_party)
         for row in pdf_page_parser:
             csv_writer.writerow(row._asdict())
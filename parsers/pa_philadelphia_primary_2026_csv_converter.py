@@ -16,28 +16,11 @@ import re
 import sys
 from pathlib import Path
 
+from office_normalizer import normalize, party_code
 
 RACE_RE = re.compile(
     r'^(.+?)\s+(Democratic|Republican|Nonpartisan)\s+\(VOTE FOR\s+\d+\)$'
 )
-DISTRICT_RE = re.compile(r"\b(\d+)(?:ST|ND|RD|TH)\s+DISTR(?:ICT)?\b", re.IGNORECASE)
-
-OFFICE_MAP = {
-    "GOVERNOR": ("Governor", False),
-    "LIEUTENANT GOVERNOR": ("Lieutenant Governor", False),
-    "REPRESENTATIVE IN CONGRESS": ("U.S. House", True),
-    "SENATOR IN THE GENERAL ASSEMBLY": ("State Senate", True),
-    "REPRESENTATIVE IN THE GENERAL ASSEMBLY": ("State House", True),
-    "MEMBER OF DEMOCRATIC STATE COMMITEE": ("Member of Democratic State Committee", False),
-    "MEMBER OF DEMOCRATIC STATE COMMITTEE": ("Member of Democratic State Committee", False),
-    "MEMBER OF REPUBLICAN STATE COMMITTEE": ("Member of Republican State Committee", False),
-}
-
-PARTY_MAP = {
-    "Democratic": "DEM",
-    "Republican": "REP",
-    "Nonpartisan": "NON",
-}
 
 # Strip trailing party abbreviation: "JOSH SHAPIRO DEM" -> "Josh Shapiro".
 _TRAILING_PARTY_RE = re.compile(r"\s+(DEM|REP|NON|GRN|LBR|CON|IND|WEP|WFP)$")
@@ -72,23 +55,15 @@ def _parse_race(race_cell: str) -> tuple[str, str, str]:
     if not m:
         return ("", "", "")
     office_raw, party_raw = m.group(1).strip(), m.group(2)
-    party = PARTY_MAP[party_raw]
+    party = party_code(party_raw)
     # Skip per-precinct Ward Executive Committee races (precinct id embedded).
     if office_raw.upper().startswith("WARD EXECUTIVE COMMITTEE"):
         return ("", "", "")
-    upper = office_raw.upper()
-    # State Committee races: district is the state committee district, not a
-    # legislative one. Map to the canonical name without extracting district.
-    if "MEMBER OF DEMOCRATIC STATE COMM" in upper or "MEMBER OF DEMOCRATIC STATE COMMITTEE" in upper:
-        return ("Member of Democratic State Committee", "", party)
-    if "MEMBER OF REPUBLICAN STATE COMMITTEE" in upper:
-        return ("Member of Republican State Committee", "", party)
-    dm = DISTRICT_RE.search(upper)
-    district = str(int(dm.group(1))) if dm else ""
-    base = DISTRICT_RE.sub("", upper).strip(" -").strip() if dm else upper
-    if base in OFFICE_MAP:
-        norm, extract = OFFICE_MAP[base]
-        return (norm, district if extract else "", party)
+    # State Committee races come back without a district: theirs is the
+    # state committee district, not a legislative one.
+    office, district, _ = normalize(office_raw)
+    if office is not None:
+        return (office, district, party)
     # Fallback: keep title-cased office.
     return (office_raw.title(), district, party)
 
@@ -28,7 +28,6 @@ import re
 import sys
 from pathlib import Path
 
-import natural_pdf as npdf
 
 COUNTY = "Schuylkill"
 
@@ -77,6 +76,8 @@ def parse_votes(m):
 
 def parse_pdf(pdf_path, precinct):
     """Parse a single precinct PDF, yielding row dicts."""
+    import natural_pdf as npdf
+
     pdf = npdf.PDF(str(pdf_path))
     text = "\n".join(page.extract_text() or "" for page in pdf.pages)
     lines = [ln.strip() for ln in text.split("\n")]
@@ -25,6 +25,16 @@ from pa_electionware_primary_2026 import load_config
 DISTRICT_FIXES = {"U.S. House": "14", "State Senate": "46"}
 
 
+def build_config():
+    return load_config("Washington")
+
+
+def post_process(rows) -> None:
+    """Fill in the districts the PDF leaves out. ``county_registry`` runs
+    this too, so registry and script output match."""
+    rows.fill("district", "office", DISTRICT_FIXES)
+
+
 def main(argv: list[str]) -> None:
     if len(argv) != 3:
         sys.exit(f"Usage: {Path(argv[0]).name} <input.pdf> <output.csv>")
@@ -32,11 +42,8 @@ def main(argv: list[str]) -> None:
     out_path = Path(argv[2])
     if not pdf_path.exists():
         sys.exit(f"Missing PDF: {pdf_path}")
-    config = load_config("Washington")
-    rows, precinct_count = parse_primary_pdf(pdf_path, config)
-    for r in rows:
-        if not r.get("district") and r.get("office") in DISTRICT_FIXES:
-            r["district"] = DISTRICT_FIXES[r["office"]]
+    rows, precinct_count = parse_primary_pdf(pdf_path, build_config())
+    post_process(rows)
     write_primary_csv(rows, out_path)
     print(
         f"Wrote {len(rows)} rows across {precinct_count} precincts to {out_path}"
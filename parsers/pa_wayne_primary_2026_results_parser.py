@@ -49,6 +49,12 @@ CONFIG = PrimarySovcConfig(
 )
 
 
+def post_process(rows) -> None:
+    """Fill in the districts the PDF leaves out. ``county_registry`` runs
+    this too, so registry and script output match."""
+    rows.fill("district", "office", DISTRICT_FIXES)
+
+
 if __name__ == "__main__":
     argv = sys.argv
     if len(argv) != 3:
@@ -58,8 +64,6 @@ if __name__ == "__main__":
     if not pdf_path.exists():
         sys.exit(f"Missing PDF: {pdf_path}")
     rows = parse_primary_sovc_pdf(pdf_path, CONFIG)
-    for r in rows:
-        if not r.get("district") and r.get("office") in DISTRICT_FIXES:
-            r["district"] = DISTRICT_FIXES[r["office"]]
+    post_process(rows)
     write_csv(rows, out_path)
     print(f"Wrote {len(rows)} rows to {out_path}")
\ No newline at end of file
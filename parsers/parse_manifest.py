@@ -0,0 +1,209 @@
+"""Output manifests for the shared engines, and ``--if-changed`` reruns.
+
+Every shared engine's ``run_cli`` writes ``<output>.manifest.json`` next to
+the CSV it produces, recording what the output was built from:
+
+  - the input PDFs' sha256 (one, or one per file for a multi-PDF run);
+  - the sha256 of every source file under ``parsers/`` the run had loaded:
+    the county script (``config``: ``__main__`` and any ``pa_*`` county
+    module it borrowed a config from) and the engine with the shared
+    modules it uses (``engine``);
+  - the options that change the output (LLM model, county name, ...);
+  - the output's own sha256, its row count, how long the parse took and
+    when it finished.
+
+With ``--if-changed`` the run first compares the manifest with the files as
+they are now and exits without opening the PDF if none of them (nor the
+output) changed, so re-running a batch only re-parses the counties whose
+PDF, script or engine moved. Otherwise it says what changed and parses.
+
+Usage in ``run_cli``::
+
+    argv, if_changed = parse_manifest.split_if_changed_arg(argv)
+    ...
+    if if_changed and parse_manifest.up_to_date(out_path, pdf_path):
+        print(f"{out_path} is up to date")
+        return
+    with parse_manifest.recording(out_path, pdf_path) as run:
+        rows = ...
+        run.rows = len(rows)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, Optional
+
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 2
+HASH_CHUNK = 1 << 20
+
+PARSERS_DIR = Path(__file__).resolve().parent
+REPO_DIR = PARSERS_DIR.parent
+
+
+def split_if_changed_arg(argv: list[str]) -> tuple[list[str], bool]:
+    """Strip ``--if-changed`` from ``argv``; returns ``(argv, if_changed)``."""
+    rest = [arg for arg in argv if arg != "--if-changed"]
+    return rest, len(rest) != len(argv)
+
+
+def manifest_path(output) -> Path:
+    output = Path(output)
+    return output.with_name(output.name + MANIFEST_SUFFIX)
+
+
+@lru_cache(maxsize=None)
+def _sha256(path: str, size: int, mtime_ns: int) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_sha256(path) -> Optional[str]:
+    """The file's sha256, or None if it doesn't exist. Memoized on size and
+    mtime, so the check and the record hash a large PDF once."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return _sha256(str(path), stat.st_size, stat.st_mtime_ns)
+
+
+def _label(path: Path) -> str:
+    try:
+        return path.relative_to(REPO_DIR).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def _main_file() -> Optional[Path]:
+    main_file = getattr(sys.modules.get("__main__"), "__file__", None)
+    return Path(main_file).resolve() if main_file else None
+
+
+def loaded_sources() -> dict[str, list[Path]]:
+    """The source files under ``parsers/`` this process has loaded, as
+    ``{"config": [...], "engine": [...]}``."""
+    main_file = _main_file()
+    config = [main_file] if main_file else []
+    engine = []
+    for module in list(sys.modules.values()):
+        module_file = getattr(module, "__file__", None)
+        if not module_file:
+            continue
+        path = Path(module_file).resolve()
+        if path == main_file or path.suffix != ".py" or PARSERS_DIR not in path.parents:
+            continue
+        (config if path.name.startswith("pa_") else engine).append(path)
+    return {"config": sorted(set(config)), "engine": sorted(set(engine))}
+
+
+def _hashes(paths) -> dict[str, Optional[str]]:
+    return {_label(path): file_sha256(path) for path in paths}
+
+
+def _inputs(input_paths) -> list:
+    """``input_paths`` as a list: one path, or a sequence of them."""
+    if isinstance(input_paths, (str, os.PathLike)):
+        return [input_paths]
+    return list(input_paths)
+
+
+def _load(output) -> Optional[dict]:
+    try:
+        with manifest_path(output).open() as fh:
+            manifest = json.load(fh)
+    except (FileNotFoundError, ValueError):
+        return None
+    return manifest if manifest.get("version") == MANIFEST_VERSION else None
+
+
+def changes(output, input_paths, options: Optional[dict] = None) -> list[str]:
+    """What differs between ``output``'s manifest and the files as they are
+    now; empty when a rerun would reproduce ``output``."""
+    manifest = _load(output)
+    if manifest is None:
+        return ["no manifest"]
+    found = []
+    if file_sha256(output) != manifest["output"]["sha256"]:
+        found.append("output")
+    inputs = _inputs(input_paths)
+    recorded_inputs = manifest["inputs"]
+    if [str(path) for path in inputs] != [entry["path"] for entry in recorded_inputs]:
+        found.append("inputs")
+    else:
+        for path, entry in zip(inputs, recorded_inputs):
+            if file_sha256(path) != entry["sha256"]:
+                found.append(f"input {path}")
+    if (options or {}) != manifest["options"]:
+        found.append("options")
+    main_file = _main_file()
+    for kind in ("config", "engine"):
+        recorded = manifest[kind]
+        if kind == "config" and main_file and _label(main_file) not in recorded:
+            found.append(f"config {_label(main_file)}")
+        for label, sha in recorded.items():
+            if file_sha256(REPO_DIR / label) != sha:
+                found.append(f"{kind} {label}")
+    return found
+
+
+def up_to_date(output, input_paths, options: Optional[dict] = None) -> bool:
+    """True if ``changes`` finds nothing; otherwise prints what changed to
+    stderr."""
+    found = changes(output, input_paths, options)
+    if found:
+        print(f"{output}: re-parsing ({', '.join(found)} changed)", file=sys.stderr)
+    return not found
+
+
+class Run:
+    """Filled in by the engine inside ``recording``. An engine that skipped
+    part of its input (a page that failed) sets ``complete`` to False, so no
+    manifest vouches for the output and ``--if-changed`` parses it again."""
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.complete = True
+
+
+@contextmanager
+def recording(output, input_paths, options: Optional[dict] = None) -> Iterator[Run]:
+    """Time the block and, if it finishes with ``run.complete``, write
+    ``output``'s manifest (an incomplete run removes any earlier one).
+    ``input_paths`` is the input PDF, or a list of them."""
+    inputs = [{"path": str(path), "sha256": file_sha256(path)} for path in _inputs(input_paths)]
+    run = Run()
+    start = time.perf_counter()
+    yield run
+    seconds = time.perf_counter() - start
+    path = manifest_path(output)
+    if not run.complete:
+        path.unlink(missing_ok=True)
+        return
+    sources = loaded_sources()
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "inputs": inputs,
+        "config": _hashes(sources["config"]),
+        "engine": _hashes(sources["engine"]),
+        "options": options or {},
+        "output": {"sha256": file_sha256(output), "rows": run.rows},
+        "seconds": round(seconds, 3),
+        "finished": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w") as fh:
+        json.dump(manifest, fh, indent=1)
+    os.replace(tmp, path)
@@ -4,21 +4,19 @@ import re
 import sys
 from pathlib import Path
 
+from pdftotext_stream import pdftotext_lines
+
 def convert_pdf_to_text(pdf_path):
     """Convert PDF to text using pdftotext with layout preservation."""
     try:
-        subprocess.run(['pdftotext', '-layout', pdf_path], check=True)
-        return str(Path(pdf_path).with_suffix('.txt'))
+        return ''.join(pdftotext_lines(pdf_path))
     except subprocess.CalledProcessError as e:
         print(f"Error converting PDF to text: {e}", file=sys.stderr)
         sys.exit(1)
 
-def process_text_file(text_path):
-    """Process the text file according to specified patterns and filters."""
+def process_text(content):
+    """Apply the specified patterns and filters to pdftotext output."""
     try:
-        with open(text_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-
         # Pattern replacements
         replacements = [
             (r'\f', ''),                    # Remove form feeds
@@ -99,9 +97,7 @@ def process_text_file(text_path):
             if not any(re.match(pattern, line) for pattern in filter_patterns):
                 filtered_lines.append(line)
 
-        # Write processed content back to file
-        with open(text_path, 'w', encoding='utf-8') as file:
-            file.write('\n'.join(filtered_lines))
+        return '\n'.join(filtered_lines)
 
     except Exception as e:
         print(f"Error processing text file: {e}", file=sys.stderr)
@@ -117,8 +113,10 @@ def main():
         print(f"Error: File '{pdf_path}' not found", file=sys.stderr)
         sys.exit(1)
 
-    text_path = convert_pdf_to_text(pdf_path)
-    process_text_file(text_path)
+    text_path = Path(pdf_path).with_suffix('.txt')
+    content = process_text(convert_pdf_to_text(pdf_path))
+    with open(text_path, 'w', encoding='utf-8') as file:
+        file.write(content)
     print(f"Processing complete. Output saved to: {text_path}")
 
 if __name__ == '__main__':
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Stream ``pdftotext -layout`` output as lines, without a temp file.
+
+The pdftotext-based scripts (``electionware_text_county.py``,
+``electionware_text_precinct.py``, ``pdf_parser.py``) used to write the
+whole report to a temp file and ``readlines()`` it before parsing. Here the
+document is split into page ranges, each range runs as its own
+``pdftotext -f N -l M ... -`` process on a small worker pool, and the
+ranges' stdout is yielded in page order as soon as the next one is ready,
+so parsing the first pages overlaps extracting the rest. Lines come out
+exactly as ``readlines()`` on the single-run output would return them:
+``\\n``-terminated, with each page's form feed kept at the start of the
+next page's first line.
+
+Without ``pdfinfo`` (to count pages) the whole document is read from one
+process's stdout instead.
+
+``LookaheadLines`` wraps the stream for parsers written against a list:
+``lines[i]`` pulls lines on demand, ``lines.has(i)`` replaces
+``i < len(lines)``, and ``release(i)`` drops lines the parser will not
+revisit.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import re
+import subprocess
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional
+
+PAGES_PER_CHUNK = 25
+MAX_WORKERS = 4
+
+
+def page_count(pdf_path) -> Optional[int]:
+    """The PDF's page count from ``pdfinfo``, or None if it can't be read."""
+    try:
+        proc = subprocess.run(
+            ["pdfinfo", str(pdf_path)], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    match = re.search(r"^Pages:\s+(\d+)", proc.stdout, re.MULTILINE)
+    return int(match.group(1)) if match else None
+
+
+def _command(pdf_path, first: Optional[int] = None, last: Optional[int] = None) -> list[str]:
+    command = ["pdftotext", "-layout"]
+    if first is not None:
+        command += ["-f", str(first), "-l", str(last)]
+    return command + [str(pdf_path), "-"]
+
+
+def _run_range(pdf_path, first: int, last: int) -> str:
+    proc = subprocess.run(_command(pdf_path, first, last), capture_output=True, check=True)
+    return proc.stdout.decode("utf-8")
+
+
+def _stream_whole(pdf_path) -> Iterator[str]:
+    command = _command(pdf_path)
+    # stderr goes to a file, not a second pipe: poppler can print more
+    # "Syntax Error" warnings for a damaged PDF than a pipe buffer holds, and
+    # it would block on them while we block reading stdout.
+    with tempfile.TemporaryFile() as errors:
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=errors) as proc:
+            yield from io.TextIOWrapper(proc.stdout, encoding="utf-8", newline="\n")
+        if proc.returncode:
+            errors.seek(0)
+            stderr = errors.read().decode("utf-8", "replace")
+            raise subprocess.CalledProcessError(proc.returncode, command, stderr=stderr)
+
+
+def split_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Re-split consecutive pieces of one text into ``\\n``-terminated lines
+    (the last may be unterminated), joining a line cut across pieces. Form
+    feeds are not line breaks, matching ``readlines()``."""
+    carry = ""
+    for chunk in chunks:
+        parts = (carry + chunk).split("\n")
+        carry = parts.pop()
+        for part in parts:
+            yield part + "\n"
+    if carry:
+        yield carry
+
+
+def pdftotext_lines(
+    pdf_path,
+    pages_per_chunk: int = PAGES_PER_CHUNK,
+    workers: Optional[int] = None,
+) -> Iterator[str]:
+    """Yield ``pdftotext -layout`` output for ``pdf_path`` line by line.
+
+    Page ranges of ``pages_per_chunk`` run concurrently on up to
+    ``workers`` processes (default: CPU count, at most ``MAX_WORKERS``);
+    at most ``workers`` ranges are extracted ahead of the consumer. Raises
+    ``FileNotFoundError`` if pdftotext is not installed and
+    ``subprocess.CalledProcessError`` if it fails.
+    """
+    pages = page_count(pdf_path)
+    if pages is None or pages <= pages_per_chunk:
+        yield from _stream_whole(pdf_path)
+        return
+    workers = workers or min(os.cpu_count() or 1, MAX_WORKERS)
+    ranges = iter(
+        (first, min(first + pages_per_chunk - 1, pages))
+        for first in range(1, pages + 1, pages_per_chunk)
+    )
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending: deque = deque()
+
+        def submit_next() -> None:
+            page_range = next(ranges, None)
+            if page_range is not None:
+                pending.append(pool.submit(_run_range, pdf_path, *page_range))
+
+        for _ in range(workers):
+            submit_next()
+
+        def chunks() -> Iterator[str]:
+            try:
+                while pending:
+                    text = pending.popleft().result()
+                    submit_next()
+                    yield text
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        yield from split_lines(chunks())
+
+
+class LookaheadLines:
+    """A line iterator with list-style random access for index-based parsers.
+
+    ``lines[i]`` reads ahead from the source as far as ``i``; ``has(i)``
+    is ``i < len(lines)`` without reading past ``i``. ``release(i)`` forgets
+    every line before ``i``; indexing a released line raises IndexError.
+    """
+
+    def __init__(self, source: Iterable[str]) -> None:
+        self._source = iter(source)
+        self._buffer: deque[str] = deque()
+        self._start = 0  # index of _buffer[0]
+        self._exhausted = False
+
+    def _fill(self, index: int) -> bool:
+        while self._start + len(self._buffer) <= index:
+            if self._exhausted:
+                return False
+            try:
+                self._buffer.append(next(self._source))
+            except StopIteration:
+                self._exhausted = True
+                return False
+        return True
+
+    def has(self, index: int) -> bool:
+        return index >= 0 and (index < self._start + len(self._buffer) or self._fill(index))
+
+    def __getitem__(self, index: int) -> str:
+        offset = index - self._start
+        if 0 <= offset < len(self._buffer):
+            return self._buffer[offset]
+        if offset < 0 or not self._fill(index):
+            raise IndexError(index)
+        return self._buffer[offset]
+
+    def release(self, index: int) -> None:
+        while self._start < index and self._buffer:
+            self._buffer.popleft()
+            self._start += 1
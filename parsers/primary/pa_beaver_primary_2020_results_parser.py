@@ -1,6 +1,7 @@
 import csv
 import os
-from parsers.pa_pdf_parser import PDFPageIterator
+import sys
+from parsers.pa_pdf_parser import PDFPageIterator, jobs_from_argv
 from parsers.electionware_parser import pdf_to_csv, ElectionwarePDFStringIterator, \
     ElectionwarePDFTableParser, ElectionwarePDFPageParser
 
@@ -79,7 +80,8 @@ class BeaverPDFPageParser(ElectionwarePDFPageParser):
 
 
 if __name__ == "__main__":
+    jobs = jobs_from_argv(sys.argv[1:])
     with open(OUTPUT_FILE, 'w', newline='') as f:
-        pdf_to_csv(PDFPageIterator(BEAVER_FILE),
+        pdf_to_csv(PDFPageIterator(BEAVER_FILE, jobs=jobs),
                    csv.DictWriter(f, OUTPUT_HEADER),
                    BeaverPDFPageParser)
@@ -1,7 +1,8 @@
 from collections import namedtuple
 import csv
 import os
-from parsers.pa_pdf_parser import PDFPageIterator, PDFStringIterator
+import sys
+from parsers.pa_pdf_parser import PDFPageIterator, jobs_from_argv, PDFStringIterator
 from parsers.constants.pa_candidates_2020 import STATEWIDE_PRIMARY_CANDIDATES
 
 
@@ -311,5 +312,6 @@ def pdf_to_csv(pdf, csv_writer):
 
 
 if __name__ == "__main__":
+    jobs = jobs_from_argv(sys.argv[1:])
     with open(OUTPUT_FILE, 'w', newline='') as f:
-        pdf_to_csv(PDFPageIterator(BERKS_FILE), csv.DictWriter(f, OUTPUT_HEADER))
+        pdf_to_csv(PDFPageIterator(BERKS_FILE, jobs=jobs), csv.DictWriter(f, OUTPUT_HEADER))
@@ -1,7 +1,8 @@
 from collections import defaultdict, namedtuple
 import csv
 import os
-from parsers.pa_pdf_parser import PDFPageIterator, PDFPageParser,\
+import sys
+from parsers.pa_pdf_parser import PDFPageIterator, jobs_from_argv, PDFPageParser,\
     TableBodyParser, TableHeaderParser, TableHeader, pdf_to_csv
 from parsers.constants.pa_candidates_2020 import STATEWIDE_PRIMARY_CANDIDATES
 
@@ -234,5 +235,6 @@ class BradfordPDFPageParser(PDFPageParser):
 
 
 if __name__ == "__main__":
+    jobs = jobs_from_argv(sys.argv[1:])
     with open(OUTPUT_FILE, 'w', newline='') as f:
-        pdf_to_csv(PDFPageIterator(BRADFORD_FILE), csv.DictWriter(f, OUTPUT_HEADER), BradfordPDFPageParser)
+        pdf_to_csv(PDFPageIterator(BRADFORD_FILE, jobs=jobs), csv.DictWriter(f, OUTPUT_HEADER), BradfordPDFPageParser)
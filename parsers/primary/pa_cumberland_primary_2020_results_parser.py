@@ -1,6 +1,7 @@
 import csv
 import os
-from parsers.pa_pdf_parser import PDFPageIterator
+import sys
+from parsers.pa_pdf_parser import PDFPageIterator, jobs_from_argv
 from parsers.electionware_parser import ElectionwarePDFStringIterator, \
     ElectionwarePDFTableParser, ElectionwarePDFPageParser
 
@@ -119,14 +120,15 @@ def append_pdf_to_csv(pdf_page_iterator, csv_writer, party):
             csv_writer.writerow(row)
 
 
-def pdfs_to_csv(csv_writer):
+def pdfs_to_csv(csv_writer, jobs=1):
     csv_writer.writeheader()
     for party in CUMBERLAND_PARTIES:
         cumberland_file = CUMBERLAND_FILE_FORMAT.format(party)
-        pdf_page_iterator = PDFPageIterator(cumberland_file)
+        pdf_page_iterator = PDFPageIterator(cumberland_file, jobs=jobs)
         append_pdf_to_csv(pdf_page_iterator, csv_writer, party)
 
 
 if __name__ == "__main__":
+    jobs = jobs_from_argv(sys.argv[1:])
     with open(OUTPUT_FILE, 'w', newline='') as f:
-        pdfs_to_csv(csv.DictWriter(f, OUTPUT_HEADER))
+        pdfs_to_csv(csv.DictWriter(f, OUTPUT_HEADER), jobs=jobs)
@@ -1,7 +1,8 @@
 import csv
 import os
+import sys
 from parsers.constants.pa_candidates_2020 import STATEWIDE_PRIMARY_CANDIDATES
-from parsers.pa_pdf_parser import PDFPageIterator, PDFStringIterator
+from parsers.pa_pdf_parser import PDFPageIterator, jobs_from_argv, PDFStringIterator
 
 
 COUNTY = 'Indiana'
@@ -911,5 +912,6 @@ def pdf_to_csv(pdf, csv_writer):
 
 
 if __name__ == "__main__":
+    jobs = jobs_from_argv(sys.argv[1:])
     with open(OUTPUT_FILE, 'w', newline='') as f:
-        pdf_to_csv(PDFPageIterator(INDIANA_FILE), csv.DictWriter(f, OUTPUT_HEADER))
+        pdf_to_csv(PDFPageIterator(INDIANA_FILE, jobs=jobs), csv.DictWriter(f, OUTPUT_HEADER))
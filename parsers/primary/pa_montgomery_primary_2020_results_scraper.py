@@ -1,8 +1,11 @@
 import csv
-import json
 import os
-import requests
-from time import sleep
+import sys
+from pathlib import Path
+
+# arcgis_client lives in parsers/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from arcgis_client import ArcgisClient, ArcgisQuery  # noqa: E402
 
 
 COUNTY = 'Montgomery'
@@ -28,36 +31,25 @@ MONTGOMERY_PRIMARY_2020_RESULTS_URL = ARCGIS_SERVICES_PATH + MONTGOMERY_PRIMARY_
 
 QUERY_FIELDS = ['Contest', 'Party', 'Candidate', 'Precinct_Name', 'NumVotes']
 QUERY_RECORD_BLOCK_SIZE = 1000
-QUERY_SPACING_IN_SECONDS = 30  # don't spam requests; total process should be <50 queries
-
-
-class ArcgisIterator:
-    def __iter__(self):
-        result_offset = 0
-        done = False
-        while not done:
-            print(f'processing feature {result_offset + 1} - {result_offset + QUERY_RECORD_BLOCK_SIZE}')
-            features = self._get_next_feature_block(result_offset)
-            for feature in features:
-                yield feature
-            done = len(features) < QUERY_RECORD_BLOCK_SIZE
-            if not done:
-                result_offset += QUERY_RECORD_BLOCK_SIZE
-                sleep(QUERY_SPACING_IN_SECONDS)
-
-    def _get_next_feature_block(self, result_offset):
-        params = {
-            'f': 'json',
-            'where': '(1=1)',
-            'outFields': ','.join(QUERY_FIELDS),
-            'orderByFields': ','.join(QUERY_FIELDS) + " DESC",
-            'resultOffset': result_offset,
-            'resultRecordCount': QUERY_RECORD_BLOCK_SIZE,
-            'quantizationParameters': '{"mode":"edit"}',
-        }
-        response = requests.get(MONTGOMERY_PRIMARY_2020_RESULTS_URL, params)
-        json_data = json.loads(response.text)
-        return json_data['features']
+QUERY_SPACING_IN_SECONDS = 2  # between request starts; total process should be <50 queries
+QUERY_WORKERS = 4
+CACHE_DIR = '.arcgis_cache'  # saved responses, re-downloaded when the layer is edited
+
+RESULTS_QUERY = ArcgisQuery(
+    MONTGOMERY_PRIMARY_2020_RESULTS_URL,
+    out_fields=QUERY_FIELDS,
+    order_by=','.join(QUERY_FIELDS) + " DESC",
+    page_size=QUERY_RECORD_BLOCK_SIZE,
+    extra_params={'quantizationParameters': '{"mode":"edit"}'},
+)
+
+
+def arcgis_features():
+    client = ArcgisClient(CACHE_DIR, workers=QUERY_WORKERS, min_interval=QUERY_SPACING_IN_SECONDS)
+    for index, feature in enumerate(client.features(RESULTS_QUERY)):
+        if index % QUERY_RECORD_BLOCK_SIZE == 0:
+            print(f'processing feature {index + 1}')
+        yield feature
 
 
 def extract_party_from_office(office, party):
@@ -77,8 +69,8 @@ def extract_district_from_office(office):
     return office, district
 
 
-def process_features(arcgis_iterator):
-    for feature in arcgis_iterator:
+def process_features(features):
+    for feature in features:
         raw_data = feature['attributes']
         office = raw_data['Contest']
         office_is_invalid = 'Delegate' in office
@@ -102,7 +94,7 @@ def main():
     with open(OUTPUT_FILE, 'w', newline='') as f_out:
         csv_writer = csv.DictWriter(f_out, OUTPUT_HEADER)
         csv_writer.writeheader()
-        for row in process_features(ArcgisIterator()):
+        for row in process_features(arcgis_features()):
             csv_writer.writerow(row)
 
 
@@ -1,6 +1,7 @@
 import os
+import sys
 import csv
-from parsers.pa_pdf_parser import PDFStringIterator, PDFPageIterator
+from parsers.pa_pdf_parser import PDFStringIterator, PDFPageIterator, jobs_from_argv
 
 COUNTY = 'PERRY'
 
@@ -152,6 +153,7 @@ def pdf_to_csv(pdf, csv_writer):
 
 
 if __name__ == "__main__":
+    jobs = jobs_from_argv(sys.argv[1:])
     with open(OUTPUT_FILE, 'w', newline='') as f:
-        pdf_to_csv(PDFPageIterator(PERRY_FILE),
+        pdf_to_csv(PDFPageIterator(PERRY_FILE, jobs=jobs),
                    csv.DictWriter(f, OUTPUT_HEADER))
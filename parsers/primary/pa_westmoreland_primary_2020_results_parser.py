@@ -1,10 +1,13 @@
 from collections import defaultdict, namedtuple
-from io import BytesIO
-from zipfile import ZipFile
-import clarify
-import requests
+from pathlib import Path
 import csv
 import os
+import sys
+
+# clarity_stream and office_normalizer live in parsers/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from clarity_stream import ClarityDetail  # noqa: E402
+from office_normalizer import normalize as normalize_office  # noqa: E402
 
 
 CandidateData = namedtuple('CandidateData', 'precinct office district party candidate')
@@ -16,37 +19,10 @@ OUTPUT_HEADER = ['county', 'precinct', 'office', 'district', 'party', 'candidate
 
 CLARITY_ELECTIONS_PA_URL = 'https://results.enr.clarityelections.com/PA'
 WESTMORELAND_URL = f'{CLARITY_ELECTIONS_PA_URL}/{COUNTY}/103293/255115/reports/detailxml.zip'
-XML_FILENAME = 'detail.xml'
-
-CONTEST_TO_OPENELECTIONS_OFFICE_PARTY_AND_DISTRICT = {
-    'PRESIDENTIAL ELECTORS': ('President', '', ''),
-    'DEM REPRESENTATIVE IN CONGRESS 13th DISTRICT': ('U.S. House', 'DEM', 13),
-    'REP REPRESENTATIVE IN CONGRESS 13th DISTRICT': ('U.S. House', 'REP', 13),
-    'DEM REPRESENTATIVE IN CONGRESS 14th DISTRICT': ('U.S. House', 'DEM', 14),
-    'REP REPRESENTATIVE IN CONGRESS 14th DISTRICT': ('U.S. House', 'REP', 14),
-    'DEM SENATOR IN THE GENERAL ASSEMBLY 39th DISTRICT': ('State Senate', 'DEM', 39),
-    'REP SENATOR IN THE GENERAL ASSEMBLY 39th DISTRICT': ('State Senate', 'REP', 39),
-    'DEM SENATOR IN THE GENERAL ASSEMBLY 41st DISTRICT': ('State Senate', 'DEM', 41),
-    'REP SENATOR IN THE GENERAL ASSEMBLY 41st DISTRICT': ('State Senate', 'REP', 41),
-    'DEM SENATOR IN THE GENERAL ASSEMBLY 45th DISTRICT': ('State Senate', 'DEM', 45),
-    'REP SENATOR IN THE GENERAL ASSEMBLY 45th DISTRICT': ('State Senate', 'REP', 45),
-    'DEM REPRESENTATIVE IN THE GENERAL ASSEMBLY 33rd DISTRI': ('General Assembly', 'DEM', 33),
-    'REP REPRESENTATIVE IN THE GENERAL ASSEMBLY 33rd DISTRI': ('General Assembly', 'REP', 33),
-    'DEM REPRESENTATIVE IN THE GENERAL ASSEMBLY 52nd DISTRI': ('General Assembly', 'DEM', 52),
-    'REP REPRESENTATIVE IN THE GENERAL ASSEMBLY 52nd DISTRI': ('General Assembly', 'REP', 52),
-    'DEM REPRESENTATIVE IN THE GENERAL ASSEMBLY 54th DISTRI': ('General Assembly', 'DEM', 54),
-    'REP REPRESENTATIVE IN THE GENERAL ASSEMBLY 54th DISTRI': ('General Assembly', 'REP', 54),
-    'DEM REPRESENTATIVE IN THE GENERAL ASSEMBLY 55th DISTRI': ('General Assembly', 'DEM', 55),
-    'REP REPRESENTATIVE IN THE GENERAL ASSEMBLY 55th DISTRI': ('General Assembly', 'REP', 55),
-    'DEM REPRESENTATIVE IN THE GENERAL ASSEMBLY 56th DISTRI': ('General Assembly', 'DEM', 56),
-    'REP REPRESENTATIVE IN THE GENERAL ASSEMBLY 56th DISTRI': ('General Assembly', 'REP', 56),
-    'DEM REPRESENTATIVE IN THE GENERAL ASSEMBLY 57th DISTRI': ('General Assembly', 'DEM', 57),
-    'REP REPRESENTATIVE IN THE GENERAL ASSEMBLY 57th DISTRI': ('General Assembly', 'REP', 57),
-    'DEM REPRESENTATIVE IN THE GENERAL ASSEMBLY 58th DISTRI': ('General Assembly', 'DEM', 58),
-    'REP REPRESENTATIVE IN THE GENERAL ASSEMBLY 58th DISTRI': ('General Assembly', 'REP', 58),
-    'DEM REPRESENTATIVE IN THE GENERAL ASSEMBLY 59th DISTRI': ('General Assembly', 'DEM', 59),
-    'REP REPRESENTATIVE IN THE GENERAL ASSEMBLY 59th DISTRI': ('General Assembly', 'REP', 59),
-}
+
+# office_normalizer names the State House "State House"; the 2020 files
+# call it "General Assembly"
+OPENELECTIONS_2020_OFFICES = {'State House': 'General Assembly'}
 
 CLARITY_TO_OPENELECTIONS_VOTE_TYPE = {
     'Election Day': 'election_day',
@@ -69,9 +45,10 @@ def should_be_recorded(result):
 
 def extract_office_party_and_district(result):
     contest = result.contest.text
-    if contest in CONTEST_TO_OPENELECTIONS_OFFICE_PARTY_AND_DISTRICT:
-        return CONTEST_TO_OPENELECTIONS_OFFICE_PARTY_AND_DISTRICT[contest]
-    return contest.title(), '', ''
+    office, district, party = normalize_office(contest)
+    if office is None:
+        return contest.title(), '', ''
+    return OPENELECTIONS_2020_OFFICES.get(office, office), party, district
 
 
 def extract_candidate_data(result):
@@ -91,19 +68,23 @@ def process_result(result, candidate_data_to_votes):
     vote_data['votes'] = vote_data.get('votes', 0) + result.votes
 
 
-def candidate_level_data(parser):
+def candidate_votes(results):
     candidate_data_to_votes = defaultdict(dict)
-    for result in parser.results:
+    for result in results:
         if should_be_recorded(result):
             process_result(result, candidate_data_to_votes)
+    return candidate_data_to_votes
+
+
+def candidate_level_data(candidate_data_to_votes):
     for candidate_data in candidate_data_to_votes:
         yield {'county': COUNTY,
                **candidate_data._asdict(),
                **candidate_data_to_votes[candidate_data]}
 
 
-def precinct_level_data(parser):
-    for jurisdiction in parser.result_jurisdictions:
+def precinct_level_data(jurisdictions):
+    for jurisdiction in jurisdictions:
         yield {'county': COUNTY, 'precinct': jurisdiction.name,
                'office': 'Ballots Cast', 'votes': jurisdiction.ballots_cast}
         yield {'county': COUNTY, 'precinct': jurisdiction.name,
@@ -111,26 +92,23 @@ def precinct_level_data(parser):
 
 
 def get_westmoreland_xml_file():
-    response = requests.get(WESTMORELAND_URL, stream=True)
-    zipped_data = ZipFile(BytesIO(response.content))
-    return zipped_data.open(XML_FILENAME)
+    return ClarityDetail(WESTMORELAND_URL)
 
 
-def clarity_to_csv(parser):
+def clarity_to_csv(detail):
+    # One streaming pass over the XML fills in both the candidate votes and
+    # the precinct turnout.
+    candidate_data_to_votes = candidate_votes(detail.results())
     with open(OUTPUT_FILE, 'w', newline='') as f_out:
         csv_writer = csv.DictWriter(f_out, OUTPUT_HEADER)
         csv_writer.writeheader()
-        for row in precinct_level_data(parser):
-            csv_writer.writerow(row)
-        for row in candidate_level_data(parser):
-            csv_writer.writerow(row)
+        csv_writer.writerows(precinct_level_data(detail.result_jurisdictions))
+        csv_writer.writerows(candidate_level_data(candidate_data_to_votes))
 
 
 def main():
-    with get_westmoreland_xml_file() as f_in:
-        parser = clarify.Parser()
-        parser.parse(f_in)
-        clarity_to_csv(parser)
+    with get_westmoreland_xml_file() as detail:
+        clarity_to_csv(detail)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,205 @@
+"""Compact column store for engine output rows.
+
+The engines used to collect one dict per output row, each repeating the
+same county, precinct, office, party and candidate strings and carrying a
+dict's per-row overhead -- on a 50k-row county that's most of the parse's
+memory. ``RowTable`` keeps the same rows column-wise instead:
+
+  - every value is dictionary-encoded: the table keeps one copy of each
+    distinct value and an ``array('i')`` of codes per column;
+  - count columns (``COUNT_FIELDS``) store non-negative ints directly in
+    their ``array('i')``; anything else there (``""``, a string count) is
+    dictionary-encoded under a negative code, so values round-trip with
+    their original type.
+
+That's about 4 bytes per cell instead of a dict slot plus a string::
+
+    rows = RowTable(FIELDNAMES)
+    rows.append({"county": "Centre", "office": "Sheriff", "votes": 12})
+    rows.add_to(0, "votes", 3)
+    rows[0]["votes"]            # 15 -- rows read back as fresh dicts
+    rows.write_csv(fh, FIELDNAMES)
+
+Rows read back (indexing, iteration) are new dicts with every field of the
+table (missing ones ``""``), so changing one doesn't change the table; use
+``set``/``add_to``, or ``fill`` for a column-wise fix-up such as a county
+script supplying districts its PDF leaves out::
+
+    rows.fill("district", "office", {"U.S. House": "14"})
+
+``write_rows`` writes a ``RowTable`` column-wise or a plain list of dicts
+the way ``csv.DictWriter`` would.
+"""
+
+from __future__ import annotations
+
+import csv
+from array import array
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence
+
+COUNT_FIELDS = ("votes", "election_day", "mail", "absentee", "provisional", "vote_for")
+_INT_MAX = 2**31 - 1
+# Rows per batch when writing, so the decoded columns stay small.
+WRITE_BATCH = 10_000
+
+
+class RowTable:
+    """Rows with a fixed set of ``fields``, stored as encoded columns."""
+
+    def __init__(self, fields: Sequence[str], counts: Iterable[str] = COUNT_FIELDS) -> None:
+        self.fields = tuple(fields)
+        self._field_set = frozenset(self.fields)
+        self._counts = frozenset(counts) & self._field_set
+        self._columns = {field: array("i") for field in self.fields}
+        self._values: list = []
+        self._codes: dict = {}
+
+    # -- encoding -------------------------------------------------------
+
+    @staticmethod
+    def _key(value):
+        # str keys are the common case; other types are keyed with their type
+        # so 1, 1.0 and True stay distinct.
+        return value if type(value) is str else (type(value), value)
+
+    def _code(self, value) -> int:
+        key = self._key(value)
+        code = self._codes.get(key)
+        if code is None:
+            code = self._codes[key] = len(self._values)
+            self._values.append(value)
+        return code
+
+    def _encode(self, field: str, value) -> int:
+        if field in self._counts:
+            if type(value) is int and 0 <= value <= _INT_MAX:
+                return value
+            return -1 - self._code(value)
+        return self._code(value)
+
+    def _decode(self, field: str, code: int):
+        if field in self._counts:
+            return code if code >= 0 else self._values[-1 - code]
+        return self._values[code]
+
+    # -- writing rows ---------------------------------------------------
+
+    def append(self, row: Mapping[str, Any]) -> int:
+        """Add ``row`` (missing fields ``""``) and return its index."""
+        if len(row) > len(self.fields) or not row.keys() <= self._field_set:
+            extra = sorted(set(row) - self._field_set)
+            if extra:
+                raise ValueError(f"row has fields not in the table: {', '.join(extra)}")
+        for field, column in self._columns.items():
+            column.append(self._encode(field, row.get(field, "")))
+        return len(self) - 1
+
+    def extend(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def set(self, index: int, field: str, value) -> None:
+        self._columns[field][index] = self._encode(field, value)
+
+    def add_to(self, index: int, field: str, amount: int) -> None:
+        """``row[field] = (row[field] or 0) + amount``."""
+        self.set(index, field, (self.get(index, field) or 0) + amount)
+
+    def fill(self, field: str, by: str, values: Mapping[Any, Any]) -> int:
+        """Where ``field`` is empty (``""`` or None), set it to
+        ``values[row[by]]`` for rows whose ``by`` value is in ``values``;
+        returns the number of rows changed."""
+        column, keys = self._columns[field], self._columns[by]
+        # Codes of the blank values already in the table (none: nothing to fill).
+        blank = {self._codes[self._key(v)] for v in ("", None) if self._key(v) in self._codes}
+        if field in self._counts:
+            blank = {-1 - code for code in blank}
+        encoded: dict[int, Optional[int]] = {}  # code of ``by`` -> code of the new value
+        changed = 0
+        for index, key in enumerate(keys):
+            if column[index] not in blank:
+                continue
+            if key not in encoded:
+                value = self._decode(by, key)
+                encoded[key] = self._encode(field, values[value]) if value in values else None
+            if encoded[key] is not None:
+                column[index] = encoded[key]
+                changed += 1
+        return changed
+
+    # -- reading rows ---------------------------------------------------
+
+    def get(self, index: int, field: str):
+        return self._decode(field, self._columns[field][index])
+
+    def column(self, field: str, start: int = 0, stop: Optional[int] = None) -> list:
+        """Decoded values of ``field`` for rows ``start:stop``."""
+        codes = self._columns[field][start:stop]
+        values = self._values
+        if field in self._counts:
+            return [c if c >= 0 else values[-1 - c] for c in codes]
+        return [values[c] for c in codes]
+
+    def __len__(self) -> int:
+        return len(self._columns[self.fields[0]]) if self.fields else 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return {field: self.get(index, field) for field in self.fields}
+
+    def __iter__(self) -> Iterator[dict]:
+        fields = self.fields
+        for start in range(0, len(self), WRITE_BATCH):
+            columns = [self.column(f, start, start + WRITE_BATCH) for f in fields]
+            for values in zip(*columns):
+                yield dict(zip(fields, values))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (RowTable, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __add__(self, other) -> list:
+        # Concatenation keeps working as it did on the old lists of dicts.
+        return [*self, *other]
+
+    def __radd__(self, other) -> list:
+        return [*other, *self]
+
+    def __repr__(self) -> str:
+        return f"RowTable({len(self)} rows, {len(self._values)} distinct values)"
+
+    def write_csv(self, fh, fieldnames: Optional[Sequence[str]] = None, header: bool = True) -> None:
+        """Write the rows to ``fh`` as CSV, ``fieldnames`` (default: the
+        table's fields) in order; a name the table lacks is written empty."""
+        fieldnames = list(fieldnames or self.fields)
+        writer = csv.writer(fh)
+        if header:
+            writer.writerow(fieldnames)
+        for start in range(0, len(self), WRITE_BATCH):
+            stop = min(start + WRITE_BATCH, len(self))
+            columns = [
+                self.column(f, start, stop) if f in self._field_set else [""] * (stop - start)
+                for f in fieldnames
+            ]
+            writer.writerows(zip(*columns))
+
+
+def write_rows(fh, rows, fieldnames: Sequence[str], extrasaction: str = "raise") -> None:
+    """Write ``rows`` with a header, as ``csv.DictWriter(fh, fieldnames,
+    extrasaction=...)`` would: column-wise for a ``RowTable``, row by row
+    for dicts."""
+    if isinstance(rows, RowTable):
+        extra = [f for f in rows.fields if f not in fieldnames]
+        if extra and extrasaction == "raise" and len(rows):
+            raise ValueError(f"dict contains fields not in fieldnames: {', '.join(map(repr, extra))}")
+        rows.write_csv(fh, fieldnames)
+        return
+    writer = csv.DictWriter(fh, fieldnames=fieldnames, extrasaction=extrasaction)
+    writer.writeheader()
+    writer.writerows(rows)
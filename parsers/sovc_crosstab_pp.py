@@ -22,17 +22,28 @@ everything else:
 paths below; each path is preserved close to verbatim from the original
 per-county scripts since there's no source PDF in the repo to golden-test
 the merge against.
+``synthetic_pdf.py`` renders Bedford-layout stand-ins (ruled tables, rotated
+headers) from a precinct CSV so ``engine_bench.py`` can time and round-trip
+check the simple path.
 """
 
 from __future__ import annotations
 
-import csv
 import re
 from dataclasses import dataclass
 from typing import Callable, Optional
 
+import instrumentation
+import parse_manifest
+from row_table import RowTable, write_rows
+
 VOTE_TYPES = {'Election Day', 'Mail-In', 'Provisional', 'Total'}
 
+FIELDNAMES = ['county', 'precinct', 'office', 'district', 'party',
+              'candidate', 'vote_for', 'votes']
+# Jefferson-style reports also break each count down by vote type.
+VOTE_TYPE_FIELDNAMES = FIELDNAMES + ['election_day', 'mail', 'provisional']
+
 
 @dataclass(frozen=True)
 class SovcCrosstabConfig:
@@ -294,17 +305,33 @@ def _parse_candidate_table_vote_types(table, candidates, precinct_state, config:
     return rows_out
 
 
+def _page_text(page):
+    with instrumentation.phase("text_extraction"):
+        return page.extract_text() or ''
+
+
+def _page_tables(page):
+    with instrumentation.phase("table_extraction"):
+        return page.extract_tables()
+
+
 def parse_sovc_crosstab_results(pdf_path, config: SovcCrosstabConfig):
     import pdfplumber
 
     clean_votes = make_clean_votes(config)
-    results = []
+    results = RowTable(VOTE_TYPE_FIELDNAMES if config.vote_type_rows else FIELDNAMES)
 
-    with pdfplumber.open(pdf_path) as pdf:
+    with instrumentation.phase("pdf_open"):
+        pdf = pdfplumber.open(pdf_path)
+    with pdf:
         print(f"Total pages: {len(pdf.pages)}")
+        instrumentation.count("pages", len(pdf.pages))
+
+        def row_count() -> int:
+            return len(results)
 
         if config.vote_type_rows:
-            pdf_pages = [(p.extract_text() or '', p.extract_tables()) for p in pdf.pages[:7]]
+            pdf_pages = [(_page_text(p), _page_tables(p)) for p in pdf.pages[:7]]
             turnout = _parse_turnout_vote_types(pdf_pages, config, clean_votes)
             print(f"Found {len(turnout)} precincts in turnout table")
 
@@ -325,8 +352,8 @@ def parse_sovc_crosstab_results(pdf_path, config: SovcCrosstabConfig):
             current_office, current_district, current_vote_for = None, '', '1'
             precinct_state = {'name': None, 'sub_data': {}}
 
-            for page_idx, page in enumerate(pdf.pages):
-                text = page.extract_text() or ''
+            for page_idx, page in instrumentation.each_unit("page", enumerate(pdf.pages), rows=row_count):
+                text = _page_text(page)
 
                 contest_info = parse_contest_title(text, config)
                 if contest_info:
@@ -336,7 +363,7 @@ def parse_sovc_crosstab_results(pdf_path, config: SovcCrosstabConfig):
                 if not current_office:
                     continue
 
-                tables = page.extract_tables()
+                tables = _page_tables(page)
                 if not tables:
                     continue
 
@@ -364,7 +391,7 @@ def parse_sovc_crosstab_results(pdf_path, config: SovcCrosstabConfig):
                     print(f"  Processed {page_idx + 1} pages...")
 
         else:
-            pages_tables = [p.extract_tables() for p in pdf.pages[:config.turnout_max_pages]]
+            pages_tables = [_page_tables(p) for p in pdf.pages[:config.turnout_max_pages]]
             turnout = _parse_turnout_simple(pages_tables, config, clean_votes)
             print(f"Found {len(turnout)} precincts in turnout table")
 
@@ -380,9 +407,12 @@ def parse_sovc_crosstab_results(pdf_path, config: SovcCrosstabConfig):
 
             current_office, current_district, current_vote_for = None, '', '1'
 
-            for page_idx in range(config.turnout_max_pages, len(pdf.pages)):
+            page_indexes = range(config.turnout_max_pages, len(pdf.pages))
+            for page_idx in instrumentation.each_unit(
+                "page", page_indexes, rows=row_count, label=lambda idx: idx + 1
+            ):
                 page = pdf.pages[page_idx]
-                text = page.extract_text() or ''
+                text = _page_text(page)
 
                 contest_info = parse_contest_title(text, config)
                 if contest_info:
@@ -391,7 +421,7 @@ def parse_sovc_crosstab_results(pdf_path, config: SovcCrosstabConfig):
                 if not current_office:
                     continue
 
-                tables = page.extract_tables()
+                tables = _page_tables(page)
                 if not tables:
                     continue
 
@@ -421,17 +451,9 @@ def parse_sovc_crosstab_results(pdf_path, config: SovcCrosstabConfig):
 
 
 def write_csv(results, output_path, config: SovcCrosstabConfig):
-    if config.vote_type_rows:
-        fieldnames = ['county', 'precinct', 'office', 'district', 'party',
-                      'candidate', 'vote_for', 'votes', 'election_day', 'mail', 'provisional']
-    else:
-        fieldnames = ['county', 'precinct', 'office', 'district', 'party',
-                      'candidate', 'vote_for', 'votes']
-
+    fieldnames = VOTE_TYPE_FIELDNAMES if config.vote_type_rows else FIELDNAMES
     with open(output_path, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(results)
+        write_rows(f, results, fieldnames)
 
     print(f"Wrote {len(results)} results to {output_path}")
 
@@ -440,9 +462,10 @@ def run_cli(config: SovcCrosstabConfig, argv=None):
     import sys
     from pathlib import Path
 
-    argv = argv if argv is not None else sys.argv[1:]
+    argv, profile = instrumentation.split_profile_arg(argv if argv is not None else sys.argv[1:])
+    argv, if_changed = parse_manifest.split_if_changed_arg(argv)
     if len(argv) != 2:
-        print(f"Usage: uv run python {sys.argv[0]} <input_pdf> <output_csv>")
+        print(f"Usage: uv run python {sys.argv[0]} <input_pdf> <output_csv> [--profile[=trace.json]] [--if-changed]")
         sys.exit(1)
 
     pdf_path, output_path = argv
@@ -451,6 +474,15 @@ def run_cli(config: SovcCrosstabConfig, argv=None):
         print(f"Error: PDF file not found: {pdf_path}", file=sys.stderr)
         sys.exit(1)
 
+    if if_changed and parse_manifest.up_to_date(output_path, pdf_path):
+        print(f"{output_path} is up to date")
+        return
+
     print(f"Parsing {pdf_path}...")
-    results = parse_sovc_crosstab_results(pdf_path, config)
-    write_csv(results, output_path, config)
+    with instrumentation.session(profile, label=pdf_path), \
+            parse_manifest.recording(output_path, pdf_path) as run:
+        results = parse_sovc_crosstab_results(pdf_path, config)
+        instrumentation.count("rows", len(results))
+        run.rows = len(results)
+        with instrumentation.phase("csv_write"):
+            write_csv(results, output_path, config)
@@ -23,15 +23,21 @@ pa_fulton_general_2025_results_parser.py.
 The line-processing state machine (``process_lines``) takes a plain list of
 text lines and is independent of natural_pdf, so it can be unit tested
 against small text fixtures without a real PDF (see tests/test_sovc_geo.py).
+For whole-report timing, ``synthetic_pdf.py`` renders a Wayne-layout PDF
+from a precinct CSV and ``engine_bench.py`` parses it.
 """
 
 from __future__ import annotations
 
-import csv
 import re
 from dataclasses import dataclass
 from typing import Callable, Optional
 
+import instrumentation
+import parse_manifest
+from row_table import RowTable, write_rows
+from text_backends import DEFAULT_BACKEND, open_page_texts
+
 DEFAULT_PRECINCT_RE = re.compile(r'^Precinct\s+(.+)$')
 DEFAULT_DATA_LINE_RE = re.compile(
     r'^(.+?)\s+(\d[\d,]*)\s+[\d.]+%\s+(\d[\d,]*)\s+(\d[\d,]*)\s+(\d[\d,]*)$'
@@ -61,6 +67,12 @@ class SovcGeoConfig:
     # dropped (no precinct means "if not current_precinct: continue") rather
     # than attached to the wrong precinct.
     countywide_marker: Optional[str] = None
+    # Page-text library; see text_backends.py.
+    text_backend: str = DEFAULT_BACKEND
+
+
+FIELDNAMES = ['county', 'precinct', 'office', 'district', 'party',
+              'candidate', 'vote_for', 'votes', 'election_day', 'mail', 'provisional']
 
 
 def clean_votes(val):
@@ -71,7 +83,7 @@ def clean_votes(val):
 
 class _ParseState:
     def __init__(self):
-        self.results = []
+        self.results = RowTable(FIELDNAMES)
         self.current_precinct = None
         self.current_office = None
         self.current_vote_for = '1'
@@ -252,22 +264,23 @@ def parse_text(text: str, config: SovcGeoConfig):
 def parse_sovc_geo_results(pdf_path, config: SovcGeoConfig):
     """Parse a Statement-of-Votes-Cast-by-geography PDF using ``config``.
     Returns (results, printed_totals)."""
-    from natural_pdf import PDF
-
-    pdf = PDF(pdf_path)
+    pages = open_page_texts(pdf_path, config.text_backend)
     state = _ParseState()
 
-    total_pages = len(pdf.pages)
+    total_pages = len(pages)
     print(f"Total pages: {total_pages}")
 
-    for page_idx, page in enumerate(pdf.pages):
-        text = page.extract_text()
-        process_lines(text.split('\n'), config, state)
+    for page_idx, text in enumerate(pages):
+        with instrumentation.unit("page", page_idx + 1) as unit, instrumentation.phase("line_classification"):
+            rows_before = len(state.results)
+            process_lines(text.split('\n'), config, state)
+            unit.rows = len(state.results) - rows_before
 
         if (page_idx + 1) % 50 == 0:
             print(f"  Processed {page_idx + 1} of {total_pages} pages...")
 
     _flush_writein(state, config.county)
+    instrumentation.count("rows", len(state.results))
 
     return state.results, state.printed_totals
 
@@ -277,48 +290,18 @@ def check_printed_totals(results, printed_totals):
     against the report's own printed "Total" line for that contest.
     Returns a list of mismatch dicts; empty means everything reconciled.
     Contests with no printed Total line (e.g. cut off by page extraction)
-    are silently skipped, not counted as mismatches.
+    are silently skipped, not counted as mismatches. See ``reconcile.py``.
     """
-    summed = {}
-    for row in results:
-        if row['office'] in ('Registered Voters', 'Ballots Cast'):
-            continue
-        key = (row['precinct'], row['office'])
-        acc = summed.setdefault(key, {'votes': 0, 'election_day': 0, 'mail': 0, 'provisional': 0})
-        for field in ('votes', 'election_day', 'mail', 'provisional'):
-            val = row.get(field) or '0'
-            try:
-                acc[field] += int(val)
-            except ValueError:
-                pass
-
-    mismatches = []
-    for key, printed in printed_totals.items():
-        actual = summed.get(key)
-        if actual is None:
-            continue
-        for field in ('votes', 'election_day', 'mail', 'provisional'):
-            try:
-                printed_val = int(printed[field])
-            except (ValueError, TypeError):
-                continue
-            if actual[field] != printed_val:
-                mismatches.append({
-                    'precinct': key[0], 'office': key[1], 'field': field,
-                    'printed': printed_val, 'summed': actual[field],
-                })
-    return mismatches
+    from reconcile import reconcile
+
+    mismatches = reconcile(results, printed_totals, keys=('precinct', 'office'))
+    return mismatches.to_dict('records')
 
 
 def write_csv(results, output_path):
     """Write results to OpenElections CSV format."""
-    fieldnames = ['county', 'precinct', 'office', 'district', 'party',
-                  'candidate', 'vote_for', 'votes', 'election_day', 'mail', 'provisional']
-
     with open(output_path, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(results)
+        write_rows(f, results, FIELDNAMES)
 
     print(f"Wrote {len(results)} results to {output_path}")
 
@@ -327,12 +310,14 @@ def run_cli(config: SovcGeoConfig, argv=None):
     import sys
     from pathlib import Path
 
-    argv = argv if argv is not None else sys.argv[1:]
+    argv, profile = instrumentation.split_profile_arg(argv if argv is not None else sys.argv[1:])
+    argv, if_changed = parse_manifest.split_if_changed_arg(argv)
     strict = '--strict' in argv
     argv = [a for a in argv if a != '--strict']
 
     if len(argv) != 2:
-        print(f"Usage: uv run python {sys.argv[0]} <input_pdf> <output_csv> [--strict]")
+        print(f"Usage: uv run python {sys.argv[0]} <input_pdf> <output_csv> [--strict] [--profile[=trace.json]]"
+              " [--if-changed]")
         sys.exit(1)
 
     pdf_path, output_path = argv
@@ -341,9 +326,17 @@ def run_cli(config: SovcGeoConfig, argv=None):
         print(f"Error: PDF file not found: {pdf_path}", file=sys.stderr)
         sys.exit(1)
 
+    if if_changed and parse_manifest.up_to_date(output_path, pdf_path):
+        print(f"{output_path} is up to date")
+        return
+
     print(f"Parsing {pdf_path}...")
-    results, printed_totals = parse_sovc_geo_results(pdf_path, config)
-    write_csv(results, output_path)
+    with instrumentation.session(profile, label=pdf_path), \
+            parse_manifest.recording(output_path, pdf_path) as run:
+        results, printed_totals = parse_sovc_geo_results(pdf_path, config)
+        with instrumentation.phase("csv_write"):
+            write_csv(results, output_path)
+        run.rows = len(results)
 
     mismatches = check_printed_totals(results, printed_totals)
     checked = len(printed_totals)
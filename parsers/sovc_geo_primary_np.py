@@ -24,15 +24,15 @@ that share the contest-header shape).
 
 from __future__ import annotations
 
-import csv
 import re
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
-
-import natural_pdf as npdf
+from typing import Iterable, Optional
 
+import instrumentation
+import parse_manifest
+from row_table import RowTable, write_rows
 from electionware_primary_np import (
     STATEWIDE_OFFICES,
     DISTRICT_ORDINAL_RE,
@@ -205,7 +205,8 @@ def parse_primary_sovc_text(text: str, config: PrimarySovcConfig, state: Optiona
                 continue
             state["skip_contest"] = False
             current_party = _normalize_party(cm.group(2))
-            current_office, current_district = _normalize_office(raw_office)
+            with instrumentation.phase("office_normalization"):
+                current_office, current_district = _normalize_office(raw_office)
             continue
         bm = BALLOTS_RE.match(line)
         bm = BALLOTS_RE.match(line)
@@ -282,9 +283,12 @@ def _flush_registered_voters(precinct_party_rv: dict, county: str) -> list[dict]
     return out
 
 
-def parse_primary_sovc_pdf(pdf_path: Path, config: PrimarySovcConfig) -> list[dict]:
-    pdf = npdf.PDF(str(pdf_path))
-    rows: list[dict] = []
+def parse_primary_sovc_pdf(pdf_path: Path, config: PrimarySovcConfig) -> RowTable:
+    import natural_pdf as npdf
+
+    with instrumentation.phase("pdf_open"):
+        pdf = npdf.PDF(str(pdf_path))
+    rows = RowTable(PRIMARY_FIELDNAMES)
     state: dict = {
         "current_precinct": None,
         "current_office": "",
@@ -293,40 +297,53 @@ def parse_primary_sovc_pdf(pdf_path: Path, config: PrimarySovcConfig) -> list[di
         "seen_precincts": set(),
         "precinct_party_rv": {},
     }
-    for page in pdf.pages:
-        text = page.extract_text() or ""
-        rows.extend(parse_primary_sovc_text(text, config, state))
+    instrumentation.count("pages", len(pdf.pages))
+    for page_idx in range(len(pdf.pages)):
+        with instrumentation.unit("page", page_idx + 1) as unit:
+            page = instrumentation.load_page(pdf.pages, page_idx)
+            with instrumentation.phase("text_extraction"):
+                text = page.extract_text() or ""
+            with instrumentation.phase("line_classification"):
+                page_rows = parse_primary_sovc_text(text, config, state)
+            unit.rows = len(page_rows)
+        rows.extend(page_rows)
     if config.emit_registered_voters:
         rv_rows = _flush_registered_voters(state["precinct_party_rv"], config.county)
         # Interleave RV rows at the start of each precinct's block for readability.
-        by_precinct: dict[str, list[dict]] = {}
-        for r in rows:
-            by_precinct.setdefault(r["precinct"], []).append(r)
-        ordered: list[dict] = []
+        by_precinct: dict[str, list[int]] = {}
+        for i, precinct in enumerate(rows.column("precinct")):
+            by_precinct.setdefault(precinct, []).append(i)
+        ordered = RowTable(PRIMARY_FIELDNAMES)
         for rv in rv_rows:
             ordered.append(rv)
-            ordered.extend(by_precinct.get(rv["precinct"], []))
+            ordered.extend(rows[i] for i in by_precinct.get(rv["precinct"], []))
         return ordered
     return rows
 
 
-def write_csv(rows: list[dict], out_path: Path) -> None:
+def write_csv(rows: Iterable[dict], out_path: Path) -> None:
     with out_path.open("w", newline="") as fh:
-        writer = csv.DictWriter(fh, fieldnames=PRIMARY_FIELDNAMES)
-        writer.writeheader()
-        for r in rows:
-            writer.writerow({k: r.get(k, "") for k in PRIMARY_FIELDNAMES})
+        write_rows(fh, rows, PRIMARY_FIELDNAMES, extrasaction="ignore")
 
 
 def run_cli(config: PrimarySovcConfig, argv: Optional[list[str]] = None) -> None:
-    argv = list(argv) if argv is not None else sys.argv
+    argv, profile = instrumentation.split_profile_arg(list(argv) if argv is not None else sys.argv)
+    argv, if_changed = parse_manifest.split_if_changed_arg(argv)
     if len(argv) != 3:
         script = Path(argv[0]).name if argv else "parser"
-        sys.exit(f"Usage: {script} <input.pdf> <output.csv>")
+        sys.exit(f"Usage: {script} <input.pdf> <output.csv> [--profile[=trace.json]] [--if-changed]")
     pdf_path = Path(argv[1])
     out_path = Path(argv[2])
     if not pdf_path.exists():
         sys.exit(f"Missing PDF: {pdf_path}")
-    rows = parse_primary_sovc_pdf(pdf_path, config)
-    write_csv(rows, out_path)
+    if if_changed and parse_manifest.up_to_date(out_path, pdf_path):
+        print(f"{out_path} is up to date")
+        return
+    with instrumentation.session(profile, label=str(pdf_path)), \
+            parse_manifest.recording(out_path, pdf_path) as run:
+        rows = parse_primary_sovc_pdf(pdf_path, config)
+        instrumentation.count("rows", len(rows))
+        with instrumentation.phase("csv_write"):
+            write_csv(rows, out_path)
+        run.rows = len(rows)
     print(f"Wrote {len(rows)} rows to {out_path}")
\ No newline at end of file
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Import-time budget check for parser entry points.
+
+Batch runs and the test suite start many short-lived interpreters, so every
+entry point should import in tens of milliseconds: heavy libraries
+(natural-pdf, pdfplumber, pandas, anthropic, llm, clarify) belong inside the
+function that opens the PDF/XML/API client, not at module top level.
+
+For each entry point this runs ``python -X importtime -c "import <module>"``
+in a fresh interpreter, reads the module's cumulative import time from the
+``-X importtime`` report, and lists any heavy library that was pulled in
+eagerly. Exits non-zero if any module exceeds the budget.
+
+Usage:
+    python parsers/startup_budget.py [--budget-ms N] [module ...]
+
+With no modules, checks the shared engines, the small CSV post-processors
+and every config-driven county script (the ones ``county_registry`` loads).
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+PARSERS_DIR = Path(__file__).resolve().parent
+
+DEFAULT_BUDGET_MS = 100.0
+
+HEAVY_MODULES = ("natural_pdf", "pdfplumber", "pandas", "anthropic", "llm", "clarify")
+
+SHARED_ENTRY_POINTS = (
+    "electionware_precinct_np",
+    "electionware_primary_np",
+    "electionware_regex_np",
+    "sovc_geo_np",
+    "sovc_geo_primary_np",
+    "sovc_crosstab_pp",
+    "llm_pdf_extract",
+    "clarity_primary_np",
+    "electionware_county",
+    "electionware_precinct",
+    "pa_electionware_primary_2024",
+    "pa_electionware_primary_2026",
+    "county_registry",
+    "filter_county_csv",
+    "pa_philadelphia_primary_2026_csv_converter",
+)
+
+# "import time:       self [us] |  cumulative | imported package"
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def default_entry_points() -> list[str]:
+    from county_registry import MODULE_NAME_RE, _CONFIG_SOURCE_RE
+
+    modules = list(SHARED_ENTRY_POINTS)
+    for path in sorted(PARSERS_DIR.glob("pa_*.py")):
+        if path.stem in modules or not MODULE_NAME_RE.match(path.stem):
+            continue
+        if _CONFIG_SOURCE_RE.search(path.read_text(encoding="utf-8")):
+            modules.append(path.stem)
+    return modules
+
+
+def measure(module: str) -> tuple[float, list[str]]:
+    """Return (cumulative import ms, heavy top-level packages imported)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PARSERS_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr.strip().splitlines()[-1]}")
+    cumulative_us: Optional[int] = None
+    heavy: list[str] = []
+    for line in proc.stderr.splitlines():
+        m = _IMPORTTIME_RE.match(line)
+        if not m:
+            continue
+        name = m.group(4)
+        if name == module:
+            cumulative_us = int(m.group(2))
+        if name in HEAVY_MODULES and name not in heavy:
+            heavy.append(name)
+    if cumulative_us is None:
+        raise RuntimeError(f"no -X importtime entry for {module}")
+    return cumulative_us / 1000.0, heavy
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    argv = list(argv) if argv is not None else sys.argv[1:]
+    budget_ms = DEFAULT_BUDGET_MS
+    if "--budget-ms" in argv:
+        idx = argv.index("--budget-ms")
+        budget_ms = float(argv[idx + 1])
+        del argv[idx:idx + 2]
+    modules = argv or default_entry_points()
+
+    over = 0
+    for module in modules:
+        try:
+            ms, heavy = measure(module)
+        except RuntimeError as exc:
+            print(f"ERROR {module}: {exc}", file=sys.stderr)
+            over += 1
+            continue
+        status = "ok" if ms <= budget_ms else "OVER"
+        if status == "OVER":
+            over += 1
+        eager = f"  eager: {', '.join(heavy)}" if heavy else ""
+        print(f"{status:4} {ms:8.1f} ms  {module}{eager}")
+
+    print(f"{len(modules) - over}/{len(modules)} entry points within {budget_ms:.0f} ms")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
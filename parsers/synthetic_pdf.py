@@ -0,0 +1,706 @@
+#!/usr/bin/env python3
+"""Render synthetic results PDFs from OpenElections precinct CSVs.
+
+No source PDFs are checked into the repo, so the shared engines can't be
+golden-tested or benchmarked against the real reports. This module draws
+stand-ins for the three report families they parse, from any existing
+precinct CSV (e.g. ``2025/counties/*precinct.csv``):
+
+  - ``electionware``: Electionware precinct summary, one "Statistics" block
+    per precinct, continuation pages repeating the office header
+    (``electionware_precinct_np``)
+  - ``sovc_geo``: Statement of Votes Cast by geography with Wayne's
+    two-line contest headers and accumulated write-in lines
+    (``sovc_geo_np``)
+  - ``sovc_crosstab``: Bedford-style crosstab, turnout table pages followed
+    by one ruled table per contest page with rotated candidate headers
+    (``sovc_crosstab_pp``)
+
+Each renderer returns a ``SyntheticPdf`` carrying the PDF bytes, an engine
+config matching the drawn layout, and the rows that engine should read back,
+so ``engine_bench.py`` can check round-trip correctness as well as time the
+parse. Office headers are drawn from the CSV's already-normalized
+office/district values (upper-cased for Electionware, with an
+``exact_offices`` table mapping them back), so the round trip exercises the
+engines' line/table handling rather than any one county's office quirks.
+
+The PDF writer is a few dozen lines over the base-14 Helvetica font, so
+generation needs nothing beyond the standard library and renders hundreds
+of pages in well under a second.
+
+Usage:
+    python parsers/synthetic_pdf.py <layout> <precinct.csv> <output.pdf> [--copies N]
+
+``--copies N`` repeats every precinct N times (suffixed ``#2``, ``#3``, ...)
+to scale a small county up to a multi-hundred-page report.
+"""
+
+from __future__ import annotations
+
+import csv
+import re
+import sys
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+TOP = 750
+BOTTOM = 60
+FONT_SIZE = 9
+LINE_HEIGHT = 12
+
+STAT_OFFICES = ("Registered Voters", "Ballots Cast", "Ballots Cast Blank")
+
+# Fields compared by ``compare_rows``; missing keys compare as "".
+COMPARE_FIELDS = (
+    "precinct",
+    "office",
+    "district",
+    "party",
+    "candidate",
+    "vote_for",
+    "votes",
+    "election_day",
+    "mail",
+    "provisional",
+)
+
+
+# ---------------------------------------------------------------------------
+# Minimal PDF writer.
+# ---------------------------------------------------------------------------
+
+
+# Helvetica advance widths (1/1000 em). Digits share one width; other
+# characters fall back to a per-case upper bound, which is only used to
+# right-align numbers and size rotated header cells, so erring wide is fine.
+_HELVETICA_WIDTHS = {
+    ",": 278, ".": 278, "%": 889, " ": 278, "(": 333, ")": 333, "/": 278,
+    "I": 278, "M": 833, "W": 944, "m": 833, "w": 722,
+}
+_HELVETICA_DIGIT = 556
+_HELVETICA_UPPER = 722
+_HELVETICA_OTHER = 556
+
+
+def _char_width(ch: str) -> int:
+    if ch in _HELVETICA_WIDTHS:
+        return _HELVETICA_WIDTHS[ch]
+    if ch.isdigit():
+        return _HELVETICA_DIGIT
+    return _HELVETICA_UPPER if ch.isupper() else _HELVETICA_OTHER
+
+
+def text_width(s: str, size: float = FONT_SIZE) -> float:
+    return sum(_char_width(ch) for ch in s) * size / 1000
+
+
+def _escape(s: str) -> str:
+    return s.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+class PdfCanvas:
+    """Just enough of a PDF writer to place text runs and ruled cells."""
+
+    def __init__(self) -> None:
+        self.pages: list[list[str]] = []
+
+    def new_page(self) -> None:
+        self.pages.append([])
+
+    def text(self, x: float, y: float, s: str, size: float = FONT_SIZE) -> None:
+        self.pages[-1].append(f"BT /F1 {size} Tf {x:.2f} {y:.2f} Td ({_escape(s)}) Tj ET")
+
+    def text_right(self, x: float, y: float, s: str, size: float = FONT_SIZE) -> None:
+        self.text(x - text_width(s, size), y, s, size)
+
+    def rotated_text(self, x: float, y: float, s: str, size: float = FONT_SIZE) -> None:
+        """Text running bottom-to-top from (x, y), like a rotated SOVC column header."""
+        self.pages[-1].append(
+            f"BT /F1 {size} Tf 0 1 -1 0 {x:.2f} {y:.2f} Tm ({_escape(s)}) Tj ET"
+        )
+
+    def rect(self, x: float, y: float, w: float, h: float) -> None:
+        self.pages[-1].append(f"0.5 w {x:.2f} {y:.2f} {w:.2f} {h:.2f} re S")
+
+    def to_bytes(self) -> bytes:
+        objects: list[bytes] = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"",  # page tree, filled in once the page ids are known
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+        ]
+        kids = []
+        for ops in self.pages:
+            data = zlib.compress("\n".join(ops).encode("cp1252", "replace"))
+            objects.append(
+                b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(data)
+                + data
+                + b"\nendstream"
+            )
+            objects.append(
+                b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+                b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+                % (PAGE_WIDTH, PAGE_HEIGHT, len(objects))
+            )
+            kids.append(len(objects))
+        objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            b" ".join(b"%d 0 R" % k for k in kids),
+            len(kids),
+        )
+
+        out = bytearray(b"%PDF-1.4\n")
+        offsets = []
+        for num, body in enumerate(objects, start=1):
+            offsets.append(len(out))
+            out += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+        xref = len(out)
+        out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        out += b"".join(b"%010d 00000 n \n" % off for off in offsets)
+        out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+            len(objects) + 1,
+            xref,
+        )
+        return bytes(out)
+
+
+# ---------------------------------------------------------------------------
+# CSV -> precinct/contest model.
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class Candidate:
+    party: str
+    name: str
+    kind: str  # "candidate", "yes", "no", "write_in", "overvotes", "undervotes"
+    votes: tuple[int, int, int, int]  # total, election_day, mail, provisional
+
+
+@dataclass
+class Contest:
+    office: str
+    district: str
+    vote_for: int
+    candidates: list[Candidate] = field(default_factory=list)
+
+
+@dataclass
+class Precinct:
+    name: str
+    stats: dict[str, tuple[int, int, int, int]] = field(default_factory=dict)
+    contests: list[Contest] = field(default_factory=list)
+
+
+def _to_int(value) -> Optional[int]:
+    try:
+        return int(str(value).replace(",", "").strip())
+    except ValueError:
+        return None
+
+
+def _candidate_kind(candidate: str) -> Optional[str]:
+    key = re.sub(r"[\s_-]", "", candidate.lower())
+    if key.startswith("writein"):
+        return "write_in"
+    if key in ("overvotes", "undervotes", "yes", "no"):
+        return key
+    if key == "notassigned":
+        return None
+    return "candidate"
+
+
+def load_csv(csv_path: Path) -> list[dict]:
+    with open(csv_path, newline="", encoding="utf-8") as fh:
+        return list(csv.DictReader(fh))
+
+
+def build_precincts(rows: list[dict], copies: int = 1) -> tuple[str, list[Precinct]]:
+    """Group CSV rows into precincts and contests, in file order.
+
+    Rows whose votes aren't integers are dropped; a missing election-day /
+    mail / provisional breakdown is drawn as (votes, 0, 0). Repeated
+    aggregate rows within a contest are summed so each contest draws one
+    write-in / overvote / undervote line.
+    """
+    county = rows[0]["county"] if rows else "Synthetic"
+    precincts: dict[str, Precinct] = {}
+    contests: dict[tuple, Contest] = {}
+    for row in rows:
+        name = " ".join((row.get("precinct") or "").split())
+        office = " ".join((row.get("office") or "").split())
+        total = _to_int(row.get("votes"))
+        if not name or not office or total is None:
+            continue
+        breakdown = [_to_int(row.get(k)) for k in ("election_day", "mail", "provisional")]
+        if None in breakdown:
+            breakdown = [total, 0, 0]
+        votes = (total, *breakdown)
+        precinct = precincts.setdefault(name, Precinct(name))
+        if office in STAT_OFFICES:
+            precinct.stats.setdefault(office, votes)
+            continue
+
+        candidate = " ".join((row.get("candidate") or "").split())
+        kind = _candidate_kind(candidate) if candidate else None
+        if kind is None:
+            continue
+        district = " ".join((row.get("district") or "").split())
+        key = (name, office, district)
+        contest = contests.get(key)
+        if contest is None:
+            contest = contests[key] = Contest(office, district, _to_int(row.get("vote_for")) or 1)
+            precinct.contests.append(contest)
+        if kind != "candidate":
+            same = next((c for c in contest.candidates if c.kind == kind), None)
+            if same is not None:
+                same.votes = tuple(a + b for a, b in zip(same.votes, votes))  # type: ignore[assignment]
+                continue
+        party = (row.get("party") or "").strip().upper()
+        contest.candidates.append(Candidate(party, candidate, kind, votes))
+
+    ordered = list(precincts.values())
+    for n in range(2, copies + 1):
+        ordered.extend(
+            Precinct(f"{p.name} #{n}", p.stats, p.contests) for p in list(precincts.values())
+        )
+    return county, ordered
+
+
+@dataclass
+class SyntheticPdf:
+    layout: str
+    county: str
+    pdf_bytes: bytes
+    page_count: int
+    config: object
+    expected: list[dict]
+
+
+def row_key(row: dict) -> tuple[str, ...]:
+    return tuple(str(row.get(f, "")) for f in COMPARE_FIELDS)
+
+
+def compare_rows(expected: list[dict], actual: list[dict]) -> list[str]:
+    """Describe every row missing from or unexpected in ``actual``
+    (order-insensitive). Empty means the round trip was exact."""
+    want = Counter(row_key(r) for r in expected)
+    got = Counter(row_key(r) for r in actual)
+    problems = []
+    for key, n in sorted((want - got).items()):
+        problems.append(f"missing x{n}: {dict(zip(COMPARE_FIELDS, key))}")
+    for key, n in sorted((got - want).items()):
+        problems.append(f"unexpected x{n}: {dict(zip(COMPARE_FIELDS, key))}")
+    return problems
+
+
+def _fmt(n: int) -> str:
+    return f"{n:,}"
+
+
+# ---------------------------------------------------------------------------
+# Electionware precinct summary.
+# ---------------------------------------------------------------------------
+
+
+ELECTIONWARE_SKIP_PREFIXES = (
+    "Summary Results Report",
+    "PRECINCT SUMMARY",
+    "TOTAL",
+    "Report generated with Electionware",
+)
+_ELECTIONWARE_COLUMNS = (380, 450, 510, 570)
+
+
+def _electionware_drawable(text: str) -> bool:
+    """False for labels the engine would read as page furniture or as a
+    statistics/aggregate row instead of the name they are."""
+    return not text.startswith(
+        ELECTIONWARE_SKIP_PREFIXES + ("Statistics", "STATISTICS", "Registered Voters - Total", "Ballots Cast - ")
+    )
+
+
+def render_electionware(county: str, precincts: list[Precinct]) -> SyntheticPdf:
+    from electionware_precinct_np import PARTY_CODES, PARTY_RE, ElectionwareConfig
+
+    party_codes = {p.upper() for p in PARTY_CODES}
+    header_suffix = f"{county.upper()} COUNTY"
+    exact_offices: dict[str, tuple[str, str]] = {}
+    expected: list[dict] = []
+    canvas = PdfCanvas()
+    y = 0.0
+
+    def start_page(precinct_name: str) -> None:
+        nonlocal y
+        canvas.new_page()
+        canvas.text(40, 770, header_suffix)
+        canvas.text(300, 770, "Summary Results Report OFFICIAL RESULTS")
+        canvas.text(300, 758, "PRECINCT SUMMARY")
+        canvas.text(40, 30, f"Report generated with Electionware Page {len(canvas.pages)}")
+        canvas.text(40, TOP, precinct_name)
+        y = TOP - LINE_HEIGHT
+
+    def line(label: str, values: Optional[tuple[int, ...]] = None) -> None:
+        nonlocal y
+        canvas.text(40, y, label)
+        for x, v in zip(_ELECTIONWARE_COLUMNS, values or ()):
+            canvas.text_right(x, y, _fmt(v))
+        y -= LINE_HEIGHT
+
+    def y_shift() -> None:
+        nonlocal y
+        y -= LINE_HEIGHT
+
+    def contest_heading(header: str, vote_for: int) -> None:
+        line(header)
+        line(f"Vote For {vote_for}")
+        canvas.text(40, y, "TOTAL")
+        for x, label in zip(_ELECTIONWARE_COLUMNS, ("VOTES", "Election Day", "Mail", "Provisional")):
+            canvas.text_right(x, y, label, 7)
+        y_shift()
+
+    def row(precinct, office, district, party, candidate, votes, vote_for) -> dict:
+        return {
+            "precinct": precinct, "office": office, "district": district, "party": party,
+            "candidate": candidate, "vote_for": vote_for, "votes": votes[0],
+            "election_day": votes[1], "mail": votes[2], "provisional": votes[3],
+        }
+
+    for precinct in precincts:
+        if not _electionware_drawable(precinct.name):
+            continue
+        start_page(precinct.name)
+        line("Statistics")
+        reg = precinct.stats.get("Registered Voters")
+        if reg is not None:
+            line("Registered Voters - Total", reg[:1])
+            expected.append({"precinct": precinct.name, "office": "Registered Voters", "votes": reg[0]})
+        for office, label in (("Ballots Cast", "Ballots Cast - Total"), ("Ballots Cast Blank", "Ballots Cast - Blank")):
+            votes = precinct.stats.get(office)
+            if votes is not None:
+                line(label, votes)
+                expected.append(row(precinct.name, office, "", "", "", votes, ""))
+        y_shift()
+
+        for contest in precinct.contests:
+            header = (f"{contest.office} - {contest.district}" if contest.district else contest.office).upper()
+            if not _electionware_drawable(header):
+                continue
+            office, district = exact_offices.setdefault(header, (contest.office, contest.district))
+            if y - 4 * LINE_HEIGHT < BOTTOM:
+                start_page(precinct.name)
+            contest_heading(header, contest.vote_for)
+            for cand in contest.candidates:
+                if y < BOTTOM:
+                    start_page(precinct.name)
+                    contest_heading(header, contest.vote_for)
+                if cand.kind == "candidate":
+                    # Parties outside PARTY_CODES are dropped; an unprefixed
+                    # name that starts like a party code can't be drawn.
+                    party = cand.party if cand.party in party_codes else ""
+                    label = f"{party} {cand.name}" if party else cand.name
+                    name = cand.name
+                    if not _electionware_drawable(label) or (not party and PARTY_RE.match(label)):
+                        continue
+                elif cand.kind == "write_in":
+                    label, party, name = "Write-In Totals", "", "Write-ins"
+                elif cand.kind in ("yes", "no"):
+                    label, party, name = cand.kind.upper(), "", cand.kind.capitalize()
+                else:
+                    label = name = cand.kind.capitalize()
+                    party = ""
+                line(label, cand.votes)
+                expected.append(row(precinct.name, office, district, party, name, cand.votes, contest.vote_for))
+            y_shift()
+
+    config = ElectionwareConfig(
+        county=county,
+        skip_prefixes=ELECTIONWARE_SKIP_PREFIXES,
+        county_header_suffix=header_suffix,
+        exact_offices=exact_offices,
+        party_optional=True,
+    )
+    return SyntheticPdf("electionware", county, canvas.to_bytes(), len(canvas.pages), config, expected)
+
+
+# ---------------------------------------------------------------------------
+# Statement of Votes Cast by geography (Wayne two-line contest headers).
+# ---------------------------------------------------------------------------
+
+
+SOVC_GEO_CONTEST_RE = re.compile(r"^(.+?)\s+\(Vote for\s+(\d+)\)$")
+SOVC_GEO_BALLOTS_RE = re.compile(
+    r"^(\d[\d,]*)\s+ballots\s+\(.*?\),\s+([\d,]+)\s+registered voters,\s+turnout\s+([\d.]+)%$"
+)
+SOVC_GEO_SKIP_PREFIXES = ("Statement of Votes Cast", "All Precincts", "Choice Votes Vote")
+_SOVC_GEO_COLUMNS = (330, 390, 450, 510, 570)
+
+
+def _sovc_geo_drawable(name: str, header_suffix: str) -> bool:
+    if name in ("Total", "Write-in") or name.startswith(("Precinct ", "Overvotes", "Undervotes")):
+        return False
+    return not name.startswith(SOVC_GEO_SKIP_PREFIXES + (header_suffix,))
+
+
+def render_sovc_geo(county: str, precincts: list[Precinct]) -> SyntheticPdf:
+    from sovc_geo_np import SovcGeoConfig
+
+    header_suffix = f"{county.upper()} COUNTY"
+    expected: list[dict] = []
+    canvas = PdfCanvas()
+    y = 0.0
+
+    def start_page() -> None:
+        nonlocal y
+        canvas.new_page()
+        canvas.text(40, 770, "Statement of Votes Cast")
+        canvas.text(300, 770, header_suffix)
+        canvas.text(40, 758, "All Precincts, All Districts, All Counter Groups")
+        canvas.text(40, TOP, "Choice Votes Vote %")
+        y = TOP - LINE_HEIGHT
+
+    def line(label: str, values: tuple[str, ...] = ()) -> None:
+        nonlocal y
+        if y < BOTTOM:
+            start_page()
+        canvas.text(40, y, label)
+        for x, v in zip(_SOVC_GEO_COLUMNS, values):
+            canvas.text_right(x, y, v)
+        y -= LINE_HEIGHT
+
+    def data_line(label: str, votes: tuple[int, ...], total: int) -> None:
+        pct = f"{100 * votes[0] / total:.2f}%" if total else "0.00%"
+        line(label, (_fmt(votes[0]), pct, *(_fmt(v) for v in votes[1:])))
+
+    def row(precinct, office, candidate, votes, vote_for) -> dict:
+        return {
+            "precinct": precinct, "office": office, "candidate": candidate,
+            "vote_for": vote_for, "votes": votes[0], "election_day": votes[1],
+            "mail": votes[2], "provisional": votes[3],
+        }
+
+    start_page()
+    for precinct in precincts:
+        line(f"Precinct {precinct.name}")
+        reg = precinct.stats.get("Registered Voters", (0,))[0]
+        ballots = precinct.stats.get("Ballots Cast", (0,))[0]
+        turnout = f"{100 * ballots / reg:.2f}" if reg else "0.00"
+        if precinct.contests:
+            expected.append({"precinct": precinct.name, "office": "Registered Voters", "votes": reg})
+            expected.append({"precinct": precinct.name, "office": "Ballots Cast", "votes": ballots})
+
+        for contest in precinct.contests:
+            office = f"{contest.office} - {contest.district}" if contest.district else contest.office
+            line(f"{office} (Vote for {contest.vote_for})")
+            line(f"{_fmt(ballots)} ballots (0 over voted ballots, 0 undervotes), "
+                 f"{_fmt(reg)} registered voters, turnout {turnout}%")
+            counted = [c for c in contest.candidates if c.kind not in ("overvotes", "undervotes")]
+            total = tuple(sum(c.votes[i] for c in counted) for i in range(4))
+            for cand in counted:
+                name = "Write-in" if cand.kind == "write_in" else cand.name
+                if cand.kind == "candidate" and not _sovc_geo_drawable(name, header_suffix):
+                    continue
+                data_line(name, cand.votes, total[0])
+                expected.append(row(precinct.name, office, name, cand.votes, str(contest.vote_for)))
+            # check_printed_totals sums every row the engine emits for the
+            # contest, so the printed Total covers the over/undervote lines
+            # this layout keeps (real Wayne reports skip them).
+            printed = tuple(sum(c.votes[i] for c in contest.candidates) for i in range(4))
+            data_line("Total", printed, printed[0])
+            for cand in contest.candidates:
+                if cand.kind in ("overvotes", "undervotes"):
+                    name = cand.kind.capitalize()
+                    data_line(name, cand.votes, total[0])
+                    expected.append(row(precinct.name, office, name, cand.votes, str(contest.vote_for)))
+
+    config = SovcGeoConfig(
+        county=county,
+        skip_prefixes=SOVC_GEO_SKIP_PREFIXES + (header_suffix,),
+        contest_re=SOVC_GEO_CONTEST_RE,
+        ballots_re=SOVC_GEO_BALLOTS_RE,
+    )
+    return SyntheticPdf("sovc_geo", county, canvas.to_bytes(), len(canvas.pages), config, expected)
+
+
+# ---------------------------------------------------------------------------
+# Rotated-header crosstab (Bedford layout).
+# ---------------------------------------------------------------------------
+
+
+_CROSSTAB_FONT = 7
+_CROSSTAB_ROW = 12
+_CROSSTAB_COLUMN = 34
+_CROSSTAB_MAX_COLUMNS = 12
+_CROSSTAB_PARTY_RE = re.compile(r"^(?:[A-Z]{1,3}|[A-Z]+(?:/[A-Z]+)+)$")
+# parse_candidate_header drops these columns; Bedford's report never has them.
+_CROSSTAB_SKIP_WORDS = ("times cast", "registered voters", "votes total", "total votes", "unresolved", "write")
+
+
+def _crosstab_table(
+    canvas: PdfCanvas, top: float, first_width: float, header: list[str], body: list[list[str]],
+    rotated: bool,
+) -> None:
+    widths = [first_width] + [_CROSSTAB_COLUMN if rotated else 80] * (len(header) - 1)
+    if rotated:
+        header_height = max(40.0, max(text_width(h, _CROSSTAB_FONT) for h in header[1:]) + 10)
+    else:
+        header_height = float(_CROSSTAB_ROW + 4)
+    y = top
+    for r, cells in enumerate([header] + body):
+        height = header_height if r == 0 else _CROSSTAB_ROW
+        x = 40.0
+        for c, value in enumerate(cells):
+            canvas.rect(x, y - height, widths[c], height)
+            if r == 0 and c > 0 and rotated:
+                canvas.rotated_text(x + widths[c] / 2 + 2, y - height + 4, value, _CROSSTAB_FONT)
+            elif c == 0:
+                canvas.text(x + 3, y - height + 3, value, _CROSSTAB_FONT)
+            else:
+                canvas.text_right(x + widths[c] - 3, y - height + 3, value, _CROSSTAB_FONT)
+            x += widths[c]
+        y -= height
+
+
+def render_sovc_crosstab(county: str, precincts: list[Precinct]) -> SyntheticPdf:
+    from sovc_crosstab_pp import SovcCrosstabConfig
+
+    county_total = f"{county} County"
+    precincts = [p for p in precincts if "Total" not in p.name and p.name not in ("Cumulative", county_total)]
+    expected: list[dict] = []
+    canvas = PdfCanvas()
+    first_width = min(250.0, max([80.0] + [text_width(p.name, _CROSSTAB_FONT) + 8 for p in precincts]))
+    rows_per_page = int((TOP - 40 - BOTTOM) / _CROSSTAB_ROW)
+
+    def page(title_lines: list[str]) -> float:
+        canvas.new_page()
+        y = 770.0
+        for text in ["Statement of Votes Cast", county_total.upper()] + title_lines:
+            canvas.text(40, y, text)
+            y -= LINE_HEIGHT
+        return y - 6
+
+    # Turnout table pages come first; the engine reads every table on them.
+    turnout_rows = []
+    for p in precincts:
+        reg = p.stats.get("Registered Voters", (0,))[0]
+        ballots = p.stats.get("Ballots Cast", (0,))[0]
+        turnout_rows.append([p.name, _fmt(reg), _fmt(ballots)])
+        expected.append({"precinct": p.name, "office": "Registered Voters", "votes": reg})
+        expected.append({"precinct": p.name, "office": "Ballots Cast", "votes": ballots})
+    turnout_pages = 0
+    for start in range(0, max(len(turnout_rows), 1), rows_per_page):
+        top = page(["Registered Voters and Ballots Cast"])
+        body = turnout_rows[start:start + rows_per_page]
+        if start + rows_per_page >= len(turnout_rows):
+            body = body + [[f"{county_total} - Total", "", ""]]
+        _crosstab_table(canvas, top, first_width, ["Precinct", "Registered Voters", "Ballots Cast"], body, False)
+        turnout_pages += 1
+
+    # One contest per (office, district), precincts as rows, candidates as
+    # rotated columns; wide contests split into column groups.
+    contests: dict[tuple, list[tuple[Precinct, Contest]]] = {}
+    for p in precincts:
+        for contest in p.contests:
+            contests.setdefault((contest.office, contest.district, contest.vote_for), []).append((p, contest))
+
+    for (office, district, vote_for), members in contests.items():
+        title_office = f"{office} - {district}" if district else office
+        m = re.search(r"District\s+([\d-]+)", title_office)
+        parsed_district = m.group(1) if m else ""
+        columns: dict[tuple[str, str], str] = {}
+        for _, contest in members:
+            for cand in contest.candidates:
+                if cand.kind in ("write_in",) or any(w in cand.name.lower() for w in _CROSSTAB_SKIP_WORDS):
+                    continue
+                if cand.kind in ("yes", "no"):
+                    key, label = ("", cand.kind.capitalize()), cand.kind.capitalize()
+                elif cand.kind in ("overvotes", "undervotes"):
+                    key = ("", cand.kind.capitalize())
+                    label = key[1]
+                else:
+                    if re.search(r"\([A-Z/]+\)", cand.name):
+                        continue
+                    party = cand.party if _CROSSTAB_PARTY_RE.match(cand.party) else ""
+                    key = (party, cand.name)
+                    label = f"{cand.name} ({party})" if party else cand.name
+                columns.setdefault(key, label)
+        if not columns:
+            continue
+        votes_by_precinct = []
+        for p, contest in members:
+            votes: dict[tuple[str, str], int] = {}
+            for cand in contest.candidates:
+                if cand.kind in ("yes", "no", "overvotes", "undervotes"):
+                    key = ("", cand.kind.capitalize())
+                else:
+                    key = (cand.party if _CROSSTAB_PARTY_RE.match(cand.party) else "", cand.name)
+                votes[key] = votes.get(key, 0) + cand.votes[0]
+            votes_by_precinct.append((p.name, votes))
+
+        keys = list(columns)
+        for col_start in range(0, len(keys), _CROSSTAB_MAX_COLUMNS):
+            group = keys[col_start:col_start + _CROSSTAB_MAX_COLUMNS]
+            header = ["Precinct"] + [columns[k] for k in group]
+            header_height = max(text_width(h, _CROSSTAB_FONT) for h in header[1:]) + 10
+            per_page = max(1, int((TOP - 40 - BOTTOM - header_height) / _CROSSTAB_ROW))
+            for row_start in range(0, len(votes_by_precinct), per_page):
+                top = page([f"{title_office} (Vote for {vote_for})"])
+                body = []
+                for name, votes in votes_by_precinct[row_start:row_start + per_page]:
+                    body.append([name] + [_fmt(votes.get(k, 0)) for k in group])
+                    for party, candidate in group:
+                        expected.append({
+                            "precinct": name, "office": title_office, "district": parsed_district,
+                            "party": party, "candidate": candidate, "vote_for": str(vote_for),
+                            "votes": votes.get((party, candidate), 0),
+                        })
+                _crosstab_table(canvas, top, first_width, header, body, True)
+
+    config = SovcCrosstabConfig(
+        county=county,
+        vote_type_rows=False,
+        is_skip_row=lambda p: p in (county_total, "Cumulative", "") or "Total" in p,
+        turnout_max_pages=turnout_pages,
+    )
+    return SyntheticPdf("sovc_crosstab", county, canvas.to_bytes(), len(canvas.pages), config, expected)
+
+
+LAYOUTS: dict[str, Callable[[str, list[Precinct]], SyntheticPdf]] = {
+    "electionware": render_electionware,
+    "sovc_geo": render_sovc_geo,
+    "sovc_crosstab": render_sovc_crosstab,
+}
+
+
+def render(layout: str, csv_path: Path, copies: int = 1) -> SyntheticPdf:
+    if layout not in LAYOUTS:
+        raise KeyError(f"unknown layout {layout!r}; choose from {', '.join(LAYOUTS)}")
+    county, precincts = build_precincts(load_csv(csv_path), copies)
+    return LAYOUTS[layout](county, precincts)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    argv = list(argv) if argv is not None else sys.argv[1:]
+    copies = 1
+    if "--copies" in argv:
+        idx = argv.index("--copies")
+        copies = int(argv[idx + 1])
+        del argv[idx:idx + 2]
+    if len(argv) != 3 or argv[0] not in LAYOUTS:
+        print(
+            f"Usage: synthetic_pdf.py {{{'|'.join(LAYOUTS)}}} <precinct.csv> <output.pdf> [--copies N]",
+            file=sys.stderr,
+        )
+        return 1
+    layout, csv_path, out_path = argv
+    synthetic = render(layout, Path(csv_path), copies)
+    Path(out_path).write_bytes(synthetic.pdf_bytes)
+    print(f"Wrote {synthetic.page_count} pages ({len(synthetic.expected)} expected rows) to {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
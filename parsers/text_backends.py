@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""Page-text backends for the line-based engines.
+
+``electionware_precinct_np``, ``electionware_primary_np``,
+``electionware_regex_np`` and ``sovc_geo_np`` only ever read each page's
+plain text and match it line by line, so which library produces that text
+is a per-county choice (``config.text_backend``):
+
+  - ``natural_pdf`` (default): ``page.extract_text()``. Loading a page parses
+    every object on it, which dominates a run (see ``--profile``).
+  - ``pdfplumber``: the same text without natural-pdf's element layer.
+  - ``pypdfium2``: PDFium's character boxes regrouped into lines with
+    pdfplumber's default tolerances; 25-35x faster on the synthetic
+    reports from ``synthetic_pdf.py``.
+  - ``pdftotext``: poppler's ``pdftotext -layout`` in one subprocess,
+    whitespace runs collapsed. Needs poppler-utils on PATH.
+
+Backends can disagree on line order (content-stream vs visual) or on how a
+word is split, so only switch a county after checking its PDF with this
+module's CLI: it extracts every page with each backend (default: all but
+``natural_pdf``), times it, and compares each page's lines against
+``natural_pdf``, printing the first ``--show`` differing pages as diffs.
+``engine_bench.py --backend NAME`` runs the engines' synthetic round trip on
+a backend.
+
+Usage:
+    python parsers/text_backends.py input.pdf [--backend NAME ...] [--show N]
+"""
+
+from __future__ import annotations
+
+import difflib
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+import instrumentation
+
+DEFAULT_BACKEND = "natural_pdf"
+
+# pdfplumber's extract_text() defaults, so pypdfium2 output lines up with it.
+X_TOLERANCE = 3.0
+Y_TOLERANCE = 3.0
+
+
+@dataclass
+class PageTexts:
+    """An opened PDF's page texts: ``len()`` is known up front, iterating
+    extracts each page once, in order."""
+
+    count: int
+    texts: Iterator[str]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[str]:
+        return self.texts
+
+
+def document_page_texts(pdf) -> Iterator[str]:
+    """Yield each page's text from an already-open natural-pdf (or
+    pdfplumber) document, timed per page when profiling."""
+    for index in range(len(pdf.pages)):
+        with instrumentation.unit("page", index + 1):
+            page = instrumentation.load_page(pdf.pages, index)
+            with instrumentation.phase("text_extraction"):
+                text = page.extract_text() or ""
+        yield text
+
+
+def _natural_pdf(pdf_path: str) -> PageTexts:
+    import natural_pdf as npdf
+
+    with instrumentation.phase("pdf_open"):
+        pdf = npdf.PDF(pdf_path)
+    return PageTexts(len(pdf.pages), document_page_texts(pdf))
+
+
+def _pdfplumber(pdf_path: str) -> PageTexts:
+    import pdfplumber
+
+    with instrumentation.phase("pdf_open"):
+        pdf = pdfplumber.open(pdf_path)
+
+    def texts() -> Iterator[str]:
+        with pdf:
+            yield from document_page_texts(pdf)
+
+    return PageTexts(len(pdf.pages), texts())
+
+
+def pdfium_page_text(page) -> str:
+    """Rebuild a pypdfium2 page's text as pdfplumber would lay it out: chars
+    clustered into lines by top edge, sorted left to right, and split into
+    words at whitespace or at gaps wider than ``X_TOLERANCE``."""
+    textpage = page.get_textpage()
+    try:
+        n = textpage.count_chars()
+        raw = textpage.get_text_range(0, n, errors="ignore") if n else ""
+        chars: list[tuple[float, float, float, str]] = []  # (top, left, right, char)
+        for i, ch in enumerate(raw[:n]):
+            if ch.isspace():
+                # PDFium reports generated and real spaces with empty boxes;
+                # keep them as zero-width word breaks after the previous char.
+                if chars:
+                    top, _, right, _ = chars[-1]
+                    chars.append((top, right, right, " "))
+                continue
+            left, _bottom, right, top = textpage.get_charbox(i, loose=True)
+            chars.append((top, left, right, ch))
+    finally:
+        textpage.close()
+
+    chars.sort(key=lambda c: -c[0])
+    lines: list[list[tuple[float, float, float, str]]] = []
+    line_top = None
+    for c in chars:
+        if line_top is not None and line_top - c[0] <= Y_TOLERANCE:
+            lines[-1].append(c)
+        else:
+            line_top = c[0]
+            lines.append([c])
+
+    out = []
+    for line in lines:
+        line.sort(key=lambda c: c[1])
+        words: list[str] = []
+        word = ""
+        prev_right = None
+        for _top, left, right, ch in line:
+            if ch == " " or (prev_right is not None and left - prev_right > X_TOLERANCE):
+                if word:
+                    words.append(word)
+                word = ""
+                prev_right = None
+                if ch == " ":
+                    continue
+            word += ch
+            prev_right = right
+        if word:
+            words.append(word)
+        if words:
+            out.append(" ".join(words))
+    return "\n".join(out)
+
+
+def _pypdfium2(pdf_path: str) -> PageTexts:
+    import pypdfium2 as pdfium
+
+    with instrumentation.phase("pdf_open"):
+        doc = pdfium.PdfDocument(pdf_path)
+
+    def texts() -> Iterator[str]:
+        try:
+            for index in range(len(doc)):
+                with instrumentation.unit("page", index + 1):
+                    with instrumentation.phase("page_load"):
+                        page = doc[index]
+                    with instrumentation.phase("text_extraction"):
+                        text = pdfium_page_text(page)
+                    page.close()
+                yield text
+        finally:
+            doc.close()
+
+    return PageTexts(len(doc), texts())
+
+
+def _collapse(text: str) -> str:
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _pdftotext(pdf_path: str) -> PageTexts:
+    # One process for the whole document; pages are separated by form feeds.
+    with instrumentation.phase("text_extraction"):
+        try:
+            proc = subprocess.run(
+                ["pdftotext", "-layout", "-enc", "UTF-8", pdf_path, "-"],
+                capture_output=True, check=True, text=True,
+            )
+        except FileNotFoundError:
+            raise RuntimeError(
+                "pdftotext not found; install poppler-utils or choose another text_backend"
+            ) from None
+    pages = proc.stdout.split("\f")
+    if pages and not pages[-1].strip():
+        pages.pop()
+    return PageTexts(len(pages), (_collapse(page) for page in pages))
+
+
+BACKENDS: dict[str, Callable[[str], PageTexts]] = {
+    "natural_pdf": _natural_pdf,
+    "pdfplumber": _pdfplumber,
+    "pypdfium2": _pypdfium2,
+    "pdftotext": _pdftotext,
+}
+
+
+def open_page_texts(pdf_path, backend: str = DEFAULT_BACKEND) -> PageTexts:
+    """Open ``pdf_path`` with ``backend`` and return its ``PageTexts``."""
+    try:
+        opener = BACKENDS[backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown text backend {backend!r}; expected one of {', '.join(BACKENDS)}"
+        ) from None
+    pages = opener(str(pdf_path))
+    instrumentation.count("pages", len(pages))
+    return pages
+
+
+class PageTextCache:
+    """Opened PDFs and their page texts, shared across the passes of one run.
+
+    A run that reads the same PDF more than once (both halves of a combined
+    Democratic/Republican primary report, page ranges of a split volume)
+    opens each file once and extracts each page at most once: ``pages``
+    extracts in order up to the last page a pass asks for and keeps the
+    texts for later passes. With the ``natural_pdf`` backend the opened
+    document itself is shared too (``document``), for configs that bring
+    their own natural-pdf block extractor.
+    """
+
+    def __init__(self, backend: str = DEFAULT_BACKEND) -> None:
+        self.backend = backend
+        self._documents: dict[str, object] = {}
+        self._texts: dict[str, tuple[PageTexts, Iterator[str], list[str]]] = {}
+
+    @staticmethod
+    def _key(pdf_path) -> str:
+        return str(Path(pdf_path).resolve())
+
+    def document(self, pdf_path):
+        """The natural-pdf document for ``pdf_path``, opened once."""
+        key = self._key(pdf_path)
+        pdf = self._documents.get(key)
+        if pdf is None:
+            import natural_pdf as npdf
+
+            with instrumentation.phase("pdf_open"):
+                pdf = self._documents[key] = npdf.PDF(key)
+        return pdf
+
+    def page_count(self, pdf_path) -> int:
+        return len(self._open(pdf_path)[0])
+
+    def _open(self, pdf_path) -> tuple[PageTexts, Iterator[str], list[str]]:
+        key = self._key(pdf_path)
+        entry = self._texts.get(key)
+        if entry is None:
+            if self.backend == DEFAULT_BACKEND:
+                pdf = self.document(pdf_path)
+                pages = PageTexts(len(pdf.pages), document_page_texts(pdf))
+                instrumentation.count("pages", len(pages))
+            else:
+                pages = open_page_texts(key, self.backend)
+            entry = self._texts[key] = (pages, iter(pages), [])
+        return entry
+
+    def pages(self, pdf_path, first: int = 1, last: Optional[int] = None) -> Iterator[str]:
+        """Yield the texts of pages ``first``..``last`` (1-based, inclusive;
+        ``last`` None for the end of the document)."""
+        pages, texts, done = self._open(pdf_path)
+        last = len(pages) if last is None else min(last, len(pages))
+        if first < 1 or first > last:
+            raise ValueError(f"{pdf_path}: no pages {first}-{last} in a {len(pages)}-page PDF")
+        for index in range(first - 1, last):
+            while len(done) <= index:
+                done.append(next(texts))
+            yield done[index]
+
+
+# ---------------------------------------------------------------------------
+# Equivalence benchmark.
+
+
+def page_lines(text: str) -> list[str]:
+    """A page's lines as the engines see them: stripped, whitespace runs
+    collapsed, blank lines dropped."""
+    return _collapse(text).split("\n") if text.strip() else []
+
+
+def compare_backend(reference: list[list[str]], candidate: list[list[str]]) -> dict:
+    """Count pages whose lines match exactly, match only as a multiset (same
+    lines, different order), or differ."""
+    same = reordered = 0
+    differing: list[int] = []
+    for number, (ref, got) in enumerate(zip(reference, candidate), 1):
+        if ref == got:
+            same += 1
+        elif sorted(ref) == sorted(got):
+            reordered += 1
+        else:
+            differing.append(number)
+    missing = abs(len(reference) - len(candidate))
+    return {"same": same, "reordered": reordered, "differing": differing, "page_count_delta": missing}
+
+
+def _extract_all(pdf_path: Path, backend: str) -> tuple[list[list[str]], float]:
+    start = time.perf_counter()
+    pages = [page_lines(text) for text in open_page_texts(pdf_path, backend)]
+    return pages, time.perf_counter() - start
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    argv = list(argv) if argv is not None else sys.argv[1:]
+    backends: list[str] = []
+    show = 1
+    rest = []
+    while argv:
+        arg = argv.pop(0)
+        if arg == "--backend" and argv:
+            backends.append(argv.pop(0))
+        elif arg == "--show" and argv:
+            show = int(argv.pop(0))
+        else:
+            rest.append(arg)
+    unknown = [b for b in backends if b not in BACKENDS]
+    if len(rest) != 1 or unknown:
+        print(__doc__.split("Usage:")[1].rstrip(), file=sys.stderr)
+        return 1
+    pdf_path = Path(rest[0])
+    backends = backends or [b for b in BACKENDS if b != DEFAULT_BACKEND]
+
+    reference, ref_seconds = _extract_all(pdf_path, DEFAULT_BACKEND)
+    print(f"{pdf_path.name}: {len(reference)} pages")
+    print(f"{DEFAULT_BACKEND:12} {ref_seconds:8.2f} s  (reference)")
+    for backend in backends:
+        try:
+            pages, seconds = _extract_all(pdf_path, backend)
+        except (ImportError, RuntimeError) as exc:
+            print(f"{backend:12} unavailable: {exc}")
+            continue
+        result = compare_backend(reference, pages)
+        verdict = "equivalent" if not result["differing"] and not result["page_count_delta"] else "DIFFERS"
+        print(
+            f"{backend:12} {seconds:8.2f} s {ref_seconds / seconds:7.1f}x  "
+            f"{result['same']} same, {result['reordered']} reordered, "
+            f"{len(result['differing'])} differing pages  {verdict}"
+        )
+        for number in result["differing"][:show]:
+            diff = difflib.unified_diff(
+                reference[number - 1], pages[number - 1],
+                f"page {number} ({DEFAULT_BACKEND})", f"page {number} ({backend})", lineterm="", n=0,
+            )
+            for line in list(diff)[:20]:
+                print(f"    {line}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
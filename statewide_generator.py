@@ -1,6 +1,20 @@
-import os
-import glob
+# Consolidates the county files of one election into a statewide file
+#
+#   python statewide_generator.py [--year 2024] [--pattern "20241105*precinct.csv"]
+#                                 [--output 20241105__pa__general__precinct.csv] [--full]
+#
+# A manifest next to the output (<output>.manifest.json) records each
+# county file's hash and where its rows sit in the output, so a rebuild
+# only re-reads the county files that changed and copies every other
+# county's rows from the previous output as they are.
+import argparse
 import csv
+import glob
+import hashlib
+import io
+import json
+import os
+import time
 
 year = '2024'
 election = '20241105'
@@ -37,47 +51,153 @@ def generate_offices(year, path):
         outfile = csv.writer(csv_outfile)
         outfile.writerows(offices)
 
-def generate_consolidated_file(year, path, output_file):
-    results = []
-    os.chdir(year)
-    os.chdir('counties')
-    for fname in glob.glob(path):
-        with open(fname, "r") as csvfile:
-            print(fname)
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                if row['office'].strip() in ['Straight Party', 'President', 'Governor', 'Secretary of State', 'Railroad Commissioner', 'State Auditor', 'Auditor General', 'State Treasurer', 'Commissioner of Agriculture & Commerce', 'Commissioner of Insurance', 'Attorney General', 'U.S. House', 'State Senate', 'State House', 'U.S. Senate', 'House of Delegates', 'State Representative', 'Registered Voters', 'Ballots Cast', 'Ballots Cast Blank']:
-                    if 'absentee' in row:
-                        absentee = row['absentee']
-                    else:
-                        absentee = None
-                    if 'mail' in row:
-                        mail = row['mail']
-                    else:
-                        mail = None
-                    if 'election_day' in row:
-                        election_day = row['election_day']
-                    else:
-                        election_day = None
-                    if 'provisional' in row:
-                        provisional = row['provisional']
-                    else:
-                        provisional = None
-                    if 'military' in row:
-                        military = row['military']
-                    else:
-                        military = None
-                    if 'extra' in row:
-                        extra = row['extra']
-                    else:
-                        extra = None
-                    results.append([row['county'], row['precinct'], row['office'], row['district'], row['candidate'], row['party'], row['votes'], election_day, absentee, mail, provisional, military, extra])
-    os.chdir('..')
-    os.chdir('..')
-    with open(output_file, "w") as csv_outfile:
-        outfile = csv.writer(csv_outfile)
-        outfile.writerow(['county','precinct', 'office', 'district', 'candidate', 'party', 'votes', 'election_day', 'absentee', 'mail', 'provisional', 'military', 'extra'])
-        outfile.writerows(results)
+# offices kept in the consolidated file
+OFFICES = ['Straight Party', 'President', 'Governor', 'Secretary of State', 'Railroad Commissioner', 'State Auditor', 'Auditor General', 'State Treasurer', 'Commissioner of Agriculture & Commerce', 'Commissioner of Insurance', 'Attorney General', 'U.S. House', 'State Senate', 'State House', 'U.S. Senate', 'House of Delegates', 'State Representative', 'Registered Voters', 'Ballots Cast', 'Ballots Cast Blank']
+HEADER = ['county','precinct', 'office', 'district', 'candidate', 'party', 'votes', 'election_day', 'absentee', 'mail', 'provisional', 'military', 'extra']
+VOTE_COLUMNS = ['election_day', 'absentee', 'mail', 'provisional', 'military', 'extra']
+
+MANIFEST_SUFFIX = '.manifest.json'
+MANIFEST_VERSION = 1
+HASH_CHUNK = 1 << 20
+
+
+def _csv_bytes(rows):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode('utf-8')
+
+
+def county_rows(fname):
+    """The consolidated rows one county file contributes."""
+    with open(fname, "r") as csvfile:
+        reader = csv.DictReader(csvfile)
+        for row in reader:
+            if row['office'].strip() in OFFICES:
+                # vote columns a county file doesn't have are left empty
+                yield [row['county'], row.get('precinct'), row['office'], row['district'], row['candidate'], row['party'], row['votes'],
+                       *(row.get(column) for column in VOTE_COLUMNS)]
+
+
+def file_sha256(fname):
+    digest = hashlib.sha256()
+    with open(fname, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stat(fname):
+    st = os.stat(fname)
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+
+def load_manifest(output_file, pattern):
+    """The shards recorded for output_file, by county file name; empty if
+    there's no manifest, it's for another pattern, or output_file was
+    changed since it was written."""
+    try:
+        with open(output_file + MANIFEST_SUFFIX) as f:
+            manifest = json.load(f)
+        output_stat = _stat(output_file)
+    except (FileNotFoundError, ValueError):
+        return {}
+    if (manifest.get('version') != MANIFEST_VERSION or manifest.get('pattern') != pattern
+            or manifest.get('output') != output_stat):
+        return {}
+    return {shard['file']: shard for shard in manifest['shards']}
+
+
+def _write_manifest(output_file, pattern, shards):
+    manifest = {'version': MANIFEST_VERSION, 'pattern': pattern, 'output': _stat(output_file), 'shards': shards}
+    tmp_file = output_file + MANIFEST_SUFFIX + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp_file, output_file + MANIFEST_SUFFIX)
+
+
+def _copy_range(src, dst, offset, length):
+    src.seek(offset)
+    while length:
+        chunk = src.read(min(length, HASH_CHUNK))
+        if not chunk:
+            raise IOError('{} is shorter than its manifest says'.format(src.name))
+        dst.write(chunk)
+        length -= len(chunk)
+
+
+def build(counties_dir, pattern, output_file, full=False):
+    """Writes the consolidated file for the county files matching pattern
+    in counties_dir, re-reading only the county files whose contents
+    changed since the last build (see the manifest written next to
+    output_file); every other county's rows are copied from the previous
+    output as they are. Returns the names of the county files re-read."""
+    fnames = sorted(os.path.basename(f) for f in glob.glob(os.path.join(counties_dir, pattern)))
+    previous = {} if full else load_manifest(output_file, pattern)
+
+    shards = []
+    changed = {}
+    restat = False
+    for fname in fnames:
+        path = os.path.join(counties_dir, fname)
+        stat = _stat(path)
+        shard = dict(previous.get(fname, {}))
+        if not shard or {'size': shard['size'], 'mtime_ns': shard['mtime_ns']} != stat:
+            restat = True
+            sha256 = file_sha256(path)
+            if shard.get('sha256') != sha256:
+                print(fname)
+                rows = list(county_rows(path))
+                changed[fname] = _csv_bytes(rows)
+                shard = {'file': fname, 'sha256': sha256, 'rows': len(rows)}
+            shard.update(stat)
+        shards.append(shard)
+
+    if not changed and [s['file'] for s in shards] == list(previous):
+        if restat:
+            # touched but unchanged: only the recorded stats are stale
+            _write_manifest(output_file, pattern, shards)
+        return []
+
+    header = _csv_bytes([HEADER])
+    tmp_file = output_file + '.tmp'
+    offset = len(header)
+    with open(tmp_file, 'wb') as out:
+        out.write(header)
+        old = open(output_file, 'rb') if previous else None
+        try:
+            for shard in shards:
+                if shard['file'] in changed:
+                    data = changed[shard['file']]
+                    out.write(data)
+                    length = len(data)
+                else:
+                    length = shard['length']
+                    _copy_range(old, out, shard['offset'], length)
+                shard['offset'], shard['length'] = offset, length
+                offset += length
+        finally:
+            if old is not None:
+                old.close()
+    os.replace(tmp_file, output_file)
+    _write_manifest(output_file, pattern, shards)
+    return list(changed)
+
+
+def generate_consolidated_file(year, path, output_file, full=False):
+    return build(os.path.join(year, 'counties'), path, output_file, full=full)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Consolidate county CSVs into one statewide file.')
+    parser.add_argument('--year', default=year)
+    parser.add_argument('--pattern', default=path, help='county file glob (default %(default)s)')
+    parser.add_argument('--output', default=output_file)
+    parser.add_argument('--full', action='store_true', help='re-read every county file')
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    changed = generate_consolidated_file(args.year, args.pattern, args.output, full=args.full)
+    print('{}: {} county files re-read in {:.2f}s'.format(args.output, len(changed), time.perf_counter() - start))
+
 
 if __name__ == '__main__':
-    generate_consolidated_file(year, path, output_file)
+    main()
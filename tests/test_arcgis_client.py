@@ -0,0 +1,107 @@
+"""Tests for the concurrent, cached ArcGIS feature fetcher."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+from arcgis_client import ArcgisClient, ArcgisError, ArcgisQuery, RateLimiter  # noqa: E402
+
+URL = "https://example.invalid/FeatureServer/1/query"
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self._data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+
+class FakeLayer:
+    """A session serving ``total`` features, at most ``max_records`` per
+    request, slowest for the first window."""
+
+    def __init__(self, total, max_records=None, last_edit=1):
+        self.total = total
+        self.max_records = max_records
+        self.last_edit = last_edit
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get(self, url, params, timeout):
+        if not url.endswith("/query"):
+            return FakeResponse({"editingInfo": {"lastEditDate": self.last_edit}})
+        with self._lock:
+            self.calls.append(dict(params))
+        if params.get("returnCountOnly"):
+            return FakeResponse({"count": self.total})
+        offset, size = params["resultOffset"], params["resultRecordCount"]
+        if offset == 0:
+            time.sleep(0.05)
+        size = min(size, self.max_records or size)
+        ids = range(offset, min(offset + size, self.total))
+        return FakeResponse({
+            "features": [{"attributes": {"id": i}} for i in ids],
+            "exceededTransferLimit": offset + size < self.total,
+        })
+
+
+def _ids(client, query):
+    return [f["attributes"]["id"] for f in client.features(query)]
+
+
+def test_windows_fetch_concurrently_in_order_and_replay_from_cache(tmp_path):
+    query = ArcgisQuery(URL, out_fields=["id"], page_size=10, extra_params={"returnGeometry": "false"})
+    layer = FakeLayer(45)
+    client = ArcgisClient(tmp_path, workers=3, min_interval=0, session=layer)
+    ids = _ids(client, query)
+    assert ids == list(range(45))
+    assert sorted(c.get("resultOffset", -1) for c in layer.calls) == [-1, 0, 10, 20, 30, 40]
+    assert all(c["returnGeometry"] == "false" and c["outFields"] == "id" for c in layer.calls)
+
+    # A new client only asks the layer when it was last edited.
+    layer.calls.clear()
+    assert _ids(ArcgisClient(tmp_path, min_interval=0, session=layer), query) == ids
+    assert layer.calls == []
+
+    # An edited layer is downloaded again.
+    layer.last_edit = 2
+    assert _ids(ArcgisClient(tmp_path, min_interval=0, session=layer), query) == ids
+    assert len(layer.calls) == 6
+
+
+def test_short_windows_are_completed_or_raise():
+    query = ArcgisQuery(URL, out_fields=["id"], page_size=10)
+    layer = FakeLayer(25, max_records=4)
+    assert _ids(ArcgisClient(min_interval=0, session=layer), query) == list(range(25))
+    assert sorted(c["resultOffset"] for c in layer.calls if "resultOffset" in c) == [
+        0, 4, 8, 10, 14, 18, 20, 24,
+    ]
+
+    # The layer lost features after it was counted.
+    client = ArcgisClient(min_interval=0, session=FakeLayer(25))
+    with pytest.raises(ArcgisError, match="offset 25 returned 0 of 5"):
+        client.window(query, 20, 10)
+
+
+def test_server_errors_raise_and_requests_are_spaced():
+    class Failing:
+        def get(self, url, params, timeout):
+            return FakeResponse({"error": {"code": 400, "message": "Invalid query"}})
+
+    with pytest.raises(ArcgisError, match="Invalid query"):
+        ArcgisClient(session=Failing()).count(ArcgisQuery(URL, out_fields=["id"]))
+
+    limiter = RateLimiter(0.02)
+    start = time.monotonic()
+    for _ in range(4):
+        limiter.wait()
+    assert time.monotonic() - start >= 0.06
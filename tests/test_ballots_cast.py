@@ -0,0 +1,87 @@
+"""Tests for the batch ballots-cast sanity check."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+from ballots_cast import ballots_cast_sanity, check, check_election, load, main  # noqa: E402
+
+ELECTION = "20251104__pa__general"
+
+
+def _write(path, text):
+    path.write_text(text.lstrip())
+    return path
+
+
+def test_overcount_respects_vote_for_and_skips_non_votes(tmp_path):
+    path = _write(tmp_path / "x.csv", """
+county,precinct,office,district,party,candidate,vote_for,votes
+X,P1,Ballots Cast,,,,,300
+X,P1,Sheriff,,,A,1,150
+X,P1,Sheriff,,,B,1,140
+X,P1,Sheriff,,,Undervotes,1,10
+X,P1,Sheriff,,,Total Votes Cast,1,290
+X,P1,School Director,,,A,4,280
+X,P1,School Director,,,B,4,270
+X,P1,School Director,,,C,4,260
+X,P1,School Director,,,D,4,250
+X,P1,Coroner,,,A,1,"9,000"
+""")
+    flagged = ballots_cast_sanity(path)
+    assert [(r["office"], r["votes"], r["off_by"]) for r in flagged] == [("Coroner", 9000, 8700)]
+
+
+def test_contests_without_vote_for_are_advisory_and_ranked_last(tmp_path, capsys):
+    rows = ["county,precinct,office,district,party,candidate,vote_for,votes", "X,P1,Ballots Cast,,,,,100"]
+    # Two committee seats, over one vote per ballot; P2's party mix differs.
+    for precinct, ballots, votes in (("P1", 100, 180), ("P2", 100, 560)):
+        if precinct != "P1":
+            rows.append(f"X,{precinct},Ballots Cast,,,,,{ballots}")
+        rows.append(f"X,{precinct},State Committee,,REP,A,,{votes // 2}")
+        rows.append(f"X,{precinct},State Committee,,REP,B,,{votes // 2}")
+    rows.append("X,P1,Sheriff,,,A,1,101")
+    path = _write(tmp_path / f"{ELECTION}__x__precinct.csv", "\n".join(rows) + "\n")
+    report = check(load([path]))
+    assert report[["precinct", "office", "kind", "off_by"]].values.tolist() == [
+        ["P1", "Sheriff", "overcount", 1],
+        ["P2", "State Committee", "no_vote_for", 460],
+        ["P1", "State Committee", "no_vote_for", 80],
+    ]
+    assert [r["office"] for r in ballots_cast_sanity(path)] == ["Sheriff"]
+
+    (tmp_path / f"{ELECTION}__x__precinct.csv").write_text("\n".join(rows[:-1]) + "\n")
+    assert main([ELECTION, "-d", str(tmp_path), "--strict"]) == 0
+    assert "2 precinct contests without a vote_for" in capsys.readouterr().out
+
+
+def test_ballots_cast_as_candidate_row_and_county_files_skipped(tmp_path):
+    _write(tmp_path / "p.csv", """
+county,precinct,office,candidate,vote_for,votes
+X,P1,,Ballots Cast,,300
+X,P1,Sheriff,A,1,301
+""")
+    _write(tmp_path / "c.csv", "county,office,candidate,votes\nX,Sheriff,A,9000\n")
+    assert len(ballots_cast_sanity(tmp_path / "p.csv")) == 1
+    assert ballots_cast_sanity(tmp_path / "c.csv") == []
+
+
+def test_election_report_ranks_overcounts_and_undercounts(tmp_path, capsys):
+    rows = ["county,precinct,office,district,party,candidate,votes"]
+    for n in range(1, 6):
+        rows.append(f"Adams,P{n},Ballots Cast,,,,100")
+        rows.append(f"Adams,P{n},Sheriff,,,A,{80 if n != 5 else 2}")
+    _write(tmp_path / f"{ELECTION}__adams__precinct.csv", "\n".join(rows) + "\n")
+    _write(tmp_path / f"{ELECTION}__bedford__precinct.csv", """
+county,precinct,office,district,party,candidate,vote_for,votes
+Bedford,B1,Ballots Cast,,,,,50
+Bedford,B1,Sheriff,,,A,1,60
+""")
+    report = check_election(ELECTION, tmp_path)
+    assert report[["precinct", "kind", "off_by"]].values.tolist() == [
+        ["B1", "overcount", 10],
+        ["P5", "undercount", 78],
+    ]
+    assert main([ELECTION, "-d", str(tmp_path), "--strict"]) == 1
+    assert "1 overcounts, 1 undercounts in 2 counties" in capsys.readouterr().out
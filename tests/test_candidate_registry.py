@@ -0,0 +1,75 @@
+"""Tests for the shared candidate-name registry."""
+
+import csv
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+import infer_county_party  # noqa: E402
+from candidate_registry import CandidateRegistry, normalize, pa_2020_primary  # noqa: E402
+from constants.pa_candidates_2020 import OFFICIAL_PRIMARY_CANDIDATE_ALIASES  # noqa: E402
+
+
+def test_normalize_folds_case_punctuation_and_order_keeping_suffixes():
+    assert normalize("Biden, Joseph R. Jr.") == "JOSEPH R BIDEN JR"
+    assert normalize("JOSEPH  R BIDEN") == "JOSEPH R BIDEN"
+    assert normalize("WAYNE LANGERHOLC, JR") == "WAYNE LANGERHOLC JR"
+    assert normalize("Langerholc, Wayne Jr.") == "WAYNE LANGERHOLC JR"
+    assert normalize("John \"Jack\" O'Neil III") == "JOHN JACK O NEIL III"
+
+
+def test_father_and_son_stay_apart():
+    registry = CandidateRegistry()
+    son = registry.add("JOHN SMITH JR")
+    assert registry.resolve("Smith, John") == son  # suffix left off, one John Smith
+    father = registry.add("SMITH, JOHN SR")
+    assert son != father
+    assert registry.resolve("John Smith Sr.") == father
+    assert registry.resolve("SMITH, JOHN JR") == son
+    assert registry.resolve("John Smith") is None  # now ambiguous
+    assert registry.resolve("John Smith III") is None
+    assert len(registry) == 2
+
+
+def test_resolve_exact_and_fuzzy():
+    registry = CandidateRegistry()
+    biden = registry.add("JOSEPH R BIDEN", aliases=["BIDEN, JOSEPH ROBINETTE JR"], party="DEM")
+    registry.add("BERNIE SANDERS")
+    assert registry.resolve("Biden, Joseph Robinette Jr.") == biden
+    assert registry.resolve("JOSEPH R BIDDEN") is None
+    assert registry.match("JOSEPH R BIDDEN") == biden
+    assert registry.match("JOSEPH R BIDDEN", min_score=0.99) is None
+    assert registry.match("ELIZABETH WARREN") is None
+    assert registry.canonical("Elizabeth Warren") == "ELIZABETH WARREN"
+    assert registry.canonical("JOSEPH R BIDDEN", fuzzy=False) == "JOSEPH R BIDDEN"
+    assert registry.party("joseph r. biden") == "DEM"
+    assert len(registry) == 2 and "Bernie Sanders" in registry
+
+
+def test_first_registration_of_an_alias_wins():
+    registry = CandidateRegistry()
+    registry.add("JOHN SMITH", aliases=["J SMITH"])
+    registry.add("JANE SMITH", aliases=["J SMITH"])
+    assert registry.resolve("J SMITH") == "JOHN SMITH"
+
+
+def test_pa_2020_primary_resolves_every_official_name():
+    registry = pa_2020_primary()
+    for official, aliases in OFFICIAL_PRIMARY_CANDIDATE_ALIASES.items():
+        for name in (official, *aliases):
+            assert registry.canonical(name, fuzzy=False) == normalize(aliases[0]), name
+
+
+def test_infer_county_party_matches_normalized_names(tmp_path):
+    rows = [
+        {"county": "Adams", "office": "Governor", "candidate": "SHAPIRO, JOSH", "party": "DEM"},
+        {"county": "Adams", "office": "Governor", "candidate": "Stacy  Garrity", "party": "REP"},
+    ]
+    with (tmp_path / "20260519__pa__primary__adams__precinct.csv").open("w", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    mapping = infer_county_party.build_map(tmp_path, "juniata")
+    assert mapping[normalize("Josh Shapiro")] == "DEM"
+    assert mapping[normalize("STACY GARRITY")] == "REP"
@@ -0,0 +1,106 @@
+"""Tests for the streaming Clarity detail.xml reader."""
+
+import io
+import sys
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+from clarity_primary_np import parse_detail_xml  # noqa: E402
+from clarity_stream import ClarityDetail  # noqa: E402
+
+DETAIL_XML = b"""<?xml version="1.0"?>
+<ElectionResult>
+    <ElectionName>2026 Primary</ElectionName>
+    <Region>Centre</Region>
+    <VoterTurnout totalVoters="300" ballotsCast="120">
+        <Precincts>
+            <Precinct name="Bellefonte 1" totalVoters="200" ballotsCast="80" />
+            <Precinct name="Bellefonte 2" totalVoters="100" ballotsCast="40" />
+        </Precincts>
+    </VoterTurnout>
+    <Contest key="1" text="DEM GOVERNOR" voteFor="1" isQuestion="false">
+        <VoteType name="Undervotes" votes="3">
+            <Precinct name="Bellefonte 1" votes="2" />
+            <Precinct name="Bellefonte 2" votes="1" />
+        </VoteType>
+        <Choice key="1" text="JOSH SHAPIRO" party="DEM" totalVotes="90">
+            <VoteType name="Election Day" votes="60">
+                <Precinct name="Bellefonte 1" votes="40" />
+                <Precinct name="Bellefonte 2" votes="20" />
+            </VoteType>
+            <VoteType name="Absentee/Mail" votes="30">
+                <Precinct name="Bellefonte 1" votes="25" />
+                <Precinct name="Bellefonte 2" votes="5" />
+            </VoteType>
+        </Choice>
+    </Contest>
+    <Contest key="2" text="Question 1" voteFor="1" isQuestion="true">
+        <Choice key="2" text="Yes" totalVotes="7">
+            <VoteType name="Election Day" votes="7">
+                <Precinct name="Bellefonte 3" votes="7" />
+            </VoteType>
+        </Choice>
+    </Contest>
+</ElectionResult>
+"""
+
+
+def _zip(path):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("detail.xml", DETAIL_XML)
+    return path
+
+
+def test_results_in_clarify_order():
+    detail = ClarityDetail(io.BytesIO(DETAIL_XML))
+    results = list(detail.results())
+    summary = [
+        (r.contest.text, r.choice and r.choice.text, r.vote_type,
+         r.jurisdiction and r.jurisdiction.name, r.votes)
+        for r in results
+    ]
+    assert summary[:6] == [
+        ("DEM GOVERNOR", None, "Undervotes", None, 3),
+        ("DEM GOVERNOR", None, "Undervotes", "Bellefonte 1", 2),
+        ("DEM GOVERNOR", None, "Undervotes", "Bellefonte 2", 1),
+        ("DEM GOVERNOR", "JOSH SHAPIRO", "Election Day", None, 60),
+        ("DEM GOVERNOR", "JOSH SHAPIRO", "Election Day", "Bellefonte 1", 40),
+        ("DEM GOVERNOR", "JOSH SHAPIRO", "Election Day", "Bellefonte 2", 20),
+    ]
+    assert len(results) == 11
+    assert results[4].jurisdiction.total_voters == 200
+    assert results[4].choice.party == "DEM"
+    assert results[-1].contest.is_question
+    assert detail.region == "Centre"
+
+
+def test_result_jurisdictions_are_the_turnout_section():
+    detail = ClarityDetail(io.BytesIO(DETAIL_XML))
+    for _ in detail.results():
+        pass
+    turnout = [(j.name, j.total_voters, j.ballots_cast) for j in detail.result_jurisdictions]
+    assert turnout == [("Bellefonte 1", 200, 80), ("Bellefonte 2", 100, 40)]
+    # A precinct only the contests name is still a jurisdiction, without turnout.
+    assert detail.jurisdictions["Bellefonte 3"].total_voters is None
+
+
+def test_zip_and_xml_sources_agree(tmp_path):
+    xml_path = tmp_path / "detail.xml"
+    xml_path.write_bytes(DETAIL_XML)
+    zip_path = _zip(tmp_path / "detailxml.zip")
+
+    with ClarityDetail(zip_path) as detail:
+        from_zip = list(detail.results())
+    assert from_zip == list(ClarityDetail(xml_path).results())
+    assert parse_detail_xml("Centre", zip_path) == parse_detail_xml("Centre", xml_path)
+
+
+def test_parse_detail_xml_rows(tmp_path):
+    rows = parse_detail_xml("Centre", _zip(tmp_path / "detailxml.zip"))
+    shapiro = [r for r in rows if r["candidate"] == "Josh Shapiro"]
+    assert [(r["precinct"], r["votes"], r["election_day"], r["absentee"]) for r in shapiro] == [
+        ("Bellefonte 1", 65, 40, 25),
+        ("Bellefonte 2", 25, 20, 5),
+    ]
@@ -0,0 +1,62 @@
+"""Tests for the in-process county config registry: discovery keys, the
+generic-primary adapter fallback, and config-class -> engine dispatch.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+import county_registry  # noqa: E402
+from sovc_geo_np import SovcGeoConfig  # noqa: E402
+
+
+def test_dedicated_general_config_is_registered():
+    entry = county_registry.get("Huntingdon", "general_2025")
+    assert entry.family == "electionware_np"
+    assert entry.module == "pa_huntingdon_general_2025_results_parser"
+    assert entry.config.county == "Huntingdon"
+
+
+def test_primary_falls_back_to_generic_adapter():
+    entry = county_registry.get("huntingdon", "primary_2026")
+    assert entry.family == "electionware_primary"
+    assert entry.module == "pa_electionware_primary_2026"
+    assert "General Primary" in entry.config.skip_prefixes
+
+
+def test_dedicated_primary_script_wins_over_adapter():
+    entry = county_registry.get("franklin", "primary_2024")
+    assert entry.module == "pa_franklin_primary_2024_results_parser"
+    assert entry.config.vote_breakdown is False
+
+
+def test_discovery_is_cached():
+    assert county_registry.discover() is county_registry.discover()
+
+
+def test_unknown_county_raises_keyerror_with_hint():
+    with pytest.raises(KeyError, match="general_2025"):
+        county_registry.get("huntingdon", "general_1999")
+
+
+def test_engine_dispatch_by_config_class():
+    config = SovcGeoConfig(county="X", skip_prefixes=(), contest_re=re.compile("x"))
+    assert county_registry.engine_for(config).family == "sovc_geo"
+    with pytest.raises(TypeError):
+        county_registry.engine_for(object())
+
+
+@pytest.mark.parametrize("county, district", [("washington", "14"), ("mckean", "15"), ("wayne", "8")])
+def test_registry_runs_the_county_post_process(county, district, monkeypatch):
+    from row_table import RowTable
+
+    entry = county_registry.get(county, "primary_2026")
+    assert entry.module == f"pa_{county}_primary_2026_results_parser"
+    rows = RowTable(["county", "office", "district"])
+    rows.append({"county": county.title(), "office": "U.S. House"})
+    monkeypatch.setattr(entry, "engine", county_registry.Engine("stub", "stub", lambda pdf, config: rows, None))
+    assert county_registry.parse(county, "primary_2026", "county.pdf").column("district") == [district]
@@ -0,0 +1,61 @@
+"""Tests for the statewide precinct-vs-county consistency check."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+from crosscheck import check_election, main  # noqa: E402
+
+ELECTION = "20260519__pa__primary"
+
+
+def _write(path, text):
+    path.write_text(text.lstrip())
+
+
+def _files(directory):
+    _write(directory / f"{ELECTION}__beaver__precinct.csv", """
+county,precinct,office,district,party,candidate,votes,election_day
+Beaver,Aliquippa 1,Ballots Cast,,,,46,31
+Beaver,Aliquippa 1,Governor,,DEM,Josh Shapiro,30,18
+Beaver,Aliquippa 2,Governor,,DEM,Josh Shapiro,"1,020",18
+Beaver,Aliquippa 1,State House,014,REP,John A. Doe,5,5
+Beaver,Aliquippa 1,Governor,,DEM,Not Assigned,0,0
+Beaver,Aliquippa 1,Democratic Committeeman Aliquippa 1,,DEM,Jane Roe,12,12
+""")
+    _write(directory / f"{ELECTION}__beaver__county.csv", """
+county,office,district,party,candidate,votes,mail
+BEAVER,Governor,,Democratic,JOSH SHAPIRO,1050,700
+Beaver,State House,14,REP,John A Doe,6,1
+Beaver,State House,14,REP,Write-In Totals,2,0
+""")
+    _write(directory / f"{ELECTION}__bedford__precinct.csv", """
+county,precinct,office,district,party,candidate,votes
+Bedford,Bedford 1,Governor,,REP,Stacy Garrity,9
+""")
+
+
+def test_mismatches_across_normalized_keys(tmp_path):
+    _files(tmp_path)
+    mismatches = check_election(ELECTION, tmp_path)
+    rows = mismatches[["county", "district", "candidate", "precincts", "county_total"]]
+    assert rows.fillna(-1).values.tolist() == [
+        ["BEAVER", "14", "JOHN A DOE", 5.0, 6.0],
+        ["BEAVER", "14", "WRITE-IN TOTALS", -1, 2.0],
+    ]
+
+
+def test_statewide_county_file_and_strict_exit(tmp_path, capsys):
+    _files(tmp_path)
+    statewide = tmp_path / f"{ELECTION}__county.csv"
+    _write(statewide, """
+county,office,district,party,candidate,votes
+BEAVER,Governor,,Democratic,JOSH SHAPIRO,1050
+BEDFORD,Governor,,Republican,STACY GARRITY,9
+""")
+    args = [ELECTION, "-d", str(tmp_path), "--county-file", str(statewide), "--strict"]
+    assert main(args) == 0
+    assert "0 mismatches" in capsys.readouterr().out
+    _write(statewide, statewide.read_text().replace("1050", "1049"))
+    assert main(args) == 1
@@ -0,0 +1,55 @@
+"""Tests for the keyed county-CSV diff."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+from csv_diff import diff_files, diff_paths, main  # noqa: E402
+
+OLD = """
+county,precinct,office,district,party,candidate,votes,election_day,mail,provisional
+Adams,P1,Governor,,DEM,Josh Shapiro,"1,020",900,100,20
+Adams,P1,Governor,,REP,Stacy Garrity,50,40,10,0
+Adams,P1,Governor,,,Write-in,1,1,0,0
+Adams,P1,Governor,,,Write-in,2,2,0,0
+Adams,P2,Governor,,DEM,Josh Shapiro,30,20,10,0
+"""
+
+# Rows and columns reordered, mail renamed absentee, one vote changed,
+# one row dropped and one added.
+NEW = """
+county,precinct,office,district,party,candidate,votes,election_day,provisional,absentee
+Adams,P1,Governor,,,Write-in,1,1,0,0
+Adams,P1,Governor,,REP,Stacy Garrity,55,45,0,10
+Adams,P1,Governor,,DEM,Josh Shapiro,1020,900,20,100
+Adams,P1,Governor,,,Write-in,2,2,0,0
+Adams,P3,Governor,,DEM,Josh Shapiro,7,7,0,0
+"""
+
+
+def _write(path, text):
+    path.write_text(text.lstrip())
+    return path
+
+
+def test_diff_ignores_order_and_reports_changes(tmp_path):
+    diff = diff_files(_write(tmp_path / "old.csv", OLD), _write(tmp_path / "new.csv", NEW))
+    assert diff.columns_added == ["absentee"] and diff.columns_removed == ["mail"]
+    assert diff.removed["precinct"].tolist() == ["P2"]
+    assert diff.added["precinct"].tolist() == ["P3"]
+    assert diff.changed[["candidate", "column", "old", "new"]].values.tolist() == [
+        ["Stacy Garrity", "votes", "50", "55"],
+        ["Stacy Garrity", "election_day", "40", "45"],
+    ]
+
+
+def test_identical_and_batch(tmp_path, capsys):
+    for name in ("old", "new"):
+        (tmp_path / name).mkdir()
+        _write(tmp_path / name / "a__precinct.csv", OLD)
+    _write(tmp_path / "new" / "b__precinct.csv", NEW)  # only on one side: skipped
+    diffs = diff_paths(tmp_path / "old", tmp_path / "new")
+    assert list(diffs) == ["a__precinct.csv"] and diffs["a__precinct.csv"].empty
+    assert main([str(tmp_path / "old"), str(tmp_path / "new")]) == 0
+    assert "a__precinct.csv: identical" in capsys.readouterr().out
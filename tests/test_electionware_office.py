@@ -0,0 +1,62 @@
+"""Tests for electionware_precinct_np.normalize_office's compiled tables:
+list-order precedence of local_offices must match the original linear
+startswith/endswith scan, and each distinct header is normalized once.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+from electionware_precinct_np import ElectionwareConfig, normalize_office  # noqa: E402
+from electionware_primary_np import PrimaryConfig, _normalize_primary_office  # noqa: E402
+
+
+def _config(**kwargs):
+    return ElectionwareConfig(county="X", skip_prefixes=(), county_header_suffix="X County", **kwargs)
+
+
+def test_prefix_orientation_uses_first_listed_match_not_longest():
+    config = _config(local_offices=[("TAX", "Tax"), ("TAX COLLECTOR", "Tax Collector")])
+    # "TAX" is listed first, so it wins even though "TAX COLLECTOR" is longer.
+    assert normalize_office("TAX COLLECTOR ABBOTT", config) == ("Tax", "Collector Abbott")
+
+
+def test_prefix_orientation_term_token_and_exact_prefix():
+    config = _config(local_offices=[("SUPERVISOR", "Supervisor")])
+    assert normalize_office("SUPERVISOR 6YR BLOSS TWP", config) == ("Supervisor (6 Year)", "Bloss Twp")
+    assert normalize_office("SUPERVISOR Bloss Township 6yr", config) == ("Supervisor (6 Year)", "Bloss Township")
+    assert normalize_office("SUPERVISOR", config) == ("Supervisor", "")
+    # Prefix must end on a word boundary.
+    assert normalize_office("SUPERVISORS", config) == ("Supervisors", "")
+
+
+def test_suffix_orientation_uses_first_listed_match():
+    config = _config(
+        local_office_orientation="suffix",
+        local_offices=[("DIRECTOR", "Director"), ("SCHOOL DIRECTOR", "School Director")],
+    )
+    assert normalize_office("SHADE SCHOOL DIRECTOR 4YR", config) == ("Director (4 Year)", "Shade School")
+
+
+def test_headers_are_memoized_per_config():
+    calls = []
+
+    def handler(line):
+        calls.append(line)
+        return None
+
+    config = _config(extra_office_handlers=[handler])
+    for _ in range(3):
+        normalize_office("  SHERIFF  ", config)
+    assert calls == ["SHERIFF"]
+    # A separate config has its own tables.
+    other = _config(extra_office_handlers=[handler])
+    normalize_office("SHERIFF", other)
+    assert calls == ["SHERIFF", "SHERIFF"]
+
+
+def test_primary_statewide_prefix_match():
+    config = PrimaryConfig(county="X", skip_prefixes=(), county_header_suffix="X County")
+    assert _normalize_primary_office("REPRESENTATIVE IN CONGRESS 5TH DISTRICT", config) == ("U.S. House", "5")
+    assert _normalize_primary_office("GOVERNOR 4 YEAR TERM", config) == ("Governor", "")
@@ -0,0 +1,99 @@
+"""Tests for multi-pass runs of electionware_primary_np: several PDFs or page
+ranges parsed in one run, sharing opened documents and page text."""
+
+import csv
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+import text_backends  # noqa: E402
+from electionware_primary_np import PdfPass, PrimaryConfig, parse_primary_passes, run_cli  # noqa: E402
+from synthetic_pdf import PdfCanvas  # noqa: E402
+
+CONFIG = PrimaryConfig(county="Cameron", skip_prefixes=("TOTAL",), county_header_suffix="CAMERON COUNTY")
+
+
+def _combined_report(tmp_path):
+    """A Democratic half (pages 1-2) and a Republican half (pages 3-4), one
+    page per precinct."""
+    canvas = PdfCanvas()
+    for party, candidate, base in (("DEM", "Josh Shapiro", 100), ("REP", "Stacy Garrity", 200)):
+        for offset, precinct in enumerate(("Driftwood Borough", "Shippen Township")):
+            canvas.new_page()
+            canvas.text(40, 770, "CAMERON COUNTY")
+            canvas.text(40, 740, precinct)
+            canvas.text(40, 720, "Statistics")
+            canvas.text(40, 700, f"{party} GOVERNOR")
+            canvas.text(40, 680, "Vote For 1")
+            canvas.text(40, 660, f"{candidate} {base + offset} {base} {offset} 0")
+    path = tmp_path / "primary.pdf"
+    path.write_bytes(canvas.to_bytes())
+    return path
+
+
+def test_pdf_pass_parses_page_ranges(tmp_path):
+    assert PdfPass.parse("a.pdf") == PdfPass(Path("a.pdf"))
+    assert PdfPass.parse("a.pdf:3") == PdfPass(Path("a.pdf"), 3, 3)
+    assert PdfPass.parse("a.pdf:3-10") == PdfPass(Path("a.pdf"), 3, 10)
+    assert PdfPass.parse("a.pdf:3-") == PdfPass(Path("a.pdf"), 3, None)
+    assert str(PdfPass.parse("a.pdf:3-")) == "a.pdf:3-"
+    with pytest.raises(ValueError):
+        PdfPass.parse("a.pdf:10-3")
+    odd = tmp_path / "odd.pdf:2"
+    odd.write_bytes(b"")
+    assert PdfPass.parse(str(odd)).whole
+
+
+def test_page_text_cache_opens_and_extracts_once(tmp_path, monkeypatch):
+    pytest.importorskip("pdfplumber")
+    path = _combined_report(tmp_path)
+    opened = []
+    open_page_texts = text_backends.open_page_texts
+
+    def counting_open(*args):
+        opened.append(args)
+        return open_page_texts(*args)
+
+    monkeypatch.setattr(text_backends, "open_page_texts", counting_open)
+
+    cache = text_backends.PageTextCache("pdfplumber")
+    first = list(cache.pages(path, 1, 2))
+    assert list(cache.pages(path, 2, None)) == [first[1], *cache.pages(path, 3, 4)]
+    assert cache.page_count(path) == 4 and len(opened) == 1
+    with pytest.raises(ValueError):
+        list(cache.pages(path, 5))
+
+
+def test_passes_merge_into_one_table(tmp_path, monkeypatch):
+    npdf = pytest.importorskip("natural_pdf")
+    path = _combined_report(tmp_path)
+    opened = []
+    pdf_class = npdf.PDF
+
+    def counting_pdf(*args, **kwargs):
+        opened.append(args)
+        return pdf_class(*args, **kwargs)
+
+    monkeypatch.setattr(npdf, "PDF", counting_pdf)
+    passes = [PdfPass(path, 3, 4), PdfPass(path, 1, 2)]
+    rows, precinct_count = parse_primary_passes(passes, CONFIG)
+    assert precinct_count == 4 and len(opened) == 1
+    assert [(r["precinct"], r["party"], r["candidate"], r["votes"]) for r in rows] == [
+        ("Driftwood Borough", "REP", "Stacy Garrity", 200),
+        ("Shippen Township", "REP", "Stacy Garrity", 201),
+        ("Driftwood Borough", "DEM", "Josh Shapiro", 100),
+        ("Shippen Township", "DEM", "Josh Shapiro", 101),
+    ]
+
+
+def test_run_cli_writes_one_csv_for_several_passes(tmp_path):
+    pytest.importorskip("natural_pdf")
+    path = _combined_report(tmp_path)
+    out = tmp_path / "cameron.csv"
+    run_cli(CONFIG, ["parser", f"{path}:1-2", f"{path}:3-", str(out)])
+    with out.open(newline="") as fh:
+        rows = list(csv.DictReader(fh))
+    assert [(r["party"], r["votes"]) for r in rows] == [("DEM", "100"), ("DEM", "101"), ("REP", "200"), ("REP", "201")]
@@ -0,0 +1,103 @@
+"""Tests for the single-pass precinct-block segmenter and line tokenizer
+shared by electionware_precinct_np.parse_precinct_rows and
+electionware_primary_np.parse_primary_precinct_rows.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+from electionware_precinct_np import (  # noqa: E402
+    ElectionwareConfig,
+    parse_precinct_rows,
+    segment_precinct_pages,
+    tokenize_precinct_lines,
+)
+from electionware_primary_np import PrimaryConfig, parse_primary_precinct_rows  # noqa: E402
+
+BLOCK = """Driftwood Borough
+Statistics
+Registered Voters - Total 1,500
+Ballots Cast - Total 250 200 40 10
+TOTAL Election Day Mail Provisional
+
+JUDGE OF THE SUPERIOR COURT
+
+Vote For 1
+DEM Christine Donohue 120 100 15 5
+Write-In: Jane 2 1 1 0
+Write-In Totals 3 2 1 0
+Overvotes 1 1 0 0
+Driftwood Borough
+JUDGE OF THE SUPERIOR COURT
+Vote For 1
+REP John Smith 100 80 15 5
+Write-In Totals 2 1 0 1
+Overvotes 1 0 1 0
+RETAIN JUDGE
+Vote For 1
+YES 10 8 1 1
+"""
+
+
+def _config(**kwargs):
+    return ElectionwareConfig(county="Cameron", skip_prefixes=("TOTAL",), county_header_suffix="CAMERON COUNTY", **kwargs)
+
+
+def test_tokenizer_classifies_each_line_once():
+    tokens = list(tokenize_precinct_lines(BLOCK, _config()))
+    kinds = [t.kind for t in tokens]
+    assert kinds[:5] == ["statistics", "registered", "ballots_cast", "skipped", "header"]
+    assert tokens[1].vals == (1500,)
+    # Header look-ahead skips the blank line before "Vote For 1".
+    assert tokens[4].text == "JUDGE OF THE SUPERIOR COURT" and tokens[4].vote_for == 1
+    assert [t.text for t in tokens if t.kind == "write_in"] == ["Write-In: Jane 2 1 1 0"]
+    assert [t.head for t in tokens if t.kind == "yes_no"] == ["Yes"]
+
+
+def test_split_aggregates_merge_across_repeated_header():
+    rows = parse_precinct_rows("Driftwood Borough", BLOCK, _config())
+    judge = [(r["party"], r["candidate"], r["votes"], r["mail"]) for r in rows if r["office"] == "Judge of the Superior Court"]
+    assert judge == [
+        ("DEM", "Christine Donohue", 120, 15),
+        ("", "Write-ins", "5", "1"),
+        ("", "Overvotes", "2", "1"),
+        ("REP", "John Smith", 100, 15),
+    ]
+    assert rows[0]["office"] == "Registered Voters" and rows[0]["votes"] == 1500
+
+
+def test_primary_engine_shares_tokenizer():
+    config = PrimaryConfig(county="Cameron", skip_prefixes=("TOTAL",), county_header_suffix="CAMERON COUNTY")
+    text = BLOCK.replace("JUDGE OF THE SUPERIOR COURT", "DEM GOVERNOR")
+    rows = parse_primary_precinct_rows("Driftwood Borough", text, config)
+    governor = [(r["party"], r["candidate"], r["votes"]) for r in rows if r["office"] == "Governor"]
+    assert governor == [
+        ("DEM", "Christine Donohue", 120),
+        ("DEM", "Write-In Totals", 3),
+        ("DEM", "Overvotes", "2"),
+        ("REP", "John Smith", 100),
+        ("DEM", "Write-In Totals", 2),
+    ]
+
+
+def test_segmenter_splits_pages_on_statistics_markers():
+    config = _config()
+    pages = [
+        "CAMERON COUNTY\nCover page",
+        "CAMERON COUNTY\nDriftwood Borough\nStatistics TOTAL Election Day\nRegistered Voters - Total 5",
+        "CAMERON COUNTY\nDriftwood Borough\nSHERIFF\nVote For 1",
+        "CAMERON COUNTY\nTOTAL\nShippen Township\nSTATISTICS\nRegistered Voters - Total 7",
+    ]
+    blocks = list(segment_precinct_pages(pages, config))
+    assert [name for name, _ in blocks] == ["Driftwood Borough", "Shippen Township"]
+    assert blocks[0][1] == "\n".join(pages[1:3])
+    assert blocks[1][1] == pages[3]
+
+
+def test_segmenter_requires_a_marker():
+    with pytest.raises(RuntimeError, match="Statistics"):
+        list(segment_precinct_pages(["CAMERON COUNTY\nNo markers here"], _config()))
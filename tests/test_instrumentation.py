@@ -0,0 +1,61 @@
+"""Tests for the opt-in profiling hooks the shared engines call."""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+import instrumentation  # noqa: E402
+from electionware_regex_np import ElectionwareRegexConfig, process_pages  # noqa: E402
+
+CONFIG = ElectionwareRegexConfig(
+    county="Indiana",
+    county_marker="Indiana County",
+    precinct_header_exclude_prefixes=("Statistics", "TOTAL"),
+    skip_prefixes=("TOTAL", "Statistics"),
+    office_keywords=("JUDGE",),
+    party_codes=("DEM", "REP"),
+    has_pct_column=False,
+    percent_skip=lambda line: "%" in line,
+)
+
+PAGES = [
+    ["November 4, 2025 Indiana County", "Armagh", "Statistics", "Registered Voters - Total 47",
+     "JUDGE OF THE SUPERIOR COURT", "Vote For 1", "DEM Christine Donohue 10 8 1 1"],
+    ["November 4, 2025 Indiana County", "Armagh", "JUDGE OF THE SUPERIOR COURT", "Vote For 1",
+     "REP John Smith 9 8 1 0"],
+]
+
+
+def test_split_profile_arg():
+    assert instrumentation.split_profile_arg(["a.pdf", "b.csv"]) == (["a.pdf", "b.csv"], None)
+    assert instrumentation.split_profile_arg(["a.pdf", "--profile", "b.csv"]) == (["a.pdf", "b.csv"], "")
+    assert instrumentation.split_profile_arg(["--profile=t.json", "a.pdf"]) == (["a.pdf"], "t.json")
+
+
+def test_hooks_are_noops_without_a_session():
+    assert instrumentation.active() is None
+    with instrumentation.phase("text_extraction"), instrumentation.unit("page", 1) as unit:
+        unit.rows = 3
+    instrumentation.count("pages")
+    assert list(instrumentation.each_unit("page", [1, 2])) == [1, 2]
+    assert instrumentation.active() is None
+
+
+def test_session_records_pages_and_writes_trace(tmp_path, capsys):
+    trace = tmp_path / "trace.json"
+    with instrumentation.session(str(trace), label="indiana") as profile:
+        rows = process_pages(PAGES, CONFIG)
+        with instrumentation.phase("csv_write"), instrumentation.phase("csv_write"):
+            pass
+    assert instrumentation.active() is None
+    assert profile.phases["line_classification"][0] == 2
+    # A phase re-entered while open is timed once.
+    assert profile.phases["csv_write"][0] == 1
+    assert sum(r for _, r in profile.units["page"].values()) == len(rows)
+
+    data = json.loads(trace.read_text())
+    assert data["label"] == "indiana"
+    assert [u["label"] for u in data["units"]["page"]] == ["1", "2"]
+    assert "slowest pages (of 2)" in capsys.readouterr().err
@@ -0,0 +1,57 @@
+"""Tests for the table-driven line classifier behind the text-layout engines."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+from line_classifier import LineClassifier, Rule  # noqa: E402
+
+CLASSIFIER = LineClassifier([
+    Rule("office", prefixes=("JUDGE", "SHERIFF"), contains=(" SCH DIR ",), suffixes=(" RETENTION",), upper=True),
+    Rule("header", prefixes=("Vote For", "TOTAL")),
+    Rule("header", patterns=(r"^(?i:page)\s+\d+",)),
+])
+
+
+def test_rules_of_one_kind_combine():
+    assert CLASSIFIER.classify("Judge of the Superior Court") == {"office"}
+    assert CLASSIFIER.classify("Bellefonte Area SCH DIR Region 1") == {"office"}
+    assert CLASSIFIER.classify("Christine Donohue Retention") == {"office"}
+    assert CLASSIFIER.classify("Vote For 1") == {"header"}
+    assert CLASSIFIER.classify("PAGE 3") == {"header"}
+    # Literal rules without ``upper`` are case-sensitive.
+    assert CLASSIFIER.classify("Total 12") == frozenset()
+    assert CLASSIFIER.classify("DEM John Sheriff 10 5 3 2") == frozenset()
+
+
+def test_results_are_cached_and_unknown_kinds_rejected():
+    first = CLASSIFIER.classify("SHERIFF")
+    assert CLASSIFIER.classify("SHERIFF") is first
+    assert CLASSIFIER.matches("office", "SHERIFF")
+    with pytest.raises(KeyError, match="precinct"):
+        CLASSIFIER.matches("precinct", "SHERIFF")
+
+
+def test_county_engine_reads_offices_and_skips_headers(tmp_path):
+    from electionware_text_county import _parse_lines
+
+    text = [
+        "November 4, 2025 Centre County\n",
+        "REGISTER & RECORDER\n",
+        "Vote For 1\n",
+        "TOTAL    Election Day    Mail    Provisional\n",
+        "DEM Jane Doe          1,319   60.00%   1,000   300   19\n",
+        "November 4, 2025 Centre County\n",
+        "Bellefonte Area SCH DIR Region 1\n",
+        "REP John Smith          900   100.00%   800   90   10\n",
+    ]
+    out = tmp_path / "out.csv"
+    _parse_lines(text, str(out))
+    rows = out.read_text().splitlines()[1:]
+    assert rows == [
+        "Centre,REGISTER & RECORDER,,DEM,Jane Doe,1319,1000,300,19",
+        "Centre,Bellefonte Area SCH DIR Region 1,,REP,John Smith,900,800,90,10",
+    ]
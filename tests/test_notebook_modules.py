@@ -0,0 +1,62 @@
+"""Tests for extracting notebook parsers into modules and re-running them."""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+import notebook_modules  # noqa: E402
+
+CELLS = [
+    "import os\nimport pandas as pd\nimport re",
+    "def clean(df):\n    df['district'] = df['district'].astype(str).str.extract('(\\d+)')\n    return df",
+    "files = ['data/' + f for f in os.listdir('data')]",
+    "file = 'data/Forest PA Primary 2024.csv'\ncounty_name = 'Forest'",
+    "# fill in the county\ndf = clean(pd.read_csv(file))\ndf['county'] = county_name",
+    "df.dtypes",
+    "df.to_csv(f'data_cleaned/20240423__pa__primary__{county_name.lower()}__precinct.csv',index=False)",
+]
+
+
+def _notebook(directory):
+    directory.mkdir(exist_ok=True)
+    path = directory / "pa_forest_primary_2024_results_parser.ipynb"
+    cells = [{"cell_type": "code", "source": source.splitlines(keepends=True), "outputs": []} for source in CELLS]
+    path.write_text(json.dumps({"cells": cells, "nbformat": 4, "nbformat_minor": 5, "metadata": {}}))
+    return path
+
+
+def test_extract_builds_a_parse_entry_point(tmp_path):
+    source = notebook_modules.extract(_notebook(tmp_path / "notebooks"))
+    assert "COUNTY = 'Forest'" in source
+    assert "SOURCE_FILE = 'Forest PA Primary 2024.csv'" in source
+    assert "    file = source\n" in source
+    assert "# fill in the county" in source
+    assert r"extract(r'(\d+)')" in source
+    assert "os.listdir" not in source and "dtypes" not in source and "to_csv" not in source
+    assert source.rstrip().endswith("return df")
+
+
+def test_run_regenerates_and_diffs(tmp_path, capsys):
+    notebook = _notebook(tmp_path / "notebooks")
+    notebook_modules.write_module(notebook)
+    sources = tmp_path / "sources"
+    sources.mkdir()
+    (sources / "Forest PA Primary 2024.csv").write_text("office,district,votes\nState Senate,25th,10\n")
+    expected = tmp_path / "expected"
+    expected.mkdir()
+    output = "20240423__pa__primary__forest__precinct.csv"
+    (expected / output).write_text("office,district,votes,county\nState Senate,25,10,Forest\n")
+
+    failed = notebook_modules.run(
+        sources, tmp_path / "out", jobs=1, expected_dir=expected, notebook_dir=notebook.parent
+    )
+    assert failed == 0
+    assert f"{output}: identical" in capsys.readouterr().out
+
+    (expected / output).write_text("office,district,votes,county\nState Senate,25,12,Forest\n")
+    assert notebook_modules.run(
+        sources, tmp_path / "out", jobs=1, expected_dir=expected, notebook_dir=notebook.parent
+    ) == 1
+    assert "1 rows only in the new file, 1 only in the checked-in one" in capsys.readouterr().out
@@ -0,0 +1,67 @@
+"""Tests for the shared office/party normalization table."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+import clarity_primary_np  # noqa: E402
+import electionware_primary_np  # noqa: E402
+from office_normalizer import Office, normalize, normalize_column, office_aliases, party_code  # noqa: E402
+
+
+def test_normalize_reads_office_district_and_party():
+    assert normalize("DEM REPRESENTATIVE IN CONGRESS 13th DISTRICT") == Office("U.S. House", "13", "DEM")
+    assert normalize("REP REPRESENTATIVE IN THE GENERAL ASSEMBLY 33rd DISTRI") == Office("State House", "33", "REP")
+    assert normalize("Representative in the General Assembly (District 196)") == Office("State House", "196", "")
+    assert normalize("Governor-DEM") == Office("Governor", "", "DEM")
+    assert normalize("Member  Of The Democratic State Comm") == Office("Member of Democratic State Committee", "", "")
+    # An exact alias wins over reading a leading "REP" as the party.
+    assert normalize("REP IN CONGRESS 5TH DISTRICT") == Office("U.S. House", "5", "")
+    # Canonical names are their own aliases.
+    assert normalize("U.S. House") == Office("U.S. House", "", "")
+
+
+def test_strict_matches_exact_names_only():
+    assert normalize("Governor and Lieutenant Governor").office == "Governor"
+    for raw in ("Governor and Lieutenant Governor", "Representative in Congress Special Election",
+                "Attorney General Special"):
+        assert normalize(raw, strict=True).office is None
+    assert normalize("Representative in Congress", strict=True) == Office("U.S. House", "", "")
+    assert normalize("DEM GOVERNOR", strict=True) == Office("Governor", "", "DEM")
+
+
+def test_offices_without_districts_drop_them_and_unknown_offices_are_none():
+    assert normalize("MEMBER OF DEMOCRATIC STATE COMMITTEE 1ST SENATORIAL DISTRICT").district == ""
+    assert normalize("Judge of the Superior Court") == Office(None, "", "")
+    assert normalize("School Director 3rd District") == Office(None, "3", "")
+
+
+def test_party_code():
+    assert party_code("Democratic") == "DEM"
+    assert party_code("no  affiliation") == "IND"
+    assert party_code("Nonpartisan") == "NON"
+    assert party_code("Mystery") is None
+
+
+def test_normalize_column_keeps_the_index():
+    import pandas as pd
+
+    column = pd.Series(["DEM GOVERNOR", "Attorney General", "DEM GOVERNOR", None], index=[10, 11, 12, 13])
+    frame = normalize_column(column)
+    assert list(frame.index) == [10, 11, 12, 13]
+    assert frame["office"].tolist()[:3] == ["Governor", "Attorney General", "Governor"]
+    assert frame["party"].tolist() == ["DEM", "", "DEM", ""]
+
+
+def test_engines_share_the_table():
+    assert {alias: clarity_primary_np.STATEWIDE_OFFICES[alias] for alias in office_aliases()} == office_aliases()
+    assert clarity_primary_np.STATEWIDE_OFFICES["PRESIDENTIAL ELECTORS"] == ("President", False)
+    primary = electionware_primary_np.STATEWIDE_OFFICES
+    assert {alias: primary[alias] for alias in office_aliases() if alias in primary} == {
+        alias: hit for alias, hit in office_aliases().items()
+        if alias not in ("PRESIDENTIAL ELECTORS", "STATE REPRESENTATIVE")
+    }
+    assert clarity_primary_np._normalize_office("DEM Representative in Congress 17th District") == (
+        "U.S. House", "17", "DEM",
+    )
@@ -0,0 +1,48 @@
+"""Tests for the batch mode of the statewide OpenElections_v2 converter."""
+
+import csv
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import OpenElections_v2 as oe  # noqa: E402
+
+HEADER = ["ElectionYear", "CountyName", "OfficeName", "District", "PartyName", "CandidateName", "Votes"]
+
+
+def _write(path, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        writer.writerows(rows)
+
+
+def test_batch_converts_globs_and_versions_existing_outputs(tmp_path, capsys):
+    _write(tmp_path / "2016.csv", [
+        ["2016", "MCKEAN", "Representative in Congress", "5th Congressional District", "Republican", "THOMPSON, GLENN W JR", "1,234"],
+        ["2016", "MCKEAN", "Judge of the Superior Court", "", "Republican", "DOE, JANE", "10"],
+        ["2016", "ADAMS", "Governor", "", "Mystery", "MCDONALD, A  B", "7"],
+        # Other contests whose names start with a kept office's name.
+        ["2016", "ADAMS", "Governor and Lieutenant Governor", "", "Democratic", "WOLF, TOM", "8"],
+        ["2016", "ADAMS", "Representative in Congress Special Election", "7th Congressional District",
+         "Democratic", "DOE, JOHN", "5"],
+        ["2016", "ADAMS", "Attorney General Special", "", "Democratic", "ROE, JANE", "4"],
+    ])
+    _write(tmp_path / "2018.csv", [
+        ["2018", "ADAMS", "Governor", "", "Mystery", "WOLF, TOM", "9"],
+    ])
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    (out_dir / "2016.csv").write_text("keep me\n")
+
+    outputs = oe.batch([str(tmp_path / "20*.csv")], str(out_dir), workers=2)
+
+    assert [Path(p).name for p in outputs] == ["2016_v1.csv", "2018.csv"]
+    assert (out_dir / "2016.csv").read_text() == "keep me\n"
+    assert (out_dir / "2016_v1.csv").read_text().splitlines() == [
+        "county,office,district,party,candidate,votes",
+        "Mckean,U.S. House,5,REP,Glenn W. Thompson Jr.,1234",
+        "Adams,Governor,,UNK,A. B. McDonald,7",
+    ]
+    assert "Unknown party: Mystery (2 rows)" in capsys.readouterr().out
@@ -0,0 +1,55 @@
+"""Tests for the legacy pdfreader page iterator's parallel rendering."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+pytest.importorskip("pdfreader")
+
+from pa_pdf_parser import PAGES_PER_TASK, PDFPageIterator, jobs_from_argv  # noqa: E402
+from synthetic_pdf import PdfCanvas  # noqa: E402
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    canvas = PdfCanvas()
+    for page in range(1, PAGES_PER_TASK * 2 + 3):
+        canvas.new_page()
+        canvas.text(72, 700, f"Precinct {page}")
+        canvas.text(72, 680, f"Page {page}")
+    path = tmp_path / "pages.pdf"
+    path.write_bytes(canvas.to_bytes())
+    return path
+
+
+def _pages(iterator):
+    return [(page.get_page_number(), list(page.get_strings())) for page in iterator]
+
+
+def test_parallel_rendering_matches_sequential(pdf_path):
+    sequential = _pages(PDFPageIterator(str(pdf_path), jobs=1))
+    assert len(sequential) == PAGES_PER_TASK * 2 + 2
+    assert _pages(PDFPageIterator(str(pdf_path), jobs=3)) == sequential
+
+
+def test_get_page_reads_one_page(pdf_path):
+    iterator = PDFPageIterator(str(pdf_path), jobs=1)
+    page = iterator.get_page(5)
+    assert page.get_page_number() == 5
+    assert "".join(page.get_strings()) == "".join(_pages(PDFPageIterator(str(pdf_path), jobs=1))[4][1])
+
+
+def test_jobs_switch():
+    assert jobs_from_argv([]) == 1
+    assert jobs_from_argv(["--jobs", "4"]) == 4
+    assert jobs_from_argv(["--jobs=0", "other"]) == 1
+
+
+def test_jobs_come_from_the_caller_not_sys_argv(pdf_path, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["pytest", "--jobs", "4"])
+    assert PDFPageIterator(str(pdf_path))._jobs == 1
+    # With workers rendering the pages the iterator itself never opens the file.
+    assert PDFPageIterator(str(pdf_path), jobs=2)._pdf_viewer is None
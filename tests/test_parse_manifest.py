@@ -0,0 +1,116 @@
+"""Tests for the engines' output manifests and ``--if-changed`` reruns."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+import parse_manifest  # noqa: E402
+from synthetic_pdf import build_precincts, render_electionware  # noqa: E402
+
+ROWS = [
+    {"county": "Adams", "precinct": "Abbottstown", "office": "Registered Voters", "votes": "649"},
+    {"county": "Adams", "precinct": "Abbottstown", "office": "Ballots Cast", "votes": "226",
+     "election_day": "187", "mail": "39", "provisional": "0"},
+    {"county": "Adams", "precinct": "Abbottstown", "office": "Judge of the Superior Court", "party": "REP",
+     "candidate": "Maria Battista", "votes": "133", "election_day": "117", "mail": "16", "provisional": "0"},
+]
+
+
+def test_split_if_changed_arg():
+    assert parse_manifest.split_if_changed_arg(["a.pdf", "--if-changed", "b.csv"]) == (["a.pdf", "b.csv"], True)
+    assert parse_manifest.split_if_changed_arg(["a.pdf", "b.csv"]) == (["a.pdf", "b.csv"], False)
+
+
+def test_changes_reports_input_output_and_options(tmp_path):
+    pdf, out = tmp_path / "in.pdf", tmp_path / "out.csv"
+    pdf.write_bytes(b"%PDF one")
+    assert parse_manifest.changes(out, pdf) == ["no manifest"]
+
+    with parse_manifest.recording(out, pdf, {"model": "a"}) as run:
+        out.write_text("county\nAdams\n")
+        run.rows = 1
+    manifest = json.loads(parse_manifest.manifest_path(out).read_text())
+    assert manifest["output"]["rows"] == 1
+    assert any(label.endswith("parsers/parse_manifest.py") for label in manifest["engine"])
+    assert parse_manifest.changes(out, pdf, {"model": "a"}) == []
+    assert parse_manifest.changes(out, pdf, {"model": "b"}) == ["options"]
+
+    pdf.write_bytes(b"%PDF two")
+    out.write_text("county\nBedford\n")
+    assert parse_manifest.changes(out, pdf, {"model": "a"}) == ["output", f"input {pdf}"]
+
+
+def test_failed_run_writes_no_manifest(tmp_path):
+    pdf, out = tmp_path / "in.pdf", tmp_path / "out.csv"
+    pdf.write_bytes(b"%PDF")
+    with pytest.raises(ValueError):
+        with parse_manifest.recording(out, pdf):
+            raise ValueError
+    assert not parse_manifest.manifest_path(out).exists()
+
+
+def test_incomplete_run_writes_no_manifest(tmp_path):
+    pdf, out = tmp_path / "in.pdf", tmp_path / "out.csv"
+    pdf.write_bytes(b"%PDF")
+    with parse_manifest.recording(out, pdf) as run:
+        out.write_text("county\nAdams\n")
+    assert parse_manifest.changes(out, pdf) == []
+
+    with parse_manifest.recording(out, pdf) as run:
+        out.write_text("county\n")
+        run.complete = False  # a page failed
+    assert not parse_manifest.manifest_path(out).exists()
+    assert parse_manifest.changes(out, pdf) == ["no manifest"]
+
+
+def test_run_cli_skips_unchanged_input(tmp_path, monkeypatch, capsys):
+    pytest.importorskip("natural_pdf")
+    import electionware_precinct_np
+
+    county, precincts = build_precincts(ROWS)
+    synthetic = render_electionware(county, precincts)
+    pdf, out = tmp_path / "adams.pdf", tmp_path / "adams.csv"
+    pdf.write_bytes(synthetic.pdf_bytes)
+    argv = ["parser", str(pdf), str(out), "--if-changed"]
+
+    electionware_precinct_np.run_cli(synthetic.config, argv)
+    assert parse_manifest.manifest_path(out).exists()
+
+    def fail(*args):
+        raise AssertionError("re-parsed an unchanged PDF")
+
+    monkeypatch.setattr(electionware_precinct_np, "parse_pdf", fail)
+    electionware_precinct_np.run_cli(synthetic.config, argv)
+    assert "is up to date" in capsys.readouterr().out
+
+    pdf.write_bytes(synthetic.pdf_bytes + b"\n")
+    with pytest.raises(AssertionError, match="re-parsed"):
+        electionware_precinct_np.run_cli(synthetic.config, argv)
+
+
+def test_llm_run_with_a_failed_page_is_re_parsed(tmp_path, monkeypatch):
+    import llm_pdf_extract
+
+    pdf, out = tmp_path / "adams.pdf", tmp_path / "adams.csv"
+    pdf.write_bytes(b"%PDF")
+    pages = [{"page_num": 1, "text": "a"}, {"page_num": 2, "text": "b"}]
+    monkeypatch.setattr(llm_pdf_extract, "extract_pdf_text", lambda path: pages)
+    calls = []
+
+    def extract(pages, county, mode, level, model_name, failed_pages):
+        calls.append(model_name)
+        if len(calls) == 1:
+            failed_pages.append(2)
+        return [{"county": county, "office": "Sheriff", "candidate": "A", "votes": "1"}]
+
+    monkeypatch.setattr(llm_pdf_extract, "extract_with_llm", extract)
+    argv = [str(pdf), str(out), "--county", "Adams", "--if-changed"]
+    llm_pdf_extract.run_cli("text", "county", argv)
+    assert out.exists() and not parse_manifest.manifest_path(out).exists()
+    llm_pdf_extract.run_cli("text", "county", argv)
+    llm_pdf_extract.run_cli("text", "county", argv)
+    assert len(calls) == 2
@@ -0,0 +1,102 @@
+"""Tests for streaming pdftotext output into the text-layout scripts."""
+
+import io
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+from pdftotext_stream import LookaheadLines, pdftotext_lines, split_lines  # noqa: E402
+from synthetic_pdf import PdfCanvas  # noqa: E402
+
+TEXT = "Page one\n   1,234\n\fPage two\nlast line\n\fPage three\n\f"
+
+
+def test_split_lines_matches_readlines_across_page_ranges():
+    chunks = ["Page one\n   1,234\n\f", "Page two\nlast line\n\f", "Page three\n\f"]
+    assert "".join(chunks) == TEXT
+    assert list(split_lines(chunks)) == io.StringIO(TEXT, newline="\n").readlines()
+    assert list(split_lines(["a\nb", "c\n", "d"])) == ["a\n", "bc\n", "d"]
+
+
+def test_lookahead_lines_reads_lazily_and_releases():
+    pulled = []
+
+    def source():
+        for line in ["a", "b", "c", "d"]:
+            pulled.append(line)
+            yield line
+
+    lines = LookaheadLines(source())
+    assert lines.has(1) and pulled == ["a", "b"]
+    assert lines[2] == "c"
+    lines.release(2)
+    with pytest.raises(IndexError):
+        lines[1]
+    assert lines[3] == "d"
+    assert not lines.has(4)
+
+
+def test_county_parser_output_unchanged_by_streaming(tmp_path):
+    from electionware_text_county import _parse_lines, _parse_text_file
+
+    text = (
+        "November 4, 2025 Centre County\n"
+        "JUDGE OF THE SUPERIOR COURT\n"
+        "Vote For 1\n"
+        "DEM Brandon Neuman                 1,319        1,000        300          19\n"
+        "REP Maria Battista                   900          800         90          1\n"
+    )
+    saved = tmp_path / "report.txt"
+    saved.write_text(text)
+    _parse_text_file(str(saved), str(tmp_path / "file.csv"))
+    _parse_lines(split_lines([text[:70], text[70:]]), str(tmp_path / "stream.csv"))
+    expected = (tmp_path / "file.csv").read_text()
+    assert "Brandon Neuman,1319" in expected
+    assert (tmp_path / "stream.csv").read_text() == expected
+
+
+@pytest.mark.skipif(not shutil.which("pdftotext"), reason="poppler-utils not installed")
+def test_page_ranges_match_a_single_run(tmp_path):
+    canvas = PdfCanvas()
+    for number in range(1, 6):
+        canvas.new_page()
+        canvas.text(40, 770, f"Page {number}")
+    path = tmp_path / "pages.pdf"
+    path.write_bytes(canvas.to_bytes())
+    whole = list(pdftotext_lines(path, pages_per_chunk=10))
+    assert list(pdftotext_lines(path, pages_per_chunk=2, workers=2)) == whole
+    assert whole[0].startswith("Page 1")
+
+
+def _fake_pdftotext(monkeypatch, script):
+    import pdftotext_stream
+
+    monkeypatch.setattr(pdftotext_stream, "page_count", lambda pdf_path: None)
+    monkeypatch.setattr(pdftotext_stream, "_command", lambda *args: [sys.executable, "-c", script])
+
+
+def test_whole_document_survives_a_flood_of_warnings(monkeypatch):
+    import subprocess
+    import threading
+
+    # Far more stderr than a pipe buffer holds, before any stdout.
+    _fake_pdftotext(monkeypatch, (
+        "import sys\n"
+        "sys.stderr.write('Syntax Error: bad xref\\n' * 50000)\n"
+        "sys.stdout.write('Page one\\n\\fPage two\\n')\n"
+    ))
+    result = []
+    reader = threading.Thread(target=lambda: result.extend(pdftotext_lines("damaged.pdf")), daemon=True)
+    reader.start()
+    reader.join(timeout=30)
+    assert not reader.is_alive(), "deadlocked on stderr"
+    assert result == ["Page one\n", "\fPage two\n"]
+
+    _fake_pdftotext(monkeypatch, "import sys; sys.stderr.write('Syntax Error\\n' * 50000); sys.exit(3)")
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        list(pdftotext_lines("damaged.pdf"))
+    assert excinfo.value.stderr.startswith("Syntax Error")
@@ -0,0 +1,52 @@
+"""Tests for printed-total reconciliation across engines."""
+
+import csv
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+from reconcile import main, reconcile, reconcile_csv, split_total_rows  # noqa: E402
+
+ROWS = [
+    {"precinct": "P1", "office": "Registered Voters", "candidate": "", "votes": "900"},
+    {"precinct": "P1", "office": "Sheriff", "candidate": "A", "votes": "150", "election_day": "100"},
+    {"precinct": "P1", "office": "Sheriff", "candidate": "B", "votes": "140", "election_day": "x"},
+    {"precinct": "P2", "office": "Sheriff", "candidate": "A", "votes": "10", "election_day": "7"},
+]
+
+
+def test_mismatches_come_back_one_row_per_field():
+    printed = {
+        ("P1", "Sheriff"): {"votes": "290", "election_day": "101"},
+        ("P2", "Sheriff"): {"votes": "10", "election_day": ""},  # unreadable: skipped
+        ("P3", "Sheriff"): {"votes": "5", "election_day": "5"},  # nothing parsed: skipped
+    }
+    mismatches = reconcile(ROWS, printed, keys=("precinct", "office"))
+    assert mismatches.to_dict("records") == [
+        {"precinct": "P1", "office": "Sheriff", "field": "election_day", "printed": 101, "summed": 100},
+    ]
+    assert reconcile(ROWS, {}, keys=("precinct", "office")).empty
+
+
+def test_total_rows_split_out_of_an_engine_output(tmp_path):
+    rows = [
+        {"precinct": "P1", "office": "President", "party": "DEM", "candidate": "Joe", "votes": "78"},
+        {"precinct": "P1", "office": "President", "party": "DEM", "candidate": "Write-In Totals", "votes": "7"},
+        {"precinct": "P1", "office": "President", "party": "DEM", "candidate": "Write-In: Scattered", "votes": "7"},
+        {"precinct": "P1", "office": "President", "party": "DEM", "candidate": "Total Votes Cast", "votes": "85"},
+        {"precinct": "P1", "office": "President", "party": "REP", "candidate": "Don", "votes": "60"},
+        {"precinct": "P1", "office": "President", "party": "REP", "candidate": "Total Votes Cast", "votes": "61"},
+    ]
+    candidates, printed = split_total_rows(rows)
+    assert len(candidates) == 3 and len(printed) == 2
+    mismatches = reconcile(candidates, printed, keys=("precinct", "office", "party"))
+    assert mismatches[["party", "printed", "summed"]].values.tolist() == [["REP", 61, 60]]
+
+    path = tmp_path / "county.csv"
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["county", "precinct", "office", "district", "party", "candidate", "votes"])
+        writer.writeheader()
+        writer.writerows({"county": "X", "district": "", **row} for row in rows)
+    assert len(reconcile_csv(path)) == 1
+    assert main([str(path), "--strict"]) == 1
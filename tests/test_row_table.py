@@ -0,0 +1,88 @@
+"""Tests for the column store the engines collect their rows in."""
+
+import csv
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+from row_table import RowTable, write_rows  # noqa: E402
+
+FIELDS = ["county", "precinct", "office", "candidate", "votes", "mail", "vote_for"]
+ROWS = [
+    {"county": "Centre", "precinct": "P1", "office": "Sheriff", "candidate": "A", "votes": 12, "mail": "", "vote_for": 1},
+    {"county": "Centre", "precinct": "P1", "office": "Sheriff", "candidate": "B", "votes": "7", "mail": "1,204"},
+    {"county": "Centre", "precinct": "P2", "office": "Sheriff", "candidate": 1, "votes": 2**40, "mail": True},
+]
+
+
+def test_rows_round_trip_with_their_types():
+    table = RowTable(FIELDS)
+    table.extend(ROWS)
+    assert len(table) == 3
+    assert table[1] == {**ROWS[1], "vote_for": ""}
+    assert [type(r["votes"]) for r in table] == [int, str, int]
+    assert table[2]["candidate"] == 1 and table[2]["mail"] is True
+    assert table == [table[0], table[1], table[2]]
+    assert table.column("precinct") == ["P1", "P1", "P2"]
+    with pytest.raises(ValueError, match="district"):
+        table.append({"district": "12"})
+
+
+def test_set_and_add_to_update_in_place():
+    table = RowTable(FIELDS)
+    table.extend(ROWS)
+    table.add_to(0, "mail", 5)
+    table.add_to(0, "votes", 3)
+    table.set(1, "votes", str(int(table.get(1, "votes")) + 1))
+    assert (table[0]["mail"], table[0]["votes"], table[1]["votes"]) == (5, 15, "8")
+
+
+def test_csv_matches_dict_writer():
+    table = RowTable(FIELDS)
+    table.extend(ROWS)
+    fieldnames = ["county", "precinct", "office", "district", "candidate", "votes", "mail", "vote_for"]
+    expected = io.StringIO()
+    writer = csv.DictWriter(expected, fieldnames=fieldnames)
+    writer.writeheader()
+    writer.writerows(ROWS)
+    got = io.StringIO()
+    write_rows(got, table, fieldnames)
+    assert got.getvalue() == expected.getvalue()
+    with pytest.raises(ValueError, match="vote_for"):
+        write_rows(io.StringIO(), table, fieldnames[:-1])
+
+
+def test_fill_sets_only_blank_cells():
+    table = RowTable(["office", "district", "votes"])
+    table.extend([
+        {"office": "U.S. House", "district": "", "votes": 1},
+        {"office": "U.S. House", "district": "9", "votes": 2},
+        {"office": "Governor", "votes": 3},
+        {"office": "State Senate", "district": None, "votes": 4},
+    ])
+    assert table.fill("district", "office", {"U.S. House": "14", "State Senate": "46"}) == 2
+    assert table.column("district") == ["14", "9", "", "46"]
+    assert RowTable(["office", "district"]).fill("district", "office", {"x": "1"}) == 0
+
+
+def test_washington_district_fixes_reach_the_csv(tmp_path, monkeypatch):
+    import pa_washington_primary_2026_results_parser as washington
+    from electionware_primary_np import PRIMARY_FIELDNAMES
+
+    rows = RowTable(PRIMARY_FIELDNAMES)
+    rows.extend([
+        {"county": "Washington", "precinct": "Amwell 1", "office": "U.S. House", "party": "DEM", "candidate": "A", "votes": 5},
+        {"county": "Washington", "precinct": "Amwell 1", "office": "State Senate", "party": "REP", "candidate": "B", "votes": 6},
+        {"county": "Washington", "precinct": "Amwell 1", "office": "Governor", "party": "DEM", "candidate": "C", "votes": 7},
+    ])
+    monkeypatch.setattr(washington, "load_config", lambda county: None)
+    monkeypatch.setattr(washington, "parse_primary_pdf", lambda pdf_path, config: (rows, 1))
+    pdf, out = tmp_path / "washington.pdf", tmp_path / "washington.csv"
+    pdf.write_bytes(b"%PDF")
+    washington.main(["parser", str(pdf), str(out)])
+    with out.open(newline="") as fh:
+        assert [r["district"] for r in csv.DictReader(fh)] == ["14", "46", ""]
@@ -0,0 +1,17 @@
+"""Shared engines and small CSV tools must not import heavy PDF/LLM
+libraries at module import time (see parsers/startup_budget.py)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+from startup_budget import SHARED_ENTRY_POINTS, measure  # noqa: E402
+
+
+@pytest.mark.parametrize("module", SHARED_ENTRY_POINTS)
+def test_entry_point_imports_no_heavy_library(module):
+    _ms, heavy = measure(module)
+    assert heavy == [], f"{module} eagerly imports {heavy}"
@@ -0,0 +1,56 @@
+"""Tests for the incremental statewide consolidation."""
+
+import csv
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import statewide_generator as sg  # noqa: E402
+
+HEADER = ["county", "precinct", "office", "district", "party", "candidate", "votes", "election_day", "mail"]
+
+
+def _write(path, county, votes):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        writer.writerow([county, "P1", "Governor", "", "DEM", "Josh Shapiro", votes, votes, 0])
+        writer.writerow([county, "P1", "Sheriff", "", "DEM", "Local Candidate", 5, 5, 0])
+
+
+def _rows(path):
+    with open(path, newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_rebuild_rereads_only_changed_counties(tmp_path):
+    counties = tmp_path / "counties"
+    counties.mkdir()
+    for county, votes in (("Adams", 10), ("Bedford", 20), ("Centre", 30)):
+        _write(counties / f"20261103__pa__general__{county.lower()}__precinct.csv", county, votes)
+    output = str(tmp_path / "statewide.csv")
+
+    assert len(sg.build(str(counties), "*precinct.csv", output)) == 3
+    assert sg.build(str(counties), "*precinct.csv", output) == []
+
+    _write(counties / "20261103__pa__general__bedford__precinct.csv", "Bedford", 2000)
+    assert sg.build(str(counties), "*precinct.csv", output) == ["20261103__pa__general__bedford__precinct.csv"]
+
+    rows = _rows(output)
+    assert rows[0] == sg.HEADER
+    assert [(r[0], r[6]) for r in rows[1:]] == [("Adams", "10"), ("Bedford", "2000"), ("Centre", "30")]
+    incremental = Path(output).read_bytes()
+    sg.build(str(counties), "*precinct.csv", output, full=True)
+    assert Path(output).read_bytes() == incremental
+
+
+def test_edited_output_forces_a_full_rebuild(tmp_path):
+    counties = tmp_path / "counties"
+    counties.mkdir()
+    _write(counties / "a__precinct.csv", "Adams", 10)
+    output = tmp_path / "statewide.csv"
+    sg.build(str(counties), "*precinct.csv", str(output))
+    output.write_text("garbage\n")
+    assert sg.build(str(counties), "*precinct.csv", str(output)) == ["a__precinct.csv"]
+    assert _rows(output)[1][:3] == ["Adams", "P1", "Governor"]
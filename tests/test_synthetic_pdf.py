@@ -0,0 +1,74 @@
+"""Round-trip tests for synthetic_pdf: each layout drawn from a few CSV rows
+must parse back, through its engine, to exactly the rows that were drawn.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+from synthetic_pdf import LAYOUTS, build_precincts, compare_rows  # noqa: E402
+
+FIELDS = ["county", "precinct", "office", "district", "party", "candidate", "votes", "election_day", "mail", "provisional"]
+
+CSV_ROWS = [
+    ["Adams", "Abbottstown", "Registered Voters", "", "", "", "649", "", "", ""],
+    ["Adams", "Abbottstown", "Ballots Cast", "", "", "", "226", "187", "39", "0"],
+    ["Adams", "Abbottstown", "Judge of the Superior Court", "", "REP", "Maria Battista", "133", "117", "16", "0"],
+    ["Adams", "Abbottstown", "Judge of the Superior Court", "", "DEM", "Brandon Neuman", "81", "61", "20", "0"],
+    ["Adams", "Abbottstown", "Judge of the Superior Court", "", "", "Write-ins", "1", "1", "0", "0"],
+    ["Adams", "Abbottstown", "Judge of the Superior Court", "", "", "Over Votes", "0", "0", "0", "0"],
+    ["Adams", "Abbottstown", "Supreme Court Retention - Christine Donohue", "", "", "Yes", "120", "100", "20", "0"],
+    ["Adams", "Abbottstown", "Supreme Court Retention - Christine Donohue", "", "", "No", "90", "80", "10", "0"],
+    ["Adams", "Abbottstown", "Magisterial District Judge", "District 51-3-01", "REP", "Tony Smith", "150", "", "", ""],
+    ["Adams", "Bendersville", "Registered Voters", "", "", "", "400", "", "", ""],
+    ["Adams", "Bendersville", "Ballots Cast", "", "", "", "150", "120", "30", "0"],
+    ["Adams", "Bendersville", "Judge of the Superior Court", "", "REP", "Maria Battista", "86", "70", "16", "0"],
+    ["Adams", "Bendersville", "Judge of the Superior Court", "", "DEM", "Brandon Neuman", "50", "40", "9", "1"],
+]
+
+
+@pytest.mark.parametrize("layout", sorted(LAYOUTS))
+def test_layout_round_trips_through_engine(layout, tmp_path):
+    pytest.importorskip("natural_pdf" if layout != "sovc_crosstab" else "pdfplumber")
+    from engine_bench import _parse
+
+    county, precincts = build_precincts([dict(zip(FIELDS, r)) for r in CSV_ROWS], copies=2)
+    synthetic = LAYOUTS[layout](county, precincts)
+    pdf_path = tmp_path / f"{layout}.pdf"
+    pdf_path.write_bytes(synthetic.pdf_bytes)
+
+    rows = _parse(layout, pdf_path, synthetic.config)
+    assert synthetic.expected
+    assert compare_rows(synthetic.expected, rows) == []
+
+
+def test_build_precincts_sums_repeated_aggregates_and_copies():
+    rows = [dict(zip(FIELDS, r)) for r in CSV_ROWS]
+    rows.append(dict(zip(FIELDS, ["Adams", "Abbottstown", "Judge of the Superior Court", "", "", "Write-in", "2", "1", "1", "0"])))
+    _, precincts = build_precincts(rows, copies=2)
+    assert [p.name for p in precincts] == ["Abbottstown", "Bendersville", "Abbottstown #2", "Bendersville #2"]
+    superior = precincts[0].contests[0]
+    write_ins = [c for c in superior.candidates if c.kind == "write_in"]
+    assert [c.votes for c in write_ins] == [(3, 2, 1, 0)]
+    # A missing breakdown is drawn as all election day.
+    mdj = precincts[0].contests[2]
+    assert mdj.candidates[0].votes == (150, 150, 0, 0)
+
+
+def test_sovc_geo_printed_totals_reconcile(tmp_path):
+    pytest.importorskip("natural_pdf")
+    from sovc_geo_np import check_printed_totals, parse_sovc_geo_results
+
+    rows = [dict(zip(FIELDS, r)) for r in CSV_ROWS]
+    rows.append(dict(zip(FIELDS, ["Adams", "Abbottstown", "Judge of the Superior Court", "", "", "Under Votes", "11", "8", "3", "0"])))
+    county, precincts = build_precincts(rows, copies=1)
+    synthetic = LAYOUTS["sovc_geo"](county, precincts)
+    pdf_path = tmp_path / "sovc_geo.pdf"
+    pdf_path.write_bytes(synthetic.pdf_bytes)
+
+    results, printed_totals = parse_sovc_geo_results(str(pdf_path), synthetic.config)
+    assert printed_totals
+    assert check_printed_totals(results, printed_totals) == []
@@ -0,0 +1,58 @@
+"""Tests for the pluggable page-text backends used by the line-based engines."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "parsers"))
+
+from electionware_precinct_np import ElectionwareConfig, precinct_blocks  # noqa: E402
+from synthetic_pdf import PdfCanvas  # noqa: E402
+from text_backends import compare_backend, open_page_texts, page_lines  # noqa: E402
+
+
+def _pdf(tmp_path):
+    canvas = PdfCanvas()
+    canvas.new_page()
+    canvas.text(40, 770, "CAMERON COUNTY Summary Results Report")
+    canvas.text(40, 740, "REP JOHN SMITH")
+    for x, value in ((300, "1,234"), (360, "1,000"), (420, "200"), (480, "34")):
+        canvas.text_right(x, 740, value)
+    canvas.text(40, 40, "Report generated with Electionware")
+    canvas.new_page()
+    canvas.text(40, 770, "Vote For 1")
+    path = tmp_path / "page.pdf"
+    path.write_bytes(canvas.to_bytes())
+    return path
+
+
+@pytest.mark.parametrize("backend", ["pdfplumber", "pypdfium2"])
+def test_backends_match_natural_pdf_lines(backend, tmp_path):
+    pytest.importorskip("natural_pdf")
+    pytest.importorskip(backend)
+    path = _pdf(tmp_path)
+    reference = [page_lines(t) for t in open_page_texts(path)]
+    pages = open_page_texts(path, backend)
+    assert len(pages) == 2
+    assert [page_lines(t) for t in pages] == reference
+    assert reference[0][1] == "REP JOHN SMITH 1,234 1,000 200 34"
+
+
+def test_compare_backend_separates_reordered_pages():
+    reference = [["a", "b"], ["c"], ["d"]]
+    candidate = [["a", "b"], ["c"], ["e"]]
+    assert compare_backend(reference, candidate)["differing"] == [3]
+    result = compare_backend([["a", "b"]], [["b", "a"]])
+    assert (result["same"], result["reordered"], result["differing"]) == (0, 1, [])
+
+
+def test_unknown_backend_and_custom_extractor_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unknown text backend"):
+        open_page_texts(tmp_path / "x.pdf", "tesseract")
+    config = ElectionwareConfig(
+        county="Lebanon", skip_prefixes=(), county_header_suffix="LEBANON COUNTY",
+        precinct_block_extractor=lambda pdf, config: iter(()), text_backend="pypdfium2",
+    )
+    with pytest.raises(ValueError, match="needs the natural_pdf"):
+        precinct_blocks(tmp_path / "x.pdf", config)
@@ -1,254 +1,43 @@
 import json
 import os
+import sys
 import requests
 from collections import defaultdict
 from csv import DictReader
+from pathlib import Path
 from time import sleep
 
+# the candidate registry and office table live in parsers/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'parsers'))
+from candidate_registry import pa_2020_primary  # noqa: E402
+from constants.pa_candidates_2020 import OFFICIAL_PRIMARY_CANDIDATE_ALIASES  # noqa: E402
+from office_normalizer import normalize as normalize_office, party_code  # noqa: E402
+
 CSV_FILE_PATH = os.path.join('..', '2020')
 PA_OFFICIAL_RESULTS_WEBSITE = 'https://www.electionreturns.pa.gov/api/ElectionReturn'
 PA_OFFICIAL_COUNTY_API = 'GetCountyData?countyName={}&methodName=GetCountyData&electionid=83&electiontype=P&isactive=0'
 PA_OFFICIAL_COUNTY_RESULTS_URL = '/'.join([PA_OFFICIAL_RESULTS_WEBSITE, PA_OFFICIAL_COUNTY_API])
 QUERY_SPACING_IN_SECONDS = 3
 
+PA_OFFICIAL_OFFICES = (
+    'President of the United States',
+    'Attorney General',
+    'Auditor General',
+    'Representative in Congress',
+    'Representative in the General Assembly',
+    'Senator in the General Assembly',
+    'State Treasurer',
+)
+# the 2020 files name the State House "General Assembly"
+OPEN_ELECTIONS_2020_OFFICES = {'State House': 'General Assembly'}
 PA_OFFICIAL_OFFICE_TO_OPEN_ELECTIONS_OFFICE = {
-    'President of the United States': 'President',
-    'Attorney General': 'Attorney General',
-    'Auditor General': 'Auditor General',
-    'Representative in Congress': 'U.S. House',
-    'Representative in the General Assembly': 'General Assembly',
-    'Senator in the General Assembly': 'State Senate',
-    'State Treasurer': 'State Treasurer',
-}
-PA_OFFICIAL_PARTY_TO_OPEN_ELECTIONS_PARTY = {
-    'Democratic': 'DEM',
-    'Republican': 'REP',
+    office: OPEN_ELECTIONS_2020_OFFICES.get(normalized, normalized)
+    for office, normalized in ((office, normalize_office(office).office) for office in PA_OFFICIAL_OFFICES)
 }
+PA_OFFICIAL_PARTY_TO_OPEN_ELECTIONS_PARTY = {party: party_code(party) for party in ('Democratic', 'Republican')}
 
-PA_OFFICIAL_CANDIDATE_TO_OPEN_ELECTIONS_CANDIDATE = {
-    # state and national offices
-    'SANDERS, BERNARD': ['BERNIE SANDERS'],
-    'BIDEN, JOSEPH ROBINETTE JR': ['JOSEPH R BIDEN'],
-    'TRUMP, DONALD J.': ['DONALD J TRUMP'],
-    'WELD, WILLIAM F': ['BILL WELD', 'BILLY WELD'],
-    'SHAPIRO, JOSHUA D': ['JOSH SHAPIRO'],
-    'CONKLIN, HARRY  SCOTT': ['H SCOTT CONKLIN'],
-    'CONKLIN, HARRY SCOTT': ['H SCOTT CONKLIN'],
-    'DAVIS, ROSE MARIE': ['ROSE ROSIE MARIE DAVIS', 'ROSE ROSIE DAVIS'],
-    'AHMAD, NILOFER NINA': ['NINA AHMAD'],
-    'DEFOOR, TIMOTHY  L': ['TIMOTHY DEFOOR'],
-    'TORSELLA, JOSEPH M': ['JOE TORSELLA'],
-    # districted offices
-    'ROWLEY, RAYMOND TODD': ['TODD ROWLEY'],
-    'MOUL, DANIEL P.': ['DAN MOUL'],
-    'STERNER, RICHARD L': ['RICH STERNER'],
-    'MASTRIANO, DOUGLAS VINCENT': ['DOUG MASTRIANO'],
-    'THOMPSON, GLENN W JR': ['GLENN GT THOMPSON'],
-    'PYLE, JEFFREY P.': ['JEFF PYLE'],
-    'LANGERHOLC, WAYNE JR.': ['WAYNE LANGERHOLC JR'],
-    'CUNNANE, MADELEINE  DEAN': ['MADELEINE DEAN'],
-    'HOULAHAN, CHRISTINA J': ['CHRISSY HOULAHAN'],
-    'QUICK, SUSAN LAURA': ['LAURA QUICK'],
-    'MEUSER, DANIEL PHILIP': ['DAN MEUSER'],
-    'KNOWLES, JEROME P': ['JERRY KNOWLES'],
-    'OSWALD, JAMES DANIEL': ['JAMES D OSWALD'],
-    'GUZMAN, MANUEL JR': ['MANNY GUZMAN'],
-    'GAGLIARDO, VINCENT D JR': ['VINCENT D GAGLIARDO, JR'],
-    'COX, JAMES A. JR.': ['JIM COX'],
-    'FOLEY, FRANCIS LAMAR JR': ['LAMAR FOLEY'],
-    'MALONEY, DAVID M. SR.': ['DAVID M MALONEY'],
-    'MACKENZIE, RYAN': ['RYAN E MACKENZIE'],
-    'BLICHAR, MICHAEL E JR': ['MICHAEL BLICHAR, JR', 'MICHAEL BLICHAR JR'],
-    'SCHWANK, JUDITH L':  ['JUDY SCHWANK'],
-    'ARGALL, DAVID G': ['DAVE ARGALL'],
-    'HURWITZ, SKYLAR': ['SKYLAR D HURWITZ'],
-    'MEEHAN, ANDREW MARTIN': ['ANDY MEEHAN'],
-    'ARCHETTO, GREGORY': ['GREG ARCHETTO'],
-    'LAREAU, MALINDA LAUREN': ['LAUREN LAREAU'],
-    'POLINCHOCK, F. TODD': ['TODD POLINCHOCK'],
-    'TOMLINSON, KATHLEEN C': ['KATHLEEN KC TOMLINSON'],
-    'KELLY, GEORGE J JR': ['MIKE KELLY'],
-    'PARNELL, RICHARD SEAN': ['SEAN PARNELL'],
-    'HEASLEY, PHILLIP C': ['PHIL HEASLEY'],
-    'BONNER, TIMOTHY R.': ['TIM BONNER'],
-    'DOCTOR, SAMUEL JOSEPH': ['SAM DOCTOR'],
-    'SMITH, DANIEL B JR': ['DANIEL SMITH JR'],
-    'MARSHALL, JAMES E.': ['JIM MARSHALL'],
-    'JAMES, R. LEE': ['R LEE JAMES'],
-    'STROMYER, SHELBIE LYNN': ['SHELBIE L STROMYER'],
-    'KRIZAN, STEPHEN JOHN III': ['STEPHEN J KRIZAN III'],
-    'VOGEL, ELDER A JR': ['ELDER A VOGEL JR'],
-    'RIGBY, JAMES PATRICK': ['JIM RIGBY'],
-    'CARNICELLA, GERALD  S': ['JERRY CARNICELLA'],
-    'SANKEY, THOMAS R III': ['TOMMY SANKEY'],
-    'BRIER, THOMAS F JR': ['TOM BRIER'],
-    'DEPASQUALE, EUGENIO A': ['EUGENE DEPASQUALE'],
-    'NESSINGER, JEDIDIAH E': ['JED NESSINGER'],
-    'BENNER, WILLIAM E. III': ['WILLIAM BILL BENNER'],
-    'ROTHMAN, WILLIAM GREGORY': ['GREG ROTHMAN'],
-    'ROSS, DOUGLAS F': ['DOUG ROSS'],
-    'COPLEN, RICHARD CHASE': ['RICK COPLEN'],
-    'REGAN, MICHAEL': ['MIKE REGAN'],
-    'TROUTMAN, WILLIAM NELSON JR': ['BILL TROUTMAN'],
-    'HICKERNELL, DAVID S.': ['DAVID S HICKERNELL'],
-    'MAXSON, KELVIN': ['KEVIN MAXSON'],
-    'SMITH, PATRICIA A': ['PATTY SMITH'],
-    'HELM, SUSAN C.': ['SUSAN C SUE HELM'],
-    'LUPP, CHRISTOPHER ANDRE': ['CHRIS LUPP'],
-    'MEHAFFIE, THOMAS L III': ['TOM MEHAFFIE'],
-    'BREAULT, HERVEY CONRAD II': ['HERV BREAULT'],
-    'KERWIN, JOSEPH P': ['JOE KERWIN'],
-    'TAYLOR, ALVIN Q SR': ['ALVIN Q TAYLOR'],
-    'DISANTO, GIOVANNI M': ['JOHN DISANTO'],
-    'JORDAN, ROBERT M': ['ROB JORDAN'],
-    'SPAHR, CATHERINE E': ['CATHY SPAHR'],
-    'WILLIAMS, WENDELL CRAIG': ['CRAIG WILLIAMS'],
-    'DELLOSO, DAVID M': ['DAVE DELLOSO'],
-    'GAGLIO, PETER THOMAS JR': ['PETE GAGLIO'],
-    'ZABEL, MICHAEL P': ['MIKE ZABEL'],
-    'SMYTHE, ROBERT F. JR.': ['ROBERT SMYTHE JR'],
-    'CIAMACCA, DEBRA  A': ['DEB CIAMACCA'],
-    'QUINN, CHRISTOPHER  B': ['CHRIS QUINN'],
-    'DONATUCCI, MARIA P.': ['MARIA P DONATUCCI'],
-    'MCCLINTON, JOANNA': ['JOANNA E MCCLINTON'],
-    'KILLION, THOMAS H.': ['THOMAS H KILLION'],
-    'MERSKI, ROBERT E': ['BOB MERSKI'],
-    'SONNEY, CURTIS G.': ['CURT SONNEY'],
-    'FERRENCE, MATTHEW': ['MATT FERRENCE'],
-    'ROAE, BRADLEY T': ['BRAD ROAE'],
-    'LAUGHLIN, DANIEL J MR': ['DAN LAUGHLIN'],
-    'MARX, WILLIAM A': ['BILL MARX'],
-    'COOK, DONALD': ['BUD COOK'],
-    'BOTTINO, ANTHONY JAMES JR': ['TONY BOTTINO'],
-    'HERSHEY, JOHNATHAN D': ['JOHN HERSHEY'],
-    'KAUFFMAN, ROBERT W.': ['ROB KAUFFMAN'],
-    'STRUZZI, JAMES BRUNO II': ['JIM STRUZZI'],
-    'MATSON, JOHN D. JR': ['JOHN JACK MATSON'],
-    'CARTWRIGHT, MATTHEW ALTON': ['MATT CARTWRIGHT'],
-    'DANIELS, THEODORE V': ['TEDDY DANIELS'],
-    'BOGNET, JAMES ROCCO': ['JIM BOGNET'],
-    'CAMMISA, MIKEL J': ['MIKE CAMMISA'],
-    'MARSICANO, MICHAEL P': ['MIKE MARSICANO'],
-    'MULLINS, KYLE': ['KYLE J MULLINS'],
-    'KOSIEROWSKI, BRIDGET': ['BRIDGET MALLOY KOSIEROWSKI'],
-    'CARROLL, MICHAEL B': ['MIKE CARROLL'],
-    'SMUCKER, LLOYD K.': ['LLOYD K SMUCKER'],
-    'FEE, MELINDA S': ['MINDY FEE'],
-    'WITMER, BRADFORD L': ['BRAD WITMER'],
-    'GREINER, KEITH JAMES': ['KEITH J GREINER'],
-    'STURLA, P MICHAEL': ['MIKE STURLA'],
-    'GULICK, DANA': ['DANA HAMP GULICK'],
-    'MENTZER, STEVEN CURTIS': ['STEVE MENTZER'],
-    'HODGE, RICHARD MICHAEL': ['RICK HODGE'],
-    'ZIMMERMAN, DAVID H.': ['DAVE ZIMMERMAN'],
-    'TEMIN, JANET': ['JANET DIAZ'],
-    'RYAN, FRANCIS X': ['FRANK RYAN'],
-    'MACKENZIE, V MILOU': ['MILOU MACKENZIE'],
-    'ELLENBERGER, JOSEPH AMOS': ['JOE ELLENBERGER'],
-    'SCHLOSSBERG, MICHAEL': ['MIKE SCHLOSSBERG'],
-    'MAKO, ZACHARY ALLEN': ['ZACH MAKO'],
-    'EACHUS, TODD  A.': ['TODD A EACHUS'],
-    'KELLER, FREDERICK B': ['FRED KELLER'],
-    'HINES, DAVID  RAMSAY': ['DAVE HINES'],
-    'HAMM, JOSEPH D': ['JOE HAMM'],
-    'DINCHER, MICHAEL A': ['MIKE DINCHER'],
-    'BAKER, JACLYN E': ['JACKIE BAKER'],
-    'YAW, EMERSON EUGENE': ['GENE YAW'],
-    'HENNESSEY, TIMOTHY F.': ['TIM HENNESSEY'],
-    'MALAGARI, STEVEN R': ['STEVE MALAGARI'],
-    'ARNOTT, ALLAN MILES': ['MILES ARNOTT'],
-    'HANBIDGE, LAURA ELIZABETH FRANCES': ['LIZ HANBIDGE'],
-    'FRIEBEL, FLORENCE L.': ['LISA FRIEBEL'],
-    'BRADFORD, MATTHEW D': ['MATT BRADFORD'],
-    'SARING, JAMES COURTLAND': ['JIM SARING'],
-    'CIRESI, JOSEPH P': ['JOE CIRESI'],
-    'SCANNAPIECO, ANNA MARIE': ['ANNAMARIE SCANNAPIECO'],
-    'DALEY, MARY JOSEPHINE': ['MARY JO DALEY'],
-    'WEBSTER, JOSEPH': ['JOE WEBSTER'],
-    'MAZZA, BETH ANN': ['BETH ANN BITTNER MAZZA'],
-    'STEPHENS, WILLIAM TODD': ['TODD STEPHENS'],
-    'SANCHEZ, BENJAMIN V': ['BEN SANCHEZ'],
-    'SPRIGG WISEHART, GRETCHEN ANDREA': ['GRETCHEN WISEHART'],
-    'SOSA, RAYMOND L': ['RAY SOSA'],
-    'BOWERS, KATHLEEN': ['KATHY GARRY BOWERS'],
-    'BASHIR, HAROON': ['AARON BASHIR'],
-    'SAMUELSON, STEPHEN P': ['STEVE SAMUELSON'],
-    'EMRICK, JOSEPH T': ['JOE EMRICK'],
-    'TARSI, ANTHONY ROBERT': ['TONY TARSI'],
-    'SYMONS, PETER JAMES JR.': ['PETER PJ SYMONS JR'],
-    'TWARDZIK, TIMOTHY F': ['TIM TWARDZIK'],
-    'OWLETT, CLINTON D.': ['CLINT OWLETT'],
-    'BROWN, MARGARET SATTERWHITE': ['MARGIE BROWN'],
-    'BROWN, JAMES MARK': ['JIM BROWN'],
-    'WILLIAMS, ROBERT T SR': ['BOB WILLIAMS'],
-    'KAIL, JOSHUA DANIEL': ['JOSHUA D KAIL'],
-    'KIRSCH, THOMAS ALAN': ['TOM KIRSCH'],
-    'PUSKARIC, MICHAEL JAMES': ['MIKE PUSKARIC'],
-    'MIHALEK (STUCK), NATALIE NICOLE': ['NATALIE MIHALEK'],
-    'O\'NEAL, TIMOTHY JON': ['TIM O\'NEAL'],
-    'IOVINO, PAMELA M': ['PAM IOVINO'],
-    'NEFF, JEFFREY WILLIAM': ['JEFF NEFF'],
-    'DERMODY, FRANCIS J.': ['FRANK DERMODY'],
-    'BROOKS, ROBERT J.': ['BOB BROOKS'],
-    'PRAH, ROBERT L JR': ['ROBERT PRAH JR'],
-    'REESE, MICHAEL P.': ['MIKE REESE'],
-    'BREWSTER, JAMES R': ['JIM BREWSTER'],
-    'JONES, PAUL MICHAEL': ['MIKE JONES'],
-    'SAYLOR, STANLEY E.': ['STAN SAYLOR'],
-    'FRENCH, KATHRYN CORRELL': ['KACEY FRENCH'],
-    'KLUNK, KATE ANNE': ['KATE A KLUNK'],
-    'GROVE, SETH MICHAEL': ['SETH M GROVE'],
-    'WALTZ, JOSEPH': ['JOE WALTZ'],
-    'WALTENBAUGH, TAY  R.': ['TAY R WALTENBAUGH'],
-    'PASHINSKI, EDWIN': ['EDDIE DAY PASHINSKI'],
-    'DRISCOLL, MICHAEL': ['MIKE DRISCOLL'],
-    'DEMPSEY, JEFFREY': ['JEFF DEMPSEY'],
-    'MURRAY, ANDREW I': ['DREW MURRAY'],
-    'MENNA, LOUIS T. IV': ['LOU MENNA IV'],
-    'HARRIS, JORDAN ALEXANDER': ['JORDAN A HARRIS'],
-    'GREEN, GWENDOLYN VERONICA': ['RONI GREEN'],
-    'DOWNING, SAMUEL VAN STONE': ['VAN STONE'],
-    'WILLIAMS, BERNARD A.': ['BERNARD A WILLIAMS'],
-    'FARNESE, LAWRENCE M JR': ['LARRY FARNESE'],
-    'BOYLE, BRENDAN F.': ['BRENDAN F BOYLE'],
-    'MONAHAN, WILLIAM T': ['BILL MONAHAN'],
-    'PEIFER, MICHAEL': ['MIKE PEIFER'],
-    'ARMANINI, MICHAEL J. MR.': ['MIKE ARMANINI'],
-    'SAINATO, CHRISTOPHER': ['CHRIS SAINATO'],
-    'RYAN, CAROL LYNNE': ['LYNNE RYAN'],
-    'RAPP, KATHY L.': ['KATHY L RAPP'],
-    'CAUSER, MARTIN T.': ['MARTIN T CAUSER'],
-    'DOYLE, MICHAEL F JR': ['MIKE DOYLE'],
-    'DICKINSON, GERALD S': ['JERRY S DICKINSON'],
-    'GAINEY, EDWARD C': ['ED GAINEY'],
-    'MARKOSEK, BRANDON': ['BRANDON J MARKOSEK'],
-    'DEASY, DANIEL': ['DAN DEASY'],
-    'HECKMANN, MICHAEL J': ['MIKE HECKMANN'],
-    'MERCURI, ROBERT W': ['ROB MERCURI'],
-    'BLACKBURN, ELIZABETH B.': ['LIBBY BLACKBURN'],
-    'SHULMAN, MELISSA GEIGER': ['LISSA GEIGER SHULMAN'],
-    'DELUCA, ANTHONY': ['TONY DELUCA'],
-    'ROLAND, CHRISTOPHER PATRICK': ['CHRIS ROLAND'],
-    'MOELLER, EDWARD D': ['ED MOELLER'],
-    'DOYLE, ADRIAN MATTHEW': ['AJ DOYLE'],
-    'PISCIOTTANO, NICKOLAS R': ['NICK PISCIOTTANO'],
-    'MILLER, DANIEL': ['DAN MILLER'],
-    'DODDATO, ROBERT AUGUST': ['BOB DODDATO'],
-    'FRANCIS, MALEK A': ['M FRANCIS'],
-    'DEVITO, DANIEL BRIAN': ['DANNY DEVITO'],
-    'COSTA, JAY JR': ['JAY COSTA, JR'],
-    'BRITTAIN, WILLIAM  S': ['BILL BRITTAIN'],
-    'KULIK, ANITA A': ['ANITA ASTORINO KULIK'],
-    'YETSKO, STEPHEN T': ['STEVE YETSKO'],
-    'KIDD, IAN  MICHAEL': ['IAN M KIDD'],
-    'IRVIN, RICHARD S': ['RICH IRVIN'],
-    'BUCKLAND, PETER DAWSON': ['PETER BUCK'],
-    'SCHMITT, LOUIS C. JR.':  ['LOU SCHMITT'],
-    'GREGORY, JAMES V': ['JIM GREGORY'],
-    'IACONO, LEONARD J.': ['LEN IACONO'],
-    'BOYER, KYLE JUAN': ['KYLE J BOYER'],
-    'MARCILLE-KERSLAKE, VIRGINIA VIVIAN': ['GINNY KERSLAKE'],
-}
+PA_OFFICIAL_CANDIDATE_TO_OPEN_ELECTIONS_CANDIDATE = OFFICIAL_PRIMARY_CANDIDATE_ALIASES
+CANDIDATES = pa_2020_primary()
 
 
 def collect_actual_data(filename, errors):
@@ -257,9 +46,8 @@ def collect_actual_data(filename, errors):
         csv_to_validate = DictReader(f_in)
         for line in csv_to_validate:
             try:
-                candidate = line['candidate'].replace('.', '').replace('(', '').replace(')', '')
                 key = line['office'].title(), line['district'], \
-                    line['party'], candidate.upper().strip()
+                    line['party'], CANDIDATES.canonical(line['candidate'], fuzzy=False)
                 candidate_to_votes[key] += int(line['votes'].replace(',', ''))
             except Exception as e:
                 errors.append(f'Unable to parse `{line}`: {e}')
@@ -326,14 +114,14 @@ def get_district(district_data):
 
 
 def get_candidate_options(candidate_data):
+    # registry keys, as collect_actual_data keys the parsed candidates; no
+    # fuzzy matching, so a misspelled parsed name is reported, not absorbed
     candidate_name = candidate_data['CandidateName'].strip().replace(' ,', ',')
-    if candidate_name in PA_OFFICIAL_CANDIDATE_TO_OPEN_ELECTIONS_CANDIDATE:
-        yield from PA_OFFICIAL_CANDIDATE_TO_OPEN_ELECTIONS_CANDIDATE[candidate_name]
+    yield CANDIDATES.canonical(candidate_name, fuzzy=False)
     last_name, first_name = candidate_name.split(', ', 1)
-    yield first_name + ' ' + last_name
     if ' ' in first_name:
         first_name, middle_name = first_name.split(' ', 1)
-        yield first_name + ' ' + last_name
+        yield CANDIDATES.canonical(first_name + ' ' + last_name, fuzzy=False)
 
 
 def get_errors(county, filename):